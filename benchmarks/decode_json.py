@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compares the installed json backends of `derpi.serialization` on the body of a search page of 50 images.
+
+Run it from the repository root:
+    python benchmarks/decode_json.py
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from derpi.serialization import BACKENDS
+from parse_images import sample_page, PAGE_SIZE
+
+__author__ = 'luckydonald'
+
+ROUNDS = 200
+REPEAT = 20  # the fastest of those is reported, as it's the least disturbed by everything else running.
+
+
+def main():
+    body = json.dumps({'images': sample_page(), 'interactions': [], 'total': 2028858}).encode('utf-8')
+    print(f'{PAGE_SIZE} images per page, {len(body)} bytes:')
+    for name, loads in BACKENDS.items():
+        durations = []
+        for _ in range(REPEAT):
+            start = time.perf_counter()
+            for _ in range(ROUNDS):
+                loads(body)
+            # end for
+            durations.append(time.perf_counter() - start)
+        # end for
+        duration = min(durations)
+        print(f'{name:>8}: {duration * 1000 / ROUNDS:.3f} ms per page, {len(body) * ROUNDS / duration / 1024 / 1024:.0f} MiB/s')
+    # end for
+# end def
+
+
+if __name__ == '__main__':
+    main()
+# end if
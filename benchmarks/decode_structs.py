@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compares decoding a search page of 50 images into the regular models and into the msgspec structs of `derpi.structs`.
+
+Run it from the repository root:
+    python benchmarks/decode_structs.py
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from derpi.serialization import loads
+from derpi.syncrounous.models import Image
+from parse_images import sample_page, PAGE_SIZE
+
+__author__ = 'luckydonald'
+
+ROUNDS = 100
+REPEAT = 20  # the fastest of those is reported, as it's the least disturbed by everything else running.
+
+
+def decode_models(body: bytes) -> list:
+    return [Image.from_dict(item) for item in loads(body)['images']]
+# end def
+
+
+def decode_structs(body: bytes) -> list:
+    from derpi.structs import decode_search_images
+    return decode_search_images(body)
+# end def
+
+
+def main():
+    body = json.dumps({'images': sample_page(), 'interactions': [], 'total': 2028858}).encode('utf-8')
+    print(f'{PAGE_SIZE} images per page, {len(body)} bytes:')
+    for name, decode in [('models', decode_models), ('structs', decode_structs)]:
+        durations = []
+        for _ in range(REPEAT):
+            start = time.perf_counter()
+            for _ in range(ROUNDS):
+                decode(body)
+            # end for
+            durations.append(time.perf_counter() - start)
+        # end for
+        duration = min(durations)
+        print(f'{name:>8}: {duration * 1000 / ROUNDS:.3f} ms per page, {duration * 1000000 / ROUNDS / PAGE_SIZE:.2f} µs per image')
+    # end for
+# end def
+
+
+if __name__ == '__main__':
+    main()
+# end if
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Measures the memory the parsed `Image` models keep alive, with and without the tag intern pool,
+and extrapolates it to a corpus of 1M images.
+
+The images are copies of `sample_image.json`, each with 42 tags drawn from 5000 tag names,
+the popular ones way more often than the rest, like on the real site.
+
+Run it from the repository root:
+    python benchmarks/intern_memory.py
+"""
+import gc
+import json
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from derpi.intern import InternPool
+from derpi.serialization import loads
+from derpi.syncrounous.models import DerpiModel, Image
+from parse_images import sample_page, PAGE_SIZE
+
+__author__ = 'luckydonald'
+
+IMAGES = 20000
+CORPUS = 1000000
+VOCABULARY = 5000
+TAGS_PER_IMAGE = 42
+
+
+def pages() -> list:
+    """
+    The json bodies of the search pages, so every parsed string is a new object, like with real responses.
+    """
+    random.seed(4458)
+    vocabulary = [(tag_id, f'tag name {tag_id}') for tag_id in range(VOCABULARY)]
+    weights = [1 / (rank + 1) for rank in range(VOCABULARY)]  # zipf distribution
+    page = sample_page()
+    bodies = []
+    for page_number in range(IMAGES // PAGE_SIZE):
+        for item in page:
+            tags = sorted(set(random.choices(vocabulary, weights=weights, k=TAGS_PER_IMAGE)))
+            item['tag_ids'] = [tag_id for tag_id, _ in tags]
+            item['tags'] = [name for _, name in tags]
+        # end for
+        bodies.append(json.dumps({'images': page}).encode('utf-8'))
+    # end for
+    return bodies
+# end def
+
+
+def measure(bodies: list, pool) -> float:
+    """
+    Bytes kept alive per image.
+    """
+    DerpiModel.intern_pool = pool
+    gc.collect()
+    tracemalloc.start()
+    images = []
+    for body in bodies:
+        images.extend(Image.from_dict(item) for item in loads(body)['images'])
+    # end for
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del images
+    return size / IMAGES
+# end def
+
+
+def main():
+    bodies = pages()
+    print(f'{IMAGES} images, extrapolated to {CORPUS} images:')
+    baseline = None
+    for name, pool in [('no pool', None), ('pool', InternPool()), ('pool, compact ids', InternPool(compact_ids=True))]:
+        per_image = measure(bodies, pool)
+        if baseline is None:
+            baseline = per_image
+        # end if
+        saved = (baseline - per_image) * CORPUS / 1024 ** 3
+        print(f'{name:>18}: {per_image:.0f} bytes per image, {per_image * CORPUS / 1024 ** 3:.2f} GiB, {saved:.2f} GiB saved')
+    # end for
+# end def
+
+
+if __name__ == '__main__':
+    main()
+# end if
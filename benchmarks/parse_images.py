@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Measures how long parsing a search page of 50 images into `Image` models takes.
+
+Run it from the repository root:
+    python benchmarks/parse_images.py
+"""
+import copy
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from derpi.syncrounous.models import Image
+
+__author__ = 'luckydonald'
+
+PAGE_SIZE = 50
+ROUNDS = 100
+REPEAT = 20  # the fastest of those is reported, as it's the least disturbed by everything else running.
+
+
+def sample_page() -> list:
+    """
+    A page of `PAGE_SIZE` images, based on `sample_image.json`.
+    """
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sample_image.json')) as f:
+        image = json.load(f)
+    # end with
+    page = []
+    for i in range(PAGE_SIZE):
+        item = copy.deepcopy(image)
+        item['id'] += i
+        page.append(item)
+    # end for
+    return page
+# end def
+
+
+def main():
+    page = sample_page()
+    durations = []
+    for _ in range(REPEAT):
+        # copied up front, so copying isn't measured, in case parsing modifies the dicts.
+        pages = [copy.deepcopy(page) for _ in range(ROUNDS)]
+        start = time.perf_counter()
+        for items in pages:
+            for item in items:
+                Image.from_dict(item)
+            # end for
+        # end for
+        durations.append(time.perf_counter() - start)
+    # end for
+    duration = min(durations)
+    print(f'{PAGE_SIZE} images per page: {duration * 1000 / ROUNDS:.3f} ms per page, {duration * 1000000 / ROUNDS / PAGE_SIZE:.2f} µs per image')
+# end def
+
+
+if __name__ == '__main__':
+    main()
+# end if
@@ -51,6 +51,20 @@ class Route(object):
         # end if
     # end def
 
+    def is_paginated(self) -> bool:
+        """
+        If the route has a `page` parameter, i.e. returns only a part of the results.
+        """
+        return any(param.name == 'page' for param in self.allowed_query_parameters)
+    # end def
+
+    def is_cacheable(self) -> bool:
+        """
+        If the route looks up a single object, e.g. an image by it's id, or the featured image.
+        """
+        return self.method == 'GET' and not self.response_format.is_list and not self.is_paginated()
+    # end def
+
     __repr__ = __str__
 # end class
 
@@ -78,6 +92,56 @@ class Parameter(object):
         self.api_name = name if not api_name else api_name
     # end def
 
+    TAG_NAME_LISTS = ('tags', 'derpibooru_tags', 'implied_tags', 'implied_by_tags', 'aliases')
+    TAG_ID_LISTS = ('tag_ids', 'hidden_tag_ids', 'spoilered_tag_ids')
+
+    def is_tag_name_list(self) -> bool:
+        """
+        If it's an array of tag names, which are shared between the models via the intern pool.
+        """
+        return self.type == 'Array' and self.name in self.TAG_NAME_LISTS
+    # end def
+
+    def is_tag_id_list(self) -> bool:
+        """
+        If it's an array of tag ids, which are shared between the models via the intern pool.
+        """
+        return self.type == 'Array' and self.name in self.TAG_ID_LISTS
+    # end def
+
+    def is_model(self, classes: List[Class]) -> bool:
+        """
+        If it's a nested model, which is only built when first read.
+        """
+        return any(clazz.name == self.type for clazz in classes)
+    # end def
+
+    MODEL_LISTS = ('links', 'awards')  # nested models the API sends a list of.
+    OBJECT_LISTS = ('dnp_entries',)  # arrays of objects without a model.
+
+    ARROW_TYPE_MAP = {
+        'Integer': 'pa.int64()',
+        'String': 'pa.string()',
+        'RFC3339 datetime': 'TIMESTAMP',
+        'Float': 'pa.float64()',
+        'Boolean': 'pa.bool_()',
+    }
+
+    def arrow_type_representation(self, classes: List[Class]) -> str:
+        """
+        The code of the matching `pyarrow` type, with nested models as the struct in `STRUCTS`.
+        Arrays of objects without a model are stored as list of json strings.
+        """
+        if self.is_model(classes):
+            struct = f'STRUCTS[{self.type!r}]'
+            return f'pa.list_({struct})' if self.name in self.MODEL_LISTS else struct
+        # end if
+        if self.type == 'Array':
+            return 'pa.list_(pa.int64())' if self.is_tag_id_list() else 'pa.list_(pa.string())'
+        # end if
+        return self.ARROW_TYPE_MAP[self.type]
+    # end def
+
     TYPE_MAP = {
         'Integer': 'int',
         'String': 'str',
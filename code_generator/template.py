@@ -43,6 +43,8 @@ def get_template(file_name):
 init_template = get_template("init.template")
 classes_template = get_template("classes.template")
 functions_template = get_template("functions.template")
+structs_template = get_template("structs.template")
+arrow_template = get_template("arrow.template")
 
 mkdir_p('../derpi/syncrounous/')
 mkdir_p('../derpi/asyncrounous/')
@@ -68,6 +70,13 @@ with open('../derpi/asyncrounous/models.py', 'w') as f:
     f.write(classes_template.render(classes=classes, is_asyncio=True))
 # end with
 
+with open('../derpi/structs.py', 'w') as f:
+    f.write(structs_template.render(classes=classes, routes=routes))
+# end with
+
+with open('../derpi/export/arrow_schemas.py', 'w') as f:
+    f.write(arrow_template.render(classes=classes))
+# end with
 
 
 
@@ -3,15 +3,45 @@
 
 __author__ = 'luckydonald'
 
+import asyncio
+
 from luckydonaldUtils.logger import logging
 from luckydonaldUtils.exceptions import assert_type_or_raise
 
-from typing import Union, List, Dict, Type, Any
+from typing import Union, List, Dict, Type, Any, AsyncIterator
 from .models import *
+from ..pagination import async_iterate_pages, async_iterate_by_id, async_fan_out_pages, DEFAULT_CONCURRENCY, query_before_id
+from ..pool import AsyncConnectionPool, register
+from ..ratelimit import RateLimiter
+from ..retry import RetryPolicy
+from ..cache import ModelCache
+from ..serialization import loads
+from ..response_cache import CachedResponse, SQLiteResponseCache
+from ..singleflight import AsyncSingleFlight
+from ..conditional import NOT_MODIFIED, validators_of, revalidation_headers_for, is_conditional
+from ..exceptions import DerpiException, DerpiConnectionError, DerpiUnexpectedResponseError, http_error_for
 
 # import httpx, an async http client
 import httpx as internet
 
+# errors of the http library meaning we didn't get any response.
+CONNECTION_ERRORS = (internet.TransportError,)
+
+
+def _new_http_client(max_connections: int, keepalive_expiry: Union[float, None]) -> internet.AsyncClient:
+    """
+    Creates the http client used by the shared `DerpiClient.pool`.
+
+    :param max_connections: Maximum of concurrent connections.
+    :param keepalive_expiry: Seconds an idle connection is kept open.
+    """
+    return internet.AsyncClient(limits=internet.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=keepalive_expiry,
+    ))
+# end def
+
 
 logger = logging.getLogger(__name__)
 if __name__ == '__main__':
@@ -22,7 +52,8 @@ if __name__ == '__main__':
 async def comment(
     comment_id: int,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
-) -> Comment:
+    _raw: bool = False,
+) -> Union[Comment, Dict]:
     """
     Fetches a **comment response** for the comment ID referenced by the `comment_id` URL parameter.
 
@@ -53,15 +84,44 @@ async def comment(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  Comment
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  Comment|Dict
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/comments/{comment_id}')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    _params: Union[Dict, None] = None
+    _headers: Union[Dict[str, str], None] = None
+    cache: Union[ModelCache, None] = None if _raw else DerpiClient.get_cache(_client)  # it holds models, not json.
+    if cache is not None:
+        cache_key = cache.make_key(route='comment', url=_url, params=_params)
+        cached: Union[Comment, None] = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        _headers = cache.revalidation_headers(cache_key)  # if we have an expired result, only ask if it changed.
+    # end if
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params=_params, headers=_headers)
+    if response.status_code == NOT_MODIFIED:
+        cached: Union[Comment, None] = cache.revalidated(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        # it got evicted in the meantime, so we need the full response after all.
+        response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params=_params)
+    # end if
+    result: Dict[str, Dict] = loads(response.content)
     result: Dict = result['comment']
     assert_type_or_raise(result, dict, parameter_name='result')
+    if _raw:
+        return result
+    # end if
     result: Comment = Comment.from_dict(result)
+    if cache is not None:
+        cache.set(cache_key, result, revalidation_headers=revalidation_headers_for(*validators_of(response)))
+    # end if
     return result
 # end def comment
 
@@ -71,7 +131,8 @@ async def image(
     filter_id: Union[int, None] = None,
     key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
-) -> Image:
+    _raw: bool = False,
+) -> Union[Image, Dict]:
     """
     Fetches an **image response** for the image ID referenced by the `image_id` URL parameter.
 
@@ -110,18 +171,47 @@ async def image(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  Image
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  Image|Dict
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/images/{image_id}')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params={
+    _params: Union[Dict, None] = {
         'filter_id': filter_id,
         'key': key,
-    })
-    result: Dict[str, Dict] = response.json()
+    }
+    _headers: Union[Dict[str, str], None] = None
+    cache: Union[ModelCache, None] = None if _raw else DerpiClient.get_cache(_client)  # it holds models, not json.
+    if cache is not None:
+        cache_key = cache.make_key(route='image', url=_url, params=_params)
+        cached: Union[Image, None] = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        _headers = cache.revalidation_headers(cache_key)  # if we have an expired result, only ask if it changed.
+    # end if
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params=_params, headers=_headers)
+    if response.status_code == NOT_MODIFIED:
+        cached: Union[Image, None] = cache.revalidated(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        # it got evicted in the meantime, so we need the full response after all.
+        response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params=_params)
+    # end if
+    result: Dict[str, Dict] = loads(response.content)
     result: Dict = result['image']
     assert_type_or_raise(result, dict, parameter_name='result')
+    if _raw:
+        return result
+    # end if
     result: Image = Image.from_dict(result)
+    if cache is not None:
+        cache.set(cache_key, result, revalidation_headers=revalidation_headers_for(*validators_of(response)))
+    # end if
     return result
 # end def image
 
@@ -130,7 +220,8 @@ async def image_upload(
     url: str,
     key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
-) -> Image:
+    _raw: bool = False,
+) -> Union[Image, Dict]:
     """
     Submits a new image. Both `key` and `url` are required. Errors will result in an `{"errors":image-errors-response}`.
 
@@ -166,17 +257,24 @@ async def image_upload(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  Image
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  Image|Dict
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/images')
     response: internet.Response = await DerpiClient.static_request('POST', url=_url, client=_client, params={
         'url': url,
         'key': key,
     })
-    result: Dict[str, Dict] = response.json()
+    result: Dict[str, Dict] = loads(response.content)
     result: Dict = result['image']
     assert_type_or_raise(result, dict, parameter_name='result')
+    if _raw:
+        return result
+    # end if
     result: Image = Image.from_dict(result)
     return result
 # end def image_upload
@@ -184,7 +282,8 @@ async def image_upload(
 
 async def featured_image(
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
-) -> Image:
+    _raw: bool = False,
+) -> Union[Image, Dict]:
     """
     Fetches an **image response** for the for the current featured image.
 
@@ -212,15 +311,44 @@ async def featured_image(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  Image
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  Image|Dict
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/images/featured')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    _params: Union[Dict, None] = None
+    _headers: Union[Dict[str, str], None] = None
+    cache: Union[ModelCache, None] = None if _raw else DerpiClient.get_cache(_client)  # it holds models, not json.
+    if cache is not None:
+        cache_key = cache.make_key(route='featured_image', url=_url, params=_params)
+        cached: Union[Image, None] = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        _headers = cache.revalidation_headers(cache_key)  # if we have an expired result, only ask if it changed.
+    # end if
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params=_params, headers=_headers)
+    if response.status_code == NOT_MODIFIED:
+        cached: Union[Image, None] = cache.revalidated(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        # it got evicted in the meantime, so we need the full response after all.
+        response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params=_params)
+    # end if
+    result: Dict[str, Dict] = loads(response.content)
     result: Dict = result['image']
     assert_type_or_raise(result, dict, parameter_name='result')
+    if _raw:
+        return result
+    # end if
     result: Image = Image.from_dict(result)
+    if cache is not None:
+        cache.set(cache_key, result, revalidation_headers=revalidation_headers_for(*validators_of(response)))
+    # end if
     return result
 # end def featured_image
 
@@ -228,7 +356,8 @@ async def featured_image(
 async def tag(
     tag_id: str,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
-) -> Tag:
+    _raw: bool = False,
+) -> Union[Tag, Dict]:
     """
     Fetches a **tag response** for the **tag slug** given by the `tag_id` URL parameter. The tag's ID is **not** used. For getting a tag by ID the search endpoint can be used like `search/tags?q=id:4458`.
 
@@ -259,15 +388,44 @@ async def tag(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  Tag
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  Tag|Dict
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/tags/{tag_id}')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    _params: Union[Dict, None] = None
+    _headers: Union[Dict[str, str], None] = None
+    cache: Union[ModelCache, None] = None if _raw else DerpiClient.get_cache(_client)  # it holds models, not json.
+    if cache is not None:
+        cache_key = cache.make_key(route='tag', url=_url, params=_params)
+        cached: Union[Tag, None] = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        _headers = cache.revalidation_headers(cache_key)  # if we have an expired result, only ask if it changed.
+    # end if
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params=_params, headers=_headers)
+    if response.status_code == NOT_MODIFIED:
+        cached: Union[Tag, None] = cache.revalidated(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        # it got evicted in the meantime, so we need the full response after all.
+        response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params=_params)
+    # end if
+    result: Dict[str, Dict] = loads(response.content)
     result: Dict = result['tag']
     assert_type_or_raise(result, dict, parameter_name='result')
+    if _raw:
+        return result
+    # end if
     result: Tag = Tag.from_dict(result)
+    if cache is not None:
+        cache.set(cache_key, result, revalidation_headers=revalidation_headers_for(*validators_of(response)))
+    # end if
     return result
 # end def tag
 
@@ -275,7 +433,8 @@ async def tag(
 async def post(
     post_id: int,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
-) -> Post:
+    _raw: bool = False,
+) -> Union[Post, Dict]:
     """
     Fetches a **post response** for the post ID given by the `post_id` URL parameter.
 
@@ -306,15 +465,44 @@ async def post(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  Post
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  Post|Dict
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/posts/{post_id}')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    _params: Union[Dict, None] = None
+    _headers: Union[Dict[str, str], None] = None
+    cache: Union[ModelCache, None] = None if _raw else DerpiClient.get_cache(_client)  # it holds models, not json.
+    if cache is not None:
+        cache_key = cache.make_key(route='post', url=_url, params=_params)
+        cached: Union[Post, None] = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        _headers = cache.revalidation_headers(cache_key)  # if we have an expired result, only ask if it changed.
+    # end if
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params=_params, headers=_headers)
+    if response.status_code == NOT_MODIFIED:
+        cached: Union[Post, None] = cache.revalidated(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        # it got evicted in the meantime, so we need the full response after all.
+        response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params=_params)
+    # end if
+    result: Dict[str, Dict] = loads(response.content)
     result: Dict = result['post']
     assert_type_or_raise(result, dict, parameter_name='result')
+    if _raw:
+        return result
+    # end if
     result: Post = Post.from_dict(result)
+    if cache is not None:
+        cache.set(cache_key, result, revalidation_headers=revalidation_headers_for(*validators_of(response)))
+    # end if
     return result
 # end def post
 
@@ -322,7 +510,8 @@ async def post(
 async def user(
     user_id: int,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
-) -> User:
+    _raw: bool = False,
+) -> Union[User, Dict]:
     """
     Fetches a **profile response** for the user ID given by the `user_id` URL parameter.
 
@@ -353,15 +542,44 @@ async def user(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  User
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  User|Dict
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/profiles/{user_id}')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    _params: Union[Dict, None] = None
+    _headers: Union[Dict[str, str], None] = None
+    cache: Union[ModelCache, None] = None if _raw else DerpiClient.get_cache(_client)  # it holds models, not json.
+    if cache is not None:
+        cache_key = cache.make_key(route='user', url=_url, params=_params)
+        cached: Union[User, None] = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        _headers = cache.revalidation_headers(cache_key)  # if we have an expired result, only ask if it changed.
+    # end if
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params=_params, headers=_headers)
+    if response.status_code == NOT_MODIFIED:
+        cached: Union[User, None] = cache.revalidated(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        # it got evicted in the meantime, so we need the full response after all.
+        response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params=_params)
+    # end if
+    result: Dict[str, Dict] = loads(response.content)
     result: Dict = result['user']
     assert_type_or_raise(result, dict, parameter_name='result')
+    if _raw:
+        return result
+    # end if
     result: User = User.from_dict(result)
+    if cache is not None:
+        cache.set(cache_key, result, revalidation_headers=revalidation_headers_for(*validators_of(response)))
+    # end if
     return result
 # end def user
 
@@ -370,7 +588,8 @@ async def filter(
     filter_id: int,
     key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
-) -> Filter:
+    _raw: bool = False,
+) -> Union[Filter, Dict]:
     """
     Fetches a **filter response** for the filter ID given by the `filter_id` URL parameter.
 
@@ -406,17 +625,46 @@ async def filter(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  Filter
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  Filter|Dict
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/filters/{filter_id}')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params={
+    _params: Union[Dict, None] = {
         'key': key,
-    })
-    result: Dict[str, Dict] = response.json()
+    }
+    _headers: Union[Dict[str, str], None] = None
+    cache: Union[ModelCache, None] = None if _raw else DerpiClient.get_cache(_client)  # it holds models, not json.
+    if cache is not None:
+        cache_key = cache.make_key(route='filter', url=_url, params=_params)
+        cached: Union[Filter, None] = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        _headers = cache.revalidation_headers(cache_key)  # if we have an expired result, only ask if it changed.
+    # end if
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params=_params, headers=_headers)
+    if response.status_code == NOT_MODIFIED:
+        cached: Union[Filter, None] = cache.revalidated(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        # it got evicted in the meantime, so we need the full response after all.
+        response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params=_params)
+    # end if
+    result: Dict[str, Dict] = loads(response.content)
     result: Dict = result['filter']
     assert_type_or_raise(result, dict, parameter_name='result')
+    if _raw:
+        return result
+    # end if
     result: Filter = Filter.from_dict(result)
+    if cache is not None:
+        cache.set(cache_key, result, revalidation_headers=revalidation_headers_for(*validators_of(response)))
+    # end if
     return result
 # end def filter
 
@@ -424,7 +672,8 @@ async def filter(
 async def system_filters(
     page: Union[int, None] = None,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
-) -> List[Filter]:
+    _raw: bool = False,
+) -> Union[List[Filter], List[Dict]]:
     """
     Fetches a list of **filter responses** that are flagged as being **system** filters (and thus usable by anyone).
 
@@ -455,29 +704,73 @@ async def system_filters(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  List[Filter]
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  List[Filter]|List[Dict]
+    """
+    result: SearchResult[Filter] = await system_filters_with_total(
+        page=page,
+        _client=_client,
+        _raw=_raw,
+    )
+    return result.hits
+# end def system_filters
+
+
+async def system_filters_with_total(
+    page: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: bool = False,
+) -> Union[SearchResult[Filter], SearchResult[Dict]]:
+    """
+    Same as `system_filters(...)`, but additionally returns the `total` amount of results the API reported,
+    e.g. to know the number of pages before requesting them.
+    The `total` is `None` if the API didn't send one.
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient`, or just an already opened `httpx.AsyncClient`.
+                    See `system_filters(...)` for examples.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+    :rtype:  SearchResult[Filter]|SearchResult[Dict]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/filters/system')
     response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params={
         'page': page,
     })
-    result: Dict[str, List[Dict]] = response.json()
-    result: List[Dict] = result['filters']
-    assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Filter] = [
-        Filter.from_dict(item)
-        for item in result
-    ]
+    result: Dict[str, Union[List[Dict], int]] = loads(response.content)
+    hits: List[Dict] = result['filters']
+    assert_type_or_raise(hits, list, parameter_name='hits')
+    if _raw:
+        return SearchResult(hits=hits, total=result.get('total', None))
+    # end if
+    result: SearchResult[Filter] = SearchResult(
+        hits=[
+            Filter.from_dict(item)
+            for item in hits
+        ],
+        total=result.get('total', None),
+    )
     return result
-# end def system_filters
+# end def system_filters_with_total
 
 
 async def user_filters(
     key: str,
     page: Union[int, None] = None,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
-) -> List[Filter]:
+    _raw: bool = False,
+) -> Union[List[Filter], List[Dict]]:
     """
     Fetches a list of **filter responses** that belong to the user given by **key**. If no **key** is given or it is invalid, will return a **403 Forbidden** error.
 
@@ -513,29 +806,80 @@ async def user_filters(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  List[Filter]
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  List[Filter]|List[Dict]
+    """
+    result: SearchResult[Filter] = await user_filters_with_total(
+        key=key,
+        page=page,
+        _client=_client,
+        _raw=_raw,
+    )
+    return result.hits
+# end def user_filters
+
+
+async def user_filters_with_total(
+    key: str,
+    page: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: bool = False,
+) -> Union[SearchResult[Filter], SearchResult[Dict]]:
+    """
+    Same as `user_filters(...)`, but additionally returns the `total` amount of results the API reported,
+    e.g. to know the number of pages before requesting them.
+    The `total` is `None` if the API didn't send one.
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient`, or just an already opened `httpx.AsyncClient`.
+                    See `user_filters(...)` for examples.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+    :rtype:  SearchResult[Filter]|SearchResult[Dict]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/filters/user')
     response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params={
         'key': key,
         'page': page,
     })
-    result: Dict[str, List[Dict]] = response.json()
-    result: List[Dict] = result['filters']
-    assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Filter] = [
-        Filter.from_dict(item)
-        for item in result
-    ]
+    result: Dict[str, Union[List[Dict], int]] = loads(response.content)
+    hits: List[Dict] = result['filters']
+    assert_type_or_raise(hits, list, parameter_name='hits')
+    if _raw:
+        return SearchResult(hits=hits, total=result.get('total', None))
+    # end if
+    result: SearchResult[Filter] = SearchResult(
+        hits=[
+            Filter.from_dict(item)
+            for item in hits
+        ],
+        total=result.get('total', None),
+    )
     return result
-# end def user_filters
+# end def user_filters_with_total
 
 
 async def oembed(
     url: str,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
-) -> Oembed:
+    _raw: bool = False,
+) -> Union[Oembed, Dict]:
     """
     Fetches an **oEmbed response** for the given app link or CDN URL.
 
@@ -566,16 +910,45 @@ async def oembed(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  Oembed
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  Oembed|Dict
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/oembed')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params={
+    _params: Union[Dict, None] = {
         'url': url,
-    })
-    result: Dict = response.json()
+    }
+    _headers: Union[Dict[str, str], None] = None
+    cache: Union[ModelCache, None] = None if _raw else DerpiClient.get_cache(_client)  # it holds models, not json.
+    if cache is not None:
+        cache_key = cache.make_key(route='oembed', url=_url, params=_params)
+        cached: Union[Oembed, None] = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        _headers = cache.revalidation_headers(cache_key)  # if we have an expired result, only ask if it changed.
+    # end if
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params=_params, headers=_headers)
+    if response.status_code == NOT_MODIFIED:
+        cached: Union[Oembed, None] = cache.revalidated(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        # it got evicted in the meantime, so we need the full response after all.
+        response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params=_params)
+    # end if
+    result: Dict = loads(response.content)
     assert_type_or_raise(result, dict, parameter_name='result')
+    if _raw:
+        return result
+    # end if
     result: Oembed = Oembed.from_dict(result)
+    if cache is not None:
+        cache.set(cache_key, result, revalidation_headers=revalidation_headers_for(*validators_of(response)))
+    # end if
     return result
 # end def oembed
 
@@ -585,7 +958,8 @@ async def search_comments(
     page: Union[int, None] = None,
     key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
-) -> List[Comment]:
+    _raw: bool = False,
+) -> Union[List[Comment], List[Dict]]:
     """
     Executes the search given by the `q` query parameter (case insensitive and stemming is applied. If you search for **best pony** results like **Best Ponies** are also be returned), and returns **comment responses** sorted by descending creation time.
 
@@ -625,8 +999,58 @@ async def search_comments(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  List[Comment]
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  List[Comment]|List[Dict]
+    """
+    result: SearchResult[Comment] = await search_comments_with_total(
+        query=query,
+        page=page,
+        key=key,
+        _client=_client,
+        _raw=_raw,
+    )
+    return result.hits
+# end def search_comments
+
+
+async def search_comments_with_total(
+    query: str,
+    page: Union[int, None] = None,
+    key: Union[str, None] = None,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: bool = False,
+) -> Union[SearchResult[Comment], SearchResult[Dict]]:
+    """
+    Same as `search_comments(...)`, but additionally returns the `total` amount of results the API reported,
+    e.g. to know the number of pages before requesting them.
+    The `total` is `None` if the API didn't send one.
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient`, or just an already opened `httpx.AsyncClient`.
+                    See `search_comments(...)` for examples.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+    :rtype:  SearchResult[Comment]|SearchResult[Dict]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/comments')
     response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params={
@@ -634,15 +1058,21 @@ async def search_comments(
         'page': page,
         'key': key,
     })
-    result: Dict[str, List[Dict]] = response.json()
-    result: List[Dict] = result['comments']
-    assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Comment] = [
-        Comment.from_dict(item)
-        for item in result
-    ]
+    result: Dict[str, Union[List[Dict], int]] = loads(response.content)
+    hits: List[Dict] = result['comments']
+    assert_type_or_raise(hits, list, parameter_name='hits')
+    if _raw:
+        return SearchResult(hits=hits, total=result.get('total', None))
+    # end if
+    result: SearchResult[Comment] = SearchResult(
+        hits=[
+            Comment.from_dict(item)
+            for item in hits
+        ],
+        total=result.get('total', None),
+    )
     return result
-# end def search_comments
+# end def search_comments_with_total
 
 
 async def search_galleries(
@@ -650,7 +1080,8 @@ async def search_galleries(
     page: Union[int, None] = None,
     key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
-) -> List[Gallery]:
+    _raw: bool = False,
+) -> Union[List[Gallery], List[Dict]]:
     """
     Executes the search given by the `q` query parameter, and returns **gallery responses** sorted by descending creation time.
 
@@ -690,8 +1121,58 @@ async def search_galleries(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  List[Gallery]
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  List[Gallery]|List[Dict]
+    """
+    result: SearchResult[Gallery] = await search_galleries_with_total(
+        query=query,
+        page=page,
+        key=key,
+        _client=_client,
+        _raw=_raw,
+    )
+    return result.hits
+# end def search_galleries
+
+
+async def search_galleries_with_total(
+    query: str,
+    page: Union[int, None] = None,
+    key: Union[str, None] = None,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: bool = False,
+) -> Union[SearchResult[Gallery], SearchResult[Dict]]:
+    """
+    Same as `search_galleries(...)`, but additionally returns the `total` amount of results the API reported,
+    e.g. to know the number of pages before requesting them.
+    The `total` is `None` if the API didn't send one.
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient`, or just an already opened `httpx.AsyncClient`.
+                    See `search_galleries(...)` for examples.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+    :rtype:  SearchResult[Gallery]|SearchResult[Dict]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/galleries')
     response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params={
@@ -699,15 +1180,21 @@ async def search_galleries(
         'page': page,
         'key': key,
     })
-    result: Dict[str, List[Dict]] = response.json()
-    result: List[Dict] = result['galleries']
-    assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Gallery] = [
-        Gallery.from_dict(item)
-        for item in result
-    ]
+    result: Dict[str, Union[List[Dict], int]] = loads(response.content)
+    hits: List[Dict] = result['galleries']
+    assert_type_or_raise(hits, list, parameter_name='hits')
+    if _raw:
+        return SearchResult(hits=hits, total=result.get('total', None))
+    # end if
+    result: SearchResult[Gallery] = SearchResult(
+        hits=[
+            Gallery.from_dict(item)
+            for item in hits
+        ],
+        total=result.get('total', None),
+    )
     return result
-# end def search_galleries
+# end def search_galleries_with_total
 
 
 async def search_posts(
@@ -715,7 +1202,8 @@ async def search_posts(
     page: Union[int, None] = None,
     key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
-) -> List[Post]:
+    _raw: bool = False,
+) -> Union[List[Post], List[Dict]]:
     """
     Executes the search given by the `q` query parameter, and returns **post responses** sorted by descending creation time.
 
@@ -755,8 +1243,58 @@ async def search_posts(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  List[Post]
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  List[Post]|List[Dict]
+    """
+    result: SearchResult[Post] = await search_posts_with_total(
+        query=query,
+        page=page,
+        key=key,
+        _client=_client,
+        _raw=_raw,
+    )
+    return result.hits
+# end def search_posts
+
+
+async def search_posts_with_total(
+    query: str,
+    page: Union[int, None] = None,
+    key: Union[str, None] = None,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: bool = False,
+) -> Union[SearchResult[Post], SearchResult[Dict]]:
+    """
+    Same as `search_posts(...)`, but additionally returns the `total` amount of results the API reported,
+    e.g. to know the number of pages before requesting them.
+    The `total` is `None` if the API didn't send one.
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient`, or just an already opened `httpx.AsyncClient`.
+                    See `search_posts(...)` for examples.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+    :rtype:  SearchResult[Post]|SearchResult[Dict]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/posts')
     response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params={
@@ -764,15 +1302,21 @@ async def search_posts(
         'page': page,
         'key': key,
     })
-    result: Dict[str, List[Dict]] = response.json()
-    result: List[Dict] = result['posts']
-    assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Post] = [
-        Post.from_dict(item)
-        for item in result
-    ]
+    result: Dict[str, Union[List[Dict], int]] = loads(response.content)
+    hits: List[Dict] = result['posts']
+    assert_type_or_raise(hits, list, parameter_name='hits')
+    if _raw:
+        return SearchResult(hits=hits, total=result.get('total', None))
+    # end if
+    result: SearchResult[Post] = SearchResult(
+        hits=[
+            Post.from_dict(item)
+            for item in hits
+        ],
+        total=result.get('total', None),
+    )
     return result
-# end def search_posts
+# end def search_posts_with_total
 
 
 async def search_images(
@@ -784,7 +1328,8 @@ async def search_images(
     sort_field: Union[str, None] = None,
     key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
-) -> List[Image]:
+    _raw: bool = False,
+) -> Union[List[Image], List[Dict]]:
     """
     Executes the search given by the `q` query parameter, and returns **image responses**.
 
@@ -838,53 +1383,198 @@ async def search_images(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  List[Image]
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  List[Image]|List[Dict]
     """
-    _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/images')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params={
-        'q': query,
-        'filter_id': filter_id,
-        'page': page,
-        'per_page': per_page,
-        'sd': sort_direction,
-        'sf': sort_field,
-        'key': key,
-    })
-    result: Dict[str, List[Dict]] = response.json()
-    result: List[Dict] = result['images']
-    assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Image] = [
-        Image.from_dict(item)
-        for item in result
-    ]
-    return result
+    result: SearchResult[Image] = await search_images_with_total(
+        query=query,
+        filter_id=filter_id,
+        page=page,
+        per_page=per_page,
+        sort_direction=sort_direction,
+        sort_field=sort_field,
+        key=key,
+        _client=_client,
+        _raw=_raw,
+    )
+    return result.hits
 # end def search_images
 
 
-async def search_tags(
+async def search_images_with_total(
     query: str,
+    filter_id: Union[int, None] = None,
     page: Union[int, None] = None,
+    per_page: Union[int, None] = None,
+    sort_direction: Union[str, None] = None,
+    sort_field: Union[str, None] = None,
+    key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
-) -> List[Tag]:
+    _raw: bool = False,
+) -> Union[SearchResult[Image], SearchResult[Dict]]:
     """
-    Executes the search given by the `q` query parameter, and returns **tag responses** sorted by descending image count.
-
-    A request will be sent to the following endpoint: `/api/v1/json/search/tags`
-    It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
-    which would for example look like this: https://derpibooru.org/api/v1/json/search/tags?q=analyzed_name:wing
-
-    The API should return json looking like `{"tags":[Tag]}` which will then be parsed to the python result `List[Tag]`.
+    Same as `search_images(...)`, but additionally returns the `total` amount of results the API reported,
+    e.g. to know the number of pages before requesting them.
+    The `total` is `None` if the API didn't send one.
     
     :param query: The current search query, if the request is a search request.
                   Note, on derpibooru's side this parameter is called `q`.
     :type  query: str
     
+    :param filter_id: Assuming the user can access the filter ID given by the parameter, overrides the current filter for this request. This is primarily useful for unauthenticated API access.
+    :type  filter_id: int|None
+    
     :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
     :type  page: int|None
     
-    :param _client: If you wanna to provide your custom `DerpiClient`, or just an already opened `httpx.AsyncClient`.
-                    Example with `httpx.AsyncClient`:
+    :param per_page: Controls the number of results per page, up to a limit of 50, if the response is paginated. The default is 25.
+    :type  per_page: int|None
+    
+    :param sort_direction: The current sort direction, if the request is a search request.
+                           Note, on derpibooru's side this parameter is called `sd`.
+    :type  sort_direction: str|None
+    
+    :param sort_field: The current sort field, if the request is a search request.
+                       Note, on derpibooru's side this parameter is called `sf`.
+    :type  sort_field: str|None
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient`, or just an already opened `httpx.AsyncClient`.
+                    See `search_images(...)` for examples.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+    :rtype:  SearchResult[Image]|SearchResult[Dict]
+    """
+    _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/images')
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params={
+        'q': query,
+        'filter_id': filter_id,
+        'page': page,
+        'per_page': per_page,
+        'sd': sort_direction,
+        'sf': sort_field,
+        'key': key,
+    })
+    result: Dict[str, Union[List[Dict], int]] = loads(response.content)
+    hits: List[Dict] = result['images']
+    assert_type_or_raise(hits, list, parameter_name='hits')
+    if _raw:
+        return SearchResult(hits=hits, total=result.get('total', None))
+    # end if
+    result: SearchResult[Image] = SearchResult(
+        hits=[
+            Image.from_dict(item)
+            for item in hits
+        ],
+        total=result.get('total', None),
+    )
+    return result
+# end def search_images_with_total
+
+
+async def search_images_batch(
+    query: str,
+    filter_id: Union[int, None] = None,
+    page: Union[int, None] = None,
+    per_page: Union[int, None] = None,
+    sort_direction: Union[str, None] = None,
+    sort_field: Union[str, None] = None,
+    key: Union[str, None] = None,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+) -> 'ImageBatch':
+    """
+    Same as `search_images(...)`, but returns the page as columnar `ImageBatch` of numpy arrays,
+    built directly from the response without creating `Image` models. Needs numpy to be installed.
+    Use `ImageBatch.concatenate(...)` to join multiple pages.
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param filter_id: Assuming the user can access the filter ID given by the parameter, overrides the current filter for this request. This is primarily useful for unauthenticated API access.
+    :type  filter_id: int|None
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param per_page: Controls the number of results per page, up to a limit of 50, if the response is paginated. The default is 25.
+    :type  per_page: int|None
+    
+    :param sort_direction: The current sort direction, if the request is a search request.
+                           Note, on derpibooru's side this parameter is called `sd`.
+    :type  sort_direction: str|None
+    
+    :param sort_field: The current sort field, if the request is a search request.
+                       Note, on derpibooru's side this parameter is called `sf`.
+    :type  sort_field: str|None
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient`, or just an already opened `httpx.AsyncClient`.
+                    See `search_images(...)` for examples.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+
+    :return: The images of that page, and the total amount of results.
+    :rtype:  derpi.batch.ImageBatch
+    """
+    from ..batch import ImageBatch  # numpy is optional, so only import it when needed.
+    _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/images')
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params={
+        'q': query,
+        'filter_id': filter_id,
+        'page': page,
+        'per_page': per_page,
+        'sd': sort_direction,
+        'sf': sort_field,
+        'key': key,
+    })
+    result: Dict[str, Union[List[Dict], int]] = loads(response.content)
+    hits: List[Dict] = result['images']
+    assert_type_or_raise(hits, list, parameter_name='hits')
+    return ImageBatch.from_dicts(hits, total=result.get('total', None))
+# end def search_images_batch
+
+
+async def search_tags(
+    query: str,
+    page: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: bool = False,
+) -> Union[List[Tag], List[Dict]]:
+    """
+    Executes the search given by the `q` query parameter, and returns **tag responses** sorted by descending image count.
+
+    A request will be sent to the following endpoint: `/api/v1/json/search/tags`
+    It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
+    which would for example look like this: https://derpibooru.org/api/v1/json/search/tags?q=analyzed_name:wing
+
+    The API should return json looking like `{"tags":[Tag]}` which will then be parsed to the python result `List[Tag]`.
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient`, or just an already opened `httpx.AsyncClient`.
+                    Example with `httpx.AsyncClient`:
                     >>> async with httpx.AsyncClient() as client:
                     ...    result = await search_tags(..., _client=client)
 
@@ -901,23 +1591,72 @@ async def search_tags(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  List[Tag]
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  List[Tag]|List[Dict]
+    """
+    result: SearchResult[Tag] = await search_tags_with_total(
+        query=query,
+        page=page,
+        _client=_client,
+        _raw=_raw,
+    )
+    return result.hits
+# end def search_tags
+
+
+async def search_tags_with_total(
+    query: str,
+    page: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: bool = False,
+) -> Union[SearchResult[Tag], SearchResult[Dict]]:
+    """
+    Same as `search_tags(...)`, but additionally returns the `total` amount of results the API reported,
+    e.g. to know the number of pages before requesting them.
+    The `total` is `None` if the API didn't send one.
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient`, or just an already opened `httpx.AsyncClient`.
+                    See `search_tags(...)` for examples.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+    :rtype:  SearchResult[Tag]|SearchResult[Dict]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/tags')
     response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params={
         'q': query,
         'page': page,
     })
-    result: Dict[str, List[Dict]] = response.json()
-    result: List[Dict] = result['tags']
-    assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Tag] = [
-        Tag.from_dict(item)
-        for item in result
-    ]
+    result: Dict[str, Union[List[Dict], int]] = loads(response.content)
+    hits: List[Dict] = result['tags']
+    assert_type_or_raise(hits, list, parameter_name='hits')
+    if _raw:
+        return SearchResult(hits=hits, total=result.get('total', None))
+    # end if
+    result: SearchResult[Tag] = SearchResult(
+        hits=[
+            Tag.from_dict(item)
+            for item in hits
+        ],
+        total=result.get('total', None),
+    )
     return result
-# end def search_tags
+# end def search_tags_with_total
 
 
 async def search_reverse(
@@ -925,7 +1664,8 @@ async def search_reverse(
     distance: Union[float, None] = None,
     key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
-) -> List[Image]:
+    _raw: bool = False,
+) -> Union[List[Image], List[Dict]]:
     """
     Returns **image responses** based on the results of reverse-searching the image given by the `url` query parameter.
 
@@ -964,8 +1704,12 @@ async def search_reverse(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  List[Image]
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  List[Image]|List[Dict]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/reverse')
     response: internet.Response = await DerpiClient.static_request('POST', url=_url, client=_client, params={
@@ -973,9 +1717,12 @@ async def search_reverse(
         'distance': distance,
         'key': key,
     })
-    result: Dict[str, List[Dict]] = response.json()
+    result: Dict[str, List[Dict]] = loads(response.content)
     result: List[Dict] = result['images']
     assert_type_or_raise(result, list, parameter_name='result')
+    if _raw:
+        return result
+    # end if
     result: List[Image] = [
         Image.from_dict(item)
         for item in result
@@ -986,7 +1733,8 @@ async def search_reverse(
 
 async def forums(
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
-) -> List[Forum]:
+    _raw: bool = False,
+) -> Union[List[Forum], List[Dict]]:
     """
     Fetches a list of **forum responses**.
 
@@ -1014,14 +1762,21 @@ async def forums(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  List[Forum]
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  List[Forum]|List[Dict]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/forums')
     response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, List[Dict]] = response.json()
+    result: Dict[str, List[Dict]] = loads(response.content)
     result: List[Dict] = result['forums']
     assert_type_or_raise(result, list, parameter_name='result')
+    if _raw:
+        return result
+    # end if
     result: List[Forum] = [
         Forum.from_dict(item)
         for item in result
@@ -1033,7 +1788,8 @@ async def forums(
 async def forum(
     short_name: str,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
-) -> Forum:
+    _raw: bool = False,
+) -> Union[Forum, Dict]:
     """
     Fetches a **forum response** for the abbreviated name given by the `short_name` URL parameter.
 
@@ -1064,15 +1820,44 @@ async def forum(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  Forum
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  Forum|Dict
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/forums/{short_name}')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    _params: Union[Dict, None] = None
+    _headers: Union[Dict[str, str], None] = None
+    cache: Union[ModelCache, None] = None if _raw else DerpiClient.get_cache(_client)  # it holds models, not json.
+    if cache is not None:
+        cache_key = cache.make_key(route='forum', url=_url, params=_params)
+        cached: Union[Forum, None] = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        _headers = cache.revalidation_headers(cache_key)  # if we have an expired result, only ask if it changed.
+    # end if
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params=_params, headers=_headers)
+    if response.status_code == NOT_MODIFIED:
+        cached: Union[Forum, None] = cache.revalidated(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        # it got evicted in the meantime, so we need the full response after all.
+        response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params=_params)
+    # end if
+    result: Dict[str, Dict] = loads(response.content)
     result: Dict = result['forum']
     assert_type_or_raise(result, dict, parameter_name='result')
+    if _raw:
+        return result
+    # end if
     result: Forum = Forum.from_dict(result)
+    if cache is not None:
+        cache.set(cache_key, result, revalidation_headers=revalidation_headers_for(*validators_of(response)))
+    # end if
     return result
 # end def forum
 
@@ -1081,7 +1866,8 @@ async def forum_topics(
     short_name: str,
     page: Union[int, None] = None,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
-) -> List[Topic]:
+    _raw: bool = False,
+) -> Union[List[Topic], List[Dict]]:
     """
     Fetches a list of **topic responses** for the abbreviated forum name given by the `short_name` URL parameter.
 
@@ -1115,29 +1901,78 @@ async def forum_topics(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  List[Topic]
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  List[Topic]|List[Dict]
+    """
+    result: SearchResult[Topic] = await forum_topics_with_total(
+        short_name=short_name,
+        page=page,
+        _client=_client,
+        _raw=_raw,
+    )
+    return result.hits
+# end def forum_topics
+
+
+async def forum_topics_with_total(
+    short_name: str,
+    page: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: bool = False,
+) -> Union[SearchResult[Topic], SearchResult[Dict]]:
+    """
+    Same as `forum_topics(...)`, but additionally returns the `total` amount of results the API reported,
+    e.g. to know the number of pages before requesting them.
+    The `total` is `None` if the API didn't send one.
+    
+    :param short_name: the variable short_name part of the url.
+    :type  short_name: str
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient`, or just an already opened `httpx.AsyncClient`.
+                    See `forum_topics(...)` for examples.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+    :rtype:  SearchResult[Topic]|SearchResult[Dict]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/forums/{short_name}/topics')
     response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params={
         'page': page,
     })
-    result: Dict[str, List[Dict]] = response.json()
-    result: List[Dict] = result['topics']
-    assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Topic] = [
-        Topic.from_dict(item)
-        for item in result
-    ]
+    result: Dict[str, Union[List[Dict], int]] = loads(response.content)
+    hits: List[Dict] = result['topics']
+    assert_type_or_raise(hits, list, parameter_name='hits')
+    if _raw:
+        return SearchResult(hits=hits, total=result.get('total', None))
+    # end if
+    result: SearchResult[Topic] = SearchResult(
+        hits=[
+            Topic.from_dict(item)
+            for item in hits
+        ],
+        total=result.get('total', None),
+    )
     return result
-# end def forum_topics
+# end def forum_topics_with_total
 
 
 async def forum_topic(
     short_name: str,
     topic_slug: str,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
-) -> Topic:
+    _raw: bool = False,
+) -> Union[Topic, Dict]:
     """
     Fetches a **topic response** for the abbreviated forum name given by the `short_name` and topic given by `topic_slug` URL parameters.
 
@@ -1171,15 +2006,44 @@ async def forum_topic(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  Topic
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  Topic|Dict
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/forums/{short_name}/topics/{topic_slug}')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    _params: Union[Dict, None] = None
+    _headers: Union[Dict[str, str], None] = None
+    cache: Union[ModelCache, None] = None if _raw else DerpiClient.get_cache(_client)  # it holds models, not json.
+    if cache is not None:
+        cache_key = cache.make_key(route='forum_topic', url=_url, params=_params)
+        cached: Union[Topic, None] = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        _headers = cache.revalidation_headers(cache_key)  # if we have an expired result, only ask if it changed.
+    # end if
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params=_params, headers=_headers)
+    if response.status_code == NOT_MODIFIED:
+        cached: Union[Topic, None] = cache.revalidated(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        # it got evicted in the meantime, so we need the full response after all.
+        response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params=_params)
+    # end if
+    result: Dict[str, Dict] = loads(response.content)
     result: Dict = result['topic']
     assert_type_or_raise(result, dict, parameter_name='result')
+    if _raw:
+        return result
+    # end if
     result: Topic = Topic.from_dict(result)
+    if cache is not None:
+        cache.set(cache_key, result, revalidation_headers=revalidation_headers_for(*validators_of(response)))
+    # end if
     return result
 # end def forum_topic
 
@@ -1189,7 +2053,8 @@ async def forum_posts(
     topic_slug: str,
     page: Union[int, None] = None,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
-) -> List[Post]:
+    _raw: bool = False,
+) -> Union[List[Post], List[Dict]]:
     """
     Fetches a list of **post responses** for the abbreviated forum name given by the `short_name` and topic given by `topic_slug` URL parameters.
 
@@ -1226,22 +2091,75 @@ async def forum_posts(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  List[Post]
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  List[Post]|List[Dict]
+    """
+    result: SearchResult[Post] = await forum_posts_with_total(
+        short_name=short_name,
+        topic_slug=topic_slug,
+        page=page,
+        _client=_client,
+        _raw=_raw,
+    )
+    return result.hits
+# end def forum_posts
+
+
+async def forum_posts_with_total(
+    short_name: str,
+    topic_slug: str,
+    page: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
+    _raw: bool = False,
+) -> Union[SearchResult[Post], SearchResult[Dict]]:
+    """
+    Same as `forum_posts(...)`, but additionally returns the `total` amount of results the API reported,
+    e.g. to know the number of pages before requesting them.
+    The `total` is `None` if the API didn't send one.
+    
+    :param short_name: the variable short_name part of the url.
+    :type  short_name: str
+    
+    :param topic_slug: the variable topic_slug part of the url.
+    :type  topic_slug: str
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient`, or just an already opened `httpx.AsyncClient`.
+                    See `forum_posts(...)` for examples.
+    :type  _client: httpx.AsyncClient|DerpiClient|None
+
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+    :rtype:  SearchResult[Post]|SearchResult[Dict]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/forums/{short_name}/topics/{topic_slug}/posts')
     response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params={
         'page': page,
     })
-    result: Dict[str, List[Dict]] = response.json()
-    result: List[Dict] = result['posts']
-    assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Post] = [
-        Post.from_dict(item)
-        for item in result
-    ]
+    result: Dict[str, Union[List[Dict], int]] = loads(response.content)
+    hits: List[Dict] = result['posts']
+    assert_type_or_raise(hits, list, parameter_name='hits')
+    if _raw:
+        return SearchResult(hits=hits, total=result.get('total', None))
+    # end if
+    result: SearchResult[Post] = SearchResult(
+        hits=[
+            Post.from_dict(item)
+            for item in hits
+        ],
+        total=result.get('total', None),
+    )
     return result
-# end def forum_posts
+# end def forum_posts_with_total
 
 
 async def forum_post(
@@ -1249,7 +2167,8 @@ async def forum_post(
     topic_slug: str,
     post_id: int,
     _client: Union[None, 'DerpiClient', internet.AsyncClient] = None,
-) -> Post:
+    _raw: bool = False,
+) -> Union[Post, Dict]:
     """
     Fetches a **post response** for the abbreviated forum name given by the `short_name`, topic given by `topic_slug` and post given by `post_id` URL parameters.
 
@@ -1286,15 +2205,44 @@ async def forum_post(
 
     :type  _client: httpx.AsyncClient|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  Post
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  Post|Dict
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/forums/{short_name}/topics/{topic_slug}/posts/{post_id}')
-    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    _params: Union[Dict, None] = None
+    _headers: Union[Dict[str, str], None] = None
+    cache: Union[ModelCache, None] = None if _raw else DerpiClient.get_cache(_client)  # it holds models, not json.
+    if cache is not None:
+        cache_key = cache.make_key(route='forum_post', url=_url, params=_params)
+        cached: Union[Post, None] = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        _headers = cache.revalidation_headers(cache_key)  # if we have an expired result, only ask if it changed.
+    # end if
+    response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params=_params, headers=_headers)
+    if response.status_code == NOT_MODIFIED:
+        cached: Union[Post, None] = cache.revalidated(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        # it got evicted in the meantime, so we need the full response after all.
+        response: internet.Response = await DerpiClient.static_request('GET', url=_url, client=_client, params=_params)
+    # end if
+    result: Dict[str, Dict] = loads(response.content)
     result: Dict = result['post']
     assert_type_or_raise(result, dict, parameter_name='result')
+    if _raw:
+        return result
+    # end if
     result: Post = Post.from_dict(result)
+    if cache is not None:
+        cache.set(cache_key, result, revalidation_headers=revalidation_headers_for(*validators_of(response)))
+    # end if
     return result
 # end def forum_post
 
@@ -1305,9 +2253,48 @@ class DerpiClient(object):
     """
     DEFAULT_BASE_URL = 'https://derpibooru.org'  # default base url.
 
-    def __init__(self, key, client: Union[None, internet.AsyncClient] = None, base_url = None):
+    # Shared http client for all requests not bringing their own.
+    # Use `DerpiClient.pool.configure(max_connections=..., keepalive_expiry=...)` to tune it,
+    # it is closed automatically on exit, or explicitly with `await DerpiClient.pool.aclose()`.
+    pool = register(AsyncConnectionPool(factory=_new_http_client))
+
+    # Limits the requests per second, per base url. Set it here to limit all requests,
+    # or give it to the constructor to only limit the requests of that DerpiClient instance.
+    rate_limiter: Union[RateLimiter, None] = None
+
+    # Decides which failed requests are sent again. Set it here for all requests,
+    # or give it to the constructor for the requests of that DerpiClient instance. `None` disables retrying.
+    retry_policy: Union[RetryPolicy, None] = RetryPolicy()
+
+    # Caches the parsed results of lookups by id, like `image(...)` or `tag(...)`. Set it here for all requests,
+    # or give it to the constructor for the requests of that DerpiClient instance. `None` disables caching.
+    cache: Union[ModelCache, None] = None
+
+    # Stores the raw bodies of `GET` responses on disk, e.g. `SQLiteResponseCache('derpi-cache.sqlite')`,
+    # so restarted jobs don't download everything again. Set it here for all requests,
+    # or give it to the constructor for the requests of that DerpiClient instance. `None` disables it.
+    response_cache: Union[SQLiteResponseCache, None] = None
+
+    # Lets identical `GET` requests running at the same time (in different tasks) share one request to the server.
+    # Set it here for all requests, or give it to the constructor for the requests of that DerpiClient instance.
+    # `None` disables it.
+    single_flight: Union[AsyncSingleFlight, None] = AsyncSingleFlight()
+
+    def __init__(
+        self, key, client: Union[None, internet.AsyncClient] = None, base_url = None,
+        rate_limiter: Union[RateLimiter, None] = None,
+        retry_policy: Union[RetryPolicy, None] = None,
+        cache: Union[ModelCache, None] = None,
+        response_cache: Union[SQLiteResponseCache, None] = None,
+        single_flight: Union[AsyncSingleFlight, None] = None,
+    ):
         """
         :param key: API key
+        :param rate_limiter: Optional `RateLimiter` for the requests of this client, instead of `DerpiClient.rate_limiter`.
+        :param retry_policy: Optional `RetryPolicy` for the requests of this client, instead of `DerpiClient.retry_policy`.
+        :param cache: Optional `ModelCache` for the results of this client, instead of `DerpiClient.cache`.
+        :param response_cache: Optional `SQLiteResponseCache` for the responses of this client, instead of `DerpiClient.response_cache`.
+        :param single_flight: Optional `AsyncSingleFlight` for the requests of this client, instead of `DerpiClient.single_flight`.
         """
         if base_url is None:
             base_url = self.DEFAULT_BASE_URL
@@ -1315,6 +2302,21 @@ class DerpiClient(object):
         self._key = key
         self._client = client
         self._base_url = base_url
+        if rate_limiter is not None:
+            self.rate_limiter = rate_limiter
+        # end if
+        if retry_policy is not None:
+            self.retry_policy = retry_policy
+        # end if
+        if cache is not None:
+            self.cache = cache
+        # end if
+        if response_cache is not None:
+            self.response_cache = response_cache
+        # end if
+        if single_flight is not None:
+            self.single_flight = single_flight
+        # end if
     # end def
 
     @classmethod
@@ -1326,38 +2328,157 @@ class DerpiClient(object):
         # end if
     # end if
 
+    @classmethod
+    def get_cache(cls, client: Union['DerpiClient', Any]) -> Union[ModelCache, None]:
+        if isinstance(client, DerpiClient):
+            return client.cache
+        else:
+            return cls.cache
+        # end if
+    # end def
+
     @classmethod
     async def static_request(
         cls: Type['DerpiClient'],
         method: str,
         url: str,
         params: Union[Dict, None] = None,
-        client: Union[None, internet.AsyncClient, 'DerpiClient'] = None
+        client: Union[None, internet.AsyncClient, 'DerpiClient'] = None,
+        headers: Union[Dict[str, str], None] = None,
+    ) -> internet.Response:
+        """
+        Sends a request, handling rate limiting, retries, the response cache
+        and sharing the response with identical `GET` requests already running.
+
+        :param method: The http method, e.g. `'GET'`.
+        :param url: The full url.
+        :param params: The query parameters.
+        :param client: A `DerpiClient`, or a http client. `None` to use the shared `DerpiClient.pool`.
+        :param headers: Additional headers. If they make it a conditional request, a `304` response is returned as well.
+
+        :raises DerpiException: If the request still failed after all retries.
+        """
+        single_flight: Union[AsyncSingleFlight, None] = client.single_flight if isinstance(client, DerpiClient) else cls.single_flight
+        if single_flight is None or method.upper() != 'GET':
+            return await cls._send_request(method=method, url=url, params=params, client=client, headers=headers)
+        # end if
+        return await single_flight.do(
+            key=single_flight.make_key(method=method, url=url, params=params, headers=headers),
+            function=lambda: cls._send_request(method=method, url=url, params=params, client=client, headers=headers),
+        )
+    # end def
+
+    @classmethod
+    async def _send_request(
+        cls: Type['DerpiClient'],
+        method: str,
+        url: str,
+        params: Union[Dict, None] = None,
+        client: Union[None, internet.AsyncClient, 'DerpiClient'] = None,
+        headers: Union[Dict[str, str], None] = None,
     ) -> internet.Response:
+        """
+        Actually sends a request for `static_request(...)`, without the coalescing of identical ones.
+        """
+        rate_limiter: Union[RateLimiter, None] = cls.rate_limiter
+        retry_policy: Union[RetryPolicy, None] = cls.retry_policy
+        response_cache: Union[SQLiteResponseCache, None] = cls.response_cache
+        base_url: str = cls.DEFAULT_BASE_URL
         if isinstance(client, DerpiClient):
+            rate_limiter = client.rate_limiter
+            retry_policy = client.retry_policy
+            response_cache = client.response_cache
+            base_url = client._base_url
             client: internet.AsyncClient = client._client
         # end if
-        if client is None:  # if we have no client, call ourself recursively with a with statement.
-            async with internet.AsyncClient() as client:
-                return await cls.static_request(method=method, url=url, params=params, client=client)
-            # end with
+        if client is None:  # if we have no client, use the shared one, so we can reuse the open connections.
+            client = cls.pool.get()
         # end if
-        response: internet.Response = await client.request(method=method, url=url, params=params)
-        cls._check_response(response)
-        return response
+        revalidating = False  # if we added conditional headers for an expired body of the response cache
+        if response_cache is not None and method.upper() == 'GET':
+            response_cache_key = response_cache.make_key(method=method, url=url, params=params)
+            body: Union[bytes, None] = response_cache.get(response_cache_key)
+            if body is not None:
+                return CachedResponse(url=url, content=body)
+            # end if
+            if not is_conditional(headers):
+                revalidation_headers = response_cache.revalidation_headers(response_cache_key)
+                if revalidation_headers:
+                    headers = {**(headers or {}), **revalidation_headers}
+                    revalidating = True
+                # end if
+            # end if
+        else:
+            response_cache = None
+        # end if
+        attempt = 0
+        while True:
+            attempt += 1
+            if rate_limiter is not None:
+                await rate_limiter.acquire_async(base_url)
+            # end if
+            try:
+                try:
+                    response: internet.Response = await client.request(method=method, url=url, params=params, headers=headers)
+                except CONNECTION_ERRORS as e:
+                    raise DerpiConnectionError(f'{method} request to {url!r} failed: {e!r}') from e
+                # end try
+                cls._check_response(response, allow_not_modified=is_conditional(headers))
+                if response.status_code == NOT_MODIFIED:
+                    if not revalidating:
+                        return response  # the caller asked for it
+                    # end if
+                    body: Union[bytes, None] = response_cache.revalidated(response_cache_key)
+                    if body is not None:
+                        return CachedResponse(url=url, content=body)
+                    # end if
+                    # it got evicted in the meantime, so we need the full response after all.
+                    headers = {name: value for name, value in headers.items() if name not in revalidation_headers}
+                    revalidating = False
+                    attempt -= 1  # nothing failed, so this doesn't count against the retry budget.
+                    continue
+                # end if
+                if response_cache is not None:
+                    etag, last_modified = validators_of(response)
+                    response_cache.set(response_cache_key, url=url, body=response.content, etag=etag, last_modified=last_modified)
+                # end if
+                return response
+            except DerpiException as e:
+                if retry_policy is None or not retry_policy.should_retry(method=method, attempt=attempt, error=e):
+                    raise
+                # end if
+                delay = retry_policy.delay(attempt=attempt, error=e)
+                logger.warning(f'Attempt {attempt} of {method} request to {url!r} failed, retrying in {delay:.2f}s: {e}')
+                await asyncio.sleep(delay)
+            # end try
+        # end while
     # end def
 
     @staticmethod
-    def _check_response(response: internet.Response) -> None:
+    def _check_response(response: internet.Response, allow_not_modified: bool = False) -> None:
         """
         Makes sure a server response looks valid,
         or raise the appropriate errors if not.
 
         :param response: A requests/httpx response.
         :type  response: requests.Response|httpx.Response
+
+        :param allow_not_modified: If a `304` response is fine as well, because we sent a conditional request.
+        :type  allow_not_modified: bool
+
+        :raises DerpiHttpError: If the status code isn't `200`. Subclasses tell the different kinds of status codes apart.
+        :raises DerpiUnexpectedResponseError: If the response isn't json.
         """
-        assert response.status_code == 200  # TODO
-        assert response.headers['content-type'] == 'application/json; charset=utf-8'
+        if allow_not_modified and response.status_code == NOT_MODIFIED:
+            return
+        # end if
+        if response.status_code != 200:
+            raise http_error_for(response)
+        # end if
+        content_type = response.headers.get('content-type', '')
+        if not content_type.startswith('application/json'):
+            raise DerpiUnexpectedResponseError(f'Expected a json response, but got {content_type!r}.', response=response)
+        # end if
     # end def
     
     # noinspection PyMethodMayBeStatic
@@ -1365,7 +2486,8 @@ class DerpiClient(object):
         self, 
         comment_id: int,
         _client: Union[None, internet.AsyncClient] = None,
-    ) -> Comment:
+        _raw: bool = False,
+    ) -> Union[Comment, Dict]:
         """
         Fetches a **comment response** for the comment ID referenced by the `comment_id` URL parameter.
 
@@ -1385,12 +2507,17 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
-        :return: The parsed result from the API.
-        :rtype:  Comment
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  Comment|Dict
         """
         return await comment(
             comment_id=comment_id,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def comment
     
@@ -1400,7 +2527,8 @@ class DerpiClient(object):
         image_id: int,
         filter_id: Union[int, None] = None,
         _client: Union[None, internet.AsyncClient] = None,
-    ) -> Image:
+        _raw: bool = False,
+    ) -> Union[Image, Dict]:
         """
         Fetches an **image response** for the image ID referenced by the `image_id` URL parameter.
 
@@ -1428,14 +2556,19 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
-        :return: The parsed result from the API.
-        :rtype:  Image
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  Image|Dict
         """
         return await image(
             image_id=image_id,
             filter_id=filter_id,
             key=self._key,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def image
     
@@ -1444,7 +2577,8 @@ class DerpiClient(object):
         self, 
         url: str,
         _client: Union[None, internet.AsyncClient] = None,
-    ) -> Image:
+        _raw: bool = False,
+    ) -> Union[Image, Dict]:
         """
         Submits a new image. Both `key` and `url` are required. Errors will result in an `{"errors":image-errors-response}`.
 
@@ -1469,13 +2603,18 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
-        :return: The parsed result from the API.
-        :rtype:  Image
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  Image|Dict
         """
         return await image_upload(
             url=url,
             key=self._key,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def image_upload
     
@@ -1483,7 +2622,8 @@ class DerpiClient(object):
     async def featured_image(
         self, 
         _client: Union[None, internet.AsyncClient] = None,
-    ) -> Image:
+        _raw: bool = False,
+    ) -> Union[Image, Dict]:
         """
         Fetches an **image response** for the for the current featured image.
 
@@ -1500,11 +2640,16 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
-        :return: The parsed result from the API.
-        :rtype:  Image
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  Image|Dict
         """
         return await featured_image(
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def featured_image
     
@@ -1513,7 +2658,8 @@ class DerpiClient(object):
         self, 
         tag_id: str,
         _client: Union[None, internet.AsyncClient] = None,
-    ) -> Tag:
+        _raw: bool = False,
+    ) -> Union[Tag, Dict]:
         """
         Fetches a **tag response** for the **tag slug** given by the `tag_id` URL parameter. The tag's ID is **not** used. For getting a tag by ID the search endpoint can be used like `search/tags?q=id:4458`.
 
@@ -1533,12 +2679,17 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
-        :return: The parsed result from the API.
-        :rtype:  Tag
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  Tag|Dict
         """
         return await tag(
             tag_id=tag_id,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def tag
     
@@ -1547,7 +2698,8 @@ class DerpiClient(object):
         self, 
         post_id: int,
         _client: Union[None, internet.AsyncClient] = None,
-    ) -> Post:
+        _raw: bool = False,
+    ) -> Union[Post, Dict]:
         """
         Fetches a **post response** for the post ID given by the `post_id` URL parameter.
 
@@ -1567,12 +2719,17 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
-        :return: The parsed result from the API.
-        :rtype:  Post
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  Post|Dict
         """
         return await post(
             post_id=post_id,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def post
     
@@ -1581,7 +2738,8 @@ class DerpiClient(object):
         self, 
         user_id: int,
         _client: Union[None, internet.AsyncClient] = None,
-    ) -> User:
+        _raw: bool = False,
+    ) -> Union[User, Dict]:
         """
         Fetches a **profile response** for the user ID given by the `user_id` URL parameter.
 
@@ -1601,12 +2759,17 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
-        :return: The parsed result from the API.
-        :rtype:  User
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  User|Dict
         """
         return await user(
             user_id=user_id,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def user
     
@@ -1615,7 +2778,8 @@ class DerpiClient(object):
         self, 
         filter_id: int,
         _client: Union[None, internet.AsyncClient] = None,
-    ) -> Filter:
+        _raw: bool = False,
+    ) -> Union[Filter, Dict]:
         """
         Fetches a **filter response** for the filter ID given by the `filter_id` URL parameter.
 
@@ -1640,13 +2804,18 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
-        :return: The parsed result from the API.
-        :rtype:  Filter
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  Filter|Dict
         """
         return await filter(
             filter_id=filter_id,
             key=self._key,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def filter
     
@@ -1655,7 +2824,8 @@ class DerpiClient(object):
         self, 
         page: Union[int, None] = None,
         _client: Union[None, internet.AsyncClient] = None,
-    ) -> List[Filter]:
+        _raw: bool = False,
+    ) -> Union[List[Filter], List[Dict]]:
         """
         Fetches a list of **filter responses** that are flagged as being **system** filters (and thus usable by anyone).
 
@@ -1675,21 +2845,167 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
-        :return: The parsed result from the API.
-        :rtype:  List[Filter]
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  List[Filter]|List[Dict]
         """
         return await system_filters(
             page=page,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def system_filters
     
+    # noinspection PyMethodMayBeStatic
+    async def system_filters_with_total(
+        self, 
+        page: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: bool = False,
+    ) -> Union[SearchResult[Filter], SearchResult[Dict]]:
+        """
+        Same as `system_filters(...)`, but additionally returns the `total` amount of results the API reported,
+        e.g. to know the number of pages before requesting them.
+        The `total` is `None` if the API didn't send one.
+        
+        :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+        :type  page: int|None
+        
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        See `system_filters(...)` for examples.
+        :type  _client: httpx.AsyncClient|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+        :rtype:  SearchResult[Filter]|SearchResult[Dict]
+        """
+        return await system_filters_with_total(
+            page=page,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def system_filters_with_total
+
+    # noinspection PyMethodMayBeStatic
+    def iter_system_filters(
+        self, 
+        start_page: int = 1,
+        max_items: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: bool = False,
+    ) -> AsyncIterator[Union[Filter, Dict]]:
+        """
+        Iterates over all the results of `system_filters(...)`, requesting one page after another as needed.
+        While the items of one page are consumed, the next page is already requested in the background.
+        Stops once the `total` amount of results is reached, or after the first page which isn't full.
+
+        Usage:
+        >>> async for item in client.iter_system_filters(...):
+        ...     pass
+        
+        :param start_page: The first page to request. The first page is `1`.
+        :type  start_page: int
+
+        :param max_items: Stop after that many items. `None` to continue until the last page.
+        :type  max_items: int|None
+
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        See `system_filters(...)` for examples.
+        :type  _client: httpx.AsyncClient|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed items of all the pages, or their plain json with `_raw`.
+        :rtype:  AsyncIterator[Filter|Dict]
+        """
+        return async_iterate_pages(
+            lambda page: self.system_filters_with_total(
+                page=page,
+                _client=_client,
+                _raw=_raw,
+            ),
+            per_page=None,
+            start_page=start_page,
+            max_items=max_items,
+        )
+    # end def iter_system_filters
+    
+    # noinspection PyMethodMayBeStatic
+    def system_filters_all(
+        self, 
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        start_page: int = 1,
+        max_pages: Union[int, None] = None,
+        semaphore: Union[asyncio.Semaphore, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: bool = False,
+    ) -> AsyncIterator[Union[Filter, Dict]]:
+        """
+        Iterates over all the results of `system_filters(...)`, requesting up to `concurrency` pages at the same time.
+        The `total` of the first page is used to know how many pages have to be requested.
+
+        Usage:
+        >>> async for item in client.system_filters_all(..., concurrency=8):
+        ...     pass
+        
+        :param concurrency: How many pages to request at the same time.
+        :type  concurrency: int
+
+        :param ordered: If `True` the items are yielded in page order,
+                        if `False` the items of a page are yielded as soon as that page arrived.
+        :type  ordered: bool
+
+        :param start_page: The first page to request. The first page is `1`.
+        :type  start_page: int
+
+        :param max_pages: Don't request more than that many pages. `None` to continue until the last page.
+        :type  max_pages: int|None
+
+        :param semaphore: Optional semaphore to share one request budget between multiple concurrent calls.
+        :type  semaphore: asyncio.Semaphore|None
+
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        See `system_filters(...)` for examples.
+        :type  _client: httpx.AsyncClient|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed items of all the pages, or their plain json with `_raw`.
+        :rtype:  AsyncIterator[Filter|Dict]
+        """
+        return async_fan_out_pages(
+            lambda page: self.system_filters_with_total(
+                page=page,
+                _client=_client,
+                _raw=_raw,
+            ),
+            per_page=None,
+            concurrency=concurrency,
+            ordered=ordered,
+            start_page=start_page,
+            max_pages=max_pages,
+            semaphore=semaphore,
+        )
+    # end def system_filters_all
+    
     # noinspection PyMethodMayBeStatic
     async def user_filters(
         self, 
         page: Union[int, None] = None,
         _client: Union[None, internet.AsyncClient] = None,
-    ) -> List[Filter]:
+        _raw: bool = False,
+    ) -> Union[List[Filter], List[Dict]]:
         """
         Fetches a list of **filter responses** that belong to the user given by **key**. If no **key** is given or it is invalid, will return a **403 Forbidden** error.
 
@@ -1714,22 +3030,184 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
-        :return: The parsed result from the API.
-        :rtype:  List[Filter]
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  List[Filter]|List[Dict]
         """
         return await user_filters(
             key=self._key,
             page=page,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def user_filters
     
+    # noinspection PyMethodMayBeStatic
+    async def user_filters_with_total(
+        self, 
+        page: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: bool = False,
+    ) -> Union[SearchResult[Filter], SearchResult[Dict]]:
+        """
+        Same as `user_filters(...)`, but additionally returns the `total` amount of results the API reported,
+        e.g. to know the number of pages before requesting them.
+        The `total` is `None` if the API didn't send one.
+        
+        :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+        :type  key: str
+        
+        :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+        :type  page: int|None
+        
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        See `user_filters(...)` for examples.
+        :type  _client: httpx.AsyncClient|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+        :rtype:  SearchResult[Filter]|SearchResult[Dict]
+        """
+        return await user_filters_with_total(
+            key=self._key,
+            page=page,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def user_filters_with_total
+
+    # noinspection PyMethodMayBeStatic
+    def iter_user_filters(
+        self, 
+        start_page: int = 1,
+        max_items: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: bool = False,
+    ) -> AsyncIterator[Union[Filter, Dict]]:
+        """
+        Iterates over all the results of `user_filters(...)`, requesting one page after another as needed.
+        While the items of one page are consumed, the next page is already requested in the background.
+        Stops once the `total` amount of results is reached, or after the first page which isn't full.
+
+        Usage:
+        >>> async for item in client.iter_user_filters(...):
+        ...     pass
+        
+        :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+        :type  key: str
+        
+        :param start_page: The first page to request. The first page is `1`.
+        :type  start_page: int
+
+        :param max_items: Stop after that many items. `None` to continue until the last page.
+        :type  max_items: int|None
+
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        See `user_filters(...)` for examples.
+        :type  _client: httpx.AsyncClient|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed items of all the pages, or their plain json with `_raw`.
+        :rtype:  AsyncIterator[Filter|Dict]
+        """
+        return async_iterate_pages(
+            lambda page: self.user_filters_with_total(
+                page=page,
+                _client=_client,
+                _raw=_raw,
+            ),
+            per_page=None,
+            start_page=start_page,
+            max_items=max_items,
+        )
+    # end def iter_user_filters
+    
+    # noinspection PyMethodMayBeStatic
+    def user_filters_all(
+        self, 
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        start_page: int = 1,
+        max_pages: Union[int, None] = None,
+        semaphore: Union[asyncio.Semaphore, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: bool = False,
+    ) -> AsyncIterator[Union[Filter, Dict]]:
+        """
+        Iterates over all the results of `user_filters(...)`, requesting up to `concurrency` pages at the same time.
+        The `total` of the first page is used to know how many pages have to be requested.
+
+        Usage:
+        >>> async for item in client.user_filters_all(..., concurrency=8):
+        ...     pass
+        
+        :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+        :type  key: str
+        
+        :param concurrency: How many pages to request at the same time.
+        :type  concurrency: int
+
+        :param ordered: If `True` the items are yielded in page order,
+                        if `False` the items of a page are yielded as soon as that page arrived.
+        :type  ordered: bool
+
+        :param start_page: The first page to request. The first page is `1`.
+        :type  start_page: int
+
+        :param max_pages: Don't request more than that many pages. `None` to continue until the last page.
+        :type  max_pages: int|None
+
+        :param semaphore: Optional semaphore to share one request budget between multiple concurrent calls.
+        :type  semaphore: asyncio.Semaphore|None
+
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        See `user_filters(...)` for examples.
+        :type  _client: httpx.AsyncClient|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed items of all the pages, or their plain json with `_raw`.
+        :rtype:  AsyncIterator[Filter|Dict]
+        """
+        return async_fan_out_pages(
+            lambda page: self.user_filters_with_total(
+                page=page,
+                _client=_client,
+                _raw=_raw,
+            ),
+            per_page=None,
+            concurrency=concurrency,
+            ordered=ordered,
+            start_page=start_page,
+            max_pages=max_pages,
+            semaphore=semaphore,
+        )
+    # end def user_filters_all
+    
     # noinspection PyMethodMayBeStatic
     async def oembed(
         self, 
         url: str,
         _client: Union[None, internet.AsyncClient] = None,
-    ) -> Oembed:
+        _raw: bool = False,
+    ) -> Union[Oembed, Dict]:
         """
         Fetches an **oEmbed response** for the given app link or CDN URL.
 
@@ -1749,12 +3227,17 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
-        :return: The parsed result from the API.
-        :rtype:  Oembed
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  Oembed|Dict
         """
         return await oembed(
             url=url,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def oembed
     
@@ -1764,7 +3247,8 @@ class DerpiClient(object):
         query: str,
         page: Union[int, None] = None,
         _client: Union[None, internet.AsyncClient] = None,
-    ) -> List[Comment]:
+        _raw: bool = False,
+    ) -> Union[List[Comment], List[Dict]]:
         """
         Executes the search given by the `q` query parameter (case insensitive and stemming is applied. If you search for **best pony** results like **Best Ponies** are also be returned), and returns **comment responses** sorted by descending creation time.
 
@@ -1792,24 +3276,201 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
-        :return: The parsed result from the API.
-        :rtype:  List[Comment]
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  List[Comment]|List[Dict]
         """
         return await search_comments(
             query=query,
             page=page,
             key=self._key,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def search_comments
     
+    # noinspection PyMethodMayBeStatic
+    async def search_comments_with_total(
+        self, 
+        query: str,
+        page: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: bool = False,
+    ) -> Union[SearchResult[Comment], SearchResult[Dict]]:
+        """
+        Same as `search_comments(...)`, but additionally returns the `total` amount of results the API reported,
+        e.g. to know the number of pages before requesting them.
+        The `total` is `None` if the API didn't send one.
+        
+        :param query: The current search query, if the request is a search request.
+        :type  query: str
+        
+        :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+        :type  page: int|None
+        
+        :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+        :type  key: str|None
+        
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        See `search_comments(...)` for examples.
+        :type  _client: httpx.AsyncClient|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+        :rtype:  SearchResult[Comment]|SearchResult[Dict]
+        """
+        return await search_comments_with_total(
+            query=query,
+            page=page,
+            key=self._key,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def search_comments_with_total
+
+    # noinspection PyMethodMayBeStatic
+    def iter_search_comments(
+        self, 
+        query: str,
+        start_page: int = 1,
+        max_items: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: bool = False,
+    ) -> AsyncIterator[Union[Comment, Dict]]:
+        """
+        Iterates over all the results of `search_comments(...)`, requesting one page after another as needed.
+        While the items of one page are consumed, the next page is already requested in the background.
+        Stops once the `total` amount of results is reached, or after the first page which isn't full.
+
+        Usage:
+        >>> async for item in client.iter_search_comments(...):
+        ...     pass
+        
+        :param query: The current search query, if the request is a search request.
+        :type  query: str
+        
+        :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+        :type  key: str|None
+        
+        :param start_page: The first page to request. The first page is `1`.
+        :type  start_page: int
+
+        :param max_items: Stop after that many items. `None` to continue until the last page.
+        :type  max_items: int|None
+
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        See `search_comments(...)` for examples.
+        :type  _client: httpx.AsyncClient|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed items of all the pages, or their plain json with `_raw`.
+        :rtype:  AsyncIterator[Comment|Dict]
+        """
+        return async_iterate_pages(
+            lambda page: self.search_comments_with_total(
+                query=query,
+                page=page,
+                _client=_client,
+                _raw=_raw,
+            ),
+            per_page=None,
+            start_page=start_page,
+            max_items=max_items,
+        )
+    # end def iter_search_comments
+    
+    # noinspection PyMethodMayBeStatic
+    def search_comments_all(
+        self, 
+        query: str,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        start_page: int = 1,
+        max_pages: Union[int, None] = None,
+        semaphore: Union[asyncio.Semaphore, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: bool = False,
+    ) -> AsyncIterator[Union[Comment, Dict]]:
+        """
+        Iterates over all the results of `search_comments(...)`, requesting up to `concurrency` pages at the same time.
+        The `total` of the first page is used to know how many pages have to be requested.
+
+        Usage:
+        >>> async for item in client.search_comments_all(..., concurrency=8):
+        ...     pass
+        
+        :param query: The current search query, if the request is a search request.
+        :type  query: str
+        
+        :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+        :type  key: str|None
+        
+        :param concurrency: How many pages to request at the same time.
+        :type  concurrency: int
+
+        :param ordered: If `True` the items are yielded in page order,
+                        if `False` the items of a page are yielded as soon as that page arrived.
+        :type  ordered: bool
+
+        :param start_page: The first page to request. The first page is `1`.
+        :type  start_page: int
+
+        :param max_pages: Don't request more than that many pages. `None` to continue until the last page.
+        :type  max_pages: int|None
+
+        :param semaphore: Optional semaphore to share one request budget between multiple concurrent calls.
+        :type  semaphore: asyncio.Semaphore|None
+
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        See `search_comments(...)` for examples.
+        :type  _client: httpx.AsyncClient|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed items of all the pages, or their plain json with `_raw`.
+        :rtype:  AsyncIterator[Comment|Dict]
+        """
+        return async_fan_out_pages(
+            lambda page: self.search_comments_with_total(
+                query=query,
+                page=page,
+                _client=_client,
+                _raw=_raw,
+            ),
+            per_page=None,
+            concurrency=concurrency,
+            ordered=ordered,
+            start_page=start_page,
+            max_pages=max_pages,
+            semaphore=semaphore,
+        )
+    # end def search_comments_all
+    
     # noinspection PyMethodMayBeStatic
     async def search_galleries(
         self, 
         query: str,
         page: Union[int, None] = None,
         _client: Union[None, internet.AsyncClient] = None,
-    ) -> List[Gallery]:
+        _raw: bool = False,
+    ) -> Union[List[Gallery], List[Dict]]:
         """
         Executes the search given by the `q` query parameter, and returns **gallery responses** sorted by descending creation time.
 
@@ -1837,32 +3498,34 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
-        :return: The parsed result from the API.
-        :rtype:  List[Gallery]
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  List[Gallery]|List[Dict]
         """
         return await search_galleries(
             query=query,
             page=page,
             key=self._key,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def search_galleries
     
     # noinspection PyMethodMayBeStatic
-    async def search_posts(
+    async def search_galleries_with_total(
         self, 
         query: str,
         page: Union[int, None] = None,
         _client: Union[None, internet.AsyncClient] = None,
-    ) -> List[Post]:
+        _raw: bool = False,
+    ) -> Union[SearchResult[Gallery], SearchResult[Dict]]:
         """
-        Executes the search given by the `q` query parameter, and returns **post responses** sorted by descending creation time.
-
-        A request will be sent to the following endpoint: `/api/v1/json/search/posts`
-        It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
-        which would for example look like this: https://derpibooru.org/api/v1/json/search/posts?q=subject:time wasting thread
-
-        The API should return json looking like `{"posts":[Post]}` which will then be parsed to the python result `List[Post]`.
+        Same as `search_galleries(...)`, but additionally returns the `total` amount of results the API reported,
+        e.g. to know the number of pages before requesting them.
+        The `total` is `None` if the API didn't send one.
         
         :param query: The current search query, if the request is a search request.
         :type  query: str
@@ -1875,43 +3538,736 @@ class DerpiClient(object):
                     You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
         :type  key: str|None
         
-        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
-                        For example:
-                        >>> async with httpx.AsyncClient() as client:
-                        ...    result = await search_posts(..., _client=client)
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        See `search_galleries(...)` for examples.
+        :type  _client: httpx.AsyncClient|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+        :rtype:  SearchResult[Gallery]|SearchResult[Dict]
+        """
+        return await search_galleries_with_total(
+            query=query,
+            page=page,
+            key=self._key,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def search_galleries_with_total
+
+    # noinspection PyMethodMayBeStatic
+    def iter_search_galleries(
+        self, 
+        query: str,
+        start_page: int = 1,
+        max_items: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: bool = False,
+    ) -> AsyncIterator[Union[Gallery, Dict]]:
+        """
+        Iterates over all the results of `search_galleries(...)`, requesting one page after another as needed.
+        While the items of one page are consumed, the next page is already requested in the background.
+        Stops once the `total` amount of results is reached, or after the first page which isn't full.
+
+        Usage:
+        >>> async for item in client.iter_search_galleries(...):
+        ...     pass
+        
+        :param query: The current search query, if the request is a search request.
+        :type  query: str
+        
+        :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+        :type  key: str|None
+        
+        :param start_page: The first page to request. The first page is `1`.
+        :type  start_page: int
+
+        :param max_items: Stop after that many items. `None` to continue until the last page.
+        :type  max_items: int|None
+
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        See `search_galleries(...)` for examples.
+        :type  _client: httpx.AsyncClient|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed items of all the pages, or their plain json with `_raw`.
+        :rtype:  AsyncIterator[Gallery|Dict]
+        """
+        return async_iterate_pages(
+            lambda page: self.search_galleries_with_total(
+                query=query,
+                page=page,
+                _client=_client,
+                _raw=_raw,
+            ),
+            per_page=None,
+            start_page=start_page,
+            max_items=max_items,
+        )
+    # end def iter_search_galleries
+    
+    # noinspection PyMethodMayBeStatic
+    def search_galleries_all(
+        self, 
+        query: str,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        start_page: int = 1,
+        max_pages: Union[int, None] = None,
+        semaphore: Union[asyncio.Semaphore, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: bool = False,
+    ) -> AsyncIterator[Union[Gallery, Dict]]:
+        """
+        Iterates over all the results of `search_galleries(...)`, requesting up to `concurrency` pages at the same time.
+        The `total` of the first page is used to know how many pages have to be requested.
+
+        Usage:
+        >>> async for item in client.search_galleries_all(..., concurrency=8):
+        ...     pass
+        
+        :param query: The current search query, if the request is a search request.
+        :type  query: str
+        
+        :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+        :type  key: str|None
+        
+        :param concurrency: How many pages to request at the same time.
+        :type  concurrency: int
+
+        :param ordered: If `True` the items are yielded in page order,
+                        if `False` the items of a page are yielded as soon as that page arrived.
+        :type  ordered: bool
+
+        :param start_page: The first page to request. The first page is `1`.
+        :type  start_page: int
+
+        :param max_pages: Don't request more than that many pages. `None` to continue until the last page.
+        :type  max_pages: int|None
+
+        :param semaphore: Optional semaphore to share one request budget between multiple concurrent calls.
+        :type  semaphore: asyncio.Semaphore|None
+
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        See `search_galleries(...)` for examples.
+        :type  _client: httpx.AsyncClient|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed items of all the pages, or their plain json with `_raw`.
+        :rtype:  AsyncIterator[Gallery|Dict]
+        """
+        return async_fan_out_pages(
+            lambda page: self.search_galleries_with_total(
+                query=query,
+                page=page,
+                _client=_client,
+                _raw=_raw,
+            ),
+            per_page=None,
+            concurrency=concurrency,
+            ordered=ordered,
+            start_page=start_page,
+            max_pages=max_pages,
+            semaphore=semaphore,
+        )
+    # end def search_galleries_all
+    
+    # noinspection PyMethodMayBeStatic
+    async def search_posts(
+        self, 
+        query: str,
+        page: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: bool = False,
+    ) -> Union[List[Post], List[Dict]]:
+        """
+        Executes the search given by the `q` query parameter, and returns **post responses** sorted by descending creation time.
+
+        A request will be sent to the following endpoint: `/api/v1/json/search/posts`
+        It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
+        which would for example look like this: https://derpibooru.org/api/v1/json/search/posts?q=subject:time wasting thread
+
+        The API should return json looking like `{"posts":[Post]}` which will then be parsed to the python result `List[Post]`.
+        
+        :param query: The current search query, if the request is a search request.
+        :type  query: str
+        
+        :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+        :type  page: int|None
+        
+        :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+        :type  key: str|None
+        
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        For example:
+                        >>> async with httpx.AsyncClient() as client:
+                        ...    result = await search_posts(..., _client=client)
+
+        :type  _client: httpx.AsyncClient|None
+        
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  List[Post]|List[Dict]
+        """
+        return await search_posts(
+            query=query,
+            page=page,
+            key=self._key,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def search_posts
+    
+    # noinspection PyMethodMayBeStatic
+    async def search_posts_with_total(
+        self, 
+        query: str,
+        page: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: bool = False,
+    ) -> Union[SearchResult[Post], SearchResult[Dict]]:
+        """
+        Same as `search_posts(...)`, but additionally returns the `total` amount of results the API reported,
+        e.g. to know the number of pages before requesting them.
+        The `total` is `None` if the API didn't send one.
+        
+        :param query: The current search query, if the request is a search request.
+        :type  query: str
+        
+        :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+        :type  page: int|None
+        
+        :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+        :type  key: str|None
+        
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        See `search_posts(...)` for examples.
+        :type  _client: httpx.AsyncClient|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+        :rtype:  SearchResult[Post]|SearchResult[Dict]
+        """
+        return await search_posts_with_total(
+            query=query,
+            page=page,
+            key=self._key,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def search_posts_with_total
+
+    # noinspection PyMethodMayBeStatic
+    def iter_search_posts(
+        self, 
+        query: str,
+        start_page: int = 1,
+        max_items: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: bool = False,
+    ) -> AsyncIterator[Union[Post, Dict]]:
+        """
+        Iterates over all the results of `search_posts(...)`, requesting one page after another as needed.
+        While the items of one page are consumed, the next page is already requested in the background.
+        Stops once the `total` amount of results is reached, or after the first page which isn't full.
+
+        Usage:
+        >>> async for item in client.iter_search_posts(...):
+        ...     pass
+        
+        :param query: The current search query, if the request is a search request.
+        :type  query: str
+        
+        :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+        :type  key: str|None
+        
+        :param start_page: The first page to request. The first page is `1`.
+        :type  start_page: int
+
+        :param max_items: Stop after that many items. `None` to continue until the last page.
+        :type  max_items: int|None
+
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        See `search_posts(...)` for examples.
+        :type  _client: httpx.AsyncClient|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed items of all the pages, or their plain json with `_raw`.
+        :rtype:  AsyncIterator[Post|Dict]
+        """
+        return async_iterate_pages(
+            lambda page: self.search_posts_with_total(
+                query=query,
+                page=page,
+                _client=_client,
+                _raw=_raw,
+            ),
+            per_page=None,
+            start_page=start_page,
+            max_items=max_items,
+        )
+    # end def iter_search_posts
+    
+    # noinspection PyMethodMayBeStatic
+    def search_posts_all(
+        self, 
+        query: str,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        start_page: int = 1,
+        max_pages: Union[int, None] = None,
+        semaphore: Union[asyncio.Semaphore, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: bool = False,
+    ) -> AsyncIterator[Union[Post, Dict]]:
+        """
+        Iterates over all the results of `search_posts(...)`, requesting up to `concurrency` pages at the same time.
+        The `total` of the first page is used to know how many pages have to be requested.
+
+        Usage:
+        >>> async for item in client.search_posts_all(..., concurrency=8):
+        ...     pass
+        
+        :param query: The current search query, if the request is a search request.
+        :type  query: str
+        
+        :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+        :type  key: str|None
+        
+        :param concurrency: How many pages to request at the same time.
+        :type  concurrency: int
+
+        :param ordered: If `True` the items are yielded in page order,
+                        if `False` the items of a page are yielded as soon as that page arrived.
+        :type  ordered: bool
+
+        :param start_page: The first page to request. The first page is `1`.
+        :type  start_page: int
+
+        :param max_pages: Don't request more than that many pages. `None` to continue until the last page.
+        :type  max_pages: int|None
+
+        :param semaphore: Optional semaphore to share one request budget between multiple concurrent calls.
+        :type  semaphore: asyncio.Semaphore|None
+
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        See `search_posts(...)` for examples.
+        :type  _client: httpx.AsyncClient|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed items of all the pages, or their plain json with `_raw`.
+        :rtype:  AsyncIterator[Post|Dict]
+        """
+        return async_fan_out_pages(
+            lambda page: self.search_posts_with_total(
+                query=query,
+                page=page,
+                _client=_client,
+                _raw=_raw,
+            ),
+            per_page=None,
+            concurrency=concurrency,
+            ordered=ordered,
+            start_page=start_page,
+            max_pages=max_pages,
+            semaphore=semaphore,
+        )
+    # end def search_posts_all
+    
+    # noinspection PyMethodMayBeStatic
+    async def search_images(
+        self, 
+        query: str,
+        filter_id: Union[int, None] = None,
+        page: Union[int, None] = None,
+        per_page: Union[int, None] = None,
+        sort_direction: Union[str, None] = None,
+        sort_field: Union[str, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: bool = False,
+    ) -> Union[List[Image], List[Dict]]:
+        """
+        Executes the search given by the `q` query parameter, and returns **image responses**.
+
+        A request will be sent to the following endpoint: `/api/v1/json/search/images`
+        It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
+        which would for example look like this: https://derpibooru.org/api/v1/json/search/images?q=safe
+
+        The API should return json looking like `{"images":[Image]}` which will then be parsed to the python result `List[Image]`.
+        
+        :param query: The current search query, if the request is a search request.
+        :type  query: str
+        
+        :param filter_id: Assuming the user can access the filter ID given by the parameter, overrides the current filter for this request. This is primarily useful for unauthenticated API access.
+        :type  filter_id: int|None
+        
+        :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+        :type  page: int|None
+        
+        :param per_page: Controls the number of results per page, up to a limit of 50, if the response is paginated. The default is 25.
+        :type  per_page: int|None
+        
+        :param sort_direction: The current sort direction, if the request is a search request.
+        :type  sort_direction: str|None
+        
+        :param sort_field: The current sort field, if the request is a search request.
+        :type  sort_field: str|None
+        
+        :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+        :type  key: str|None
+        
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        For example:
+                        >>> async with httpx.AsyncClient() as client:
+                        ...    result = await search_images(..., _client=client)
+
+        :type  _client: httpx.AsyncClient|None
+        
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  List[Image]|List[Dict]
+        """
+        return await search_images(
+            query=query,
+            filter_id=filter_id,
+            page=page,
+            per_page=per_page,
+            sort_direction=sort_direction,
+            sort_field=sort_field,
+            key=self._key,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def search_images
+    
+    # noinspection PyMethodMayBeStatic
+    async def search_images_with_total(
+        self, 
+        query: str,
+        filter_id: Union[int, None] = None,
+        page: Union[int, None] = None,
+        per_page: Union[int, None] = None,
+        sort_direction: Union[str, None] = None,
+        sort_field: Union[str, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: bool = False,
+    ) -> Union[SearchResult[Image], SearchResult[Dict]]:
+        """
+        Same as `search_images(...)`, but additionally returns the `total` amount of results the API reported,
+        e.g. to know the number of pages before requesting them.
+        The `total` is `None` if the API didn't send one.
+        
+        :param query: The current search query, if the request is a search request.
+        :type  query: str
+        
+        :param filter_id: Assuming the user can access the filter ID given by the parameter, overrides the current filter for this request. This is primarily useful for unauthenticated API access.
+        :type  filter_id: int|None
+        
+        :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+        :type  page: int|None
+        
+        :param per_page: Controls the number of results per page, up to a limit of 50, if the response is paginated. The default is 25.
+        :type  per_page: int|None
+        
+        :param sort_direction: The current sort direction, if the request is a search request.
+        :type  sort_direction: str|None
+        
+        :param sort_field: The current sort field, if the request is a search request.
+        :type  sort_field: str|None
+        
+        :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+        :type  key: str|None
+        
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        See `search_images(...)` for examples.
+        :type  _client: httpx.AsyncClient|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+        :rtype:  SearchResult[Image]|SearchResult[Dict]
+        """
+        return await search_images_with_total(
+            query=query,
+            filter_id=filter_id,
+            page=page,
+            per_page=per_page,
+            sort_direction=sort_direction,
+            sort_field=sort_field,
+            key=self._key,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def search_images_with_total
+
+    # noinspection PyMethodMayBeStatic
+    async def search_images_batch(
+        self, 
+        query: str,
+        filter_id: Union[int, None] = None,
+        page: Union[int, None] = None,
+        per_page: Union[int, None] = None,
+        sort_direction: Union[str, None] = None,
+        sort_field: Union[str, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+    ) -> 'ImageBatch':
+        """
+        Same as `search_images(...)`, but returns the page as columnar `ImageBatch` of numpy arrays,
+        built directly from the response without creating `Image` models. Needs numpy to be installed.
+        
+        :param query: The current search query, if the request is a search request.
+        :type  query: str
+        
+        :param filter_id: Assuming the user can access the filter ID given by the parameter, overrides the current filter for this request. This is primarily useful for unauthenticated API access.
+        :type  filter_id: int|None
+        
+        :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+        :type  page: int|None
+        
+        :param per_page: Controls the number of results per page, up to a limit of 50, if the response is paginated. The default is 25.
+        :type  per_page: int|None
+        
+        :param sort_direction: The current sort direction, if the request is a search request.
+        :type  sort_direction: str|None
+        
+        :param sort_field: The current sort field, if the request is a search request.
+        :type  sort_field: str|None
+        
+        :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+        :type  key: str|None
+        
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        See `search_images(...)` for examples.
+        :type  _client: httpx.AsyncClient|None
+
+        :return: The images of that page, and the total amount of results.
+        :rtype:  derpi.batch.ImageBatch
+        """
+        return await search_images_batch(
+            query=query,
+            filter_id=filter_id,
+            page=page,
+            per_page=per_page,
+            sort_direction=sort_direction,
+            sort_field=sort_field,
+            key=self._key,
+            _client=_client if _client else self,
+        )
+    # end def search_images_batch
+
+    # noinspection PyMethodMayBeStatic
+    def iter_search_images(
+        self, 
+        query: str,
+        filter_id: Union[int, None] = None,
+        per_page: Union[int, None] = None,
+        sort_direction: Union[str, None] = None,
+        sort_field: Union[str, None] = None,
+        start_page: int = 1,
+        max_items: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: bool = False,
+    ) -> AsyncIterator[Union[Image, Dict]]:
+        """
+        Iterates over all the results of `search_images(...)`, requesting one page after another as needed.
+        While the items of one page are consumed, the next page is already requested in the background.
+        Stops once the `total` amount of results is reached, or after the first page which isn't full.
+
+        Usage:
+        >>> async for item in client.iter_search_images(...):
+        ...     pass
+        
+        :param query: The current search query, if the request is a search request.
+        :type  query: str
+        
+        :param filter_id: Assuming the user can access the filter ID given by the parameter, overrides the current filter for this request. This is primarily useful for unauthenticated API access.
+        :type  filter_id: int|None
+        
+        :param per_page: Controls the number of results per page, up to a limit of 50, if the response is paginated. The default is 25.
+        :type  per_page: int|None
+        
+        :param sort_direction: The current sort direction, if the request is a search request.
+        :type  sort_direction: str|None
+        
+        :param sort_field: The current sort field, if the request is a search request.
+        :type  sort_field: str|None
+        
+        :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+        :type  key: str|None
+        
+        :param start_page: The first page to request. The first page is `1`.
+        :type  start_page: int
+
+        :param max_items: Stop after that many items. `None` to continue until the last page.
+        :type  max_items: int|None
+
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        See `search_images(...)` for examples.
+        :type  _client: httpx.AsyncClient|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed items of all the pages, or their plain json with `_raw`.
+        :rtype:  AsyncIterator[Image|Dict]
+        """
+        return async_iterate_pages(
+            lambda page: self.search_images_with_total(
+                query=query,
+                filter_id=filter_id,
+                page=page,
+                per_page=per_page,
+                sort_direction=sort_direction,
+                sort_field=sort_field,
+                _client=_client,
+                _raw=_raw,
+            ),
+            per_page=per_page,
+            start_page=start_page,
+            max_items=max_items,
+        )
+    # end def iter_search_images
+
+    # noinspection PyMethodMayBeStatic
+    def iter_search_images_by_id(
+        self, 
+        query: str,
+        filter_id: Union[int, None] = None,
+        per_page: Union[int, None] = None,
+        before_id: Union[int, None] = None,
+        max_items: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: bool = False,
+    ) -> AsyncIterator[Union[Image, Dict]]:
+        """
+        Iterates over all the results of `search_images(...)`, newest first, by sorting by `id`
+        and narrowing the query to `id.lt:<last id>` on each step instead of requesting page numbers.
+        Every request costs the same regardless how deep it is, and results which are added or removed meanwhile
+        don't shift the later pages, so no result is skipped or repeated.
+
+        Usage:
+        >>> async for item in client.iter_search_images_by_id(...):
+        ...     pass
+        
+        :param query: The current search query, if the request is a search request.
+        :type  query: str
+        
+        :param filter_id: Assuming the user can access the filter ID given by the parameter, overrides the current filter for this request. This is primarily useful for unauthenticated API access.
+        :type  filter_id: int|None
+        
+        :param per_page: Controls the number of results per page, up to a limit of 50, if the response is paginated. The default is 25.
+        :type  per_page: int|None
+        
+        :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+        :type  key: str|None
+        
+        :param before_id: Only results with an id lower than that, e.g. to continue after the last one seen.
+                          `None` to start with the newest one.
+        :type  before_id: int|None
 
+        :param max_items: Stop after that many items. `None` to continue until the last one.
+        :type  max_items: int|None
+
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        See `search_images(...)` for examples.
         :type  _client: httpx.AsyncClient|None
-        
-        :return: The parsed result from the API.
-        :rtype:  List[Post]
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed items, or their plain json with `_raw`.
+        :rtype:  AsyncIterator[Image|Dict]
         """
-        return await search_posts(
-            query=query,
-            page=page,
-            key=self._key,
-            _client=_client if _client else self._client,
+        return async_iterate_by_id(
+            lambda last_id: self.search_images_with_total(
+                query=query_before_id(query, last_id),
+                filter_id=filter_id,
+                page=1,
+                per_page=per_page,
+                sort_direction='desc',
+                sort_field='id',
+                _client=_client,
+                _raw=_raw,
+            ),
+            per_page=per_page,
+            before_id=before_id,
+            max_items=max_items,
         )
-    # end def search_posts
+    # end def iter_search_images_by_id
     
     # noinspection PyMethodMayBeStatic
-    async def search_images(
+    def search_images_all(
         self, 
         query: str,
         filter_id: Union[int, None] = None,
-        page: Union[int, None] = None,
         per_page: Union[int, None] = None,
         sort_direction: Union[str, None] = None,
         sort_field: Union[str, None] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        start_page: int = 1,
+        max_pages: Union[int, None] = None,
+        semaphore: Union[asyncio.Semaphore, None] = None,
         _client: Union[None, internet.AsyncClient] = None,
-    ) -> List[Image]:
+        _raw: bool = False,
+    ) -> AsyncIterator[Union[Image, Dict]]:
         """
-        Executes the search given by the `q` query parameter, and returns **image responses**.
-
-        A request will be sent to the following endpoint: `/api/v1/json/search/images`
-        It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
-        which would for example look like this: https://derpibooru.org/api/v1/json/search/images?q=safe
+        Iterates over all the results of `search_images(...)`, requesting up to `concurrency` pages at the same time.
+        The `total` of the first page is used to know how many pages have to be requested.
 
-        The API should return json looking like `{"images":[Image]}` which will then be parsed to the python result `List[Image]`.
+        Usage:
+        >>> async for item in client.search_images_all(..., concurrency=8):
+        ...     pass
         
         :param query: The current search query, if the request is a search request.
         :type  query: str
@@ -1919,9 +4275,6 @@ class DerpiClient(object):
         :param filter_id: Assuming the user can access the filter ID given by the parameter, overrides the current filter for this request. This is primarily useful for unauthenticated API access.
         :type  filter_id: int|None
         
-        :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
-        :type  page: int|None
-        
         :param per_page: Controls the number of results per page, up to a limit of 50, if the response is paginated. The default is 25.
         :type  per_page: int|None
         
@@ -1936,27 +4289,52 @@ class DerpiClient(object):
                     You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
         :type  key: str|None
         
-        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
-                        For example:
-                        >>> async with httpx.AsyncClient() as client:
-                        ...    result = await search_images(..., _client=client)
+        :param concurrency: How many pages to request at the same time.
+        :type  concurrency: int
+
+        :param ordered: If `True` the items are yielded in page order,
+                        if `False` the items of a page are yielded as soon as that page arrived.
+        :type  ordered: bool
+
+        :param start_page: The first page to request. The first page is `1`.
+        :type  start_page: int
 
+        :param max_pages: Don't request more than that many pages. `None` to continue until the last page.
+        :type  max_pages: int|None
+
+        :param semaphore: Optional semaphore to share one request budget between multiple concurrent calls.
+        :type  semaphore: asyncio.Semaphore|None
+
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        See `search_images(...)` for examples.
         :type  _client: httpx.AsyncClient|None
-        
-        :return: The parsed result from the API.
-        :rtype:  List[Image]
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed items of all the pages, or their plain json with `_raw`.
+        :rtype:  AsyncIterator[Image|Dict]
         """
-        return await search_images(
-            query=query,
-            filter_id=filter_id,
-            page=page,
+        return async_fan_out_pages(
+            lambda page: self.search_images_with_total(
+                query=query,
+                filter_id=filter_id,
+                page=page,
+                per_page=per_page,
+                sort_direction=sort_direction,
+                sort_field=sort_field,
+                _client=_client,
+                _raw=_raw,
+            ),
             per_page=per_page,
-            sort_direction=sort_direction,
-            sort_field=sort_field,
-            key=self._key,
-            _client=_client if _client else self._client,
+            concurrency=concurrency,
+            ordered=ordered,
+            start_page=start_page,
+            max_pages=max_pages,
+            semaphore=semaphore,
         )
-    # end def search_images
+    # end def search_images_all
     
     # noinspection PyMethodMayBeStatic
     async def search_tags(
@@ -1964,7 +4342,8 @@ class DerpiClient(object):
         query: str,
         page: Union[int, None] = None,
         _client: Union[None, internet.AsyncClient] = None,
-    ) -> List[Tag]:
+        _raw: bool = False,
+    ) -> Union[List[Tag], List[Dict]]:
         """
         Executes the search given by the `q` query parameter, and returns **tag responses** sorted by descending image count.
 
@@ -1987,23 +4366,184 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
-        :return: The parsed result from the API.
-        :rtype:  List[Tag]
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  List[Tag]|List[Dict]
         """
         return await search_tags(
             query=query,
             page=page,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def search_tags
     
+    # noinspection PyMethodMayBeStatic
+    async def search_tags_with_total(
+        self, 
+        query: str,
+        page: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: bool = False,
+    ) -> Union[SearchResult[Tag], SearchResult[Dict]]:
+        """
+        Same as `search_tags(...)`, but additionally returns the `total` amount of results the API reported,
+        e.g. to know the number of pages before requesting them.
+        The `total` is `None` if the API didn't send one.
+        
+        :param query: The current search query, if the request is a search request.
+        :type  query: str
+        
+        :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+        :type  page: int|None
+        
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        See `search_tags(...)` for examples.
+        :type  _client: httpx.AsyncClient|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+        :rtype:  SearchResult[Tag]|SearchResult[Dict]
+        """
+        return await search_tags_with_total(
+            query=query,
+            page=page,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def search_tags_with_total
+
+    # noinspection PyMethodMayBeStatic
+    def iter_search_tags(
+        self, 
+        query: str,
+        start_page: int = 1,
+        max_items: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: bool = False,
+    ) -> AsyncIterator[Union[Tag, Dict]]:
+        """
+        Iterates over all the results of `search_tags(...)`, requesting one page after another as needed.
+        While the items of one page are consumed, the next page is already requested in the background.
+        Stops once the `total` amount of results is reached, or after the first page which isn't full.
+
+        Usage:
+        >>> async for item in client.iter_search_tags(...):
+        ...     pass
+        
+        :param query: The current search query, if the request is a search request.
+        :type  query: str
+        
+        :param start_page: The first page to request. The first page is `1`.
+        :type  start_page: int
+
+        :param max_items: Stop after that many items. `None` to continue until the last page.
+        :type  max_items: int|None
+
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        See `search_tags(...)` for examples.
+        :type  _client: httpx.AsyncClient|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed items of all the pages, or their plain json with `_raw`.
+        :rtype:  AsyncIterator[Tag|Dict]
+        """
+        return async_iterate_pages(
+            lambda page: self.search_tags_with_total(
+                query=query,
+                page=page,
+                _client=_client,
+                _raw=_raw,
+            ),
+            per_page=None,
+            start_page=start_page,
+            max_items=max_items,
+        )
+    # end def iter_search_tags
+    
+    # noinspection PyMethodMayBeStatic
+    def search_tags_all(
+        self, 
+        query: str,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        start_page: int = 1,
+        max_pages: Union[int, None] = None,
+        semaphore: Union[asyncio.Semaphore, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: bool = False,
+    ) -> AsyncIterator[Union[Tag, Dict]]:
+        """
+        Iterates over all the results of `search_tags(...)`, requesting up to `concurrency` pages at the same time.
+        The `total` of the first page is used to know how many pages have to be requested.
+
+        Usage:
+        >>> async for item in client.search_tags_all(..., concurrency=8):
+        ...     pass
+        
+        :param query: The current search query, if the request is a search request.
+        :type  query: str
+        
+        :param concurrency: How many pages to request at the same time.
+        :type  concurrency: int
+
+        :param ordered: If `True` the items are yielded in page order,
+                        if `False` the items of a page are yielded as soon as that page arrived.
+        :type  ordered: bool
+
+        :param start_page: The first page to request. The first page is `1`.
+        :type  start_page: int
+
+        :param max_pages: Don't request more than that many pages. `None` to continue until the last page.
+        :type  max_pages: int|None
+
+        :param semaphore: Optional semaphore to share one request budget between multiple concurrent calls.
+        :type  semaphore: asyncio.Semaphore|None
+
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        See `search_tags(...)` for examples.
+        :type  _client: httpx.AsyncClient|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed items of all the pages, or their plain json with `_raw`.
+        :rtype:  AsyncIterator[Tag|Dict]
+        """
+        return async_fan_out_pages(
+            lambda page: self.search_tags_with_total(
+                query=query,
+                page=page,
+                _client=_client,
+                _raw=_raw,
+            ),
+            per_page=None,
+            concurrency=concurrency,
+            ordered=ordered,
+            start_page=start_page,
+            max_pages=max_pages,
+            semaphore=semaphore,
+        )
+    # end def search_tags_all
+    
     # noinspection PyMethodMayBeStatic
     async def search_reverse(
         self, 
         url: str,
         distance: Union[float, None] = None,
         _client: Union[None, internet.AsyncClient] = None,
-    ) -> List[Image]:
+        _raw: bool = False,
+    ) -> Union[List[Image], List[Dict]]:
         """
         Returns **image responses** based on the results of reverse-searching the image given by the `url` query parameter.
 
@@ -2031,14 +4571,19 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
-        :return: The parsed result from the API.
-        :rtype:  List[Image]
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  List[Image]|List[Dict]
         """
         return await search_reverse(
             url=url,
             distance=distance,
             key=self._key,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def search_reverse
     
@@ -2046,7 +4591,8 @@ class DerpiClient(object):
     async def forums(
         self, 
         _client: Union[None, internet.AsyncClient] = None,
-    ) -> List[Forum]:
+        _raw: bool = False,
+    ) -> Union[List[Forum], List[Dict]]:
         """
         Fetches a list of **forum responses**.
 
@@ -2063,11 +4609,16 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
-        :return: The parsed result from the API.
-        :rtype:  List[Forum]
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  List[Forum]|List[Dict]
         """
         return await forums(
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def forums
     
@@ -2076,7 +4627,8 @@ class DerpiClient(object):
         self, 
         short_name: str,
         _client: Union[None, internet.AsyncClient] = None,
-    ) -> Forum:
+        _raw: bool = False,
+    ) -> Union[Forum, Dict]:
         """
         Fetches a **forum response** for the abbreviated name given by the `short_name` URL parameter.
 
@@ -2096,12 +4648,17 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
-        :return: The parsed result from the API.
-        :rtype:  Forum
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  Forum|Dict
         """
         return await forum(
             short_name=short_name,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def forum
     
@@ -2111,7 +4668,8 @@ class DerpiClient(object):
         short_name: str,
         page: Union[int, None] = None,
         _client: Union[None, internet.AsyncClient] = None,
-    ) -> List[Topic]:
+        _raw: bool = False,
+    ) -> Union[List[Topic], List[Dict]]:
         """
         Fetches a list of **topic responses** for the abbreviated forum name given by the `short_name` URL parameter.
 
@@ -2134,23 +4692,184 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
-        :return: The parsed result from the API.
-        :rtype:  List[Topic]
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  List[Topic]|List[Dict]
         """
         return await forum_topics(
             short_name=short_name,
             page=page,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def forum_topics
     
+    # noinspection PyMethodMayBeStatic
+    async def forum_topics_with_total(
+        self, 
+        short_name: str,
+        page: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: bool = False,
+    ) -> Union[SearchResult[Topic], SearchResult[Dict]]:
+        """
+        Same as `forum_topics(...)`, but additionally returns the `total` amount of results the API reported,
+        e.g. to know the number of pages before requesting them.
+        The `total` is `None` if the API didn't send one.
+        
+        :param short_name: the variable short_name part of the url.
+        :type  short_name: str
+        
+        :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+        :type  page: int|None
+        
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        See `forum_topics(...)` for examples.
+        :type  _client: httpx.AsyncClient|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+        :rtype:  SearchResult[Topic]|SearchResult[Dict]
+        """
+        return await forum_topics_with_total(
+            short_name=short_name,
+            page=page,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def forum_topics_with_total
+
+    # noinspection PyMethodMayBeStatic
+    def iter_forum_topics(
+        self, 
+        short_name: str,
+        start_page: int = 1,
+        max_items: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: bool = False,
+    ) -> AsyncIterator[Union[Topic, Dict]]:
+        """
+        Iterates over all the results of `forum_topics(...)`, requesting one page after another as needed.
+        While the items of one page are consumed, the next page is already requested in the background.
+        Stops once the `total` amount of results is reached, or after the first page which isn't full.
+
+        Usage:
+        >>> async for item in client.iter_forum_topics(...):
+        ...     pass
+        
+        :param short_name: the variable short_name part of the url.
+        :type  short_name: str
+        
+        :param start_page: The first page to request. The first page is `1`.
+        :type  start_page: int
+
+        :param max_items: Stop after that many items. `None` to continue until the last page.
+        :type  max_items: int|None
+
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        See `forum_topics(...)` for examples.
+        :type  _client: httpx.AsyncClient|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed items of all the pages, or their plain json with `_raw`.
+        :rtype:  AsyncIterator[Topic|Dict]
+        """
+        return async_iterate_pages(
+            lambda page: self.forum_topics_with_total(
+                short_name=short_name,
+                page=page,
+                _client=_client,
+                _raw=_raw,
+            ),
+            per_page=None,
+            start_page=start_page,
+            max_items=max_items,
+        )
+    # end def iter_forum_topics
+    
+    # noinspection PyMethodMayBeStatic
+    def forum_topics_all(
+        self, 
+        short_name: str,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        start_page: int = 1,
+        max_pages: Union[int, None] = None,
+        semaphore: Union[asyncio.Semaphore, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: bool = False,
+    ) -> AsyncIterator[Union[Topic, Dict]]:
+        """
+        Iterates over all the results of `forum_topics(...)`, requesting up to `concurrency` pages at the same time.
+        The `total` of the first page is used to know how many pages have to be requested.
+
+        Usage:
+        >>> async for item in client.forum_topics_all(..., concurrency=8):
+        ...     pass
+        
+        :param short_name: the variable short_name part of the url.
+        :type  short_name: str
+        
+        :param concurrency: How many pages to request at the same time.
+        :type  concurrency: int
+
+        :param ordered: If `True` the items are yielded in page order,
+                        if `False` the items of a page are yielded as soon as that page arrived.
+        :type  ordered: bool
+
+        :param start_page: The first page to request. The first page is `1`.
+        :type  start_page: int
+
+        :param max_pages: Don't request more than that many pages. `None` to continue until the last page.
+        :type  max_pages: int|None
+
+        :param semaphore: Optional semaphore to share one request budget between multiple concurrent calls.
+        :type  semaphore: asyncio.Semaphore|None
+
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        See `forum_topics(...)` for examples.
+        :type  _client: httpx.AsyncClient|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed items of all the pages, or their plain json with `_raw`.
+        :rtype:  AsyncIterator[Topic|Dict]
+        """
+        return async_fan_out_pages(
+            lambda page: self.forum_topics_with_total(
+                short_name=short_name,
+                page=page,
+                _client=_client,
+                _raw=_raw,
+            ),
+            per_page=None,
+            concurrency=concurrency,
+            ordered=ordered,
+            start_page=start_page,
+            max_pages=max_pages,
+            semaphore=semaphore,
+        )
+    # end def forum_topics_all
+    
     # noinspection PyMethodMayBeStatic
     async def forum_topic(
         self, 
         short_name: str,
         topic_slug: str,
         _client: Union[None, internet.AsyncClient] = None,
-    ) -> Topic:
+        _raw: bool = False,
+    ) -> Union[Topic, Dict]:
         """
         Fetches a **topic response** for the abbreviated forum name given by the `short_name` and topic given by `topic_slug` URL parameters.
 
@@ -2173,13 +4892,18 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
-        :return: The parsed result from the API.
-        :rtype:  Topic
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  Topic|Dict
         """
         return await forum_topic(
             short_name=short_name,
             topic_slug=topic_slug,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def forum_topic
     
@@ -2190,7 +4914,8 @@ class DerpiClient(object):
         topic_slug: str,
         page: Union[int, None] = None,
         _client: Union[None, internet.AsyncClient] = None,
-    ) -> List[Post]:
+        _raw: bool = False,
+    ) -> Union[List[Post], List[Dict]]:
         """
         Fetches a list of **post responses** for the abbreviated forum name given by the `short_name` and topic given by `topic_slug` URL parameters.
 
@@ -2216,17 +4941,192 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
-        :return: The parsed result from the API.
-        :rtype:  List[Post]
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  List[Post]|List[Dict]
         """
         return await forum_posts(
             short_name=short_name,
             topic_slug=topic_slug,
             page=page,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def forum_posts
     
+    # noinspection PyMethodMayBeStatic
+    async def forum_posts_with_total(
+        self, 
+        short_name: str,
+        topic_slug: str,
+        page: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: bool = False,
+    ) -> Union[SearchResult[Post], SearchResult[Dict]]:
+        """
+        Same as `forum_posts(...)`, but additionally returns the `total` amount of results the API reported,
+        e.g. to know the number of pages before requesting them.
+        The `total` is `None` if the API didn't send one.
+        
+        :param short_name: the variable short_name part of the url.
+        :type  short_name: str
+        
+        :param topic_slug: the variable topic_slug part of the url.
+        :type  topic_slug: str
+        
+        :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+        :type  page: int|None
+        
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        See `forum_posts(...)` for examples.
+        :type  _client: httpx.AsyncClient|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+        :rtype:  SearchResult[Post]|SearchResult[Dict]
+        """
+        return await forum_posts_with_total(
+            short_name=short_name,
+            topic_slug=topic_slug,
+            page=page,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def forum_posts_with_total
+
+    # noinspection PyMethodMayBeStatic
+    def iter_forum_posts(
+        self, 
+        short_name: str,
+        topic_slug: str,
+        start_page: int = 1,
+        max_items: Union[int, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: bool = False,
+    ) -> AsyncIterator[Union[Post, Dict]]:
+        """
+        Iterates over all the results of `forum_posts(...)`, requesting one page after another as needed.
+        While the items of one page are consumed, the next page is already requested in the background.
+        Stops once the `total` amount of results is reached, or after the first page which isn't full.
+
+        Usage:
+        >>> async for item in client.iter_forum_posts(...):
+        ...     pass
+        
+        :param short_name: the variable short_name part of the url.
+        :type  short_name: str
+        
+        :param topic_slug: the variable topic_slug part of the url.
+        :type  topic_slug: str
+        
+        :param start_page: The first page to request. The first page is `1`.
+        :type  start_page: int
+
+        :param max_items: Stop after that many items. `None` to continue until the last page.
+        :type  max_items: int|None
+
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        See `forum_posts(...)` for examples.
+        :type  _client: httpx.AsyncClient|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed items of all the pages, or their plain json with `_raw`.
+        :rtype:  AsyncIterator[Post|Dict]
+        """
+        return async_iterate_pages(
+            lambda page: self.forum_posts_with_total(
+                short_name=short_name,
+                topic_slug=topic_slug,
+                page=page,
+                _client=_client,
+                _raw=_raw,
+            ),
+            per_page=None,
+            start_page=start_page,
+            max_items=max_items,
+        )
+    # end def iter_forum_posts
+    
+    # noinspection PyMethodMayBeStatic
+    def forum_posts_all(
+        self, 
+        short_name: str,
+        topic_slug: str,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        start_page: int = 1,
+        max_pages: Union[int, None] = None,
+        semaphore: Union[asyncio.Semaphore, None] = None,
+        _client: Union[None, internet.AsyncClient] = None,
+        _raw: bool = False,
+    ) -> AsyncIterator[Union[Post, Dict]]:
+        """
+        Iterates over all the results of `forum_posts(...)`, requesting up to `concurrency` pages at the same time.
+        The `total` of the first page is used to know how many pages have to be requested.
+
+        Usage:
+        >>> async for item in client.forum_posts_all(..., concurrency=8):
+        ...     pass
+        
+        :param short_name: the variable short_name part of the url.
+        :type  short_name: str
+        
+        :param topic_slug: the variable topic_slug part of the url.
+        :type  topic_slug: str
+        
+        :param concurrency: How many pages to request at the same time.
+        :type  concurrency: int
+
+        :param ordered: If `True` the items are yielded in page order,
+                        if `False` the items of a page are yielded as soon as that page arrived.
+        :type  ordered: bool
+
+        :param start_page: The first page to request. The first page is `1`.
+        :type  start_page: int
+
+        :param max_pages: Don't request more than that many pages. `None` to continue until the last page.
+        :type  max_pages: int|None
+
+        :param semaphore: Optional semaphore to share one request budget between multiple concurrent calls.
+        :type  semaphore: asyncio.Semaphore|None
+
+        :param _client: If you wanna to provide your custom, already opened httpx.AsyncClient.
+                        See `forum_posts(...)` for examples.
+        :type  _client: httpx.AsyncClient|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed items of all the pages, or their plain json with `_raw`.
+        :rtype:  AsyncIterator[Post|Dict]
+        """
+        return async_fan_out_pages(
+            lambda page: self.forum_posts_with_total(
+                short_name=short_name,
+                topic_slug=topic_slug,
+                page=page,
+                _client=_client,
+                _raw=_raw,
+            ),
+            per_page=None,
+            concurrency=concurrency,
+            ordered=ordered,
+            start_page=start_page,
+            max_pages=max_pages,
+            semaphore=semaphore,
+        )
+    # end def forum_posts_all
+    
     # noinspection PyMethodMayBeStatic
     async def forum_post(
         self, 
@@ -2234,7 +5134,8 @@ class DerpiClient(object):
         topic_slug: str,
         post_id: int,
         _client: Union[None, internet.AsyncClient] = None,
-    ) -> Post:
+        _raw: bool = False,
+    ) -> Union[Post, Dict]:
         """
         Fetches a **post response** for the abbreviated forum name given by the `short_name`, topic given by `topic_slug` and post given by `post_id` URL parameters.
 
@@ -2260,14 +5161,19 @@ class DerpiClient(object):
 
         :type  _client: httpx.AsyncClient|None
         
-        :return: The parsed result from the API.
-        :rtype:  Post
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  Post|Dict
         """
         return await forum_post(
             short_name=short_name,
             topic_slug=topic_slug,
             post_id=post_id,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def forum_post
     
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Columnar storage of many images as numpy arrays, so filtering and aggregating them can be vectorized.
+Needs numpy to be installed, e.g. with `pip install derpi[numpy]`.
+"""
+from datetime import timezone
+from typing import Any, Dict, Iterable, List, Sequence, Union
+
+import numpy as np
+from luckydonaldUtils.logger import logging
+
+from .timestamps import parse_datetime
+
+__author__ = 'luckydonald'
+__all__ = ['ImageBatch']
+
+logger = logging.getLogger(__name__)
+if __name__ == '__main__':
+    logging.add_colored_handler(level=logging.DEBUG)
+# end if
+
+
+def _to_datetime64(values: Sequence[Union[str, None]]) -> np.ndarray:
+    """
+    Converts RFC3339 timestamps to a `datetime64[us]` array in UTC. `None` becomes `NaT`.
+    """
+    # numpy can parse the timestamps itself, as long as they are in UTC without an explicit offset.
+    cleaned = [value[:-1] if value and value.endswith('Z') else value for value in values]
+    try:
+        return np.array(cleaned, dtype='datetime64[us]')
+    except ValueError:
+        pass
+    # end try
+    # some have an offset, so parse them one by one.
+    return np.array([
+        None if value is None else parse_datetime(value).astimezone(timezone.utc).replace(tzinfo=None)
+        for value in values
+    ], dtype='datetime64[us]')
+# end def
+
+
+class ImageBatch(object):
+    """
+    Many images as a "struct of arrays": one numpy array per field, with one entry per image.
+
+    The tags are stored in compressed sparse row (CSR) format: the tag ids of all images are concatenated into
+    `tag_ids`, and the ones of image `i` are `tag_ids[tag_offsets[i]:tag_offsets[i + 1]]`.
+
+    >>> batch = client.search_images_batch(query='safe', per_page=50)
+    >>> batch[batch.score > 100].wilson_score.mean()
+    >>> batch[batch.has_tag(24249)].id
+    """
+
+    INTEGER_FIELDS = (
+        'id', 'score', 'upvotes', 'downvotes', 'faves', 'comment_count', 'width', 'height', 'size', 'tag_count',
+    )
+    FLOAT_FIELDS = ('wilson_score', 'aspect_ratio', 'duration')
+    TIMESTAMP_FIELDS = ('created_at', 'first_seen_at', 'updated_at')
+
+    id: np.ndarray
+    score: np.ndarray
+    upvotes: np.ndarray
+    downvotes: np.ndarray
+    faves: np.ndarray
+    comment_count: np.ndarray
+    width: np.ndarray
+    height: np.ndarray
+    size: np.ndarray
+    tag_count: np.ndarray
+    wilson_score: np.ndarray
+    aspect_ratio: np.ndarray
+    duration: np.ndarray
+    created_at: np.ndarray
+    first_seen_at: np.ndarray
+    updated_at: np.ndarray
+
+    def __init__(self, columns: Dict[str, np.ndarray], tag_offsets: np.ndarray, tag_ids: np.ndarray, total: Union[int, None] = None):
+        """
+        :param columns: One array per field of `INTEGER_FIELDS`, `FLOAT_FIELDS` and `TIMESTAMP_FIELDS`, all of the same length.
+        :param tag_offsets: Where the tags of each image start in `tag_ids`, with one more entry than there are images.
+        :param tag_ids: The tag ids of all images, concatenated.
+        :param total: The total amount of results the API reported, if this is a search page.
+        """
+        for name in self.INTEGER_FIELDS + self.FLOAT_FIELDS + self.TIMESTAMP_FIELDS:
+            setattr(self, name, columns[name])
+        # end for
+        self.tag_offsets = tag_offsets
+        self.tag_ids = tag_ids
+        self.total = total
+    # end def
+
+    @classmethod
+    def from_dicts(cls, items: Sequence[Dict[str, Any]], total: Union[int, None] = None) -> 'ImageBatch':
+        """
+        Builds a batch directly from the image dicts of the API, without creating `Image` models first.
+        Missing or `None` values become `-1` for integers, `NaN` for floats and `NaT` for timestamps.
+
+        :param items: The image dicts, e.g. the `'images'` of a search response.
+        :param total: The total amount of results the API reported.
+        """
+        columns = {}
+        for name in cls.INTEGER_FIELDS:
+            columns[name] = np.fromiter(
+                (-1 if item.get(name) is None else item[name] for item in items), dtype=np.int64, count=len(items),
+            )
+        # end for
+        for name in cls.FLOAT_FIELDS:
+            columns[name] = np.fromiter(
+                (np.nan if item.get(name) is None else item[name] for item in items), dtype=np.float64, count=len(items),
+            )
+        # end for
+        for name in cls.TIMESTAMP_FIELDS:
+            columns[name] = _to_datetime64([item.get(name) for item in items])
+        # end for
+        tag_lists: List[List[int]] = [item.get('tag_ids') or [] for item in items]
+        tag_offsets = np.zeros(len(items) + 1, dtype=np.int64)
+        np.cumsum([len(tags) for tags in tag_lists], out=tag_offsets[1:])
+        tag_ids = np.fromiter(
+            (tag_id for tags in tag_lists for tag_id in tags), dtype=np.int64, count=int(tag_offsets[-1]),
+        )
+        return cls(columns=columns, tag_offsets=tag_offsets, tag_ids=tag_ids, total=total)
+    # end def
+
+    @classmethod
+    def from_images(cls, images: Sequence[Any], total: Union[int, None] = None) -> 'ImageBatch':
+        """
+        Builds a batch from already parsed `Image` models.
+        """
+        fields = cls.INTEGER_FIELDS + cls.FLOAT_FIELDS + cls.TIMESTAMP_FIELDS + ('tag_ids',)
+        items = []
+        for image in images:
+            item = {name: getattr(image, name) for name in fields}
+            for name in cls.TIMESTAMP_FIELDS:
+                if item[name] is not None:
+                    item[name] = item[name].astimezone(timezone.utc).replace(tzinfo=None).isoformat()
+                # end if
+            # end for
+            items.append(item)
+        # end for
+        return cls.from_dicts(items, total=total)
+    # end def
+
+    @classmethod
+    def concatenate(cls, batches: Iterable['ImageBatch']) -> 'ImageBatch':
+        """
+        Joins several batches, e.g. the pages of a search, into one.
+        """
+        batches = list(batches)
+        if not batches:
+            return cls.from_dicts([])
+        # end if
+        columns = {
+            name: np.concatenate([getattr(batch, name) for batch in batches])
+            for name in cls.INTEGER_FIELDS + cls.FLOAT_FIELDS + cls.TIMESTAMP_FIELDS
+        }
+        offsets = [batches[0].tag_offsets]
+        for batch in batches[1:]:
+            offsets.append(batch.tag_offsets[1:] + offsets[-1][-1])
+        # end for
+        return cls(
+            columns=columns,
+            tag_offsets=np.concatenate(offsets),
+            tag_ids=np.concatenate([batch.tag_ids for batch in batches]),
+            total=batches[0].total,
+        )
+    # end def
+
+    def __len__(self) -> int:
+        return len(self.id)
+    # end def
+
+    def __getitem__(self, selection: Union[np.ndarray, slice, Sequence[int]]) -> 'ImageBatch':
+        """
+        A new batch with only the selected images, e.g. `batch[batch.score > 100]`.
+
+        :param selection: A boolean mask, an array of indices or a slice.
+        """
+        indices = np.arange(len(self))[selection]
+        columns = {
+            name: getattr(self, name)[indices]
+            for name in self.INTEGER_FIELDS + self.FLOAT_FIELDS + self.TIMESTAMP_FIELDS
+        }
+        starts = self.tag_offsets[indices]
+        counts = self.tag_offsets[indices + 1] - starts
+        tag_offsets = np.zeros(len(indices) + 1, dtype=np.int64)
+        np.cumsum(counts, out=tag_offsets[1:])
+        # position of every selected tag in the old `tag_ids`: the start of its image plus its index within the image.
+        positions = np.repeat(starts - tag_offsets[:-1], counts) + np.arange(tag_offsets[-1])
+        return type(self)(columns=columns, tag_offsets=tag_offsets, tag_ids=self.tag_ids[positions], total=self.total)
+    # end def
+
+    def tags_of(self, index: int) -> np.ndarray:
+        """
+        The tag ids of the image at that position.
+        """
+        return self.tag_ids[self.tag_offsets[index]:self.tag_offsets[index + 1]]
+    # end def
+
+    def has_tag(self, tag_id: int) -> np.ndarray:
+        """
+        Boolean mask of the images having the given tag.
+        """
+        image_of_tag = np.repeat(np.arange(len(self)), np.diff(self.tag_offsets))
+        mask = np.zeros(len(self), dtype=bool)
+        mask[image_of_tag[self.tag_ids == tag_id]] = True
+        return mask
+    # end def
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(images={len(self)!r}, tags={len(self.tag_ids)!r}, total={self.total!r})'
+    # end def
+# end class
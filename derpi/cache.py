@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+In-memory cache for parsed API results, so looking up the same image or tag again costs neither a request nor parsing.
+"""
+import hashlib
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Tuple, Union
+
+from luckydonaldUtils.logger import logging
+
+__author__ = 'luckydonald'
+__all__ = ['ModelCache']
+
+logger = logging.getLogger(__name__)
+if __name__ == '__main__':
+    logging.add_colored_handler(level=logging.DEBUG)
+# end if
+
+
+class ModelCache(object):
+    """
+    Thread safe LRU cache with a time to live, holding parsed model instances.
+
+    Keys are built by `make_key(route, url, params)`, the url already contains the base url and the url parameters.
+    The API key, if any, is only stored as a hash.
+    Note that cached models are shared between all callers, so don't modify them.
+
+    Expired results are kept if the server sent validators (`ETag`/`Last-Modified`) for them,
+    so they can be revalidated with a conditional request instead of being downloaded and parsed again.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 300.0, route_ttls: Union[Dict[str, float], None] = None):
+        """
+        :param max_size: How many results are kept at most, the least recently used are dropped first.
+        :param ttl: Seconds a result is kept.
+        :param route_ttls: Different TTLs for some of the routes, e.g. `{'featured_image': 60, 'tag': 3600}`.
+        """
+        assert max_size >= 1
+        self.max_size = max_size
+        self.ttl = ttl
+        self.route_ttls: Dict[str, float] = dict(route_ttls or {})
+        # key -> (expires_at, value, revalidation_headers)
+        self._entries: 'OrderedDict[Hashable, Tuple[float, Any, Union[Dict[str, str], None]]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits: Dict[str, int] = {}  # per route
+        self.misses: Dict[str, int] = {}  # per route
+        self.revalidations: Dict[str, int] = {}  # per route, results the server confirmed to be still up to date
+    # end def
+
+    @staticmethod
+    def make_key(route: str, url: str, params: Union[Dict[str, Any], None] = None) -> Tuple:
+        """
+        Builds the cache key of a request.
+
+        :param route: The name of the route, e.g. `'image'`.
+        :param url: The full url, including base url and url parameters.
+        :param params: The query parameters. `None` values are ignored, the `key` is hashed.
+        """
+        items = []
+        for name, value in sorted((params or {}).items()):
+            if value is None:
+                continue
+            # end if
+            if name == 'key':
+                value = hashlib.sha256(str(value).encode('utf-8')).hexdigest()
+            # end if
+            items.append((name, value))
+        # end for
+        return route, url, tuple(items)
+    # end def
+
+    def ttl_for(self, route: str) -> float:
+        """
+        Seconds results of the given route are kept.
+        """
+        return self.route_ttls.get(route, self.ttl)
+    # end def
+
+    def get(self, key: Tuple) -> Union[Any, None]:
+        """
+        The cached value, or `None` if there is none or it expired.
+
+        :param key: As returned by `make_key(...)`.
+        """
+        route = key[0]
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value, revalidation_headers = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits[route] = self.hits.get(route, 0) + 1
+                    return value
+                # end if
+                if not revalidation_headers:
+                    del self._entries[key]
+                # end if
+            # end if
+            self.misses[route] = self.misses.get(route, 0) + 1
+            return None
+        # end with
+    # end def
+
+    def revalidation_headers(self, key: Tuple) -> Union[Dict[str, str], None]:
+        """
+        The headers for a conditional request, if there is an expired value the server sent validators for.
+
+        :param key: As returned by `make_key(...)`.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        # end with
+        if entry is None:
+            return None
+        # end if
+        return entry[2] or None
+    # end def
+
+    def revalidated(self, key: Tuple) -> Union[Any, None]:
+        """
+        The server confirmed the (expired) value is still up to date, so it's valid for another `ttl` again.
+
+        :param key: As returned by `make_key(...)`.
+        :return: The value, or `None` if it was evicted in the meantime.
+        """
+        route = key[0]
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            # end if
+            _, value, revalidation_headers = entry
+            self._entries[key] = (time.monotonic() + self.ttl_for(route), value, revalidation_headers)
+            self._entries.move_to_end(key)
+            self.revalidations[route] = self.revalidations.get(route, 0) + 1
+            return value
+        # end with
+    # end def
+
+    def set(self, key: Tuple, value: Any, revalidation_headers: Union[Dict[str, str], None] = None) -> None:
+        """
+        Stores a value, evicting the least recently used ones if the cache is full.
+
+        :param key: As returned by `make_key(...)`.
+        :param value: The parsed result.
+        :param revalidation_headers: The headers to check if the value is still up to date once it expired,
+                                     see `derpi.conditional.revalidation_headers_for(...)`.
+        """
+        if value is None:
+            return
+        # end if
+        expires_at = time.monotonic() + self.ttl_for(key[0])
+        with self._lock:
+            self._entries[key] = (expires_at, value, revalidation_headers)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+            # end while
+        # end with
+    # end def
+
+    def clear(self) -> None:
+        """
+        Removes all values, the statistics are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+        # end with
+    # end def
+
+    def __len__(self) -> int:
+        return len(self._entries)
+    # end def
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Total hits, misses and the current size of the cache.
+        """
+        with self._lock:
+            return {
+                'hits': sum(self.hits.values()),
+                'misses': sum(self.misses.values()),
+                'size': len(self._entries),
+            }
+        # end with
+    # end def
+# end class
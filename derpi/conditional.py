@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Helpers for conditional requests, asking the server to only send a result again if it changed since we last got it.
+"""
+from typing import Any, Dict, Tuple, Union
+
+from luckydonaldUtils.logger import logging
+
+__author__ = 'luckydonald'
+__all__ = ['NOT_MODIFIED', 'validators_of', 'revalidation_headers_for', 'is_conditional']
+
+logger = logging.getLogger(__name__)
+if __name__ == '__main__':
+    logging.add_colored_handler(level=logging.DEBUG)
+# end if
+
+
+NOT_MODIFIED = 304  # status code of a response to a conditional request, if our copy is still up to date.
+
+
+def validators_of(response: Any) -> Tuple[Union[str, None], Union[str, None]]:
+    """
+    The `ETag` and `Last-Modified` headers of a requests/httpx response, `None` if not present.
+    """
+    return response.headers.get('etag', None), response.headers.get('last-modified', None)
+# end def
+
+
+def revalidation_headers_for(etag: Union[str, None], last_modified: Union[str, None]) -> Dict[str, str]:
+    """
+    The request headers to ask if a result with the given validators changed. Empty if there are no validators.
+    """
+    headers = {}
+    if etag:
+        headers['If-None-Match'] = etag
+    # end if
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+    # end if
+    return headers
+# end def
+
+
+def is_conditional(headers: Union[Dict[str, str], None]) -> bool:
+    """
+    If the given request headers make it a conditional request, i.e. if a `304` response is to be expected.
+    """
+    if not headers:
+        return False
+    # end if
+    return any(name.lower() in ('if-none-match', 'if-modified-since') for name in headers)
+# end def
@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Crawls huge image searches in parallel, by splitting them into `created_at` ranges which are requested at the same time.
+"""
+import asyncio
+import math
+import queue
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, Iterator, List, Set, Union
+
+from luckydonaldUtils.logger import logging
+
+from .pagination import DEFAULT_CONCURRENCY, MAX_PAGE_SIZE
+
+__author__ = 'luckydonald'
+__all__ = [
+    'EPOCH', 'DEFAULT_SHARD_SIZE', 'Shard',
+    'plan_shards', 'async_plan_shards', 'crawl_images', 'async_crawl_images',
+]
+
+logger = logging.getLogger(__name__)
+if __name__ == '__main__':
+    logging.add_colored_handler(level=logging.DEBUG)
+# end if
+
+
+EPOCH = datetime(2012, 1, 1, tzinfo=timezone.utc)  # derpibooru has no images uploaded before.
+DEFAULT_SHARD_SIZE = 10000  # ranges with more images are split further.
+MAX_SPLIT = 16  # a range is split into at most that many parts at once, as every part costs a request to count it.
+MIN_SPAN = timedelta(minutes=1)  # ranges this short are not split further, regardless how many images they have.
+
+
+def _timestamp(value: datetime) -> str:
+    """
+    The datetime as the search syntax wants it, in UTC.
+    """
+    return value.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+# end def
+
+
+class Shard(object):
+    """
+    The images of a query uploaded in a range of time, from `start` including to `end` excluding.
+    """
+    __slots__ = ['start', 'end', 'total']
+
+    def __init__(self, start: datetime, end: datetime, total: Union[int, None] = None):
+        """
+        :param start: The first moment in the range.
+        :param end: The first moment after the range.
+        :param total: How many images the API reported for the range, `None` if not yet requested or unknown.
+        """
+        self.start = start
+        self.end = end
+        self.total = total
+    # end def
+
+    def query(self, query: str) -> str:
+        """
+        The query narrowed to this range.
+        """
+        return f'({query}), created_at.gte:{_timestamp(self.start)}, created_at.lt:{_timestamp(self.end)}'
+    # end def
+
+    def split(self, parts: int) -> List['Shard']:
+        """
+        The range cut into up to `parts` ranges of the same length, at whole seconds.
+        """
+        step = (self.end - self.start) / parts
+        bounds = [self.start]
+        for part in range(1, parts):
+            bound = (self.start + step * part).replace(microsecond=0)
+            if bound > bounds[-1]:
+                bounds.append(bound)
+            # end if
+        # end for
+        bounds.append(self.end)
+        return [Shard(start, end) for start, end in zip(bounds, bounds[1:])]
+    # end def
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(start={self.start!r}, end={self.end!r}, total={self.total!r})'
+    # end def
+# end class
+
+
+def _parts_needed(shard: Shard, shard_size: int, min_span: timedelta) -> int:
+    """
+    Into how many parts the counted shard should be split, `1` if it's fine as it is.
+    """
+    if shard.total is None or shard.total <= shard_size or shard.end - shard.start <= min_span:
+        return 1
+    # end if
+    return min(math.ceil(shard.total / shard_size), MAX_SPLIT)
+# end def
+
+
+def _range(start: Union[datetime, None], end: Union[datetime, None]) -> Shard:
+    """
+    The whole range to crawl, with the defaults filled in.
+    """
+    start = EPOCH if start is None else start
+    end = datetime.now(timezone.utc) if end is None else end
+    if start.tzinfo is None or end.tzinfo is None:
+        raise ValueError('start and end need a timezone, e.g. `datetime(2020, 1, 1, tzinfo=timezone.utc)`.')
+    # end if
+    if start >= end:
+        raise ValueError(f'start ({start}) has to be before end ({end}).')
+    # end if
+    return Shard(start, end)
+# end def
+
+
+def plan_shards(
+    query: str,
+    start: Union[datetime, None] = None,
+    end: Union[datetime, None] = None,
+    filter_id: Union[int, None] = None,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    min_span: timedelta = MIN_SPAN,
+    client: Union['DerpiClient', None] = None,
+) -> List[Shard]:
+    """
+    Splits the uploads of a query into ranges with no more than about `shard_size` images each.
+
+    Every range is counted with a request for a single image, using the `total` the API reports.
+    A range with too many images is split into as many equally long parts as it would need if the uploads were spread evenly,
+    and those are counted again, as they usually aren't. Ranges without any images are dropped.
+
+    :param query: The search query.
+    :param start: The first upload time to include. Defaults to before the first image was uploaded.
+    :param end: The first upload time not to include anymore. Defaults to now.
+    :param filter_id: Optional filter to use. The default filter hides some images.
+    :param shard_size: Ranges with more images are split further.
+    :param concurrency: How many ranges are counted at the same time, using a thread pool.
+    :param min_span: Ranges this short are not split further, regardless how many images they have.
+    :param client: The `DerpiClient` to use, e.g. for an api key, rate limiting or retrying.
+    :return: The ranges, oldest first, with their `total`.
+    """
+    from .syncrounous.client import DerpiClient
+    if client is None:
+        client = DerpiClient(key=None)
+    # end if
+
+    def count(shard: Shard) -> Shard:
+        shard.total = client.search_images_with_total(
+            query=shard.query(query), filter_id=filter_id, page=1, per_page=1, _raw=True,
+        ).total
+        return shard
+    # end def
+
+    planned: List[Shard] = []
+    pending = [_range(start, end)]
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        while pending:
+            counted = list(executor.map(count, pending))
+            pending = []
+            for shard in counted:
+                parts = _parts_needed(shard, shard_size=shard_size, min_span=min_span)
+                split = shard.split(parts) if parts > 1 else [shard]
+                if len(split) > 1:
+                    pending.extend(split)
+                elif shard.total != 0:  # also if it's too short to be split at whole seconds.
+                    planned.append(shard)
+                # end if
+            # end for
+        # end while
+    # end with
+    planned.sort(key=lambda shard: shard.start)
+    logger.debug(f'Split {query!r} into {len(planned)} shards.')
+    return planned
+# end def
+
+
+async def async_plan_shards(
+    query: str,
+    start: Union[datetime, None] = None,
+    end: Union[datetime, None] = None,
+    filter_id: Union[int, None] = None,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    min_span: timedelta = MIN_SPAN,
+    client: Union['DerpiClient', None] = None,
+) -> List[Shard]:
+    """
+    Same as `plan_shards(...)`, but with the async `DerpiClient`, counting up to `concurrency` ranges at the same time.
+    """
+    from .asyncrounous.client import DerpiClient
+    if client is None:
+        client = DerpiClient(key=None)
+    # end if
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def count(shard: Shard) -> Shard:
+        async with semaphore:
+            result = await client.search_images_with_total(
+                query=shard.query(query), filter_id=filter_id, page=1, per_page=1, _raw=True,
+            )
+        # end with
+        shard.total = result.total
+        return shard
+    # end def
+
+    planned: List[Shard] = []
+    pending = [_range(start, end)]
+    while pending:
+        counted = await asyncio.gather(*[count(shard) for shard in pending])
+        pending = []
+        for shard in counted:
+            parts = _parts_needed(shard, shard_size=shard_size, min_span=min_span)
+            split = shard.split(parts) if parts > 1 else [shard]
+            if len(split) > 1:
+                pending.extend(split)
+            elif shard.total != 0:  # also if it's too short to be split at whole seconds.
+                planned.append(shard)
+            # end if
+        # end for
+    # end while
+    planned.sort(key=lambda shard: shard.start)
+    logger.debug(f'Split {query!r} into {len(planned)} shards.')
+    return planned
+# end def
+
+
+def _id_of(item: Union[Dict[str, Any], Any]) -> int:
+    return item['id'] if isinstance(item, dict) else item.id
+# end def
+
+
+class _ShardDone(object):
+    """
+    Put in the queue once a shard has no more images, with the error if it failed.
+    """
+    __slots__ = ['error']
+
+    def __init__(self, error: Union[BaseException, None] = None):
+        self.error = error
+    # end def
+# end class
+
+
+def crawl_images(
+    query: str,
+    start: Union[datetime, None] = None,
+    end: Union[datetime, None] = None,
+    filter_id: Union[int, None] = None,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    min_span: timedelta = MIN_SPAN,
+    client: Union['DerpiClient', None] = None,
+    _raw: bool = False,
+) -> Iterator[Union['Image', Dict]]:
+    """
+    Yields all images of a query, crawling `concurrency` ranges of upload time at once in a thread pool.
+
+    The ranges are planned with `plan_shards(...)` first, every one of them is then walked with
+    `iter_search_images_by_id(...)`. The images are yielded as they arrive, so not in any order,
+    and every image only once, even if it moved between ranges while crawling.
+
+    >>> for image in crawl_images('safe, pony', concurrency=8, client=DerpiClient(key='...')):
+    ...     pass
+
+    :param query: The search query.
+    :param start: The first upload time to include. Defaults to before the first image was uploaded.
+    :param end: The first upload time not to include anymore. Defaults to now.
+    :param filter_id: Optional filter to use. The default filter hides some images.
+    :param shard_size: Ranges with more images are split further.
+    :param concurrency: How many ranges are requested at the same time. Use a `RateLimiter` on the client to stay polite.
+    :param min_span: Ranges this short are not split further, regardless how many images they have.
+    :param client: The `DerpiClient` to use, e.g. for an api key, rate limiting or retrying.
+    :param _raw: Yield the json of the API as is, without building any models.
+    """
+    from .syncrounous.client import DerpiClient
+    if client is None:
+        client = DerpiClient(key=None)
+    # end if
+    shards = plan_shards(
+        query, start=start, end=end, filter_id=filter_id, shard_size=shard_size, concurrency=concurrency,
+        min_span=min_span, client=client,
+    )
+    items = queue.Queue(maxsize=concurrency * MAX_PAGE_SIZE)
+    stopped = threading.Event()
+
+    def put(item: Any) -> bool:
+        """ Waits for space in the queue, unless the consumer is gone. """
+        while not stopped.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+            # end try
+        # end while
+        return False
+    # end def
+
+    def crawl(shard: Shard) -> None:
+        try:
+            for item in client.iter_search_images_by_id(
+                shard.query(query), filter_id=filter_id, per_page=MAX_PAGE_SIZE, _raw=_raw,
+            ):
+                if not put(item):
+                    return
+                # end if
+            # end for
+        except Exception as e:
+            put(_ShardDone(e))
+            return
+        # end try
+        put(_ShardDone())
+    # end def
+
+    seen: Set[int] = set()
+    remaining = len(shards)
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        for shard in shards:
+            executor.submit(crawl, shard)
+        # end for
+        while remaining:
+            item = items.get()
+            if isinstance(item, _ShardDone):
+                if item.error is not None:
+                    raise item.error
+                # end if
+                remaining -= 1
+                continue
+            # end if
+            image_id = _id_of(item)
+            if image_id not in seen:
+                seen.add(image_id)
+                yield item
+            # end if
+        # end while
+    finally:
+        stopped.set()
+        executor.shutdown(wait=False)
+    # end try
+# end def
+
+
+async def async_crawl_images(
+    query: str,
+    start: Union[datetime, None] = None,
+    end: Union[datetime, None] = None,
+    filter_id: Union[int, None] = None,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    min_span: timedelta = MIN_SPAN,
+    client: Union['DerpiClient', None] = None,
+    _raw: bool = False,
+) -> AsyncIterator[Union['Image', Dict]]:
+    """
+    Same as `crawl_images(...)`, but with the async `DerpiClient`, crawling `concurrency` ranges as tasks at the same time.
+
+    >>> async for image in async_crawl_images('safe, pony', concurrency=8, client=DerpiClient(key='...')):
+    ...     pass
+    """
+    from .asyncrounous.client import DerpiClient
+    if client is None:
+        client = DerpiClient(key=None)
+    # end if
+    shards = await async_plan_shards(
+        query, start=start, end=end, filter_id=filter_id, shard_size=shard_size, concurrency=concurrency,
+        min_span=min_span, client=client,
+    )
+    items = asyncio.Queue(maxsize=concurrency * MAX_PAGE_SIZE)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def crawl(shard: Shard) -> None:
+        async with semaphore:
+            try:
+                async for item in client.iter_search_images_by_id(
+                    shard.query(query), filter_id=filter_id, per_page=MAX_PAGE_SIZE, _raw=_raw,
+                ):
+                    await items.put(item)
+                # end for
+            except Exception as e:
+                await items.put(_ShardDone(e))
+                return
+            # end try
+        # end with
+        await items.put(_ShardDone())
+    # end def
+
+    seen: Set[int] = set()
+    remaining = len(shards)
+    tasks = [asyncio.ensure_future(crawl(shard)) for shard in shards]
+    try:
+        while remaining:
+            item = await items.get()
+            if isinstance(item, _ShardDone):
+                if item.error is not None:
+                    raise item.error
+                # end if
+                remaining -= 1
+                continue
+            # end if
+            image_id = _id_of(item)
+            if image_id not in seen:
+                seen.add(image_id)
+                yield item
+            # end if
+        # end while
+    finally:
+        for task in tasks:
+            task.cancel()
+        # end for
+    # end try
+# end def
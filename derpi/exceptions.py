@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Errors raised when talking to the API.
+"""
+import time
+
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Union
+
+from luckydonaldUtils.logger import logging
+
+__author__ = 'luckydonald'
+__all__ = [
+    'DerpiException', 'DerpiConnectionError', 'DerpiUnexpectedResponseError',
+    'DerpiHttpError', 'DerpiClientError', 'DerpiNotFoundError', 'DerpiRateLimitedError', 'DerpiServerError',
+    'http_error_for', 'parse_retry_after',
+]
+
+logger = logging.getLogger(__name__)
+if __name__ == '__main__':
+    logging.add_colored_handler(level=logging.DEBUG)
+# end if
+
+
+class DerpiException(Exception):
+    """
+    Base class for all errors of this library.
+    """
+    pass
+# end class
+
+
+class DerpiConnectionError(DerpiException):
+    """
+    The request didn't get a response, e.g. a connection reset or a timeout.
+    The original error of requests/httpx is available as `__cause__`.
+    """
+    pass
+# end class
+
+
+class DerpiUnexpectedResponseError(DerpiException):
+    """
+    The server answered, but not with something we can parse, e.g. an html page instead of json.
+    """
+
+    def __init__(self, message: str, response: Any = None):
+        """
+        :param message: What was wrong.
+        :param response: The requests/httpx response.
+        """
+        super().__init__(message)
+        self.response = response
+    # end def
+# end class
+
+
+class DerpiHttpError(DerpiException):
+    """
+    The server answered with a status code other than `200`.
+    """
+
+    def __init__(self, status_code: int, message: str, response: Any = None, retry_after: Union[float, None] = None):
+        """
+        :param status_code: The http status code of the response.
+        :param message: Human readable description, including the start of the response body.
+        :param response: The requests/httpx response.
+        :param retry_after: Seconds the server asked us to wait via a `Retry-After` header, if any.
+        """
+        super().__init__(message)
+        self.status_code = status_code
+        self.response = response
+        self.retry_after = retry_after
+    # end def
+# end class
+
+
+class DerpiClientError(DerpiHttpError):
+    """
+    `4xx` status code, the request was wrong.
+    """
+    pass
+# end class
+
+
+class DerpiNotFoundError(DerpiClientError):
+    """
+    `404` status code, e.g. the image with that id doesn't exist.
+    """
+    pass
+# end class
+
+
+class DerpiRateLimitedError(DerpiClientError):
+    """
+    `429` status code, we sent too many requests.
+    """
+    pass
+# end class
+
+
+class DerpiServerError(DerpiHttpError):
+    """
+    `5xx` status code, the server, or something in front of it, had a problem.
+    """
+    pass
+# end class
+
+
+def parse_retry_after(value: Union[str, None]) -> Union[float, None]:
+    """
+    Parses a `Retry-After` header, which is either in seconds or a http date.
+
+    :return: Seconds to wait, or `None` if there was no (valid) header.
+    """
+    if not value:
+        return None
+    # end if
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    # end if
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    # end try
+    if date is None:
+        return None
+    # end if
+    if date.tzinfo is None:  # http dates are always GMT, even if written as `-0000`.
+        date = date.replace(tzinfo=timezone.utc)
+    # end if
+    return max(0.0, date.timestamp() - time.time())
+# end def
+
+
+def http_error_for(response: Any) -> DerpiHttpError:
+    """
+    Builds the fitting `DerpiHttpError` subclass for a requests/httpx response with a non `200` status code.
+    """
+    status_code: int = response.status_code
+    try:
+        body = response.text[:200]
+    except Exception:
+        body = ''
+    # end try
+    message = f'Server responded with status code {status_code}: {body!r}'
+    retry_after = parse_retry_after(response.headers.get('retry-after', None))
+    if status_code == 404:
+        error_class = DerpiNotFoundError
+    elif status_code == 429:
+        error_class = DerpiRateLimitedError
+    elif 400 <= status_code < 500:
+        error_class = DerpiClientError
+    elif 500 <= status_code < 600:
+        error_class = DerpiServerError
+    else:
+        error_class = DerpiHttpError
+    # end if
+    return error_class(status_code=status_code, message=message, response=response, retry_after=retry_after)
+# end def
@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Writing (lots of) API results to files, for working with them offline.
+The Arrow and Parquet export is in `derpi.export.arrow`, as it needs pyarrow.
+"""
+from .jsonl import Checkpoint, JsonlExport, search_images_to_jsonl, async_search_images_to_jsonl
+
+__author__ = 'luckydonald'
+__all__ = ['Checkpoint', 'JsonlExport', 'search_images_to_jsonl', 'async_search_images_to_jsonl']
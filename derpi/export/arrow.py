@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Converts API results to Apache Arrow tables, and writes search results to Parquet files page by page.
+Needs pyarrow to be installed, e.g. with `pip install derpi[arrow]`.
+
+The schemas are generated from the models, see `derpi.export.arrow_schemas`.
+"""
+from typing import Any, Dict, Iterable, List, Union
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from luckydonaldUtils.logger import logging
+
+from ..pagination import MAX_PAGE_SIZE
+from ..serialization import dumps
+from ..timestamps import parse_datetime_fast
+from .arrow_schemas import SCHEMAS, TIMESTAMP_FIELDS, NESTED_FIELDS, JSON_FIELDS
+
+__author__ = 'luckydonald'
+__all__ = [
+    'MODELS_OF_ROUTES', 'table_of', 'ParquetExport',
+    'search_to_parquet', 'async_search_to_parquet', 'search_images_to_parquet', 'async_search_images_to_parquet',
+]
+
+logger = logging.getLogger(__name__)
+if __name__ == '__main__':
+    logging.add_colored_handler(level=logging.DEBUG)
+# end if
+
+
+# paginated route -> name of the model it returns.
+MODELS_OF_ROUTES: Dict[str, str] = {
+    'search_images': 'Image',
+    'search_tags': 'Tag',
+    'search_comments': 'Comment',
+    'search_posts': 'Post',
+    'search_galleries': 'Gallery',
+}
+
+
+def _prepare(model: str, item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    A copy of the json of a model, with the values pyarrow can't convert itself replaced:
+    timestamps become `datetime`s and arrays of objects json strings, in nested models as well.
+    """
+    item = dict(item)
+    for name in TIMESTAMP_FIELDS.get(model, ()):
+        if item.get(name) is not None:
+            item[name] = parse_datetime_fast(item[name])
+        # end if
+    # end for
+    for name in JSON_FIELDS.get(model, ()):
+        if item.get(name) is not None:
+            item[name] = [dumps(value).decode('utf-8') for value in item[name]]
+        # end if
+    # end for
+    for name, nested_model in NESTED_FIELDS.get(model, {}).items():
+        value = item.get(name)
+        if isinstance(value, list):
+            item[name] = [_prepare(nested_model, nested) for nested in value]
+        elif value:
+            item[name] = _prepare(nested_model, value)
+        else:  # `{}` means none, like for `from_dict(...)`.
+            item[name] = None
+        # end if
+    # end for
+    return item
+# end def
+
+
+def table_of(items: Iterable[Union[Dict[str, Any], Any]], model: str) -> pa.Table:
+    """
+    Converts models, or their plain json like with `_raw=True`, to a table with the schema of that model.
+
+    >>> table_of(client.search_images('safe', _raw=True), 'Image')
+
+    :param items: The models, or dicts.
+    :param model: Name of the model, e.g. `'Image'`. See `derpi.export.arrow_schemas.SCHEMAS`.
+    """
+    if model not in SCHEMAS:
+        raise ValueError(f'Unknown model {model!r}, known are: {list(SCHEMAS)!r}')
+    # end if
+    rows = [_prepare(model, item if isinstance(item, dict) else item.to_dict()) for item in items]
+    return pa.Table.from_pylist(rows, schema=SCHEMAS[model])
+# end def
+
+
+class ParquetExport(object):
+    """
+    Writes models (or their json) to a Parquet file, in row groups of `row_group_size` rows.
+    Only the rows of the current row group are kept in memory.
+
+    >>> with ParquetExport('images.parquet', 'Image') as export:
+    ...     for page in pages:
+    ...         export.write(page)
+    """
+
+    def __init__(self, path: str, model: str, row_group_size: int = 10000, compression: str = 'zstd'):
+        """
+        :param path: The file to write.
+        :param model: Name of the model, e.g. `'Image'`. See `derpi.export.arrow_schemas.SCHEMAS`.
+        :param row_group_size: How many rows are collected before they are written as one row group.
+        :param compression: The Parquet compression codec, e.g. `'zstd'`, `'snappy'` or `'none'`.
+        """
+        if model not in SCHEMAS:
+            raise ValueError(f'Unknown model {model!r}, known are: {list(SCHEMAS)!r}')
+        # end if
+        assert row_group_size >= 1
+        self.model = model
+        self.row_group_size = row_group_size
+        self.writer = pq.ParquetWriter(path, SCHEMAS[model], compression=compression)
+        self.rows: List[Union[Dict[str, Any], Any]] = []
+        self.written = 0
+    # end def
+
+    def write(self, items: Iterable[Union[Dict[str, Any], Any]]) -> None:
+        """
+        Adds models, or their json, writing a row group whenever enough are collected.
+        """
+        for item in items:
+            self.rows.append(item)
+            if len(self.rows) >= self.row_group_size:
+                self.flush()
+            # end if
+        # end for
+    # end def
+
+    def flush(self) -> None:
+        """
+        Writes the collected rows as a row group.
+        """
+        if not self.rows:
+            return
+        # end if
+        self.writer.write_table(table_of(self.rows, self.model), row_group_size=self.row_group_size)
+        self.written += len(self.rows)
+        self.rows = []
+    # end def
+
+    def close(self) -> None:
+        """
+        Writes the remaining rows and finishes the file.
+        """
+        self.flush()
+        self.writer.close()
+    # end def
+
+    def __enter__(self) -> 'ParquetExport':
+        return self
+    # end def
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    # end def
+# end class
+
+
+def search_to_parquet(
+    route: str,
+    query: str,
+    path: str,
+    filter_id: Union[int, None] = None,
+    sort_field: Union[str, None] = None,
+    sort_direction: Union[str, None] = None,
+    per_page: Union[int, None] = None,
+    row_group_size: int = 10000,
+    compression: str = 'zstd',
+    max_items: Union[int, None] = None,
+    client: Union['DerpiClient', None] = None,
+) -> int:
+    """
+    Writes all results of a search to a Parquet file, as they are requested page by page.
+
+    >>> search_to_parquet('search_tags', 'category:origin', 'tags.parquet', client=DerpiClient(key='...'))
+
+    :param route: The search, one of `MODELS_OF_ROUTES`, e.g. `'search_images'`.
+    :param query: The search query.
+    :param path: The file to write.
+    :param filter_id: Optional filter to use. Only for the routes having that parameter, e.g. `search_images`.
+    :param sort_field: Field to sort by. Only for the routes having that parameter.
+    :param sort_direction: `'desc'` or `'asc'`. Only for the routes having that parameter.
+    :param per_page: How many results to request at once. Only for the routes having that parameter.
+    :param row_group_size: How many rows are written as one row group. That's how many are kept in memory.
+    :param compression: The Parquet compression codec.
+    :param max_items: Stop after that many results. `None` for all of them.
+    :param client: The `DerpiClient` to use, e.g. for an api key, rate limiting or retrying.
+    :return: The amount of rows written.
+    """
+    from ..syncrounous.client import DerpiClient
+    if route not in MODELS_OF_ROUTES:
+        raise ValueError(f'Unknown search {route!r}, supported are: {list(MODELS_OF_ROUTES)!r}')
+    # end if
+    if client is None:
+        client = DerpiClient(key=None)
+    # end if
+    parameters = dict(filter_id=filter_id, sort_field=sort_field, sort_direction=sort_direction, per_page=per_page)
+    parameters = {name: value for name, value in parameters.items() if value is not None}  # not all searches have them.
+    with ParquetExport(path, MODELS_OF_ROUTES[route], row_group_size=row_group_size, compression=compression) as export:
+        export.write(getattr(client, 'iter_' + route)(query, max_items=max_items, _raw=True, **parameters))
+    # end with
+    return export.written
+# end def
+
+
+async def async_search_to_parquet(
+    route: str,
+    query: str,
+    path: str,
+    filter_id: Union[int, None] = None,
+    sort_field: Union[str, None] = None,
+    sort_direction: Union[str, None] = None,
+    per_page: Union[int, None] = None,
+    row_group_size: int = 10000,
+    compression: str = 'zstd',
+    max_items: Union[int, None] = None,
+    client: Union['DerpiClient', None] = None,
+) -> int:
+    """
+    Same as `search_to_parquet(...)`, but with the async `DerpiClient`.
+    Writing a row group still blocks, but that's fast compared to requesting the pages.
+    """
+    from ..asyncrounous.client import DerpiClient
+    if route not in MODELS_OF_ROUTES:
+        raise ValueError(f'Unknown search {route!r}, supported are: {list(MODELS_OF_ROUTES)!r}')
+    # end if
+    if client is None:
+        client = DerpiClient(key=None)
+    # end if
+    parameters = dict(filter_id=filter_id, sort_field=sort_field, sort_direction=sort_direction, per_page=per_page)
+    parameters = {name: value for name, value in parameters.items() if value is not None}  # not all searches have them.
+    with ParquetExport(path, MODELS_OF_ROUTES[route], row_group_size=row_group_size, compression=compression) as export:
+        async for item in getattr(client, 'iter_' + route)(query, max_items=max_items, _raw=True, **parameters):
+            export.write((item,))
+        # end for
+    # end with
+    return export.written
+# end def
+
+
+def search_images_to_parquet(query: str, path: str, **kwargs) -> int:
+    """
+    `search_to_parquet('search_images', ...)`, see there for the parameters.
+    By default it requests as many images at once as possible.
+    """
+    kwargs.setdefault('per_page', MAX_PAGE_SIZE)
+    return search_to_parquet('search_images', query, path, **kwargs)
+# end def
+
+
+async def async_search_images_to_parquet(query: str, path: str, **kwargs) -> int:
+    """
+    `async_search_to_parquet('search_images', ...)`, see there for the parameters.
+    By default it requests as many images at once as possible.
+    """
+    kwargs.setdefault('per_page', MAX_PAGE_SIZE)
+    return await async_search_to_parquet('search_images', query, path, **kwargs)
+# end def
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+The models as Apache Arrow types, for `derpi.export.arrow`.
+Needs pyarrow to be installed, e.g. with `pip install derpi[arrow]`.
+
+Every field may be `null`, as the API sends `null` for some fields not documented as optional.
+Timestamps are in UTC, lists like `Image.tags` are list types and nested models like `Image.representations` are structs.
+Arrays of objects without a model, like `Tag.dnp_entries`, are stored as list of json strings.
+"""
+from typing import Dict, Tuple
+
+import pyarrow as pa
+
+__author__ = 'luckydonald'
+__all__ = ['TIMESTAMP', 'STRUCTS', 'SCHEMAS', 'TIMESTAMP_FIELDS', 'NESTED_FIELDS', 'JSON_FIELDS']
+
+TIMESTAMP = pa.timestamp('us', tz='UTC')
+
+# name of the model -> its fields as struct. The nested models first, so the others can use them.
+STRUCTS: Dict[str, pa.StructType] = {}
+
+STRUCTS['Representations'] = pa.struct([
+    pa.field('full', pa.string(), metadata={'description': 'The url to the image in original resolution.'}),
+    pa.field('large', pa.string(), metadata={'description': 'The url to the image in large resolution.'}),
+    pa.field('medium', pa.string(), metadata={'description': 'The url to the image in medium resolution.'}),
+    pa.field('small', pa.string(), metadata={'description': 'The url to the image in small resolution.'}),
+    pa.field('tall', pa.string(), metadata={'description': 'The url to the image in tall resolution.'}),
+    pa.field('thumb', pa.string(), metadata={'description': 'The url to the image thumbnail in normal resolution.'}),
+    pa.field('thumb_small', pa.string(), metadata={'description': 'The url to the image thumbnail in small resolution.'}),
+    pa.field('thumb_tiny', pa.string(), metadata={'description': 'The url to the image thumbnail in tiny resolution.'}),
+    pa.field('mp4', pa.string(), metadata={'description': 'Optional. The url to the animated image as mp4 format.'}),
+    pa.field('webm', pa.string(), metadata={'description': 'Optional. The url to the animated image as webm format.'}),
+])
+STRUCTS['Intensities'] = pa.struct([
+    pa.field('ne', pa.float64(), metadata={'description': 'Northeast intensity. Whatever that means…'}),
+    pa.field('nw', pa.float64(), metadata={'description': 'Northwest intensity. Whatever that means…'}),
+    pa.field('se', pa.float64(), metadata={'description': 'Southeast intensity. Whatever that means…'}),
+    pa.field('sw', pa.float64(), metadata={'description': 'Southwest intensity. Whatever that means…'}),
+])
+STRUCTS['Comment'] = pa.struct([
+    pa.field('author', pa.string(), metadata={'description': "The comment's author."}),
+    pa.field('avatar', pa.string(), metadata={'description': "The URL of the author's avatar. May be a link to the CDN path, or a `data:` URI."}),
+    pa.field('body', pa.string(), metadata={'description': 'The comment text.'}),
+    pa.field('created_at', TIMESTAMP, metadata={'description': 'The creation time, in UTC, of the comment.'}),
+    pa.field('edit_reason', pa.string(), metadata={'description': 'The edit reason for this comment, or `null` if none provided.'}),
+    pa.field('edited_at', TIMESTAMP, metadata={'description': 'The time, in UTC, this comment was last edited at, or `null` if it was not edited.'}),
+    pa.field('id', pa.int64(), metadata={'description': "The comment's ID."}),
+    pa.field('image_id', pa.int64(), metadata={'description': 'The ID of the image the comment belongs to.'}),
+    pa.field('updated_at', TIMESTAMP, metadata={'description': 'The time, in UTC, the comment was last updated at.'}),
+    pa.field('user_id', pa.int64(), metadata={'description': 'The ID of the user the comment belongs to, if any.'}),
+])
+STRUCTS['Forum'] = pa.struct([
+    pa.field('name', pa.string(), metadata={'description': "The forum's name."}),
+    pa.field('short_name', pa.string(), metadata={'description': "The forum's short name (used to identify it)."}),
+    pa.field('description', pa.string(), metadata={'description': "The forum's description."}),
+    pa.field('topic_count', pa.int64(), metadata={'description': 'The amount of topics in the forum.'}),
+    pa.field('post_count', pa.int64(), metadata={'description': 'The amount of posts in the forum.'}),
+])
+STRUCTS['Topic'] = pa.struct([
+    pa.field('slug', pa.string(), metadata={'description': "The topic's slug (used to identify it)."}),
+    pa.field('title', pa.string(), metadata={'description': "The topic's title."}),
+    pa.field('post_count', pa.int64(), metadata={'description': 'The amount of posts in the topic.'}),
+    pa.field('view_count', pa.int64(), metadata={'description': 'The amount of views the topic has received.'}),
+    pa.field('sticky', pa.bool_(), metadata={'description': 'Whether the topic is sticky.'}),
+    pa.field('last_replied_to_at', TIMESTAMP, metadata={'description': 'The time, in UTC, when the last reply was made.'}),
+    pa.field('locked', pa.bool_(), metadata={'description': 'Whether the topic is locked.'}),
+    pa.field('user_id', pa.int64(), metadata={'description': 'The ID of the user who made the topic. `null` if posted anonymously.'}),
+    pa.field('author', pa.string(), metadata={'description': 'The name of the user who made the topic.'}),
+])
+STRUCTS['Post'] = pa.struct([
+    pa.field('author', pa.string(), metadata={'description': "The post's author."}),
+    pa.field('avatar', pa.string(), metadata={'description': "The URL of the author's avatar. May be a link to the CDN path, or a `data:` URI."}),
+    pa.field('body', pa.string(), metadata={'description': 'The post text.'}),
+    pa.field('created_at', TIMESTAMP, metadata={'description': 'The creation time, in UTC, of the post.'}),
+    pa.field('edit_reason', pa.string(), metadata={'description': 'The edit reason for this post.'}),
+    pa.field('edited_at', TIMESTAMP, metadata={'description': 'The time, in UTC, this post was last edited at, or `null` if it was not edited.'}),
+    pa.field('id', pa.int64(), metadata={'description': "The post's ID (used to identify it)."}),
+    pa.field('updated_at', TIMESTAMP, metadata={'description': 'The time, in UTC, the post was last updated at.'}),
+    pa.field('user_id', pa.int64(), metadata={'description': 'The ID of the user the post belongs to, if any.'}),
+])
+STRUCTS['Tag'] = pa.struct([
+    pa.field('aliased_tag', pa.string(), metadata={'description': 'The slug of the tag this tag is aliased to, if any.'}),
+    pa.field('aliases', pa.list_(pa.string()), metadata={'description': 'The slugs of the tags aliased to this tag.'}),
+    pa.field('category', pa.string(), metadata={'description': 'The category class of this tag. One of `"character", "content-fanmade", "content-official", "error", "oc", "origin", "rating", "species", "spoiler"`.'}),
+    pa.field('description', pa.string(), metadata={'description': 'The long description for the tag.'}),
+    pa.field('dnp_entries', pa.list_(pa.string()), metadata={'description': 'An array of objects containing DNP entries claimed on the tag.'}),
+    pa.field('id', pa.int64(), metadata={'description': "The tag's ID."}),
+    pa.field('images', pa.int64(), metadata={'description': 'The image count of the tag.'}),
+    pa.field('implied_by_tags', pa.list_(pa.string()), metadata={'description': 'The slugs of the tags this tag is implied by.'}),
+    pa.field('implied_tags', pa.list_(pa.string()), metadata={'description': 'The slugs of the tags this tag implies.'}),
+    pa.field('name', pa.string(), metadata={'description': 'The name of the tag.'}),
+    pa.field('name_in_namespace', pa.string(), metadata={'description': 'The name of the tag in its namespace.'}),
+    pa.field('namespace', pa.string(), metadata={'description': 'The namespace of the tag.'}),
+    pa.field('short_description', pa.string(), metadata={'description': 'The short description for the tag.'}),
+    pa.field('slug', pa.string(), metadata={'description': 'The slug for the tag.'}),
+    pa.field('spoiler_image_uri', pa.string(), metadata={'description': 'The spoiler image for the tag, or `null` if none provided. '}),
+])
+STRUCTS['Filter'] = pa.struct([
+    pa.field('id', pa.int64(), metadata={'description': 'The id of the filter.'}),
+    pa.field('name', pa.string(), metadata={'description': 'The name of the filter.'}),
+    pa.field('description', pa.string(), metadata={'description': 'The description of the filter.'}),
+    pa.field('user_id', pa.int64(), metadata={'description': "The id of the user the filter belongs to. `null` if it isn't assigned to a user (usually `system` filters only)."}),
+    pa.field('user_count', pa.int64(), metadata={'description': 'The amount of users employing this filter.'}),
+    pa.field('system', pa.bool_(), metadata={'description': "If `true`, is a system filter. System filters are usable by anyone and don't have a `user_id` set."}),
+    pa.field('public', pa.bool_(), metadata={'description': 'If `true`, is a public filter. Public filters are usable by anyone.'}),
+    pa.field('spoilered_tag_ids', pa.list_(pa.int64()), metadata={'description': 'A list of tag IDs (as integers) that this filter will spoil.'}),
+    pa.field('spoilered_complex', pa.string(), metadata={'description': 'The complex spoiled filter.'}),
+    pa.field('hidden_tag_ids', pa.list_(pa.int64()), metadata={'description': 'A list of tag IDs (as integers) that this filter will hide.'}),
+    pa.field('hidden_complex', pa.string(), metadata={'description': 'The complex hidden filter.'}),
+])
+STRUCTS['Links'] = pa.struct([
+    pa.field('user_id', pa.int64(), metadata={'description': 'The ID of the user who owns this link.'}),
+    pa.field('created_at', TIMESTAMP, metadata={'description': 'The creation time, in UTC, of this link.'}),
+    pa.field('state', pa.string(), metadata={'description': 'The state of this link.'}),
+    pa.field('tag_id', pa.int64(), metadata={'description': 'The ID of an associated tag for this link. `null` if no tag linked.'}),
+])
+STRUCTS['Awards'] = pa.struct([
+    pa.field('image_url', pa.string(), metadata={'description': 'The URL of this award.'}),
+    pa.field('title', pa.string(), metadata={'description': 'The title of this award.'}),
+    pa.field('id', pa.int64(), metadata={'description': 'The ID of the badge this award is derived from.'}),
+    pa.field('label', pa.string(), metadata={'description': 'The label of this award.'}),
+    pa.field('awarded_on', TIMESTAMP, metadata={'description': 'The time, in UTC, when this award was given.'}),
+])
+STRUCTS['Gallery'] = pa.struct([
+    pa.field('description', pa.string(), metadata={'description': "The gallery's description."}),
+    pa.field('id', pa.int64(), metadata={'description': "The gallery's ID."}),
+    pa.field('spoiler_warning', pa.string(), metadata={'description': "The gallery's spoiler warning."}),
+    pa.field('thumbnail_id', pa.int64(), metadata={'description': 'The ID of the cover image for the gallery.'}),
+    pa.field('title', pa.string(), metadata={'description': "The gallery's title."}),
+    pa.field('user', pa.string(), metadata={'description': "The name of the gallery's creator."}),
+    pa.field('user_id', pa.int64(), metadata={'description': "The ID of the gallery's creator."}),
+])
+STRUCTS['ImageErrors'] = pa.struct([
+    pa.field('image', pa.list_(pa.string()), metadata={'description': 'Errors in the submitted image'}),
+    pa.field('image_aspect_ratio', pa.list_(pa.string()), metadata={'description': 'Errors in the submitted image'}),
+    pa.field('image_format', pa.list_(pa.string()), metadata={'description': 'When an image is unsupported (ex. WEBP)'}),
+    pa.field('image_height', pa.list_(pa.string()), metadata={'description': 'Errors in the submitted image'}),
+    pa.field('image_width', pa.list_(pa.string()), metadata={'description': 'Errors in the submitted image'}),
+    pa.field('image_size', pa.list_(pa.string()), metadata={'description': 'Usually if an image that is too large is uploaded.'}),
+    pa.field('image_is_animated', pa.list_(pa.string()), metadata={'description': 'Errors in the submitted image'}),
+    pa.field('image_mime_type', pa.list_(pa.string()), metadata={'description': 'Errors in the submitted image'}),
+    pa.field('image_orig_sha512_hash', pa.list_(pa.string()), metadata={'description': 'Errors in the submitted image. If **has already been taken** is present, means the image already exists in the database.'}),
+    pa.field('image_sha512_hash', pa.list_(pa.string()), metadata={'description': 'Errors in the submitted image'}),
+    pa.field('tag_input', pa.list_(pa.string()), metadata={'description': 'Errors with the tag metadata.'}),
+    pa.field('uploaded_image', pa.list_(pa.string()), metadata={'description': 'Errors in the submitted image'}),
+])
+STRUCTS['Oembed'] = pa.struct([
+    pa.field('author_name', pa.string(), metadata={'description': 'The comma-delimited names of the image authors.'}),
+    pa.field('author_url', pa.string(), metadata={'description': 'The source URL of the image.'}),
+    pa.field('cache_age', pa.int64(), metadata={'description': 'Always `7200`.'}),
+    pa.field('derpibooru_comments', pa.int64(), metadata={'description': 'The number of comments made on the image.'}),
+    pa.field('derpibooru_id', pa.int64(), metadata={'description': "The image's ID."}),
+    pa.field('derpibooru_score', pa.int64(), metadata={'description': "The image's number of upvotes minus the image's number of downvotes."}),
+    pa.field('derpibooru_tags', pa.list_(pa.string()), metadata={'description': "The names of the image's tags."}),
+    pa.field('provider_name', pa.string(), metadata={'description': 'Always `"Derpibooru"`.'}),
+    pa.field('provider_url', pa.string(), metadata={'description': 'Always `"https://derpibooru.org"`.'}),
+    pa.field('title', pa.string(), metadata={'description': "The image's ID and associated tags, as would be given on the title of the image page."}),
+    pa.field('type', pa.string(), metadata={'description': 'Always `"photo"`.'}),
+    pa.field('version', pa.string(), metadata={'description': 'Always `"1.0"`.'}),
+])
+STRUCTS['Image'] = pa.struct([
+    pa.field('animated', pa.bool_(), metadata={'description': 'Whether the image is animated.'}),
+    pa.field('aspect_ratio', pa.float64(), metadata={'description': "The image's width divided by its height."}),
+    pa.field('comment_count', pa.int64(), metadata={'description': 'The number of comments made on the image.'}),
+    pa.field('created_at', TIMESTAMP, metadata={'description': 'The creation time, in UTC, of the image.'}),
+    pa.field('deletion_reason', pa.string(), metadata={'description': 'The hide reason for the image, or `null` if none provided. This will only have a value on images which are deleted for a rule violation.'}),
+    pa.field('description', pa.string(), metadata={'description': "The image's description."}),
+    pa.field('downvotes', pa.int64(), metadata={'description': 'The number of downvotes the image has.'}),
+    pa.field('duplicate_of', pa.int64(), metadata={'description': 'The ID of the target image, or `null` if none provided. This will only have a value on images which are merged into another image.'}),
+    pa.field('duration', pa.float64(), metadata={'description': 'The number of seconds the image lasts, if animated.'}),
+    pa.field('faves', pa.int64(), metadata={'description': 'The number of faves the image has.'}),
+    pa.field('first_seen_at', TIMESTAMP, metadata={'description': 'The time, in UTC, the image was first seen (before any duplicate merging).'}),
+    pa.field('format', pa.string(), metadata={'description': 'The file extension of the image. One of `"gif", "jpg", "jpeg", "png", "svg", "webm"`.'}),
+    pa.field('height', pa.int64(), metadata={'description': "The image's height, in pixels."}),
+    pa.field('hidden_from_users', pa.bool_(), metadata={'description': 'Whether the image is hidden. An image is hidden if it is merged or deleted for a rule violation.'}),
+    pa.field('id', pa.int64(), metadata={'description': "The image's ID."}),
+    pa.field('intensities', STRUCTS['Intensities'], metadata={'description': 'Optional object of [internal image intensity data](https://derpibooru.orghttps://github.com/derpibooru/cli_intensities) for deduplication purposes. May be `null` if intensities have not yet been generated.'}),
+    pa.field('mime_type', pa.string(), metadata={'description': 'The MIME type of this image. One of `"image/gif", "image/jpeg", "image/png", "image/svg+xml", "video/webm"`.'}),
+    pa.field('name', pa.string(), metadata={'description': 'The filename that the image was uploaded with.'}),
+    pa.field('orig_sha512_hash', pa.string(), metadata={'description': 'The SHA512 hash of the image as it was originally uploaded.'}),
+    pa.field('processed', pa.bool_(), metadata={'description': 'Whether the image has finished optimization.'}),
+    pa.field('representations', STRUCTS['Representations'], metadata={'description': 'A mapping of representation names to their respective URLs. Contains the keys `"full", "large", "medium", "small", "tall", "thumb", "thumb_small", "thumb_tiny"`.'}),
+    pa.field('score', pa.int64(), metadata={'description': "The image's number of upvotes minus the image's number of downvotes."}),
+    pa.field('sha512_hash', pa.string(), metadata={'description': 'The SHA512 hash of this image after it has been processed.'}),
+    pa.field('size', pa.int64(), metadata={'description': "The number of bytes the image's file contains."}),
+    pa.field('source_url', pa.string(), metadata={'description': 'The current source URL of the image.'}),
+    pa.field('spoilered', pa.bool_(), metadata={'description': 'Whether the image is hit by the current filter.'}),
+    pa.field('tag_count', pa.int64(), metadata={'description': 'The number of tags present on the image.'}),
+    pa.field('tag_ids', pa.list_(pa.int64()), metadata={'description': 'A list of tag IDs the image contains.'}),
+    pa.field('tags', pa.list_(pa.string()), metadata={'description': 'A list of tag names the image contains.'}),
+    pa.field('thumbnails_generated', pa.bool_(), metadata={'description': 'Whether the image has finished thumbnail generation. Do not attempt to load images from `view_url` or `representations` if this is false.'}),
+    pa.field('updated_at', TIMESTAMP, metadata={'description': 'The time, in UTC, the image was last updated.'}),
+    pa.field('uploader', pa.string(), metadata={'description': "The image's uploader."}),
+    pa.field('uploader_id', pa.int64(), metadata={'description': "The ID of the image's uploader. `null` if uploaded anonymously."}),
+    pa.field('upvotes', pa.int64(), metadata={'description': "The image's number of upvotes."}),
+    pa.field('view_url', pa.string(), metadata={'description': "The image's view URL, including tags."}),
+    pa.field('width', pa.int64(), metadata={'description': "The image's width, in pixels."}),
+    pa.field('wilson_score', pa.float64(), metadata={'description': 'The lower bound of the [Wilson score interval](https://derpibooru.orghttps://en.wikipedia.org/wiki/Binomial_proportion_confidence_interval#Wilson_score_interval) for the image, based on its upvotes and downvotes, given a z-score corresponding to a confidence of 99.5%.'}),
+])
+STRUCTS['User'] = pa.struct([
+    pa.field('id', pa.int64(), metadata={'description': 'The ID of the user.'}),
+    pa.field('name', pa.string(), metadata={'description': 'The name of the user.'}),
+    pa.field('slug', pa.string(), metadata={'description': 'The slug of the user.'}),
+    pa.field('role', pa.string(), metadata={'description': 'The role of the user.'}),
+    pa.field('description', pa.string(), metadata={'description': 'The description (bio) of the user.'}),
+    pa.field('avatar_url', pa.string(), metadata={'description': "The URL of the user's thumbnail. `null` if the avatar is not set."}),
+    pa.field('created_at', TIMESTAMP, metadata={'description': 'The creation time, in UTC, of the user.'}),
+    pa.field('comments_count', pa.int64(), metadata={'description': 'The comment count of the user.'}),
+    pa.field('uploads_count', pa.int64(), metadata={'description': 'The upload count of the user.'}),
+    pa.field('posts_count', pa.int64(), metadata={'description': 'The forum posts count of the user.'}),
+    pa.field('topics_count', pa.int64(), metadata={'description': 'The forum topics count of the user.'}),
+    pa.field('links', pa.list_(STRUCTS['Links']), metadata={'description': '`Links`.'}),
+    pa.field('awards', pa.list_(STRUCTS['Awards']), metadata={'description': '`Awards`.'}),
+])
+
+# name of the model -> schema of a table of them.
+SCHEMAS: Dict[str, pa.Schema] = {name: pa.schema(list(struct)) for name, struct in STRUCTS.items()}
+
+# name of the model -> the fields which are timestamps.
+TIMESTAMP_FIELDS: Dict[str, Tuple[str, ...]] = {
+    'Image': ('created_at', 'first_seen_at', 'updated_at', ),
+    'Comment': ('created_at', 'edited_at', 'updated_at', ),
+    'Topic': ('last_replied_to_at', ),
+    'Post': ('created_at', 'edited_at', 'updated_at', ),
+    'User': ('created_at', ),
+    'Links': ('created_at', ),
+    'Awards': ('awarded_on', ),
+}
+
+# name of the model -> field -> name of the nested model.
+NESTED_FIELDS: Dict[str, Dict[str, str]] = {
+    'Image': {'intensities': 'Intensities', 'representations': 'Representations', },
+    'User': {'links': 'Links', 'awards': 'Awards', },
+}
+
+# name of the model -> the arrays of objects, stored as json strings.
+JSON_FIELDS: Dict[str, Tuple[str, ...]] = {
+    'Tag': ('dnp_entries', ),
+}
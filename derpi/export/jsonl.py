@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Streams the results of a search into a JSON Lines file, one image per line, page by page.
+Only one page is kept in memory at a time, and an interrupted export continues where it stopped.
+"""
+import gzip
+import os
+
+from typing import Any, BinaryIO, Dict, List, Union
+
+from luckydonaldUtils.logger import logging
+
+from ..pagination import MAX_PAGE_SIZE, full_page_size, query_before_id
+from ..serialization import dumps, loads
+
+__author__ = 'luckydonald'
+__all__ = ['COMPRESSIONS', 'RESUME_MODES', 'Checkpoint', 'JsonlExport', 'search_images_to_jsonl', 'async_search_images_to_jsonl']
+
+logger = logging.getLogger(__name__)
+if __name__ == '__main__':
+    logging.add_colored_handler(level=logging.DEBUG)
+# end if
+
+
+COMPRESSIONS = ('gzip', 'zstd')
+RESUME_MODES = ('page', 'id')
+_SUFFIXES = {'.gz': 'gzip', '.gzip': 'gzip', '.zst': 'zstd', '.zstd': 'zstd'}
+
+
+class _Uncompressed(object):
+    """
+    Same interface as the compressing writers, writing directly to the file.
+    """
+
+    def __init__(self, file: BinaryIO):
+        self.file = file
+    # end def
+
+    def write(self, data: bytes) -> None:
+        self.file.write(data)
+    # end def
+
+    def close(self) -> None:
+        pass  # the file stays open.
+    # end def
+# end class
+
+
+def _open_member(file: BinaryIO, compression: Union[str, None]) -> Any:
+    """
+    Starts a new gzip member or zstd frame at the current position of the file.
+    Closing it finishes the member, but leaves the file open.
+
+    Both formats allow to simply concatenate them, so after every checkpoint a new one is started,
+    and on resume the file is cut back to the end of the last finished one.
+    """
+    if compression == 'gzip':
+        return gzip.GzipFile(fileobj=file, mode='wb')
+    # end if
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError('Writing zstd needs "zstandard" to be installed, e.g. with `pip install derpi[zstd]`.')
+        # end try
+        return zstandard.ZstdCompressor().stream_writer(file, closefd=False)
+    # end if
+    return _Uncompressed(file)
+# end def
+
+
+class Checkpoint(object):
+    """
+    How far an export got, stored as json next to the output file.
+
+    It's only written once everything before `offset` is safely on disk,
+    so resuming truncates the file to `offset` and continues from `page` (or after `last_id`).
+    """
+
+    def __init__(
+        self,
+        parameters: Dict[str, Any],
+        page: int = 1,
+        last_id: Union[int, None] = None,
+        written: int = 0,
+        offset: int = 0,
+        done: bool = False,
+    ):
+        """
+        :param parameters: The search and export parameters, resuming with different ones is refused.
+        :param page: The next page to request, when resuming by page.
+        :param last_id: The id of the last exported image, when resuming by id.
+        :param written: How many images are in the file up to `offset`.
+        :param offset: Size of the file when the checkpoint was written.
+        :param done: If the export is complete.
+        """
+        self.parameters = parameters
+        self.page = page
+        self.last_id = last_id
+        self.written = written
+        self.offset = offset
+        self.done = done
+    # end def
+
+    @classmethod
+    def load(cls, path: str) -> Union['Checkpoint', None]:
+        """
+        Reads the checkpoint file, `None` if there is none.
+        """
+        try:
+            with open(path, 'rb') as file:
+                data = loads(file.read())
+            # end with
+        except FileNotFoundError:
+            return None
+        # end try
+        return cls(**data)
+    # end def
+
+    def save(self, path: str) -> None:
+        """
+        Writes the checkpoint file. It's replaced atomically, so a crash can't leave a half written one.
+        """
+        temporary = path + '.tmp'
+        with open(temporary, 'wb') as file:
+            file.write(dumps({
+                'parameters': self.parameters, 'page': self.page, 'last_id': self.last_id,
+                'written': self.written, 'offset': self.offset, 'done': self.done,
+            }))
+            file.flush()
+            os.fsync(file.fileno())
+        # end with
+        os.replace(temporary, path)
+    # end def
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(page={self.page!r}, last_id={self.last_id!r}, written={self.written!r}, offset={self.offset!r}, done={self.done!r})'
+    # end def
+# end class
+
+
+class JsonlExport(object):
+    """
+    The output side of an export: writes pages of image dicts to the file, and keeps the checkpoint.
+    Decides which page has to be requested next, so the sync and async exporters only do the requests.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        query: str,
+        filter_id: Union[int, None] = None,
+        sort_field: Union[str, None] = None,
+        sort_direction: Union[str, None] = None,
+        per_page: int = MAX_PAGE_SIZE,
+        compression: Union[str, None] = 'auto',
+        resume: bool = True,
+        resume_by: str = 'page',
+        checkpoint_every: int = 10,
+        max_items: Union[int, None] = None,
+    ):
+        """
+        See `search_images_to_jsonl(...)` for the parameters.
+        """
+        if compression == 'auto':
+            compression = _SUFFIXES.get(os.path.splitext(path)[1].lower(), None)
+        # end if
+        if compression is not None and compression not in COMPRESSIONS:
+            raise ValueError(f'Unknown compression {compression!r}, supported are: {COMPRESSIONS!r}')
+        # end if
+        if resume_by not in RESUME_MODES:
+            raise ValueError(f'Unknown resume mode {resume_by!r}, supported are: {RESUME_MODES!r}')
+        # end if
+        if resume_by == 'id' and (sort_field is not None or sort_direction is not None):
+            raise ValueError('Resuming by id sorts by descending id, so sort_field and sort_direction can\'t be used.')
+        # end if
+        assert checkpoint_every >= 1
+        self.path = path
+        self.checkpoint_path = path + '.checkpoint'
+        self.query = query
+        self.filter_id = filter_id
+        self.sort_field = sort_field
+        self.sort_direction = sort_direction
+        self.per_page = per_page
+        self.compression = compression
+        self.resume_by = resume_by
+        self.checkpoint_every = checkpoint_every
+        self.max_items = max_items
+        parameters = {
+            'query': query, 'filter_id': filter_id, 'sort_field': sort_field, 'sort_direction': sort_direction,
+            'per_page': per_page, 'compression': compression, 'resume_by': resume_by,
+        }
+        self.checkpoint = Checkpoint.load(self.checkpoint_path) if resume else None
+        if self.checkpoint is not None and self.checkpoint.parameters != parameters:
+            raise ValueError(
+                f'The checkpoint {self.checkpoint_path!r} belongs to an export with other parameters: '
+                f'{self.checkpoint.parameters!r}. Delete it, or use resume=False to start over.'
+            )
+        # end if
+        if self.checkpoint is not None:
+            size = os.path.getsize(path) if os.path.exists(path) else None
+            if size is None or size < self.checkpoint.offset:
+                # the file isn't the one the checkpoint was written for, appending to it would corrupt it.
+                logger.warning(
+                    f'The export file {path!r} is missing or shorter than the checkpoint {self.checkpoint_path!r} '
+                    f'expects ({size!r} < {self.checkpoint.offset!r} bytes), starting over.'
+                )
+                self.checkpoint = None
+            # end if
+        # end if
+        if self.checkpoint is None:
+            # a stale checkpoint must not be resumed later, if we stop before writing our first one.
+            try:
+                os.remove(self.checkpoint_path)
+            except FileNotFoundError:
+                pass
+            # end try
+            self.checkpoint = Checkpoint(parameters=parameters)
+            self.file: BinaryIO = open(path, 'wb')
+        else:
+            logger.info(f'Resuming export to {path!r} at {self.checkpoint!r}.')
+            self.file: BinaryIO = open(path, 'r+b')
+            self.file.truncate(self.checkpoint.offset)  # drop what was written after the last checkpoint.
+            self.file.seek(self.checkpoint.offset)
+        # end if
+        self.member = None
+        self.pages_since_checkpoint = 0
+    # end def
+
+    @property
+    def done(self) -> bool:
+        return self.checkpoint.done
+    # end def
+
+    def request_parameters(self) -> Dict[str, Any]:
+        """
+        The arguments for `search_images_with_total(...)` to get the next page.
+        """
+        if self.resume_by == 'id':
+            # keyset pagination like `iter_search_images_by_id(...)`, but with the last id stored in the checkpoint.
+            query = query_before_id(self.query, self.checkpoint.last_id)
+            return dict(query=query, filter_id=self.filter_id, page=1, per_page=self.per_page, sort_field='id', sort_direction='desc')
+        # end if
+        return dict(
+            query=self.query, filter_id=self.filter_id, page=self.checkpoint.page, per_page=self.per_page,
+            sort_field=self.sort_field, sort_direction=self.sort_direction,
+        )
+    # end def
+
+    def write_page(self, hits: List[Dict[str, Any]], total: Union[int, None] = None) -> None:
+        """
+        Appends the images of the page just requested, and checkpoints every `checkpoint_every` pages.
+
+        :param hits: The plain image dicts of the page.
+        :param total: The total amount of results the API reported.
+        """
+        page_size = full_page_size(self.per_page)
+        is_last = len(hits) < page_size
+        if self.resume_by == 'page' and total is not None and self.checkpoint.page * page_size >= total:
+            is_last = True
+        # end if
+        if self.max_items is not None and self.checkpoint.written + len(hits) >= self.max_items:
+            hits = hits[:self.max_items - self.checkpoint.written]
+            is_last = True
+        # end if
+        if hits:
+            if self.member is None:
+                self.member = _open_member(self.file, self.compression)
+            # end if
+            self.member.write(b''.join(dumps(item) + b'\n' for item in hits))
+            self.checkpoint.written += len(hits)
+            self.checkpoint.last_id = hits[-1]['id']
+        # end if
+        self.checkpoint.page += 1
+        self.pages_since_checkpoint += 1
+        if is_last:
+            self.finish()
+        elif self.pages_since_checkpoint >= self.checkpoint_every:
+            self.save_checkpoint()
+        # end if
+    # end def
+
+    def save_checkpoint(self) -> None:
+        """
+        Makes sure everything written so far is on disk, and remembers how far we got.
+        """
+        if self.member is not None:
+            self.member.close()
+            self.member = None
+        # end if
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.checkpoint.offset = self.file.tell()
+        self.checkpoint.save(self.checkpoint_path)
+        self.pages_since_checkpoint = 0
+    # end def
+
+    def finish(self) -> None:
+        """
+        Marks the export as complete. Resuming it again doesn't request anything.
+        """
+        self.checkpoint.done = True
+        self.save_checkpoint()
+    # end def
+
+    def close(self) -> None:
+        """
+        Closes the file. Pages written after the last checkpoint will be written again when resuming.
+        """
+        self.file.close()
+    # end def
+
+    def __enter__(self) -> 'JsonlExport':
+        return self
+    # end def
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    # end def
+# end class
+
+
+def search_images_to_jsonl(
+    query: str,
+    path: str,
+    filter_id: Union[int, None] = None,
+    sort_field: Union[str, None] = None,
+    sort_direction: Union[str, None] = None,
+    per_page: int = MAX_PAGE_SIZE,
+    compression: Union[str, None] = 'auto',
+    resume: bool = True,
+    resume_by: str = 'page',
+    checkpoint_every: int = 10,
+    max_items: Union[int, None] = None,
+    client: Union['DerpiClient', None] = None,
+) -> int:
+    """
+    Writes all images of a search to a JSON Lines file, as the plain json of the API, without building models.
+
+    Progress is stored in `<path>.checkpoint`. If it exists, the export continues from there,
+    e.g. after it was interrupted. A complete export isn't requested again.
+
+    >>> search_images_to_jsonl('safe, pony', 'ponies.jsonl.gz', client=DerpiClient(key='...'))
+
+    :param query: The search query.
+    :param path: The file to write. With `.gz` or `.zst` at the end it's compressed accordingly.
+    :param filter_id: Optional filter to use.
+    :param sort_field: Field to sort by. Note that resuming by page can miss or duplicate images
+                       if new images move the pages, e.g. with the default sort by upload date.
+    :param sort_direction: `'desc'` or `'asc'`.
+    :param per_page: How many images to request at once.
+    :param compression: `'gzip'`, `'zstd'` (needs `zstandard`), `None` for plain text,
+                        or `'auto'` to decide by the file ending.
+    :param resume: If an existing checkpoint should be used, otherwise the file is written from scratch.
+    :param resume_by: `'page'` to request the pages by number, `'id'` to sort by descending id,
+                      and request the images older than the last exported one instead.
+                      The latter isn't affected by new uploads and doesn't need deep page numbers.
+    :param checkpoint_every: After how many pages the progress is saved.
+    :param max_items: Stop after that many images. `None` for all of them.
+    :param client: The `DerpiClient` to use, e.g. for an api key, rate limiting or retrying.
+    :return: The amount of images in the file.
+    """
+    from ..syncrounous.client import DerpiClient
+    if client is None:
+        client = DerpiClient(key=None)
+    # end if
+    with JsonlExport(
+        path=path, query=query, filter_id=filter_id, sort_field=sort_field, sort_direction=sort_direction,
+        per_page=per_page, compression=compression, resume=resume, resume_by=resume_by,
+        checkpoint_every=checkpoint_every, max_items=max_items,
+    ) as export:
+        while not export.done:
+            result = client.search_images_with_total(**export.request_parameters(), _raw=True)
+            export.write_page(result.hits, total=result.total)
+        # end while
+        return export.checkpoint.written
+    # end with
+# end def
+
+
+async def async_search_images_to_jsonl(
+    query: str,
+    path: str,
+    filter_id: Union[int, None] = None,
+    sort_field: Union[str, None] = None,
+    sort_direction: Union[str, None] = None,
+    per_page: int = MAX_PAGE_SIZE,
+    compression: Union[str, None] = 'auto',
+    resume: bool = True,
+    resume_by: str = 'page',
+    checkpoint_every: int = 10,
+    max_items: Union[int, None] = None,
+    client: Union['DerpiClient', None] = None,
+) -> int:
+    """
+    Same as `search_images_to_jsonl(...)`, but with the async `DerpiClient`.
+    Writing to the file still blocks, but that's fast compared to requesting the pages.
+    """
+    from ..asyncrounous.client import DerpiClient
+    if client is None:
+        client = DerpiClient(key=None)
+    # end if
+    with JsonlExport(
+        path=path, query=query, filter_id=filter_id, sort_field=sort_field, sort_direction=sort_direction,
+        per_page=per_page, compression=compression, resume=resume, resume_by=resume_by,
+        checkpoint_every=checkpoint_every, max_items=max_items,
+    ) as export:
+        while not export.done:
+            result = await client.search_images_with_total(**export.request_parameters(), _raw=True)
+            export.write_page(result.hits, total=result.total)
+        # end while
+        return export.checkpoint.written
+    # end with
+# end def
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sharing of the tag names and ids between all parsed models, instead of every model having it's own copies.
+"""
+from array import array
+from typing import Dict, Iterable, List, Union
+
+from luckydonaldUtils.logger import logging
+
+__author__ = 'luckydonald'
+__all__ = ['InternPool', 'tag_pool']
+
+logger = logging.getLogger(__name__)
+if __name__ == '__main__':
+    logging.add_colored_handler(level=logging.DEBUG)
+# end if
+
+
+class InternPool(object):
+    """
+    Hands out one canonical object for every distinct tag name or tag id.
+
+    The json decoder creates a new `str` for every tag of every image, even though the same few thousand tags
+    repeat all the time. Replacing them with the canonical ones lets the duplicates be freed right away.
+    Same goes for the tag ids, as python only shares the objects of ints up to 256.
+
+    With `compact_ids` the tag id lists become `array('I')` instead, storing 4 bytes per id
+    instead of a pointer to an int object. Note that such an array isn't equal to a list with the same ids.
+    """
+
+    def __init__(self, compact_ids: bool = False):
+        """
+        :param compact_ids: If lists of tag ids should be stored as `array('I')`.
+        """
+        self.compact_ids = compact_ids
+        self._strings: Dict[str, str] = {}
+        self._ids: Dict[int, int] = {}
+    # end def
+
+    def string(self, value: str) -> str:
+        """
+        The canonical object for that string.
+        """
+        return self._strings.setdefault(value, value)
+    # end def
+
+    def strings(self, values: Union[Iterable[str], None]) -> Union[List[str], None]:
+        """
+        The list with the canonical objects for those strings.
+        """
+        if values is None:
+            return None
+        # end if
+        setdefault = self._strings.setdefault
+        return [setdefault(value, value) for value in values]
+    # end def
+
+    def ids(self, values: Union[Iterable[int], None]) -> Union[List[int], array, None]:
+        """
+        The list with the canonical objects for those ids, or an `array('I')` of them with `compact_ids`.
+        """
+        if values is None:
+            return None
+        # end if
+        if self.compact_ids:
+            return array('I', values)
+        # end if
+        setdefault = self._ids.setdefault
+        return [setdefault(value, value) for value in values]
+    # end def
+
+    def clear(self) -> None:
+        """
+        Forgets all canonical objects. Models parsed already keep theirs.
+        """
+        self._strings.clear()
+        self._ids.clear()
+    # end def
+
+    def __len__(self) -> int:
+        return len(self._strings) + len(self._ids)
+    # end def
+# end class
+
+
+# Used by all models, see `DerpiModel.intern_pool`.
+tag_pool = InternPool()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nested models, e.g. the `Representations` of an `Image`, only built once they are actually used.
+"""
+import sys
+
+from array import array
+from datetime import datetime
+from typing import Any, Dict, List, Union
+
+from luckydonaldUtils.logger import logging
+
+__author__ = 'luckydonald'
+__all__ = ['LazyModel', 'json_value']
+
+logger = logging.getLogger(__name__)
+if __name__ == '__main__':
+    logging.add_colored_handler(level=logging.DEBUG)
+# end if
+
+
+class _Unparsed(object):
+    """
+    Marks the json of a nested model which wasn't built yet.
+    """
+    __slots__ = ('data',)
+
+    def __init__(self, data: Union[Dict, List[Dict]]):
+        self.data = data
+    # end def
+# end class
+
+
+class LazyModel(object):
+    """
+    Descriptor for a field holding a nested model, or a list of them.
+
+    If a dict (or a list of dicts) is assigned, it's kept in the slot with the same name prefixed by an underscore,
+    and only given to the model's `from_dict(...)` when the field is read the first time. The result replaces it.
+    Anything else, e.g. an already built model, is stored as is.
+    """
+
+    def __init__(self, class_name: str):
+        """
+        :param class_name: Name of the nested model, in the module of the model having the field.
+                           A name and not the class, as the nested models are defined after the ones using them.
+        """
+        self.class_name = class_name
+        self.model_class = None
+        self.name: Union[str, None] = None
+        self.slot_name: Union[str, None] = None
+    # end def
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+        self.slot_name = '_' + name
+        self.module_name = owner.__module__
+    # end def
+
+    def __get__(self, instance: Any, owner: type = None) -> Any:
+        if instance is None:
+            return self
+        # end if
+        value = getattr(instance, self.slot_name)
+        if type(value) is _Unparsed:
+            if self.model_class is None:
+                self.model_class = getattr(sys.modules[self.module_name], self.class_name)
+            # end if
+            value = self.model_class.from_dict(value.data)
+            setattr(instance, self.slot_name, value)
+        # end if
+        return value
+    # end def
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        if isinstance(value, dict) or (isinstance(value, list) and all(isinstance(item, dict) for item in value)):
+            value = _Unparsed(value)
+        # end if
+        setattr(instance, self.slot_name, value)
+    # end def
+# end class
+
+
+def json_value(value: Any) -> Any:
+    """
+    Converts the stored value of a lazy field back to json, for `to_dict()`.
+    If it wasn't read yet that's simply the json it was created from.
+
+    :param value: The content of the slot, e.g. `image._representations` or `image._created_at`.
+    """
+    if type(value) is _Unparsed:
+        return value.data
+    # end if
+    if isinstance(value, datetime):
+        return value.isoformat()
+    # end if
+    if isinstance(value, list):
+        return [json_value(item) for item in value]
+    # end if
+    if isinstance(value, array):  # tag ids of `InternPool(compact_ids=True)`
+        return value.tolist()
+    # end if
+    if hasattr(value, 'to_dict'):
+        return value.to_dict()
+    # end if
+    return value  # None, or the unparsed timestamp
+# end def
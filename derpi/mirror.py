@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Local copy of images, tags and comments in SQLite, kept up to date by only requesting what changed since the last sync.
+"""
+import os
+import sqlite3
+import threading
+import time
+
+from contextlib import contextmanager
+from datetime import timezone
+from typing import Any, Dict, Iterable, Iterator, List, Union
+
+from luckydonaldUtils.logger import logging
+
+from .pagination import MAX_PAGE_SIZE
+from .serialization import dumps, loads
+from .timestamps import parse_datetime_fast
+
+__author__ = 'luckydonald'
+__all__ = ['Mirror']
+
+logger = logging.getLogger(__name__)
+if __name__ == '__main__':
+    logging.add_colored_handler(level=logging.DEBUG)
+# end if
+
+
+def _utc(value: Union[str, None]) -> Union[str, None]:
+    """
+    A timestamp of the API in the same format for all rows, so they sort correctly as text.
+    """
+    if value is None:
+        return None
+    # end if
+    return parse_datetime_fast(value).astimezone(timezone.utc).isoformat()
+# end def
+
+
+def _json_of(item: Union[Dict[str, Any], Any]) -> Dict[str, Any]:
+    """
+    The json of a model, or the dict as is.
+    """
+    return item if isinstance(item, dict) else item.to_dict()
+# end def
+
+
+class Mirror(object):
+    """
+    Stores images, tags and comments in a SQLite database, with their full json and the columns worth querying.
+
+    `sync_images(query)` requests the images of that query which were updated since the last sync,
+    sorted by `updated_at`, so after the first run a sync only costs as much as there were changes.
+
+    >>> mirror = Mirror('ponies.sqlite')
+    >>> mirror.sync_images('safe, pony', client=DerpiClient(key='...'))
+    >>> Image.from_dict(mirror.image(4458))
+
+    Like `SQLiteResponseCache` the database runs in WAL mode, and every thread gets it's own connection.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS images (
+            id INTEGER PRIMARY KEY,
+            score INTEGER,
+            upvotes INTEGER,
+            downvotes INTEGER,
+            faves INTEGER,
+            wilson_score REAL,
+            created_at TEXT,
+            updated_at TEXT,
+            uploader_id INTEGER,
+            width INTEGER,
+            height INTEGER,
+            format TEXT,
+            data BLOB NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS images_score ON images (score);
+        CREATE INDEX IF NOT EXISTS images_created_at ON images (created_at);
+        CREATE INDEX IF NOT EXISTS images_updated_at ON images (updated_at);
+        CREATE TABLE IF NOT EXISTS image_tags (
+            image_id INTEGER NOT NULL,
+            tag_id INTEGER NOT NULL,
+            PRIMARY KEY (image_id, tag_id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS image_tags_tag_id ON image_tags (tag_id, image_id);
+        CREATE TABLE IF NOT EXISTS tags (
+            id INTEGER PRIMARY KEY,
+            name TEXT,
+            slug TEXT,
+            category TEXT,
+            images INTEGER,
+            data BLOB NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS tags_name ON tags (name);
+        CREATE INDEX IF NOT EXISTS tags_slug ON tags (slug);
+        CREATE TABLE IF NOT EXISTS comments (
+            id INTEGER PRIMARY KEY,
+            image_id INTEGER,
+            user_id INTEGER,
+            created_at TEXT,
+            updated_at TEXT,
+            data BLOB NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS comments_image_id ON comments (image_id);
+        CREATE INDEX IF NOT EXISTS comments_created_at ON comments (created_at);
+        CREATE TABLE IF NOT EXISTS syncs (
+            query TEXT PRIMARY KEY,
+            watermark TEXT,
+            synced_at REAL NOT NULL
+        );
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: File name of the database. It is created if needed.
+        """
+        self.path = path
+        self._local = threading.local()
+        self._connection().executescript(self.SCHEMA)
+    # end def
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        The connection of the current thread, opened if needed.
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+        # end if
+        return connection
+    # end def
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Everything inside is stored at once, or not at all.
+        """
+        connection = self._connection()
+        connection.execute('BEGIN')
+        try:
+            yield connection
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        # end try
+        connection.execute('COMMIT')
+    # end def
+
+    def _store_images(self, connection: sqlite3.Connection, images: Iterable[Union[Dict[str, Any], Any]]) -> int:
+        count = 0
+        for image in images:
+            data = _json_of(image)
+            connection.execute(
+                'INSERT OR REPLACE INTO images '
+                '(id, score, upvotes, downvotes, faves, wilson_score, created_at, updated_at, uploader_id, width, height, format, data) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (
+                    data['id'], data.get('score'), data.get('upvotes'), data.get('downvotes'), data.get('faves'),
+                    data.get('wilson_score'), _utc(data.get('created_at')), _utc(data.get('updated_at')),
+                    data.get('uploader_id'), data.get('width'), data.get('height'), data.get('format'), dumps(data),
+                ),
+            )
+            connection.execute('DELETE FROM image_tags WHERE image_id = ?', (data['id'],))
+            connection.executemany(
+                'INSERT OR IGNORE INTO image_tags (image_id, tag_id) VALUES (?, ?)',
+                [(data['id'], tag_id) for tag_id in data.get('tag_ids') or ()],
+            )
+            count += 1
+        # end for
+        return count
+    # end def
+
+    def store_images(self, images: Iterable[Union[Dict[str, Any], Any]]) -> int:
+        """
+        Inserts or updates images, and the tag ids they have.
+
+        :param images: `Image` models, or their json, e.g. from `search_images(..., _raw=True)`.
+        :return: How many were stored.
+        """
+        with self._transaction() as connection:
+            return self._store_images(connection, images)
+        # end with
+    # end def
+
+    def store_tags(self, tags: Iterable[Union[Dict[str, Any], Any]]) -> int:
+        """
+        Inserts or updates tags.
+
+        :param tags: `Tag` models, or their json.
+        :return: How many were stored.
+        """
+        rows = []
+        for tag in tags:
+            data = _json_of(tag)
+            rows.append((data['id'], data.get('name'), data.get('slug'), data.get('category'), data.get('images'), dumps(data)))
+        # end for
+        with self._transaction() as connection:
+            connection.executemany(
+                'INSERT OR REPLACE INTO tags (id, name, slug, category, images, data) VALUES (?, ?, ?, ?, ?, ?)', rows,
+            )
+        # end with
+        return len(rows)
+    # end def
+
+    def store_comments(self, comments: Iterable[Union[Dict[str, Any], Any]]) -> int:
+        """
+        Inserts or updates comments.
+
+        :param comments: `Comment` models, or their json.
+        :return: How many were stored.
+        """
+        rows = []
+        for comment in comments:
+            data = _json_of(comment)
+            rows.append((
+                data['id'], data.get('image_id'), data.get('user_id'),
+                _utc(data.get('created_at')), _utc(data.get('updated_at')), dumps(data),
+            ))
+        # end for
+        with self._transaction() as connection:
+            connection.executemany(
+                'INSERT OR REPLACE INTO comments (id, image_id, user_id, created_at, updated_at, data) VALUES (?, ?, ?, ?, ?, ?)',
+                rows,
+            )
+        # end with
+        return len(rows)
+    # end def
+
+    def watermark(self, query: str) -> Union[str, None]:
+        """
+        The newest `updated_at` of the images of that query we got so far. `None` if it was never synced.
+        """
+        row = self._connection().execute('SELECT watermark FROM syncs WHERE query = ?', (query,)).fetchone()
+        return None if row is None else row[0]
+    # end def
+
+    def sync_images(
+        self,
+        query: str,
+        filter_id: Union[int, None] = None,
+        per_page: int = MAX_PAGE_SIZE,
+        client: Union['DerpiClient', None] = None,
+    ) -> int:
+        """
+        Requests the images of the query which changed since the last sync, and stores them.
+
+        The images are sorted by `updated_at`, and the query narrowed to `updated_at.gte:<watermark>`.
+        Every page is stored together with the new watermark, so an interrupted sync continues where it stopped.
+        Images updated at exactly the watermark are requested again, as multiple images can share a timestamp.
+
+        :param query: The search query. Each query has it's own watermark.
+        :param filter_id: Optional filter to use. The default filter hides some images.
+        :param per_page: How many images to request at once.
+        :param client: The `DerpiClient` to use, e.g. for an api key, rate limiting or retrying.
+        :return: How many images were stored.
+        """
+        from .syncrounous.client import DerpiClient
+        if client is None:
+            client = DerpiClient(key=None)
+        # end if
+        watermark = self.watermark(query)
+        page = 1  # only increased when a whole page has the same `updated_at`, as then narrowing doesn't help.
+        stored = 0
+        while True:
+            result = client.search_images_with_total(
+                query=query if watermark is None else f'({query}), updated_at.gte:{watermark}',
+                filter_id=filter_id, page=page, per_page=per_page, sort_field='updated_at', sort_direction='asc',
+                _raw=True,
+            )
+            hits: List[Dict[str, Any]] = result.hits
+            newest = max((hit['updated_at'] for hit in hits if hit.get('updated_at')), key=_utc, default=None)
+            with self._transaction() as connection:
+                stored += self._store_images(connection, hits)
+                if newest is not None and (watermark is None or _utc(newest) > _utc(watermark)):
+                    watermark = newest
+                    page = 1
+                else:
+                    page += 1
+                # end if
+                connection.execute(
+                    'INSERT OR REPLACE INTO syncs (query, watermark, synced_at) VALUES (?, ?, ?)',
+                    (query, watermark, time.time()),
+                )
+            # end with
+            if len(hits) < min(per_page, MAX_PAGE_SIZE):
+                return stored
+            # end if
+        # end while
+    # end def
+
+    def sync_tags(self, query: str, client: Union['DerpiClient', None] = None) -> int:
+        """
+        Requests all tags of the query, and stores them. Tags can't be sorted by `updated_at`, so it's always all of them.
+
+        :return: How many tags were stored.
+        """
+        from .syncrounous.client import DerpiClient
+        if client is None:
+            client = DerpiClient(key=None)
+        # end if
+        return self._store_pages(self.store_tags, client.iter_search_tags(query, _raw=True))
+    # end def
+
+    def sync_comments(self, query: str, client: Union['DerpiClient', None] = None) -> int:
+        """
+        Requests all comments of the query, e.g. `'image_id:4458'`, and stores them.
+        Comments can't be sorted by `updated_at`, so it's always all of them.
+
+        :return: How many comments were stored.
+        """
+        from .syncrounous.client import DerpiClient
+        if client is None:
+            client = DerpiClient(key=None)
+        # end if
+        return self._store_pages(self.store_comments, client.iter_search_comments(query, _raw=True))
+    # end def
+
+    @staticmethod
+    def _store_pages(store, items: Iterable[Dict[str, Any]], batch_size: int = 1000) -> int:
+        """
+        Stores the items in batches, so not all of them have to be in memory.
+        """
+        stored = 0
+        batch = []
+        for item in items:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                stored += store(batch)
+                batch = []
+            # end if
+        # end for
+        return stored + store(batch)
+    # end def
+
+    def image(self, image_id: int) -> Union[Dict[str, Any], None]:
+        """
+        The json of the image, e.g. for `Image.from_dict(...)`. `None` if it isn't stored.
+        """
+        row = self._connection().execute('SELECT data FROM images WHERE id = ?', (image_id,)).fetchone()
+        return None if row is None else loads(row[0])
+    # end def
+
+    def image_ids_with_tag(self, tag_id: int) -> List[int]:
+        """
+        The ids of the stored images having that tag, newest first.
+        """
+        return [row[0] for row in self._connection().execute(
+            'SELECT image_id FROM image_tags WHERE tag_id = ? ORDER BY image_id DESC', (tag_id,),
+        )]
+    # end def
+
+    def count(self, table: str = 'images') -> int:
+        """
+        How many rows are stored in the table, `'images'`, `'tags'` or `'comments'`.
+        """
+        if table not in ('images', 'tags', 'comments'):
+            raise ValueError(f'Unknown table {table!r}')
+        # end if
+        return self._connection().execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+    # end def
+
+    def close(self) -> None:
+        """
+        Closes the connection of the current thread.
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+        # end if
+    # end def
+# end class
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Helpers to walk through paginated API routes, one page after another.
+"""
+import asyncio
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Tuple, TypeVar, Union
+
+from luckydonaldUtils.logger import logging
+
+__author__ = 'luckydonald'
+__all__ = [
+    'DEFAULT_PAGE_SIZE', 'MAX_PAGE_SIZE', 'DEFAULT_CONCURRENCY',
+    'full_page_size', 'page_count', 'iterate_pages', 'async_iterate_pages', 'async_fan_out_pages',
+    'query_before_id', 'iterate_by_id', 'async_iterate_by_id',
+]
+
+logger = logging.getLogger(__name__)
+if __name__ == '__main__':
+    logging.add_colored_handler(level=logging.DEBUG)
+# end if
+
+T = TypeVar('T')
+
+DEFAULT_PAGE_SIZE = 25  # what the API returns if no `per_page` is given.
+MAX_PAGE_SIZE = 50  # the API will never return more than that, regardless of `per_page`.
+DEFAULT_CONCURRENCY = 4  # how many pages are requested at the same time by `async_fan_out_pages`.
+
+
+def full_page_size(per_page: Union[int, None]) -> int:
+    """
+    The amount of items a full page will have for the given `per_page` parameter.
+    """
+    if not per_page:
+        return DEFAULT_PAGE_SIZE
+    # end if
+    return min(per_page, MAX_PAGE_SIZE)
+# end def
+
+
+def page_count(total: int, per_page: Union[int, None] = None) -> int:
+    """
+    How many pages are needed to get all of the `total` results.
+
+    :param total: The total amount of results, as in `SearchResult.total`.
+    :param per_page: The `per_page` value used for the request. `None` if the API default is used.
+    """
+    page_size = full_page_size(per_page)
+    return (total + page_size - 1) // page_size
+# end def
+
+
+def _is_last_page(
+    result: 'SearchResult[T]', page: int, page_size: int, yielded: int, max_items: Union[int, None],
+) -> bool:
+    """
+    If there is no need to request a page after this one.
+    """
+    if len(result.hits) < page_size:  # a short page is the last one.
+        return True
+    # end if
+    if result.total is not None and page * page_size >= result.total:
+        return True
+    # end if
+    return max_items is not None and yielded + len(result.hits) >= max_items
+# end def
+
+
+def iterate_pages(
+    fetch_page: Callable[[int], 'SearchResult[T]'],
+    per_page: Union[int, None] = None,
+    start_page: int = 1,
+    max_items: Union[int, None] = None,
+    prefetch: bool = True,
+) -> Iterator[T]:
+    """
+    Yields the items of all pages, one after another.
+    While the items of one page are consumed, the next page is already fetched in a background thread.
+    Stops once the `total` is reached, or after the first page with less than `per_page` items.
+
+    :param fetch_page: Function returning the `SearchResult` of the given page number.
+    :param per_page: The `per_page` value used for the request. `None` if the API default is used.
+    :param start_page: The first page to fetch. The first page is `1`.
+    :param max_items: Stop after that many items. `None` to continue until the last page.
+    :param prefetch: If the next page should be fetched in a background thread.
+    """
+    if max_items is not None and max_items <= 0:
+        return
+    # end if
+    page_size = full_page_size(per_page)
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+
+    def submit(page: int) -> Future:
+        if executor is not None:
+            return executor.submit(fetch_page, page)
+        # end if
+        future = Future()
+        future.set_result(fetch_page(page))
+        return future
+    # end def
+
+    page = start_page
+    yielded = 0
+    try:
+        future = submit(page)
+        while True:
+            result: 'SearchResult[T]' = future.result()
+            is_last = _is_last_page(result, page=page, page_size=page_size, yielded=yielded, max_items=max_items)
+            if not is_last:
+                future = submit(page + 1)
+            # end if
+            for item in result.hits:
+                yield item
+                yielded += 1
+                if max_items is not None and yielded >= max_items:
+                    return
+                # end if
+            # end for
+            if is_last:
+                return
+            # end if
+            page += 1
+        # end while
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False)
+        # end if
+    # end try
+# end def
+
+
+async def async_iterate_pages(
+    fetch_page: Callable[[int], Awaitable['SearchResult[T]']],
+    per_page: Union[int, None] = None,
+    start_page: int = 1,
+    max_items: Union[int, None] = None,
+    prefetch: bool = True,
+) -> AsyncIterator[T]:
+    """
+    Yields the items of all pages, one after another.
+    While the items of one page are consumed, the next page is already fetched in a background task.
+    Stops once the `total` is reached, or after the first page with less than `per_page` items.
+
+    :param fetch_page: Coroutine function returning the `SearchResult` of the given page number.
+    :param per_page: The `per_page` value used for the request. `None` if the API default is used.
+    :param start_page: The first page to fetch. The first page is `1`.
+    :param max_items: Stop after that many items. `None` to continue until the last page.
+    :param prefetch: If the next page should be fetched in a background task.
+    """
+    if max_items is not None and max_items <= 0:
+        return
+    # end if
+    page_size = full_page_size(per_page)
+    page = start_page
+    yielded = 0
+    next_page: Union[asyncio.Future, None] = None
+    try:
+        result: 'SearchResult[T]' = await fetch_page(page)
+        while True:
+            is_last = _is_last_page(result, page=page, page_size=page_size, yielded=yielded, max_items=max_items)
+            if not is_last and prefetch:
+                next_page = asyncio.ensure_future(fetch_page(page + 1))
+            # end if
+            for item in result.hits:
+                yield item
+                yielded += 1
+                if max_items is not None and yielded >= max_items:
+                    return
+                # end if
+            # end for
+            if is_last:
+                return
+            # end if
+            page += 1
+            if next_page is not None:
+                result = await next_page
+                next_page = None
+            else:
+                result = await fetch_page(page)
+            # end if
+        # end while
+    finally:
+        if next_page is not None:
+            next_page.cancel()
+        # end if
+    # end try
+# end def
+
+
+async def async_fan_out_pages(
+    fetch_page: Callable[[int], Awaitable['SearchResult[T]']],
+    per_page: Union[int, None] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    ordered: bool = True,
+    start_page: int = 1,
+    max_pages: Union[int, None] = None,
+    semaphore: Union[asyncio.Semaphore, None] = None,
+) -> AsyncIterator[T]:
+    """
+    Yields the items of all pages, requesting up to `concurrency` pages at the same time.
+
+    The first page is requested alone, it's `total` tells how many pages there are.
+    The remaining pages are then requested concurrently, with never more than `concurrency` of them in flight
+    (or not yet consumed, if `ordered`), so memory stays bounded as well.
+    If the API sent no `total` pages are requested until the first page which isn't full.
+
+    :param fetch_page: Coroutine function returning the `SearchResult` of the given page number.
+    :param per_page: The `per_page` value used for the request. `None` if the API default is used.
+    :param concurrency: How many pages to request at the same time.
+    :param ordered: If `True` the items are yielded in page order,
+                    if `False` the items of a page are yielded as soon as that page arrived.
+    :param start_page: The first page to fetch. The first page is `1`.
+    :param max_pages: Don't request more than that many pages. `None` to continue until the last page.
+    :param semaphore: Optional semaphore every single request has to acquire,
+                      to share one request budget between multiple concurrent fan-outs.
+    """
+    assert concurrency >= 1
+    page_size = full_page_size(per_page)
+
+    async def fetch(page: int) -> Tuple[int, 'SearchResult[T]']:
+        if semaphore is None:
+            return page, await fetch_page(page)
+        # end if
+        async with semaphore:
+            return page, await fetch_page(page)
+        # end with
+    # end def
+
+    _, first = await fetch(start_page)
+    for item in first.hits:
+        yield item
+    # end for
+    if len(first.hits) < page_size:
+        return
+    # end if
+
+    last_page: Union[int, None] = None  # inclusive, `None` if yet unknown.
+    if first.total is not None:
+        last_page = page_count(first.total, per_page=per_page)
+    # end if
+    if max_pages is not None:
+        max_page = start_page + max_pages - 1
+        last_page = max_page if last_page is None else min(last_page, max_page)
+    # end if
+
+    pending: Dict[int, asyncio.Future] = {}
+    next_to_schedule = start_page + 1
+    next_to_yield = start_page + 1  # only used if `ordered`.
+
+    def schedule():
+        nonlocal next_to_schedule
+        while len(pending) < concurrency and (last_page is None or next_to_schedule <= last_page):
+            pending[next_to_schedule] = asyncio.ensure_future(fetch(next_to_schedule))
+            next_to_schedule += 1
+        # end while
+    # end def
+
+    try:
+        schedule()
+        while pending:
+            if ordered:
+                page, result = await pending.pop(next_to_yield)
+                next_to_yield += 1
+            else:
+                done, _ = await asyncio.wait(list(pending.values()), return_when=asyncio.FIRST_COMPLETED)
+                page, result = done.pop().result()
+                del pending[page]
+            # end if
+            if len(result.hits) < page_size and (last_page is None or page < last_page):
+                # a short page is the last one, everything after it is not needed.
+                last_page = page
+                for later_page in [p for p in pending if p > last_page]:
+                    pending.pop(later_page).cancel()
+                # end for
+            # end if
+            for item in result.hits:
+                yield item
+            # end for
+            schedule()
+        # end while
+    finally:
+        for task in pending.values():
+            task.cancel()
+        # end for
+    # end try
+# end def
+
+
+def query_before_id(query: str, before_id: Union[int, None]) -> str:
+    """
+    The query narrowed to the results with an id lower than `before_id`. `None` leaves the query as is.
+    """
+    if before_id is None:
+        return query
+    # end if
+    return f'({query}), id.lt:{before_id}'
+# end def
+
+
+def _id_of(item: Union[Dict[str, Any], Any]) -> int:
+    """
+    The id of a model, or of it's json.
+    """
+    return item['id'] if isinstance(item, dict) else item.id
+# end def
+
+
+def _is_last_keyset_page(result: 'SearchResult[T]', page_size: int) -> bool:
+    """
+    If there are no results with a lower id than the last one of this page.
+    """
+    if len(result.hits) < page_size:
+        return True
+    # end if
+    return result.total is not None and result.total <= len(result.hits)
+# end def
+
+
+def iterate_by_id(
+    fetch_before: Callable[[Union[int, None]], 'SearchResult[T]'],
+    per_page: Union[int, None] = None,
+    before_id: Union[int, None] = None,
+    max_items: Union[int, None] = None,
+) -> Iterator[T]:
+    """
+    Yields the items of all pages, sorted by descending id.
+    Instead of page numbers every request asks for the first page of results with an id lower than the last one so far,
+    so a request costs the same regardless how deep it is, and new or removed results don't shift the later pages.
+    As every request needs the last id of the page before, they can't be fetched in the background.
+
+    :param fetch_before: Function returning the first page, sorted by descending id,
+                         of the results with an id lower than the given one (`None` for no limit).
+    :param per_page: The `per_page` value used for the request. `None` if the API default is used.
+    :param before_id: Only yield results with an id lower than that, e.g. to continue after the last one seen.
+    :param max_items: Stop after that many items. `None` to continue until the last page.
+    """
+    if max_items is not None and max_items <= 0:
+        return
+    # end if
+    page_size = full_page_size(per_page)
+    yielded = 0
+    while True:
+        result: 'SearchResult[T]' = fetch_before(before_id)
+        for item in result.hits:
+            yield item
+            yielded += 1
+            if max_items is not None and yielded >= max_items:
+                return
+            # end if
+        # end for
+        if _is_last_keyset_page(result, page_size=page_size):
+            return
+        # end if
+        before_id = _id_of(result.hits[-1])
+    # end while
+# end def
+
+
+async def async_iterate_by_id(
+    fetch_before: Callable[[Union[int, None]], Awaitable['SearchResult[T]']],
+    per_page: Union[int, None] = None,
+    before_id: Union[int, None] = None,
+    max_items: Union[int, None] = None,
+) -> AsyncIterator[T]:
+    """
+    Same as `iterate_by_id(...)`, with a coroutine function to fetch the pages.
+
+    :param fetch_before: Coroutine function returning the first page, sorted by descending id,
+                         of the results with an id lower than the given one (`None` for no limit).
+    :param per_page: The `per_page` value used for the request. `None` if the API default is used.
+    :param before_id: Only yield results with an id lower than that, e.g. to continue after the last one seen.
+    :param max_items: Stop after that many items. `None` to continue until the last page.
+    """
+    if max_items is not None and max_items <= 0:
+        return
+    # end if
+    page_size = full_page_size(per_page)
+    yielded = 0
+    while True:
+        result: 'SearchResult[T]' = await fetch_before(before_id)
+        for item in result.hits:
+            yield item
+            yielded += 1
+            if max_items is not None and yielded >= max_items:
+                return
+            # end if
+        # end for
+        if _is_last_keyset_page(result, page_size=page_size):
+            return
+        # end if
+        before_id = _id_of(result.hits[-1])
+    # end while
+# end def
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Process wide http clients, shared by every request which doesn't bring it's own client.
+
+Opening a new `requests.Session`/`httpx.Client` per call means a new TCP and TLS handshake every time.
+Those pools keep one (lazily created) client around and hand it out to everyone, so keep-alive connections are reused.
+"""
+import atexit
+import asyncio
+import threading
+import weakref
+
+from typing import Any, Callable, Dict, Union
+
+from luckydonaldUtils.logger import logging
+
+__author__ = 'luckydonald'
+__all__ = [
+    'DEFAULT_MAX_CONNECTIONS', 'DEFAULT_KEEPALIVE_EXPIRY', 'DEFAULT_CLOSE_DELAY', 'ConnectionPool', 'AsyncConnectionPool', 'register', 'close_all',
+]
+
+logger = logging.getLogger(__name__)
+if __name__ == '__main__':
+    logging.add_colored_handler(level=logging.DEBUG)
+# end if
+
+
+DEFAULT_MAX_CONNECTIONS = 10  # per host
+DEFAULT_KEEPALIVE_EXPIRY = 5.0  # seconds an idle connection is kept open
+DEFAULT_CLOSE_DELAY = 60.0  # seconds a replaced client stays open, for the requests still using it
+
+_UNCHANGED = object()  # default of `configure(...)`, as `None` is a valid setting.
+
+
+class ConnectionPool(object):
+    """
+    Thread safe holder of a single, lazily created synchronous http client.
+
+    The `factory` is called as `factory(max_connections=..., keepalive_expiry=...)` and has to return
+    something with a `request(method, url, ...)` and a `close()` method, e.g. a `requests.Session` or `httpx.Client`.
+    The client is kept for as long as the pool lives. Expiring idle connections is left to the client itself:
+    httpx closes them after `keepalive_expiry` seconds, and requests reconnects if the server closed one.
+    """
+    close_delay: float = DEFAULT_CLOSE_DELAY  # seconds until a client replaced by `configure(...)` gets closed.
+
+    def __init__(
+        self,
+        factory: Callable[..., Any],
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        keepalive_expiry: Union[float, None] = DEFAULT_KEEPALIVE_EXPIRY,
+    ):
+        """
+        :param factory: Callable creating a new http client.
+        :param max_connections: How many connections to keep open per host.
+        :param keepalive_expiry: Seconds an idle connection is kept open, passed on to the `factory`.
+                                 `None` to keep them until the server closes them.
+        """
+        self.factory = factory
+        self.max_connections = max_connections
+        self.keepalive_expiry = keepalive_expiry
+        self._client = None
+        self._lock = threading.Lock()
+    # end def
+
+    def configure(
+        self, max_connections: Union[int, None] = None, keepalive_expiry: Union[float, None, object] = _UNCHANGED,
+    ) -> None:
+        """
+        Change the pool settings. The next request will create a new client with them.
+        The current client may still be in use by other threads, so it's only closed after `close_delay` seconds.
+        Settings not given stay as they are, `keepalive_expiry=None` keeps idle connections until the server closes them.
+        """
+        with self._lock:
+            if max_connections is not None:
+                self.max_connections = max_connections
+            # end if
+            if keepalive_expiry is not _UNCHANGED:
+                self.keepalive_expiry = keepalive_expiry
+            # end if
+            client, self._client = self._client, None
+        # end with
+        if client is not None:
+            closer = threading.Timer(self.close_delay, client.close)
+            closer.daemon = True
+            closer.start()
+        # end if
+    # end def
+
+    def get(self) -> Any:
+        """
+        Returns the shared client, creating it if there is none yet.
+        """
+        with self._lock:
+            if self._client is None:
+                logger.debug(f'creating shared http client with max_connections={self.max_connections!r}.')
+                self._client = self.factory(max_connections=self.max_connections, keepalive_expiry=self.keepalive_expiry)
+            # end if
+            return self._client
+        # end with
+    # end def
+
+    def close(self) -> None:
+        """
+        Closes the shared client, if there is one.
+        """
+        with self._lock:
+            client, self._client = self._client, None
+        # end with
+        if client is not None:
+            client.close()
+        # end if
+    # end def
+# end class
+
+
+class AsyncConnectionPool(object):
+    """
+    Holder of lazily created `httpx.AsyncClient`s, one per event loop.
+
+    An `httpx.AsyncClient` is bound to the loop it was first used in,
+    so every running loop gets it's own client, and it is dropped together with the loop.
+    The `factory` is called as `factory(max_connections=..., keepalive_expiry=...)`.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[..., Any],
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        keepalive_expiry: Union[float, None] = DEFAULT_KEEPALIVE_EXPIRY,
+    ):
+        """
+        :param factory: Callable creating a new `httpx.AsyncClient`.
+        :param max_connections: Maximum of concurrent connections.
+        :param keepalive_expiry: Seconds an idle connection is kept open.
+        """
+        self.factory = factory
+        self.max_connections = max_connections
+        self.keepalive_expiry = keepalive_expiry
+        self._clients: Dict[asyncio.AbstractEventLoop, Any] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+    # end def
+
+    def configure(
+        self, max_connections: Union[int, None] = None, keepalive_expiry: Union[float, None, object] = _UNCHANGED,
+    ) -> None:
+        """
+        Change the pool settings. Only clients created afterwards will use them,
+        call `await pool.aclose()` to replace the one of the current loop right away.
+        Settings not given stay as they are, `keepalive_expiry=None` keeps idle connections until the server closes them.
+        """
+        if max_connections is not None:
+            self.max_connections = max_connections
+        # end if
+        if keepalive_expiry is not _UNCHANGED:
+            self.keepalive_expiry = keepalive_expiry
+        # end if
+    # end def
+
+    def get(self) -> Any:
+        """
+        Returns the shared client of the currently running event loop, creating it if there is none yet.
+        """
+        loop = asyncio.get_running_loop() if hasattr(asyncio, 'get_running_loop') else asyncio.get_event_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None:
+                logger.debug(f'creating shared async http client with max_connections={self.max_connections!r}.')
+                client = self.factory(max_connections=self.max_connections, keepalive_expiry=self.keepalive_expiry)
+                self._clients[loop] = client
+            # end if
+            return client
+        # end with
+    # end def
+
+    async def aclose(self) -> None:
+        """
+        Closes the shared client of the currently running event loop, if there is one.
+        """
+        loop = asyncio.get_running_loop() if hasattr(asyncio, 'get_running_loop') else asyncio.get_event_loop()
+        with self._lock:
+            client = self._clients.pop(loop, None)
+        # end with
+        if client is not None:
+            await client.aclose()
+        # end if
+    # end def
+
+    def close(self) -> None:
+        """
+        Closes all clients whose event loop is still around and not running, e.g. at interpreter shutdown.
+        Clients of already closed loops can't be closed cleanly anymore, so they are just dropped.
+        """
+        with self._lock:
+            clients = list(self._clients.items())
+            self._clients.clear()
+        # end with
+        for loop, client in clients:
+            if loop.is_closed() or loop.is_running():
+                continue
+            # end if
+            try:
+                loop.run_until_complete(client.aclose())
+            except Exception as e:
+                logger.debug(f'could not close shared async http client: {e!r}')
+            # end try
+        # end for
+    # end def
+# end class
+
+
+_pools = weakref.WeakSet()
+
+
+def register(pool: Union[ConnectionPool, AsyncConnectionPool]) -> Union[ConnectionPool, AsyncConnectionPool]:
+    """
+    Registers a pool to be closed on interpreter exit.
+    """
+    _pools.add(pool)
+    return pool
+# end def
+
+
+@atexit.register
+def close_all() -> None:
+    """
+    Closes all registered pools. Called automatically on interpreter exit.
+    """
+    for pool in list(_pools):
+        try:
+            pool.close()
+        except Exception as e:
+            logger.debug(f'could not close connection pool {pool!r}: {e!r}')
+        # end try
+    # end for
+# end def
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Client side rate limiting, so parallel workers don't get throttled or blocked by the server.
+"""
+import asyncio
+import threading
+import time
+
+from typing import Dict, Union
+
+from luckydonaldUtils.logger import logging
+
+__author__ = 'luckydonald'
+__all__ = ['TokenBucket', 'RateLimiter']
+
+logger = logging.getLogger(__name__)
+if __name__ == '__main__':
+    logging.add_colored_handler(level=logging.DEBUG)
+# end if
+
+
+class TokenBucket(object):
+    """
+    A token bucket refilling with `rate` tokens per second, holding at most `burst` tokens.
+
+    Tokens are reserved instead of waited for: `reserve()` takes a token right away, possibly going into debt,
+    and returns how long the caller has to wait until that token would have been available.
+    That way the bucket itself never blocks, and the same bucket works for threads as well as for asyncio tasks.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        :param rate: Tokens added per second.
+        :param burst: Maximum amount of tokens, i.e. how many requests may be sent at once after being idle.
+        """
+        assert rate > 0
+        assert burst >= 1
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    # end def
+
+    def reserve(self) -> float:
+        """
+        Takes a token.
+
+        :return: Seconds to wait before the token may be used, `0.0` if it can be used right away.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            # end if
+            return -self._tokens / self.rate
+        # end with
+    # end def
+# end class
+
+
+class RateLimiter(object):
+    """
+    Rate limiter with one `TokenBucket` per host.
+
+    Can be shared between threads (`acquire`) and asyncio tasks (`acquire_async`).
+    The time spent waiting is returned by every call, and summed up per host in `waited`.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        :param rate: Requests per second allowed per host.
+        :param burst: How many requests per host may be sent at once after being idle.
+        """
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+        self.waited: Dict[str, float] = {}  # total seconds spent waiting, per host
+        self._lock = threading.Lock()
+    # end def
+
+    def bucket(self, host: str) -> TokenBucket:
+        """
+        The bucket of the given host, created if needed.
+        """
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(rate=self.rate, burst=self.burst)
+            # end if
+            return bucket
+        # end with
+    # end def
+
+    def _reserve(self, host: str) -> float:
+        delay = self.bucket(host).reserve()
+        if delay > 0:
+            with self._lock:
+                self.waited[host] = self.waited.get(host, 0.0) + delay
+            # end with
+            logger.debug(f'rate limited, waiting {delay:.3f}s for {host!r}.')
+        # end if
+        return delay
+    # end def
+
+    def acquire(self, host: str) -> float:
+        """
+        Blocks until a request to the given host may be sent.
+
+        :param host: The host, or base url, to limit.
+        :return: Seconds spent waiting.
+        """
+        delay = self._reserve(host)
+        if delay > 0:
+            time.sleep(delay)
+        # end if
+        return delay
+    # end def
+
+    async def acquire_async(self, host: str) -> float:
+        """
+        Waits until a request to the given host may be sent, without blocking the event loop.
+
+        :param host: The host, or base url, to limit.
+        :return: Seconds spent waiting.
+        """
+        delay = self._reserve(host)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        # end if
+        return delay
+    # end def
+
+    def total_waited(self, host: Union[str, None] = None) -> float:
+        """
+        Total seconds spent waiting, for the given host or for all of them.
+        """
+        with self._lock:
+            if host is not None:
+                return self.waited.get(host, 0.0)
+            # end if
+            return sum(self.waited.values())
+        # end with
+    # end def
+# end class
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Persistent cache of raw API responses, stored in SQLite, so restarted or replayed jobs don't download everything again.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from typing import Any, Dict, Union
+
+from luckydonaldUtils.logger import logging
+
+from .conditional import revalidation_headers_for
+from .serialization import loads
+
+__author__ = 'luckydonald'
+__all__ = ['CachedResponse', 'SQLiteResponseCache']
+
+logger = logging.getLogger(__name__)
+if __name__ == '__main__':
+    logging.add_colored_handler(level=logging.DEBUG)
+# end if
+
+
+class CachedResponse(object):
+    """
+    Stands in for a requests/httpx response, for a body coming from a cache instead of the network.
+    """
+
+    def __init__(self, url: str, content: bytes, status_code: int = 200, headers: Union[Dict[str, str], None] = None):
+        """
+        :param url: The url the body was originally fetched from.
+        :param content: The raw response body.
+        :param status_code: The http status code to report.
+        :param headers: Headers to report, by default only a json content type.
+        """
+        self.url = url
+        self.content = content
+        self.status_code = status_code
+        self.headers = {'content-type': 'application/json; charset=utf-8'}
+        self.headers.update(headers or {})
+    # end def
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8')
+    # end def
+
+    def json(self) -> Any:
+        return loads(self.content)
+    # end def
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(url={self.url!r}, status_code={self.status_code!r}, size={len(self.content)!r})'
+    # end def
+# end class
+
+
+class SQLiteResponseCache(object):
+    """
+    Stores raw response bodies of `GET` requests in a SQLite database.
+
+    The database runs in WAL mode, so multiple processes (and threads, each gets it's own connection) can share it.
+    Entries expire after `ttl` seconds. If the bodies take more than `max_bytes`, the least recently used are dropped.
+    Expired entries with validators (`ETag`/`Last-Modified`) are kept until then, so they can be revalidated
+    with a conditional request instead of being downloaded again.
+    The database calls are blocking, but they are quick enough to be used from the async client as well.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            url TEXT NOT NULL,
+            body BLOB NOT NULL,
+            size INTEGER NOT NULL,
+            stored_at REAL NOT NULL,
+            accessed_at REAL NOT NULL,
+            etag TEXT,
+            last_modified TEXT
+        );
+        CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+        CREATE INDEX IF NOT EXISTS responses_stored_at ON responses (stored_at);
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: Union[float, None] = 3600.0,
+        max_bytes: Union[int, None] = 512 * 1024 * 1024,
+        evict_every: int = 100,
+    ):
+        """
+        :param path: File name of the database. It is created if needed.
+        :param ttl: Seconds a response is valid. `None` to keep them forever, e.g. to replay a job offline.
+        :param max_bytes: Upper limit for the size of all bodies together. `None` for no limit.
+        :param evict_every: Check for expired and too many entries every that many stored responses.
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.evict_every = evict_every
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._stores_since_eviction = 0
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        connection = self._connection()
+        connection.executescript(self.SCHEMA)
+        columns = {row[1] for row in connection.execute('PRAGMA table_info(responses)')}
+        for column in ('etag', 'last_modified'):  # databases created before those were added
+            if column not in columns:
+                connection.execute(f'ALTER TABLE responses ADD COLUMN {column} TEXT')
+            # end if
+        # end for
+    # end def
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        The connection of the current thread, opened if needed.
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+        # end if
+        return connection
+    # end def
+
+    @staticmethod
+    def make_key(method: str, url: str, params: Union[Dict[str, Any], None] = None) -> str:
+        """
+        Builds the cache key of a request. `None` parameters are ignored, as they aren't sent either.
+        """
+        items = sorted((name, str(value)) for name, value in (params or {}).items() if value is not None)
+        return hashlib.sha256(json.dumps([method.upper(), url, items]).encode('utf-8')).hexdigest()
+    # end def
+
+    def get(self, key: str) -> Union[bytes, None]:
+        """
+        The stored body, or `None` if there is none or it expired.
+
+        :param key: As returned by `make_key(...)`.
+        """
+        connection = self._connection()
+        row = connection.execute('SELECT body, stored_at FROM responses WHERE key = ?', (key,)).fetchone()
+        now = time.time()
+        if row is None or (self.ttl is not None and row[1] + self.ttl < now):
+            self.misses += 1
+            return None
+        # end if
+        connection.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (now, key))
+        self.hits += 1
+        return row[0]
+    # end def
+
+    def revalidation_headers(self, key: str) -> Union[Dict[str, str], None]:
+        """
+        The headers for a conditional request, if there is an expired body the server sent validators for.
+
+        :param key: As returned by `make_key(...)`.
+        """
+        row = self._connection().execute('SELECT etag, last_modified FROM responses WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        # end if
+        return revalidation_headers_for(etag=row[0], last_modified=row[1]) or None
+    # end def
+
+    def revalidated(self, key: str) -> Union[bytes, None]:
+        """
+        The server confirmed the (expired) body is still up to date, so it's valid for another `ttl` again.
+
+        :param key: As returned by `make_key(...)`.
+        :return: The body, or `None` if it was evicted in the meantime.
+        """
+        connection = self._connection()
+        row = connection.execute('SELECT body FROM responses WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        # end if
+        now = time.time()
+        connection.execute('UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?', (now, now, key))
+        self.revalidations += 1
+        return row[0]
+    # end def
+
+    def set(
+        self, key: str, url: str, body: bytes, etag: Union[str, None] = None, last_modified: Union[str, None] = None,
+    ) -> None:
+        """
+        Stores a response body.
+
+        :param key: As returned by `make_key(...)`.
+        :param url: The url, only stored for debugging.
+        :param body: The raw response body.
+        :param etag: The `ETag` header of the response, if any.
+        :param last_modified: The `Last-Modified` header of the response, if any.
+        """
+        now = time.time()
+        self._connection().execute(
+            'INSERT OR REPLACE INTO responses (key, url, body, size, stored_at, accessed_at, etag, last_modified) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (key, url, body, len(body), now, now, etag, last_modified),
+        )
+        with self._lock:
+            self._stores_since_eviction += 1
+            evict = self._stores_since_eviction >= self.evict_every
+            if evict:
+                self._stores_since_eviction = 0
+            # end if
+        # end with
+        if evict:
+            self.evict()
+        # end if
+    # end def
+
+    def evict(self) -> None:
+        """
+        Deletes expired responses which can't be revalidated, and the least recently used ones exceeding `max_bytes`.
+        """
+        connection = self._connection()
+        if self.ttl is not None:
+            connection.execute(
+                'DELETE FROM responses WHERE stored_at < ? AND etag IS NULL AND last_modified IS NULL',
+                (time.time() - self.ttl,),
+            )
+        # end if
+        if self.max_bytes is not None:
+            connection.execute(
+                """
+                DELETE FROM responses WHERE key IN (
+                    SELECT key FROM (
+                        SELECT key, SUM(size) OVER (ORDER BY accessed_at DESC, key) AS running_size FROM responses
+                    ) WHERE running_size > ?
+                )
+                """,
+                (self.max_bytes,),
+            )
+        # end if
+    # end def
+
+    def clear(self) -> None:
+        """
+        Deletes all stored responses.
+        """
+        self._connection().execute('DELETE FROM responses')
+    # end def
+
+    def __len__(self) -> int:
+        return self._connection().execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+    # end def
+
+    def close(self) -> None:
+        """
+        Closes the connection of the current thread.
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+        # end if
+    # end def
+# end class
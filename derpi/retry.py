@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+When and how long to wait before a failed request is sent again.
+"""
+import random
+
+from typing import FrozenSet, Iterable, Union
+
+from luckydonaldUtils.logger import logging
+
+from .exceptions import DerpiException, DerpiConnectionError, DerpiHttpError
+
+__author__ = 'luckydonald'
+__all__ = ['RetryPolicy']
+
+logger = logging.getLogger(__name__)
+if __name__ == '__main__':
+    logging.add_colored_handler(level=logging.DEBUG)
+# end if
+
+
+class RetryPolicy(object):
+    """
+    Decides if a failed request should be sent again, and how long to wait before doing so.
+
+    The wait time grows exponentially (`backoff_factor * 2 ** (attempt - 1)`, at most `backoff_max` seconds),
+    with "full jitter", i.e. a random value between zero and that, so many workers failing at the same time
+    don't all come back at the same time as well.
+    A `Retry-After` header sent by the server is used instead, if present.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        backoff_factor: float = 0.5,
+        backoff_max: float = 60.0,
+        jitter: bool = True,
+        retry_statuses: Iterable[int] = (429, 500, 502, 503, 504),
+        retry_methods: Iterable[str] = ('GET', 'HEAD', 'OPTIONS'),
+        respect_retry_after: bool = True,
+        max_retry_after: float = 300.0,
+    ):
+        """
+        :param max_attempts: How often a request is sent at most, including the first try. `1` disables retrying.
+        :param backoff_factor: Seconds to wait after the first failed attempt, doubled for every following one.
+        :param backoff_max: Upper limit for the exponential backoff, in seconds.
+        :param jitter: If the backoff should be randomized.
+        :param retry_statuses: The http status codes worth retrying.
+        :param retry_methods: The http methods which are safe to be sent again, by default only the idempotent ones.
+        :param respect_retry_after: If the `Retry-After` header of the server should be used for the wait time.
+        :param max_retry_after: If the server wants us to wait longer than that many seconds, we give up instead.
+        """
+        assert max_attempts >= 1
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.retry_statuses: FrozenSet[int] = frozenset(retry_statuses)
+        self.retry_methods: FrozenSet[str] = frozenset(method.upper() for method in retry_methods)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+    # end def
+
+    def should_retry(self, method: str, attempt: int, error: DerpiException) -> bool:
+        """
+        If the request should be sent again.
+
+        :param method: The http method of the request.
+        :param attempt: How many attempts were already made, `1` after the first one failed.
+        :param error: Why the last attempt failed.
+        """
+        if attempt >= self.max_attempts:
+            return False
+        # end if
+        if method.upper() not in self.retry_methods:
+            return False
+        # end if
+        if isinstance(error, DerpiConnectionError):
+            return True
+        # end if
+        if isinstance(error, DerpiHttpError) and error.status_code in self.retry_statuses:
+            if self.respect_retry_after and error.retry_after is not None and error.retry_after > self.max_retry_after:
+                return False
+            # end if
+            return True
+        # end if
+        return False
+    # end def
+
+    def delay(self, attempt: int, error: Union[DerpiException, None] = None) -> float:
+        """
+        Seconds to wait before the next attempt.
+
+        :param attempt: How many attempts were already made, `1` after the first one failed.
+        :param error: Why the last attempt failed.
+        """
+        if self.respect_retry_after and isinstance(error, DerpiHttpError) and error.retry_after is not None:
+            return error.retry_after
+        # end if
+        backoff = min(self.backoff_max, self.backoff_factor * 2 ** (attempt - 1))
+        if self.jitter:
+            return random.uniform(0, backoff)
+        # end if
+        return backoff
+    # end def
+# end class
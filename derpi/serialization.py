@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Decoding of the json responses, and encoding of models, with the fastest library available.
+"""
+import json
+
+from array import array
+from datetime import datetime
+
+from typing import Any, Callable, Dict, Union
+
+from luckydonaldUtils.logger import logging
+
+__author__ = 'luckydonald'
+__all__ = ['BACKENDS', 'ENCODERS', 'backend', 'loads', 'dumps', 'use_backend']
+
+logger = logging.getLogger(__name__)
+if __name__ == '__main__':
+    logging.add_colored_handler(level=logging.DEBUG)
+# end if
+
+
+def _default(value: Any) -> Any:
+    """
+    Converts the values the json libraries don't know themselves.
+    """
+    if hasattr(value, 'to_dict'):  # a model
+        return value.to_dict()
+    # end if
+    if isinstance(value, array):  # tag ids of a `InternPool(compact_ids=True)`
+        return value.tolist()
+    # end if
+    if isinstance(value, datetime):
+        return value.isoformat()
+    # end if
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+# end def
+
+
+# name -> function decoding `bytes` (or `str`), for every library installed. Ordered from fastest to slowest.
+BACKENDS: Dict[str, Callable[[Union[bytes, str]], Any]] = {}
+# name -> function encoding to `bytes`, for the same libraries.
+ENCODERS: Dict[str, Callable[[Any], bytes]] = {}
+
+try:
+    import orjson
+    BACKENDS['orjson'] = orjson.loads
+    ENCODERS['orjson'] = lambda value: orjson.dumps(value, default=_default)
+except ImportError:
+    pass
+# end try
+
+try:
+    import msgspec
+    BACKENDS['msgspec'] = msgspec.json.Decoder().decode
+    ENCODERS['msgspec'] = msgspec.json.Encoder(enc_hook=_default).encode
+except ImportError:
+    pass
+# end try
+
+BACKENDS['json'] = json.loads  # since python 3.6 that takes bytes as well.
+ENCODERS['json'] = lambda value: json.dumps(value, default=_default, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+backend: str = next(iter(BACKENDS))  # name of the library currently used by `loads(...)` and `dumps(...)`.
+_loads: Callable[[Union[bytes, str]], Any] = BACKENDS[backend]
+_dumps: Callable[[Any], bytes] = ENCODERS[backend]
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Decodes json, e.g. the `response.content` of the API, with the currently selected library.
+    """
+    return _loads(data)
+# end def
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Encodes json with the currently selected library. Models, datetimes and arrays are converted as needed.
+    """
+    return _dumps(value)
+# end def
+
+
+def use_backend(name: str) -> None:
+    """
+    Selects the library `loads(...)` and `dumps(...)` use. By default the fastest installed one is used.
+
+    :param name: One of the keys of `BACKENDS`, i.e. `'orjson'`, `'msgspec'` or `'json'` if installed.
+    """
+    global backend, _loads, _dumps
+    if name not in BACKENDS:
+        raise ValueError(f'Unknown or not installed json backend {name!r}, available are: {list(BACKENDS)!r}')
+    # end if
+    backend = name
+    _loads = BACKENDS[name]
+    _dumps = ENCODERS[name]
+# end def
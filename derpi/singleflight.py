@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Coalescing of identical requests running at the same time, so only one of them actually goes to the server.
+"""
+import asyncio
+import threading
+
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar, Union
+
+from luckydonaldUtils.logger import logging
+
+__author__ = 'luckydonald'
+__all__ = ['SingleFlight', 'AsyncSingleFlight']
+
+logger = logging.getLogger(__name__)
+if __name__ == '__main__':
+    logging.add_colored_handler(level=logging.DEBUG)
+# end if
+
+
+T = TypeVar('T')
+
+
+def make_key(
+    method: str, url: str, params: Union[Dict[str, Any], None] = None, headers: Union[Dict[str, str], None] = None,
+) -> Tuple:
+    """
+    Builds the key identical requests share. `None` parameters are ignored, as they aren't sent either.
+    """
+    return (
+        method.upper(),
+        url,
+        tuple(sorted((name, str(value)) for name, value in (params or {}).items() if value is not None)),
+        tuple(sorted((headers or {}).items())),
+    )
+# end def
+
+
+class SingleFlight(object):
+    """
+    Lets threads asking for the same key at the same time share one call.
+    The first thread runs it, the others wait for it and get the same result, or the same exception.
+    """
+
+    make_key = staticmethod(make_key)
+
+    def __init__(self):
+        self._futures: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.shared = 0  # how many calls could be saved
+    # end def
+
+    def do(self, key: Hashable, function: Callable[[], T]) -> T:
+        """
+        Runs `function()`, unless a call with the same key is already running, in which case that one's result is used.
+
+        :param key: As returned by `make_key(...)`.
+        :param function: Does the actual work.
+        """
+        with self._lock:
+            future = self._futures.get(key)
+            leader = future is None
+            if leader:
+                future = self._futures[key] = Future()
+            else:
+                self.shared += 1
+            # end if
+        # end with
+        if not leader:
+            return future.result()
+        # end if
+        try:
+            future.set_result(function())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                del self._futures[key]
+            # end with
+        # end try
+        return future.result()
+    # end def
+# end class
+
+
+class AsyncSingleFlight(object):
+    """
+    Lets tasks asking for the same key at the same time share one call.
+    The call runs in it's own task, so cancelling one of the waiting tasks doesn't cancel it for the others.
+    """
+
+    make_key = staticmethod(make_key)
+
+    def __init__(self):
+        self._tasks: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Task] = {}
+        self.shared = 0  # how many calls could be saved
+    # end def
+
+    async def do(self, key: Hashable, function: Callable[[], Awaitable[T]]) -> T:
+        """
+        Runs `await function()`, unless a call with the same key is already running, in which case that one's result is used.
+
+        :param key: As returned by `make_key(...)`.
+        :param function: Does the actual work.
+        """
+        loop = asyncio.get_running_loop()
+        task_key = (loop, key)  # tasks can't be awaited from a different event loop
+        task = self._tasks.get(task_key)
+        if task is not None:
+            self.shared += 1
+        else:
+            task = self._tasks[task_key] = loop.create_task(function())
+            task.add_done_callback(lambda done: self._done(task_key, done))
+        # end if
+        return await asyncio.shield(task)
+    # end def
+
+    def _done(self, task_key: Tuple[asyncio.AbstractEventLoop, Hashable], task: asyncio.Task) -> None:
+        if self._tasks.get(task_key) is task:
+            del self._tasks[task_key]
+        # end if
+        if not task.cancelled():
+            task.exception()  # mark it as retrieved, even if all the waiting tasks were cancelled.
+        # end if
+    # end def
+# end class
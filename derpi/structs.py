@@ -0,0 +1,1375 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+The models as `msgspec.Struct` types, decoded directly from the response bytes in one pass,
+without the intermediate dicts, `prepare_dict(...)` and `from_dict(...)` of the regular models.
+Needs msgspec to be installed, e.g. with `pip install derpi[msgspec]`.
+
+For each route there is a `decode_<route>(body)` function, e.g. for a search page:
+>>> from derpi.syncrounous.client import DerpiClient
+>>> response = DerpiClient.static_request('GET', url='https://derpibooru.org/api/v1/json/search/images', params={'q': 'safe'})
+>>> images = decode_search_images(response.content)
+
+Timestamps are `datetime`s in UTC, like those of the regular models.
+The structs aren't tracked by the garbage collector (`gc=False`), as decoded json can't contain reference cycles.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Union, List, Generic, TypeVar
+
+import msgspec
+
+__author__ = 'luckydonald'
+__all__ = [
+    'SearchResult', 'Image', 'Representations', 'Intensities', 'Comment', 'Forum', 'Topic', 'Post', 'Tag', 'User', 'Filter', 'Links', 'Awards', 'Gallery', 'ImageErrors', 'Oembed', 
+    'decode_comment', 'decode_image', 'decode_image_upload', 'decode_featured_image', 'decode_tag', 'decode_post', 'decode_user', 'decode_filter', 'decode_system_filters', 'decode_system_filters_with_total', 'decode_user_filters', 'decode_user_filters_with_total', 'decode_oembed', 'decode_search_comments', 'decode_search_comments_with_total', 'decode_search_galleries', 'decode_search_galleries_with_total', 'decode_search_posts', 'decode_search_posts_with_total', 'decode_search_images', 'decode_search_images_with_total', 'decode_search_tags', 'decode_search_tags_with_total', 'decode_search_reverse', 'decode_forums', 'decode_forum', 'decode_forum_topics', 'decode_forum_topics_with_total', 'decode_forum_topic', 'decode_forum_posts', 'decode_forum_posts_with_total', 'decode_forum_post', 
+]
+
+T = TypeVar('T')
+
+
+class SearchResult(msgspec.Struct, Generic[T]):
+    """
+    A page of results, and the total amount of results the API reported. `None` if it didn't send one.
+    """
+    hits: List[T]
+    total: Union[int, None] = None
+# end class
+
+
+class Image(msgspec.Struct, kw_only=True, gc=False):
+    """
+    A Image of the Derpibooru API, decoded by msgspec.
+    Unknown fields are ignored. The API sends `null` for some fields not documented as optional,
+    so all of them may be `None`, but only the optional ones may be missing.
+
+    
+    :param animated: Whether the image is animated.
+    :type  animated: bool
+    
+    :param aspect_ratio: The image's width divided by its height.
+    :type  aspect_ratio: float
+    
+    :param comment_count: The number of comments made on the image.
+    :type  comment_count: int
+    
+    :param created_at: The creation time, in UTC, of the image.
+    :type  created_at: datetime
+    
+    :param deletion_reason: The hide reason for the image, or `null` if none provided. This will only have a value on images which are deleted for a rule violation.
+    :type  deletion_reason: str|None
+    
+    :param description: The image's description.
+    :type  description: str
+    
+    :param downvotes: The number of downvotes the image has.
+    :type  downvotes: int
+    
+    :param duplicate_of: The ID of the target image, or `null` if none provided. This will only have a value on images which are merged into another image.
+    :type  duplicate_of: int|None
+    
+    :param duration: The number of seconds the image lasts, if animated.
+    :type  duration: float
+    
+    :param faves: The number of faves the image has.
+    :type  faves: int
+    
+    :param first_seen_at: The time, in UTC, the image was first seen (before any duplicate merging).
+    :type  first_seen_at: datetime
+    
+    :param format: The file extension of the image. One of `"gif", "jpg", "jpeg", "png", "svg", "webm"`.
+    :type  format: str
+    
+    :param height: The image's height, in pixels.
+    :type  height: int
+    
+    :param hidden_from_users: Whether the image is hidden. An image is hidden if it is merged or deleted for a rule violation.
+    :type  hidden_from_users: bool
+    
+    :param id: The image's ID.
+    :type  id: int
+    
+    :param intensities: Optional object of [internal image intensity data](https://derpibooru.orghttps://github.com/derpibooru/cli_intensities) for deduplication purposes. May be `null` if intensities have not yet been generated.
+    :type  intensities: Intensities|None
+    
+    :param mime_type: The MIME type of this image. One of `"image/gif", "image/jpeg", "image/png", "image/svg+xml", "video/webm"`.
+    :type  mime_type: str
+    
+    :param name: The filename that the image was uploaded with.
+    :type  name: str
+    
+    :param orig_sha512_hash: The SHA512 hash of the image as it was originally uploaded.
+    :type  orig_sha512_hash: str
+    
+    :param processed: Whether the image has finished optimization.
+    :type  processed: bool
+    
+    :param representations: A mapping of representation names to their respective URLs. Contains the keys `"full", "large", "medium", "small", "tall", "thumb", "thumb_small", "thumb_tiny"`.
+    :type  representations: Representations
+    
+    :param score: The image's number of upvotes minus the image's number of downvotes.
+    :type  score: int
+    
+    :param sha512_hash: The SHA512 hash of this image after it has been processed.
+    :type  sha512_hash: str
+    
+    :param size: The number of bytes the image's file contains.
+    :type  size: int
+    
+    :param source_url: The current source URL of the image.
+    :type  source_url: str
+    
+    :param spoilered: Whether the image is hit by the current filter.
+    :type  spoilered: bool
+    
+    :param tag_count: The number of tags present on the image.
+    :type  tag_count: int
+    
+    :param tag_ids: A list of tag IDs the image contains.
+    :type  tag_ids: list
+    
+    :param tags: A list of tag names the image contains.
+    :type  tags: list
+    
+    :param thumbnails_generated: Whether the image has finished thumbnail generation. Do not attempt to load images from `view_url` or `representations` if this is false.
+    :type  thumbnails_generated: bool
+    
+    :param updated_at: The time, in UTC, the image was last updated.
+    :type  updated_at: datetime
+    
+    :param uploader: The image's uploader.
+    :type  uploader: str
+    
+    :param uploader_id: The ID of the image's uploader. `null` if uploaded anonymously.
+    :type  uploader_id: int|None
+    
+    :param upvotes: The image's number of upvotes.
+    :type  upvotes: int
+    
+    :param view_url: The image's view URL, including tags.
+    :type  view_url: str
+    
+    :param width: The image's width, in pixels.
+    :type  width: int
+    
+    :param wilson_score: The lower bound of the [Wilson score interval](https://derpibooru.orghttps://en.wikipedia.org/wiki/Binomial_proportion_confidence_interval#Wilson_score_interval) for the image, based on its upvotes and downvotes, given a z-score corresponding to a confidence of 99.5%.
+    :type  wilson_score: float
+    
+    """
+    animated: Union[bool, None]
+    aspect_ratio: Union[float, None]
+    comment_count: Union[int, None]
+    created_at: Union[datetime, None]
+    deletion_reason: Union[str, None] = None
+    description: Union[str, None]
+    downvotes: Union[int, None]
+    duplicate_of: Union[int, None] = None
+    duration: Union[float, None]
+    faves: Union[int, None]
+    first_seen_at: Union[datetime, None]
+    format: Union[str, None]
+    height: Union[int, None]
+    hidden_from_users: Union[bool, None]
+    id: Union[int, None]
+    intensities: Union[Intensities, List[Intensities], None] = None
+    mime_type: Union[str, None]
+    name: Union[str, None]
+    orig_sha512_hash: Union[str, None]
+    processed: Union[bool, None]
+    representations: Union[Representations, List[Representations], None]
+    score: Union[int, None]
+    sha512_hash: Union[str, None]
+    size: Union[int, None]
+    source_url: Union[str, None]
+    spoilered: Union[bool, None]
+    tag_count: Union[int, None]
+    tag_ids: Union[list, None]
+    tags: Union[list, None]
+    thumbnails_generated: Union[bool, None]
+    updated_at: Union[datetime, None]
+    uploader: Union[str, None]
+    uploader_id: Union[int, None] = None
+    upvotes: Union[int, None]
+    view_url: Union[str, None]
+    width: Union[int, None]
+    wilson_score: Union[float, None]
+
+    def __post_init__(self):
+        # msgspec keeps timestamps without a timezone naive, but the API means UTC.
+        if self.created_at is not None and self.created_at.tzinfo is None:
+            self.created_at = self.created_at.replace(tzinfo=timezone.utc)
+        # end if
+        if self.first_seen_at is not None and self.first_seen_at.tzinfo is None:
+            self.first_seen_at = self.first_seen_at.replace(tzinfo=timezone.utc)
+        # end if
+        if self.updated_at is not None and self.updated_at.tzinfo is None:
+            self.updated_at = self.updated_at.replace(tzinfo=timezone.utc)
+        # end if
+    # end def
+# end class
+
+
+class Representations(msgspec.Struct, kw_only=True, gc=False):
+    """
+    A Representations of the Derpibooru API, decoded by msgspec.
+    Unknown fields are ignored. The API sends `null` for some fields not documented as optional,
+    so all of them may be `None`, but only the optional ones may be missing.
+
+    
+    :param full: The url to the image in original resolution.
+    :type  full: str
+    
+    :param large: The url to the image in large resolution.
+    :type  large: str
+    
+    :param medium: The url to the image in medium resolution.
+    :type  medium: str
+    
+    :param small: The url to the image in small resolution.
+    :type  small: str
+    
+    :param tall: The url to the image in tall resolution.
+    :type  tall: str
+    
+    :param thumb: The url to the image thumbnail in normal resolution.
+    :type  thumb: str
+    
+    :param thumb_small: The url to the image thumbnail in small resolution.
+    :type  thumb_small: str
+    
+    :param thumb_tiny: The url to the image thumbnail in tiny resolution.
+    :type  thumb_tiny: str
+    
+    :param mp4: Optional. The url to the animated image as mp4 format.
+    :type  mp4: str|None
+    
+    :param webm: Optional. The url to the animated image as webm format.
+    :type  webm: str|None
+    
+    """
+    full: Union[str, None]
+    large: Union[str, None]
+    medium: Union[str, None]
+    small: Union[str, None]
+    tall: Union[str, None]
+    thumb: Union[str, None]
+    thumb_small: Union[str, None]
+    thumb_tiny: Union[str, None]
+    mp4: Union[str, None] = None
+    webm: Union[str, None] = None
+# end class
+
+
+class Intensities(msgspec.Struct, kw_only=True, gc=False):
+    """
+    A Intensities of the Derpibooru API, decoded by msgspec.
+    Unknown fields are ignored. The API sends `null` for some fields not documented as optional,
+    so all of them may be `None`, but only the optional ones may be missing.
+
+    
+    :param ne: Northeast intensity. Whatever that means…
+    :type  ne: float
+    
+    :param nw: Northwest intensity. Whatever that means…
+    :type  nw: float
+    
+    :param se: Southeast intensity. Whatever that means…
+    :type  se: float
+    
+    :param sw: Southwest intensity. Whatever that means…
+    :type  sw: float
+    
+    """
+    ne: Union[float, None]
+    nw: Union[float, None]
+    se: Union[float, None]
+    sw: Union[float, None]
+# end class
+
+
+class Comment(msgspec.Struct, kw_only=True, gc=False):
+    """
+    A Comment of the Derpibooru API, decoded by msgspec.
+    Unknown fields are ignored. The API sends `null` for some fields not documented as optional,
+    so all of them may be `None`, but only the optional ones may be missing.
+
+    
+    :param author: The comment's author.
+    :type  author: str
+    
+    :param avatar: The URL of the author's avatar. May be a link to the CDN path, or a `data:` URI.
+    :type  avatar: str
+    
+    :param body: The comment text.
+    :type  body: str
+    
+    :param created_at: The creation time, in UTC, of the comment.
+    :type  created_at: datetime
+    
+    :param edit_reason: The edit reason for this comment, or `null` if none provided.
+    :type  edit_reason: str|None
+    
+    :param edited_at: The time, in UTC, this comment was last edited at, or `null` if it was not edited.
+    :type  edited_at: datetime|None
+    
+    :param id: The comment's ID.
+    :type  id: int
+    
+    :param image_id: The ID of the image the comment belongs to.
+    :type  image_id: int
+    
+    :param updated_at: The time, in UTC, the comment was last updated at.
+    :type  updated_at: datetime
+    
+    :param user_id: The ID of the user the comment belongs to, if any.
+    :type  user_id: int
+    
+    """
+    author: Union[str, None]
+    avatar: Union[str, None]
+    body: Union[str, None]
+    created_at: Union[datetime, None]
+    edit_reason: Union[str, None] = None
+    edited_at: Union[datetime, None] = None
+    id: Union[int, None]
+    image_id: Union[int, None]
+    updated_at: Union[datetime, None]
+    user_id: Union[int, None]
+
+    def __post_init__(self):
+        # msgspec keeps timestamps without a timezone naive, but the API means UTC.
+        if self.created_at is not None and self.created_at.tzinfo is None:
+            self.created_at = self.created_at.replace(tzinfo=timezone.utc)
+        # end if
+        if self.edited_at is not None and self.edited_at.tzinfo is None:
+            self.edited_at = self.edited_at.replace(tzinfo=timezone.utc)
+        # end if
+        if self.updated_at is not None and self.updated_at.tzinfo is None:
+            self.updated_at = self.updated_at.replace(tzinfo=timezone.utc)
+        # end if
+    # end def
+# end class
+
+
+class Forum(msgspec.Struct, kw_only=True, gc=False):
+    """
+    A Forum of the Derpibooru API, decoded by msgspec.
+    Unknown fields are ignored. The API sends `null` for some fields not documented as optional,
+    so all of them may be `None`, but only the optional ones may be missing.
+
+    
+    :param name: The forum's name.
+    :type  name: str
+    
+    :param short_name: The forum's short name (used to identify it).
+    :type  short_name: str
+    
+    :param description: The forum's description.
+    :type  description: str
+    
+    :param topic_count: The amount of topics in the forum.
+    :type  topic_count: int
+    
+    :param post_count: The amount of posts in the forum.
+    :type  post_count: int
+    
+    """
+    name: Union[str, None]
+    short_name: Union[str, None]
+    description: Union[str, None]
+    topic_count: Union[int, None]
+    post_count: Union[int, None]
+# end class
+
+
+class Topic(msgspec.Struct, kw_only=True, gc=False):
+    """
+    A Topic of the Derpibooru API, decoded by msgspec.
+    Unknown fields are ignored. The API sends `null` for some fields not documented as optional,
+    so all of them may be `None`, but only the optional ones may be missing.
+
+    
+    :param slug: The topic's slug (used to identify it).
+    :type  slug: str
+    
+    :param title: The topic's title.
+    :type  title: str
+    
+    :param post_count: The amount of posts in the topic.
+    :type  post_count: int
+    
+    :param view_count: The amount of views the topic has received.
+    :type  view_count: int
+    
+    :param sticky: Whether the topic is sticky.
+    :type  sticky: bool
+    
+    :param last_replied_to_at: The time, in UTC, when the last reply was made.
+    :type  last_replied_to_at: datetime
+    
+    :param locked: Whether the topic is locked.
+    :type  locked: bool
+    
+    :param user_id: The ID of the user who made the topic. `null` if posted anonymously.
+    :type  user_id: int|None
+    
+    :param author: The name of the user who made the topic.
+    :type  author: str
+    
+    """
+    slug: Union[str, None]
+    title: Union[str, None]
+    post_count: Union[int, None]
+    view_count: Union[int, None]
+    sticky: Union[bool, None]
+    last_replied_to_at: Union[datetime, None]
+    locked: Union[bool, None]
+    user_id: Union[int, None] = None
+    author: Union[str, None]
+
+    def __post_init__(self):
+        # msgspec keeps timestamps without a timezone naive, but the API means UTC.
+        if self.last_replied_to_at is not None and self.last_replied_to_at.tzinfo is None:
+            self.last_replied_to_at = self.last_replied_to_at.replace(tzinfo=timezone.utc)
+        # end if
+    # end def
+# end class
+
+
+class Post(msgspec.Struct, kw_only=True, gc=False):
+    """
+    A Post of the Derpibooru API, decoded by msgspec.
+    Unknown fields are ignored. The API sends `null` for some fields not documented as optional,
+    so all of them may be `None`, but only the optional ones may be missing.
+
+    
+    :param author: The post's author.
+    :type  author: str
+    
+    :param avatar: The URL of the author's avatar. May be a link to the CDN path, or a `data:` URI.
+    :type  avatar: str
+    
+    :param body: The post text.
+    :type  body: str
+    
+    :param created_at: The creation time, in UTC, of the post.
+    :type  created_at: datetime
+    
+    :param edit_reason: The edit reason for this post.
+    :type  edit_reason: str
+    
+    :param edited_at: The time, in UTC, this post was last edited at, or `null` if it was not edited.
+    :type  edited_at: datetime|None
+    
+    :param id: The post's ID (used to identify it).
+    :type  id: int
+    
+    :param updated_at: The time, in UTC, the post was last updated at.
+    :type  updated_at: datetime
+    
+    :param user_id: The ID of the user the post belongs to, if any.
+    :type  user_id: int
+    
+    """
+    author: Union[str, None]
+    avatar: Union[str, None]
+    body: Union[str, None]
+    created_at: Union[datetime, None]
+    edit_reason: Union[str, None]
+    edited_at: Union[datetime, None] = None
+    id: Union[int, None]
+    updated_at: Union[datetime, None]
+    user_id: Union[int, None]
+
+    def __post_init__(self):
+        # msgspec keeps timestamps without a timezone naive, but the API means UTC.
+        if self.created_at is not None and self.created_at.tzinfo is None:
+            self.created_at = self.created_at.replace(tzinfo=timezone.utc)
+        # end if
+        if self.edited_at is not None and self.edited_at.tzinfo is None:
+            self.edited_at = self.edited_at.replace(tzinfo=timezone.utc)
+        # end if
+        if self.updated_at is not None and self.updated_at.tzinfo is None:
+            self.updated_at = self.updated_at.replace(tzinfo=timezone.utc)
+        # end if
+    # end def
+# end class
+
+
+class Tag(msgspec.Struct, kw_only=True, gc=False):
+    """
+    A Tag of the Derpibooru API, decoded by msgspec.
+    Unknown fields are ignored. The API sends `null` for some fields not documented as optional,
+    so all of them may be `None`, but only the optional ones may be missing.
+
+    
+    :param aliased_tag: The slug of the tag this tag is aliased to, if any.
+    :type  aliased_tag: str
+    
+    :param aliases: The slugs of the tags aliased to this tag.
+    :type  aliases: list
+    
+    :param category: The category class of this tag. One of `"character", "content-fanmade", "content-official", "error", "oc", "origin", "rating", "species", "spoiler"`.
+    :type  category: str
+    
+    :param description: The long description for the tag.
+    :type  description: str
+    
+    :param dnp_entries: An array of objects containing DNP entries claimed on the tag.
+    :type  dnp_entries: list
+    
+    :param id: The tag's ID.
+    :type  id: int
+    
+    :param images: The image count of the tag.
+    :type  images: int
+    
+    :param implied_by_tags: The slugs of the tags this tag is implied by.
+    :type  implied_by_tags: list
+    
+    :param implied_tags: The slugs of the tags this tag implies.
+    :type  implied_tags: list
+    
+    :param name: The name of the tag.
+    :type  name: str
+    
+    :param name_in_namespace: The name of the tag in its namespace.
+    :type  name_in_namespace: str
+    
+    :param namespace: The namespace of the tag.
+    :type  namespace: str
+    
+    :param short_description: The short description for the tag.
+    :type  short_description: str
+    
+    :param slug: The slug for the tag.
+    :type  slug: str
+    
+    :param spoiler_image_uri: The spoiler image for the tag, or `null` if none provided. 
+    :type  spoiler_image_uri: str|None
+    
+    """
+    aliased_tag: Union[str, None]
+    aliases: Union[list, None]
+    category: Union[str, None]
+    description: Union[str, None]
+    dnp_entries: Union[list, None]
+    id: Union[int, None]
+    images: Union[int, None]
+    implied_by_tags: Union[list, None]
+    implied_tags: Union[list, None]
+    name: Union[str, None]
+    name_in_namespace: Union[str, None]
+    namespace: Union[str, None]
+    short_description: Union[str, None]
+    slug: Union[str, None]
+    spoiler_image_uri: Union[str, None] = None
+# end class
+
+
+class User(msgspec.Struct, kw_only=True, gc=False):
+    """
+    A User of the Derpibooru API, decoded by msgspec.
+    Unknown fields are ignored. The API sends `null` for some fields not documented as optional,
+    so all of them may be `None`, but only the optional ones may be missing.
+
+    
+    :param id: The ID of the user.
+    :type  id: int
+    
+    :param name: The name of the user.
+    :type  name: str
+    
+    :param slug: The slug of the user.
+    :type  slug: str
+    
+    :param role: The role of the user.
+    :type  role: str
+    
+    :param description: The description (bio) of the user.
+    :type  description: str
+    
+    :param avatar_url: The URL of the user's thumbnail. `null` if the avatar is not set.
+    :type  avatar_url: str|None
+    
+    :param created_at: The creation time, in UTC, of the user.
+    :type  created_at: datetime
+    
+    :param comments_count: The comment count of the user.
+    :type  comments_count: int
+    
+    :param uploads_count: The upload count of the user.
+    :type  uploads_count: int
+    
+    :param posts_count: The forum posts count of the user.
+    :type  posts_count: int
+    
+    :param topics_count: The forum topics count of the user.
+    :type  topics_count: int
+    
+    :param links: `Links`.
+    :type  links: Links
+    
+    :param awards: `Awards`.
+    :type  awards: Awards
+    
+    """
+    id: Union[int, None]
+    name: Union[str, None]
+    slug: Union[str, None]
+    role: Union[str, None]
+    description: Union[str, None]
+    avatar_url: Union[str, None] = None
+    created_at: Union[datetime, None]
+    comments_count: Union[int, None]
+    uploads_count: Union[int, None]
+    posts_count: Union[int, None]
+    topics_count: Union[int, None]
+    links: Union[Links, List[Links], None]
+    awards: Union[Awards, List[Awards], None]
+
+    def __post_init__(self):
+        # msgspec keeps timestamps without a timezone naive, but the API means UTC.
+        if self.created_at is not None and self.created_at.tzinfo is None:
+            self.created_at = self.created_at.replace(tzinfo=timezone.utc)
+        # end if
+    # end def
+# end class
+
+
+class Filter(msgspec.Struct, kw_only=True, gc=False):
+    """
+    A Filter of the Derpibooru API, decoded by msgspec.
+    Unknown fields are ignored. The API sends `null` for some fields not documented as optional,
+    so all of them may be `None`, but only the optional ones may be missing.
+
+    
+    :param id: The id of the filter.
+    :type  id: int
+    
+    :param name: The name of the filter.
+    :type  name: str
+    
+    :param description: The description of the filter.
+    :type  description: str
+    
+    :param user_id: The id of the user the filter belongs to. `null` if it isn't assigned to a user (usually `system` filters only).
+    :type  user_id: int|None
+    
+    :param user_count: The amount of users employing this filter.
+    :type  user_count: int
+    
+    :param system: If `true`, is a system filter. System filters are usable by anyone and don't have a `user_id` set.
+    :type  system: bool
+    
+    :param public: If `true`, is a public filter. Public filters are usable by anyone.
+    :type  public: bool
+    
+    :param spoilered_tag_ids: A list of tag IDs (as integers) that this filter will spoil.
+    :type  spoilered_tag_ids: list
+    
+    :param spoilered_complex: The complex spoiled filter.
+    :type  spoilered_complex: str
+    
+    :param hidden_tag_ids: A list of tag IDs (as integers) that this filter will hide.
+    :type  hidden_tag_ids: list
+    
+    :param hidden_complex: The complex hidden filter.
+    :type  hidden_complex: str
+    
+    """
+    id: Union[int, None]
+    name: Union[str, None]
+    description: Union[str, None]
+    user_id: Union[int, None] = None
+    user_count: Union[int, None]
+    system: Union[bool, None]
+    public: Union[bool, None]
+    spoilered_tag_ids: Union[list, None]
+    spoilered_complex: Union[str, None]
+    hidden_tag_ids: Union[list, None]
+    hidden_complex: Union[str, None]
+# end class
+
+
+class Links(msgspec.Struct, kw_only=True, gc=False):
+    """
+    A Links of the Derpibooru API, decoded by msgspec.
+    Unknown fields are ignored. The API sends `null` for some fields not documented as optional,
+    so all of them may be `None`, but only the optional ones may be missing.
+
+    
+    :param user_id: The ID of the user who owns this link.
+    :type  user_id: int
+    
+    :param created_at: The creation time, in UTC, of this link.
+    :type  created_at: datetime
+    
+    :param state: The state of this link.
+    :type  state: str
+    
+    :param tag_id: The ID of an associated tag for this link. `null` if no tag linked.
+    :type  tag_id: int|None
+    
+    """
+    user_id: Union[int, None]
+    created_at: Union[datetime, None]
+    state: Union[str, None]
+    tag_id: Union[int, None] = None
+
+    def __post_init__(self):
+        # msgspec keeps timestamps without a timezone naive, but the API means UTC.
+        if self.created_at is not None and self.created_at.tzinfo is None:
+            self.created_at = self.created_at.replace(tzinfo=timezone.utc)
+        # end if
+    # end def
+# end class
+
+
+class Awards(msgspec.Struct, kw_only=True, gc=False):
+    """
+    A Awards of the Derpibooru API, decoded by msgspec.
+    Unknown fields are ignored. The API sends `null` for some fields not documented as optional,
+    so all of them may be `None`, but only the optional ones may be missing.
+
+    
+    :param image_url: The URL of this award.
+    :type  image_url: str
+    
+    :param title: The title of this award.
+    :type  title: str
+    
+    :param id: The ID of the badge this award is derived from.
+    :type  id: int
+    
+    :param label: The label of this award.
+    :type  label: str
+    
+    :param awarded_on: The time, in UTC, when this award was given.
+    :type  awarded_on: datetime
+    
+    """
+    image_url: Union[str, None]
+    title: Union[str, None]
+    id: Union[int, None]
+    label: Union[str, None]
+    awarded_on: Union[datetime, None]
+
+    def __post_init__(self):
+        # msgspec keeps timestamps without a timezone naive, but the API means UTC.
+        if self.awarded_on is not None and self.awarded_on.tzinfo is None:
+            self.awarded_on = self.awarded_on.replace(tzinfo=timezone.utc)
+        # end if
+    # end def
+# end class
+
+
+class Gallery(msgspec.Struct, kw_only=True, gc=False):
+    """
+    A Gallery of the Derpibooru API, decoded by msgspec.
+    Unknown fields are ignored. The API sends `null` for some fields not documented as optional,
+    so all of them may be `None`, but only the optional ones may be missing.
+
+    
+    :param description: The gallery's description.
+    :type  description: str
+    
+    :param id: The gallery's ID.
+    :type  id: int
+    
+    :param spoiler_warning: The gallery's spoiler warning.
+    :type  spoiler_warning: str
+    
+    :param thumbnail_id: The ID of the cover image for the gallery.
+    :type  thumbnail_id: int
+    
+    :param title: The gallery's title.
+    :type  title: str
+    
+    :param user: The name of the gallery's creator.
+    :type  user: str
+    
+    :param user_id: The ID of the gallery's creator.
+    :type  user_id: int
+    
+    """
+    description: Union[str, None]
+    id: Union[int, None]
+    spoiler_warning: Union[str, None]
+    thumbnail_id: Union[int, None]
+    title: Union[str, None]
+    user: Union[str, None]
+    user_id: Union[int, None]
+# end class
+
+
+class ImageErrors(msgspec.Struct, kw_only=True, gc=False):
+    """
+    A ImageErrors of the Derpibooru API, decoded by msgspec.
+    Unknown fields are ignored. The API sends `null` for some fields not documented as optional,
+    so all of them may be `None`, but only the optional ones may be missing.
+
+    
+    :param image: Errors in the submitted image
+    :type  image: list
+    
+    :param image_aspect_ratio: Errors in the submitted image
+    :type  image_aspect_ratio: list
+    
+    :param image_format: When an image is unsupported (ex. WEBP)
+    :type  image_format: list
+    
+    :param image_height: Errors in the submitted image
+    :type  image_height: list
+    
+    :param image_width: Errors in the submitted image
+    :type  image_width: list
+    
+    :param image_size: Usually if an image that is too large is uploaded.
+    :type  image_size: list
+    
+    :param image_is_animated: Errors in the submitted image
+    :type  image_is_animated: list
+    
+    :param image_mime_type: Errors in the submitted image
+    :type  image_mime_type: list
+    
+    :param image_orig_sha512_hash: Errors in the submitted image. If **has already been taken** is present, means the image already exists in the database.
+    :type  image_orig_sha512_hash: list
+    
+    :param image_sha512_hash: Errors in the submitted image
+    :type  image_sha512_hash: list
+    
+    :param tag_input: Errors with the tag metadata.
+    :type  tag_input: list
+    
+    :param uploaded_image: Errors in the submitted image
+    :type  uploaded_image: list
+    
+    """
+    image: Union[list, None]
+    image_aspect_ratio: Union[list, None]
+    image_format: Union[list, None]
+    image_height: Union[list, None]
+    image_width: Union[list, None]
+    image_size: Union[list, None]
+    image_is_animated: Union[list, None]
+    image_mime_type: Union[list, None]
+    image_orig_sha512_hash: Union[list, None]
+    image_sha512_hash: Union[list, None]
+    tag_input: Union[list, None]
+    uploaded_image: Union[list, None]
+# end class
+
+
+class Oembed(msgspec.Struct, kw_only=True, gc=False):
+    """
+    A Oembed of the Derpibooru API, decoded by msgspec.
+    Unknown fields are ignored. The API sends `null` for some fields not documented as optional,
+    so all of them may be `None`, but only the optional ones may be missing.
+
+    
+    :param author_name: The comma-delimited names of the image authors.
+    :type  author_name: str
+    
+    :param author_url: The source URL of the image.
+    :type  author_url: str
+    
+    :param cache_age: Always `7200`.
+    :type  cache_age: int
+    
+    :param derpibooru_comments: The number of comments made on the image.
+    :type  derpibooru_comments: int
+    
+    :param derpibooru_id: The image's ID.
+    :type  derpibooru_id: int
+    
+    :param derpibooru_score: The image's number of upvotes minus the image's number of downvotes.
+    :type  derpibooru_score: int
+    
+    :param derpibooru_tags: The names of the image's tags.
+    :type  derpibooru_tags: list
+    
+    :param provider_name: Always `"Derpibooru"`.
+    :type  provider_name: str
+    
+    :param provider_url: Always `"https://derpibooru.org"`.
+    :type  provider_url: str
+    
+    :param title: The image's ID and associated tags, as would be given on the title of the image page.
+    :type  title: str
+    
+    :param type: Always `"photo"`.
+    :type  type: str
+    
+    :param version: Always `"1.0"`.
+    :type  version: str
+    
+    """
+    author_name: Union[str, None]
+    author_url: Union[str, None]
+    cache_age: Union[int, None]
+    derpibooru_comments: Union[int, None]
+    derpibooru_id: Union[int, None]
+    derpibooru_score: Union[int, None]
+    derpibooru_tags: Union[list, None]
+    provider_name: Union[str, None]
+    provider_url: Union[str, None]
+    title: Union[str, None]
+    type: Union[str, None]
+    version: Union[str, None]
+# end class
+
+
+class _CommentResponse(msgspec.Struct):
+    comment: Comment
+# end class
+
+
+class _ImageResponse(msgspec.Struct):
+    image: Image
+# end class
+
+
+class _ImageUploadResponse(msgspec.Struct):
+    image: Image
+# end class
+
+
+class _FeaturedImageResponse(msgspec.Struct):
+    image: Image
+# end class
+
+
+class _TagResponse(msgspec.Struct):
+    tag: Tag
+# end class
+
+
+class _PostResponse(msgspec.Struct):
+    post: Post
+# end class
+
+
+class _UserResponse(msgspec.Struct):
+    user: User
+# end class
+
+
+class _FilterResponse(msgspec.Struct):
+    filter: Filter
+# end class
+
+
+class _SystemFiltersResponse(msgspec.Struct):
+    filters: List[Filter]
+    total: Union[int, None] = None
+# end class
+
+
+class _UserFiltersResponse(msgspec.Struct):
+    filters: List[Filter]
+    total: Union[int, None] = None
+# end class
+
+
+class _SearchCommentsResponse(msgspec.Struct):
+    comments: List[Comment]
+    total: Union[int, None] = None
+# end class
+
+
+class _SearchGalleriesResponse(msgspec.Struct):
+    galleries: List[Gallery]
+    total: Union[int, None] = None
+# end class
+
+
+class _SearchPostsResponse(msgspec.Struct):
+    posts: List[Post]
+    total: Union[int, None] = None
+# end class
+
+
+class _SearchImagesResponse(msgspec.Struct):
+    images: List[Image]
+    total: Union[int, None] = None
+# end class
+
+
+class _SearchTagsResponse(msgspec.Struct):
+    tags: List[Tag]
+    total: Union[int, None] = None
+# end class
+
+
+class _SearchReverseResponse(msgspec.Struct):
+    images: List[Image]
+# end class
+
+
+class _ForumsResponse(msgspec.Struct):
+    forums: List[Forum]
+# end class
+
+
+class _ForumResponse(msgspec.Struct):
+    forum: Forum
+# end class
+
+
+class _ForumTopicsResponse(msgspec.Struct):
+    topics: List[Topic]
+    total: Union[int, None] = None
+# end class
+
+
+class _ForumTopicResponse(msgspec.Struct):
+    topic: Topic
+# end class
+
+
+class _ForumPostsResponse(msgspec.Struct):
+    posts: List[Post]
+    total: Union[int, None] = None
+# end class
+
+
+class _ForumPostResponse(msgspec.Struct):
+    post: Post
+# end class
+
+
+_comment_decoder = msgspec.json.Decoder(_CommentResponse)
+
+
+def decode_comment(body: Union[bytes, str]) -> Comment:
+    """
+    Decodes the response of `comment(...)`, i.e. of `GET /api/v1/json/comments/:comment_id`, looking like `{"comment":Comment}`.
+    """
+    return _comment_decoder.decode(body).comment
+# end def
+
+
+_image_decoder = msgspec.json.Decoder(_ImageResponse)
+
+
+def decode_image(body: Union[bytes, str]) -> Image:
+    """
+    Decodes the response of `image(...)`, i.e. of `GET /api/v1/json/images/:image_id`, looking like `{"image":Image}`.
+    """
+    return _image_decoder.decode(body).image
+# end def
+
+
+_image_upload_decoder = msgspec.json.Decoder(_ImageUploadResponse)
+
+
+def decode_image_upload(body: Union[bytes, str]) -> Image:
+    """
+    Decodes the response of `image_upload(...)`, i.e. of `POST /api/v1/json/images`, looking like `{"image":Image}`.
+    """
+    return _image_upload_decoder.decode(body).image
+# end def
+
+
+_featured_image_decoder = msgspec.json.Decoder(_FeaturedImageResponse)
+
+
+def decode_featured_image(body: Union[bytes, str]) -> Image:
+    """
+    Decodes the response of `featured_image(...)`, i.e. of `GET /api/v1/json/images/featured`, looking like `{"image":Image}`.
+    """
+    return _featured_image_decoder.decode(body).image
+# end def
+
+
+_tag_decoder = msgspec.json.Decoder(_TagResponse)
+
+
+def decode_tag(body: Union[bytes, str]) -> Tag:
+    """
+    Decodes the response of `tag(...)`, i.e. of `GET /api/v1/json/tags/:tag_id`, looking like `{"tag":Tag}`.
+    """
+    return _tag_decoder.decode(body).tag
+# end def
+
+
+_post_decoder = msgspec.json.Decoder(_PostResponse)
+
+
+def decode_post(body: Union[bytes, str]) -> Post:
+    """
+    Decodes the response of `post(...)`, i.e. of `GET /api/v1/json/posts/:post_id`, looking like `{"post":Post}`.
+    """
+    return _post_decoder.decode(body).post
+# end def
+
+
+_user_decoder = msgspec.json.Decoder(_UserResponse)
+
+
+def decode_user(body: Union[bytes, str]) -> User:
+    """
+    Decodes the response of `user(...)`, i.e. of `GET /api/v1/json/profiles/:user_id`, looking like `{"user":User}`.
+    """
+    return _user_decoder.decode(body).user
+# end def
+
+
+_filter_decoder = msgspec.json.Decoder(_FilterResponse)
+
+
+def decode_filter(body: Union[bytes, str]) -> Filter:
+    """
+    Decodes the response of `filter(...)`, i.e. of `GET /api/v1/json/filters/:filter_id`, looking like `{"filter":Filter}`.
+    """
+    return _filter_decoder.decode(body).filter
+# end def
+
+
+_system_filters_decoder = msgspec.json.Decoder(_SystemFiltersResponse)
+
+
+def decode_system_filters(body: Union[bytes, str]) -> List[Filter]:
+    """
+    Decodes the response of `system_filters(...)`, i.e. of `GET /api/v1/json/filters/system`, looking like `{"filters":[Filter]}`.
+    """
+    return _system_filters_decoder.decode(body).filters
+# end def
+
+
+def decode_system_filters_with_total(body: Union[bytes, str]) -> SearchResult[Filter]:
+    """
+    Same as `decode_system_filters(...)`, but additionally returns the `total` amount of results the API reported.
+    """
+    response = _system_filters_decoder.decode(body)
+    return SearchResult(hits=response.filters, total=response.total)
+# end def
+
+
+_user_filters_decoder = msgspec.json.Decoder(_UserFiltersResponse)
+
+
+def decode_user_filters(body: Union[bytes, str]) -> List[Filter]:
+    """
+    Decodes the response of `user_filters(...)`, i.e. of `GET /api/v1/json/filters/user`, looking like `{"filters":[Filter]}`.
+    """
+    return _user_filters_decoder.decode(body).filters
+# end def
+
+
+def decode_user_filters_with_total(body: Union[bytes, str]) -> SearchResult[Filter]:
+    """
+    Same as `decode_user_filters(...)`, but additionally returns the `total` amount of results the API reported.
+    """
+    response = _user_filters_decoder.decode(body)
+    return SearchResult(hits=response.filters, total=response.total)
+# end def
+
+
+_oembed_decoder = msgspec.json.Decoder(Oembed)
+
+
+def decode_oembed(body: Union[bytes, str]) -> Oembed:
+    """
+    Decodes the response of `oembed(...)`, i.e. of `GET /api/v1/json/oembed`, looking like `Oembed`.
+    """
+    return _oembed_decoder.decode(body)
+# end def
+
+
+_search_comments_decoder = msgspec.json.Decoder(_SearchCommentsResponse)
+
+
+def decode_search_comments(body: Union[bytes, str]) -> List[Comment]:
+    """
+    Decodes the response of `search_comments(...)`, i.e. of `GET /api/v1/json/search/comments`, looking like `{"comments":[Comment]}`.
+    """
+    return _search_comments_decoder.decode(body).comments
+# end def
+
+
+def decode_search_comments_with_total(body: Union[bytes, str]) -> SearchResult[Comment]:
+    """
+    Same as `decode_search_comments(...)`, but additionally returns the `total` amount of results the API reported.
+    """
+    response = _search_comments_decoder.decode(body)
+    return SearchResult(hits=response.comments, total=response.total)
+# end def
+
+
+_search_galleries_decoder = msgspec.json.Decoder(_SearchGalleriesResponse)
+
+
+def decode_search_galleries(body: Union[bytes, str]) -> List[Gallery]:
+    """
+    Decodes the response of `search_galleries(...)`, i.e. of `GET /api/v1/json/search/galleries`, looking like `{"galleries":[Gallery]}`.
+    """
+    return _search_galleries_decoder.decode(body).galleries
+# end def
+
+
+def decode_search_galleries_with_total(body: Union[bytes, str]) -> SearchResult[Gallery]:
+    """
+    Same as `decode_search_galleries(...)`, but additionally returns the `total` amount of results the API reported.
+    """
+    response = _search_galleries_decoder.decode(body)
+    return SearchResult(hits=response.galleries, total=response.total)
+# end def
+
+
+_search_posts_decoder = msgspec.json.Decoder(_SearchPostsResponse)
+
+
+def decode_search_posts(body: Union[bytes, str]) -> List[Post]:
+    """
+    Decodes the response of `search_posts(...)`, i.e. of `GET /api/v1/json/search/posts`, looking like `{"posts":[Post]}`.
+    """
+    return _search_posts_decoder.decode(body).posts
+# end def
+
+
+def decode_search_posts_with_total(body: Union[bytes, str]) -> SearchResult[Post]:
+    """
+    Same as `decode_search_posts(...)`, but additionally returns the `total` amount of results the API reported.
+    """
+    response = _search_posts_decoder.decode(body)
+    return SearchResult(hits=response.posts, total=response.total)
+# end def
+
+
+_search_images_decoder = msgspec.json.Decoder(_SearchImagesResponse)
+
+
+def decode_search_images(body: Union[bytes, str]) -> List[Image]:
+    """
+    Decodes the response of `search_images(...)`, i.e. of `GET /api/v1/json/search/images`, looking like `{"images":[Image]}`.
+    """
+    return _search_images_decoder.decode(body).images
+# end def
+
+
+def decode_search_images_with_total(body: Union[bytes, str]) -> SearchResult[Image]:
+    """
+    Same as `decode_search_images(...)`, but additionally returns the `total` amount of results the API reported.
+    """
+    response = _search_images_decoder.decode(body)
+    return SearchResult(hits=response.images, total=response.total)
+# end def
+
+
+_search_tags_decoder = msgspec.json.Decoder(_SearchTagsResponse)
+
+
+def decode_search_tags(body: Union[bytes, str]) -> List[Tag]:
+    """
+    Decodes the response of `search_tags(...)`, i.e. of `GET /api/v1/json/search/tags`, looking like `{"tags":[Tag]}`.
+    """
+    return _search_tags_decoder.decode(body).tags
+# end def
+
+
+def decode_search_tags_with_total(body: Union[bytes, str]) -> SearchResult[Tag]:
+    """
+    Same as `decode_search_tags(...)`, but additionally returns the `total` amount of results the API reported.
+    """
+    response = _search_tags_decoder.decode(body)
+    return SearchResult(hits=response.tags, total=response.total)
+# end def
+
+
+_search_reverse_decoder = msgspec.json.Decoder(_SearchReverseResponse)
+
+
+def decode_search_reverse(body: Union[bytes, str]) -> List[Image]:
+    """
+    Decodes the response of `search_reverse(...)`, i.e. of `POST /api/v1/json/search/reverse`, looking like `{"images":[Image]}`.
+    """
+    return _search_reverse_decoder.decode(body).images
+# end def
+
+
+_forums_decoder = msgspec.json.Decoder(_ForumsResponse)
+
+
+def decode_forums(body: Union[bytes, str]) -> List[Forum]:
+    """
+    Decodes the response of `forums(...)`, i.e. of `GET /api/v1/json/forums`, looking like `{"forums":[Forum]}`.
+    """
+    return _forums_decoder.decode(body).forums
+# end def
+
+
+_forum_decoder = msgspec.json.Decoder(_ForumResponse)
+
+
+def decode_forum(body: Union[bytes, str]) -> Forum:
+    """
+    Decodes the response of `forum(...)`, i.e. of `GET /api/v1/json/forums/:short_name`, looking like `{"forum":Forum}`.
+    """
+    return _forum_decoder.decode(body).forum
+# end def
+
+
+_forum_topics_decoder = msgspec.json.Decoder(_ForumTopicsResponse)
+
+
+def decode_forum_topics(body: Union[bytes, str]) -> List[Topic]:
+    """
+    Decodes the response of `forum_topics(...)`, i.e. of `GET /api/v1/json/forums/:short_name/topics`, looking like `{"topics":[Topic]}`.
+    """
+    return _forum_topics_decoder.decode(body).topics
+# end def
+
+
+def decode_forum_topics_with_total(body: Union[bytes, str]) -> SearchResult[Topic]:
+    """
+    Same as `decode_forum_topics(...)`, but additionally returns the `total` amount of results the API reported.
+    """
+    response = _forum_topics_decoder.decode(body)
+    return SearchResult(hits=response.topics, total=response.total)
+# end def
+
+
+_forum_topic_decoder = msgspec.json.Decoder(_ForumTopicResponse)
+
+
+def decode_forum_topic(body: Union[bytes, str]) -> Topic:
+    """
+    Decodes the response of `forum_topic(...)`, i.e. of `GET /api/v1/json/forums/:short_name/topics/:topic_slug`, looking like `{"topic":Topic}`.
+    """
+    return _forum_topic_decoder.decode(body).topic
+# end def
+
+
+_forum_posts_decoder = msgspec.json.Decoder(_ForumPostsResponse)
+
+
+def decode_forum_posts(body: Union[bytes, str]) -> List[Post]:
+    """
+    Decodes the response of `forum_posts(...)`, i.e. of `GET /api/v1/json/forums/:short_name/topics/:topic_slug/posts`, looking like `{"posts":[Post]}`.
+    """
+    return _forum_posts_decoder.decode(body).posts
+# end def
+
+
+def decode_forum_posts_with_total(body: Union[bytes, str]) -> SearchResult[Post]:
+    """
+    Same as `decode_forum_posts(...)`, but additionally returns the `total` amount of results the API reported.
+    """
+    response = _forum_posts_decoder.decode(body)
+    return SearchResult(hits=response.posts, total=response.total)
+# end def
+
+
+_forum_post_decoder = msgspec.json.Decoder(_ForumPostResponse)
+
+
+def decode_forum_post(body: Union[bytes, str]) -> Post:
+    """
+    Decodes the response of `forum_post(...)`, i.e. of `GET /api/v1/json/forums/:short_name/topics/:topic_slug/posts/:post_id`, looking like `{"post":Post}`.
+    """
+    return _forum_post_decoder.decode(body).post
+# end def
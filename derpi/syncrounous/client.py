@@ -3,11 +3,23 @@
 
 __author__ = 'luckydonald'
 
+import time
+
 from luckydonaldUtils.logger import logging
 from luckydonaldUtils.exceptions import assert_type_or_raise
 
-from typing import Union, List, Dict, Type, Any
+from typing import Union, List, Dict, Type, Any, Iterator
 from .models import *
+from ..pagination import iterate_pages, iterate_by_id, query_before_id
+from ..pool import ConnectionPool, register
+from ..ratelimit import RateLimiter
+from ..retry import RetryPolicy
+from ..cache import ModelCache
+from ..serialization import loads
+from ..response_cache import CachedResponse, SQLiteResponseCache
+from ..singleflight import SingleFlight
+from ..conditional import NOT_MODIFIED, validators_of, revalidation_headers_for, is_conditional
+from ..exceptions import DerpiException, DerpiConnectionError, DerpiUnexpectedResponseError, http_error_for
 
 # import either requests or httpx, whichever sync http client is available.
 try:
@@ -24,6 +36,36 @@ except ImportError:
     CLIENT_TYPE = internet.Client
 # end try
 
+# errors of the http library meaning we didn't get any response.
+if is_requests:
+    CONNECTION_ERRORS = (internet.ConnectionError, internet.Timeout, internet.exceptions.ChunkedEncodingError)
+else:
+    CONNECTION_ERRORS = (internet.TransportError,)
+# end if
+
+
+def _new_http_client(max_connections: int, keepalive_expiry: Union[float, None]) -> CLIENT_TYPE:
+    """
+    Creates the http client used by the shared `DerpiClient.pool`.
+
+    :param max_connections: How many connections to keep open per host.
+    :param keepalive_expiry: Seconds an idle connection is kept open. Only used by httpx,
+                             requests keeps them until the server closes them, and then reconnects.
+    """
+    if is_requests:
+        client = internet.Session()
+        adapter = internet.adapters.HTTPAdapter(pool_connections=max_connections, pool_maxsize=max_connections)
+        client.mount('https://', adapter)
+        client.mount('http://', adapter)
+        return client
+    # end if
+    return internet.Client(limits=internet.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=keepalive_expiry,
+    ))
+# end def
+
 
 logger = logging.getLogger(__name__)
 if __name__ == '__main__':
@@ -34,7 +76,8 @@ if __name__ == '__main__':
 def comment(
     comment_id: int,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
-) -> Comment:
+    _raw: bool = False,
+) -> Union[Comment, Dict]:
     """
     Fetches a **comment response** for the comment ID referenced by the `comment_id` URL parameter.
 
@@ -70,15 +113,44 @@ def comment(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  Comment
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  Comment|Dict
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/comments/{comment_id}')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    _params: Union[Dict, None] = None
+    _headers: Union[Dict[str, str], None] = None
+    cache: Union[ModelCache, None] = None if _raw else DerpiClient.get_cache(_client)  # it holds models, not json.
+    if cache is not None:
+        cache_key = cache.make_key(route='comment', url=_url, params=_params)
+        cached: Union[Comment, None] = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        _headers = cache.revalidation_headers(cache_key)  # if we have an expired result, only ask if it changed.
+    # end if
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params=_params, headers=_headers)
+    if response.status_code == NOT_MODIFIED:
+        cached: Union[Comment, None] = cache.revalidated(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        # it got evicted in the meantime, so we need the full response after all.
+        response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params=_params)
+    # end if
+    result: Dict[str, Dict] = loads(response.content)
     result: Dict = result['comment']
     assert_type_or_raise(result, dict, parameter_name='result')
+    if _raw:
+        return result
+    # end if
     result: Comment = Comment.from_dict(result)
+    if cache is not None:
+        cache.set(cache_key, result, revalidation_headers=revalidation_headers_for(*validators_of(response)))
+    # end if
     return result
 # end def comment
 
@@ -88,7 +160,8 @@ def image(
     filter_id: Union[int, None] = None,
     key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
-) -> Image:
+    _raw: bool = False,
+) -> Union[Image, Dict]:
     """
     Fetches an **image response** for the image ID referenced by the `image_id` URL parameter.
 
@@ -132,18 +205,47 @@ def image(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  Image
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  Image|Dict
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/images/{image_id}')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params={
+    _params: Union[Dict, None] = {
         'filter_id': filter_id,
         'key': key,
-    })
-    result: Dict[str, Dict] = response.json()
+    }
+    _headers: Union[Dict[str, str], None] = None
+    cache: Union[ModelCache, None] = None if _raw else DerpiClient.get_cache(_client)  # it holds models, not json.
+    if cache is not None:
+        cache_key = cache.make_key(route='image', url=_url, params=_params)
+        cached: Union[Image, None] = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        _headers = cache.revalidation_headers(cache_key)  # if we have an expired result, only ask if it changed.
+    # end if
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params=_params, headers=_headers)
+    if response.status_code == NOT_MODIFIED:
+        cached: Union[Image, None] = cache.revalidated(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        # it got evicted in the meantime, so we need the full response after all.
+        response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params=_params)
+    # end if
+    result: Dict[str, Dict] = loads(response.content)
     result: Dict = result['image']
     assert_type_or_raise(result, dict, parameter_name='result')
+    if _raw:
+        return result
+    # end if
     result: Image = Image.from_dict(result)
+    if cache is not None:
+        cache.set(cache_key, result, revalidation_headers=revalidation_headers_for(*validators_of(response)))
+    # end if
     return result
 # end def image
 
@@ -152,7 +254,8 @@ def image_upload(
     url: str,
     key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
-) -> Image:
+    _raw: bool = False,
+) -> Union[Image, Dict]:
     """
     Submits a new image. Both `key` and `url` are required. Errors will result in an `{"errors":image-errors-response}`.
 
@@ -193,17 +296,24 @@ def image_upload(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  Image
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  Image|Dict
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/images')
     response: internet.Response = DerpiClient.static_request('POST', url=_url, client=_client, params={
         'url': url,
         'key': key,
     })
-    result: Dict[str, Dict] = response.json()
+    result: Dict[str, Dict] = loads(response.content)
     result: Dict = result['image']
     assert_type_or_raise(result, dict, parameter_name='result')
+    if _raw:
+        return result
+    # end if
     result: Image = Image.from_dict(result)
     return result
 # end def image_upload
@@ -211,7 +321,8 @@ def image_upload(
 
 def featured_image(
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
-) -> Image:
+    _raw: bool = False,
+) -> Union[Image, Dict]:
     """
     Fetches an **image response** for the for the current featured image.
 
@@ -244,15 +355,44 @@ def featured_image(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  Image
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  Image|Dict
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/images/featured')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    _params: Union[Dict, None] = None
+    _headers: Union[Dict[str, str], None] = None
+    cache: Union[ModelCache, None] = None if _raw else DerpiClient.get_cache(_client)  # it holds models, not json.
+    if cache is not None:
+        cache_key = cache.make_key(route='featured_image', url=_url, params=_params)
+        cached: Union[Image, None] = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        _headers = cache.revalidation_headers(cache_key)  # if we have an expired result, only ask if it changed.
+    # end if
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params=_params, headers=_headers)
+    if response.status_code == NOT_MODIFIED:
+        cached: Union[Image, None] = cache.revalidated(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        # it got evicted in the meantime, so we need the full response after all.
+        response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params=_params)
+    # end if
+    result: Dict[str, Dict] = loads(response.content)
     result: Dict = result['image']
     assert_type_or_raise(result, dict, parameter_name='result')
+    if _raw:
+        return result
+    # end if
     result: Image = Image.from_dict(result)
+    if cache is not None:
+        cache.set(cache_key, result, revalidation_headers=revalidation_headers_for(*validators_of(response)))
+    # end if
     return result
 # end def featured_image
 
@@ -260,7 +400,8 @@ def featured_image(
 def tag(
     tag_id: str,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
-) -> Tag:
+    _raw: bool = False,
+) -> Union[Tag, Dict]:
     """
     Fetches a **tag response** for the **tag slug** given by the `tag_id` URL parameter. The tag's ID is **not** used. For getting a tag by ID the search endpoint can be used like `search/tags?q=id:4458`.
 
@@ -296,15 +437,44 @@ def tag(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  Tag
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  Tag|Dict
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/tags/{tag_id}')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    _params: Union[Dict, None] = None
+    _headers: Union[Dict[str, str], None] = None
+    cache: Union[ModelCache, None] = None if _raw else DerpiClient.get_cache(_client)  # it holds models, not json.
+    if cache is not None:
+        cache_key = cache.make_key(route='tag', url=_url, params=_params)
+        cached: Union[Tag, None] = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        _headers = cache.revalidation_headers(cache_key)  # if we have an expired result, only ask if it changed.
+    # end if
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params=_params, headers=_headers)
+    if response.status_code == NOT_MODIFIED:
+        cached: Union[Tag, None] = cache.revalidated(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        # it got evicted in the meantime, so we need the full response after all.
+        response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params=_params)
+    # end if
+    result: Dict[str, Dict] = loads(response.content)
     result: Dict = result['tag']
     assert_type_or_raise(result, dict, parameter_name='result')
+    if _raw:
+        return result
+    # end if
     result: Tag = Tag.from_dict(result)
+    if cache is not None:
+        cache.set(cache_key, result, revalidation_headers=revalidation_headers_for(*validators_of(response)))
+    # end if
     return result
 # end def tag
 
@@ -312,7 +482,8 @@ def tag(
 def post(
     post_id: int,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
-) -> Post:
+    _raw: bool = False,
+) -> Union[Post, Dict]:
     """
     Fetches a **post response** for the post ID given by the `post_id` URL parameter.
 
@@ -348,15 +519,44 @@ def post(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  Post
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  Post|Dict
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/posts/{post_id}')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    _params: Union[Dict, None] = None
+    _headers: Union[Dict[str, str], None] = None
+    cache: Union[ModelCache, None] = None if _raw else DerpiClient.get_cache(_client)  # it holds models, not json.
+    if cache is not None:
+        cache_key = cache.make_key(route='post', url=_url, params=_params)
+        cached: Union[Post, None] = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        _headers = cache.revalidation_headers(cache_key)  # if we have an expired result, only ask if it changed.
+    # end if
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params=_params, headers=_headers)
+    if response.status_code == NOT_MODIFIED:
+        cached: Union[Post, None] = cache.revalidated(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        # it got evicted in the meantime, so we need the full response after all.
+        response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params=_params)
+    # end if
+    result: Dict[str, Dict] = loads(response.content)
     result: Dict = result['post']
     assert_type_or_raise(result, dict, parameter_name='result')
+    if _raw:
+        return result
+    # end if
     result: Post = Post.from_dict(result)
+    if cache is not None:
+        cache.set(cache_key, result, revalidation_headers=revalidation_headers_for(*validators_of(response)))
+    # end if
     return result
 # end def post
 
@@ -364,7 +564,8 @@ def post(
 def user(
     user_id: int,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
-) -> User:
+    _raw: bool = False,
+) -> Union[User, Dict]:
     """
     Fetches a **profile response** for the user ID given by the `user_id` URL parameter.
 
@@ -400,15 +601,44 @@ def user(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  User
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  User|Dict
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/profiles/{user_id}')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    _params: Union[Dict, None] = None
+    _headers: Union[Dict[str, str], None] = None
+    cache: Union[ModelCache, None] = None if _raw else DerpiClient.get_cache(_client)  # it holds models, not json.
+    if cache is not None:
+        cache_key = cache.make_key(route='user', url=_url, params=_params)
+        cached: Union[User, None] = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        _headers = cache.revalidation_headers(cache_key)  # if we have an expired result, only ask if it changed.
+    # end if
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params=_params, headers=_headers)
+    if response.status_code == NOT_MODIFIED:
+        cached: Union[User, None] = cache.revalidated(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        # it got evicted in the meantime, so we need the full response after all.
+        response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params=_params)
+    # end if
+    result: Dict[str, Dict] = loads(response.content)
     result: Dict = result['user']
     assert_type_or_raise(result, dict, parameter_name='result')
+    if _raw:
+        return result
+    # end if
     result: User = User.from_dict(result)
+    if cache is not None:
+        cache.set(cache_key, result, revalidation_headers=revalidation_headers_for(*validators_of(response)))
+    # end if
     return result
 # end def user
 
@@ -417,7 +647,8 @@ def filter(
     filter_id: int,
     key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
-) -> Filter:
+    _raw: bool = False,
+) -> Union[Filter, Dict]:
     """
     Fetches a **filter response** for the filter ID given by the `filter_id` URL parameter.
 
@@ -458,17 +689,46 @@ def filter(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  Filter
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  Filter|Dict
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/filters/{filter_id}')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params={
+    _params: Union[Dict, None] = {
         'key': key,
-    })
-    result: Dict[str, Dict] = response.json()
+    }
+    _headers: Union[Dict[str, str], None] = None
+    cache: Union[ModelCache, None] = None if _raw else DerpiClient.get_cache(_client)  # it holds models, not json.
+    if cache is not None:
+        cache_key = cache.make_key(route='filter', url=_url, params=_params)
+        cached: Union[Filter, None] = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        _headers = cache.revalidation_headers(cache_key)  # if we have an expired result, only ask if it changed.
+    # end if
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params=_params, headers=_headers)
+    if response.status_code == NOT_MODIFIED:
+        cached: Union[Filter, None] = cache.revalidated(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        # it got evicted in the meantime, so we need the full response after all.
+        response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params=_params)
+    # end if
+    result: Dict[str, Dict] = loads(response.content)
     result: Dict = result['filter']
     assert_type_or_raise(result, dict, parameter_name='result')
+    if _raw:
+        return result
+    # end if
     result: Filter = Filter.from_dict(result)
+    if cache is not None:
+        cache.set(cache_key, result, revalidation_headers=revalidation_headers_for(*validators_of(response)))
+    # end if
     return result
 # end def filter
 
@@ -476,7 +736,8 @@ def filter(
 def system_filters(
     page: Union[int, None] = None,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
-) -> List[Filter]:
+    _raw: bool = False,
+) -> Union[List[Filter], List[Dict]]:
     """
     Fetches a list of **filter responses** that are flagged as being **system** filters (and thus usable by anyone).
 
@@ -512,29 +773,73 @@ def system_filters(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  List[Filter]
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  List[Filter]|List[Dict]
+    """
+    result: SearchResult[Filter] = system_filters_with_total(
+        page=page,
+        _client=_client,
+        _raw=_raw,
+    )
+    return result.hits
+# end def system_filters
+
+
+def system_filters_with_total(
+    page: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: bool = False,
+) -> Union[SearchResult[Filter], SearchResult[Dict]]:
+    """
+    Same as `system_filters(...)`, but additionally returns the `total` amount of results the API reported,
+    e.g. to know the number of pages before requesting them.
+    The `total` is `None` if the API didn't send one.
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient`, or just an already opened `requests.Session`/`httpx.Client`.
+                    See `system_filters(...)` for examples.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+    :rtype:  SearchResult[Filter]|SearchResult[Dict]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/filters/system')
     response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params={
         'page': page,
     })
-    result: Dict[str, List[Dict]] = response.json()
-    result: List[Dict] = result['filters']
-    assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Filter] = [
-        Filter.from_dict(item)
-        for item in result
-    ]
+    result: Dict[str, Union[List[Dict], int]] = loads(response.content)
+    hits: List[Dict] = result['filters']
+    assert_type_or_raise(hits, list, parameter_name='hits')
+    if _raw:
+        return SearchResult(hits=hits, total=result.get('total', None))
+    # end if
+    result: SearchResult[Filter] = SearchResult(
+        hits=[
+            Filter.from_dict(item)
+            for item in hits
+        ],
+        total=result.get('total', None),
+    )
     return result
-# end def system_filters
+# end def system_filters_with_total
 
 
 def user_filters(
     key: str,
     page: Union[int, None] = None,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
-) -> List[Filter]:
+    _raw: bool = False,
+) -> Union[List[Filter], List[Dict]]:
     """
     Fetches a list of **filter responses** that belong to the user given by **key**. If no **key** is given or it is invalid, will return a **403 Forbidden** error.
 
@@ -575,29 +880,80 @@ def user_filters(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  List[Filter]
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  List[Filter]|List[Dict]
+    """
+    result: SearchResult[Filter] = user_filters_with_total(
+        key=key,
+        page=page,
+        _client=_client,
+        _raw=_raw,
+    )
+    return result.hits
+# end def user_filters
+
+
+def user_filters_with_total(
+    key: str,
+    page: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: bool = False,
+) -> Union[SearchResult[Filter], SearchResult[Dict]]:
+    """
+    Same as `user_filters(...)`, but additionally returns the `total` amount of results the API reported,
+    e.g. to know the number of pages before requesting them.
+    The `total` is `None` if the API didn't send one.
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient`, or just an already opened `requests.Session`/`httpx.Client`.
+                    See `user_filters(...)` for examples.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+    :rtype:  SearchResult[Filter]|SearchResult[Dict]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/filters/user')
     response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params={
         'key': key,
         'page': page,
     })
-    result: Dict[str, List[Dict]] = response.json()
-    result: List[Dict] = result['filters']
-    assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Filter] = [
-        Filter.from_dict(item)
-        for item in result
-    ]
+    result: Dict[str, Union[List[Dict], int]] = loads(response.content)
+    hits: List[Dict] = result['filters']
+    assert_type_or_raise(hits, list, parameter_name='hits')
+    if _raw:
+        return SearchResult(hits=hits, total=result.get('total', None))
+    # end if
+    result: SearchResult[Filter] = SearchResult(
+        hits=[
+            Filter.from_dict(item)
+            for item in hits
+        ],
+        total=result.get('total', None),
+    )
     return result
-# end def user_filters
+# end def user_filters_with_total
 
 
 def oembed(
     url: str,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
-) -> Oembed:
+    _raw: bool = False,
+) -> Union[Oembed, Dict]:
     """
     Fetches an **oEmbed response** for the given app link or CDN URL.
 
@@ -633,16 +989,45 @@ def oembed(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  Oembed
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  Oembed|Dict
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/oembed')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params={
+    _params: Union[Dict, None] = {
         'url': url,
-    })
-    result: Dict = response.json()
+    }
+    _headers: Union[Dict[str, str], None] = None
+    cache: Union[ModelCache, None] = None if _raw else DerpiClient.get_cache(_client)  # it holds models, not json.
+    if cache is not None:
+        cache_key = cache.make_key(route='oembed', url=_url, params=_params)
+        cached: Union[Oembed, None] = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        _headers = cache.revalidation_headers(cache_key)  # if we have an expired result, only ask if it changed.
+    # end if
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params=_params, headers=_headers)
+    if response.status_code == NOT_MODIFIED:
+        cached: Union[Oembed, None] = cache.revalidated(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        # it got evicted in the meantime, so we need the full response after all.
+        response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params=_params)
+    # end if
+    result: Dict = loads(response.content)
     assert_type_or_raise(result, dict, parameter_name='result')
+    if _raw:
+        return result
+    # end if
     result: Oembed = Oembed.from_dict(result)
+    if cache is not None:
+        cache.set(cache_key, result, revalidation_headers=revalidation_headers_for(*validators_of(response)))
+    # end if
     return result
 # end def oembed
 
@@ -652,7 +1037,8 @@ def search_comments(
     page: Union[int, None] = None,
     key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
-) -> List[Comment]:
+    _raw: bool = False,
+) -> Union[List[Comment], List[Dict]]:
     """
     Executes the search given by the `q` query parameter (case insensitive and stemming is applied. If you search for **best pony** results like **Best Ponies** are also be returned), and returns **comment responses** sorted by descending creation time.
 
@@ -697,8 +1083,58 @@ def search_comments(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  List[Comment]
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  List[Comment]|List[Dict]
+    """
+    result: SearchResult[Comment] = search_comments_with_total(
+        query=query,
+        page=page,
+        key=key,
+        _client=_client,
+        _raw=_raw,
+    )
+    return result.hits
+# end def search_comments
+
+
+def search_comments_with_total(
+    query: str,
+    page: Union[int, None] = None,
+    key: Union[str, None] = None,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: bool = False,
+) -> Union[SearchResult[Comment], SearchResult[Dict]]:
+    """
+    Same as `search_comments(...)`, but additionally returns the `total` amount of results the API reported,
+    e.g. to know the number of pages before requesting them.
+    The `total` is `None` if the API didn't send one.
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient`, or just an already opened `requests.Session`/`httpx.Client`.
+                    See `search_comments(...)` for examples.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+    :rtype:  SearchResult[Comment]|SearchResult[Dict]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/comments')
     response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params={
@@ -706,15 +1142,21 @@ def search_comments(
         'page': page,
         'key': key,
     })
-    result: Dict[str, List[Dict]] = response.json()
-    result: List[Dict] = result['comments']
-    assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Comment] = [
-        Comment.from_dict(item)
-        for item in result
-    ]
+    result: Dict[str, Union[List[Dict], int]] = loads(response.content)
+    hits: List[Dict] = result['comments']
+    assert_type_or_raise(hits, list, parameter_name='hits')
+    if _raw:
+        return SearchResult(hits=hits, total=result.get('total', None))
+    # end if
+    result: SearchResult[Comment] = SearchResult(
+        hits=[
+            Comment.from_dict(item)
+            for item in hits
+        ],
+        total=result.get('total', None),
+    )
     return result
-# end def search_comments
+# end def search_comments_with_total
 
 
 def search_galleries(
@@ -722,7 +1164,8 @@ def search_galleries(
     page: Union[int, None] = None,
     key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
-) -> List[Gallery]:
+    _raw: bool = False,
+) -> Union[List[Gallery], List[Dict]]:
     """
     Executes the search given by the `q` query parameter, and returns **gallery responses** sorted by descending creation time.
 
@@ -767,8 +1210,58 @@ def search_galleries(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  List[Gallery]
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  List[Gallery]|List[Dict]
+    """
+    result: SearchResult[Gallery] = search_galleries_with_total(
+        query=query,
+        page=page,
+        key=key,
+        _client=_client,
+        _raw=_raw,
+    )
+    return result.hits
+# end def search_galleries
+
+
+def search_galleries_with_total(
+    query: str,
+    page: Union[int, None] = None,
+    key: Union[str, None] = None,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: bool = False,
+) -> Union[SearchResult[Gallery], SearchResult[Dict]]:
+    """
+    Same as `search_galleries(...)`, but additionally returns the `total` amount of results the API reported,
+    e.g. to know the number of pages before requesting them.
+    The `total` is `None` if the API didn't send one.
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient`, or just an already opened `requests.Session`/`httpx.Client`.
+                    See `search_galleries(...)` for examples.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+    :rtype:  SearchResult[Gallery]|SearchResult[Dict]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/galleries')
     response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params={
@@ -776,15 +1269,21 @@ def search_galleries(
         'page': page,
         'key': key,
     })
-    result: Dict[str, List[Dict]] = response.json()
-    result: List[Dict] = result['galleries']
-    assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Gallery] = [
-        Gallery.from_dict(item)
-        for item in result
-    ]
+    result: Dict[str, Union[List[Dict], int]] = loads(response.content)
+    hits: List[Dict] = result['galleries']
+    assert_type_or_raise(hits, list, parameter_name='hits')
+    if _raw:
+        return SearchResult(hits=hits, total=result.get('total', None))
+    # end if
+    result: SearchResult[Gallery] = SearchResult(
+        hits=[
+            Gallery.from_dict(item)
+            for item in hits
+        ],
+        total=result.get('total', None),
+    )
     return result
-# end def search_galleries
+# end def search_galleries_with_total
 
 
 def search_posts(
@@ -792,7 +1291,8 @@ def search_posts(
     page: Union[int, None] = None,
     key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
-) -> List[Post]:
+    _raw: bool = False,
+) -> Union[List[Post], List[Dict]]:
     """
     Executes the search given by the `q` query parameter, and returns **post responses** sorted by descending creation time.
 
@@ -837,8 +1337,58 @@ def search_posts(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  List[Post]
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  List[Post]|List[Dict]
+    """
+    result: SearchResult[Post] = search_posts_with_total(
+        query=query,
+        page=page,
+        key=key,
+        _client=_client,
+        _raw=_raw,
+    )
+    return result.hits
+# end def search_posts
+
+
+def search_posts_with_total(
+    query: str,
+    page: Union[int, None] = None,
+    key: Union[str, None] = None,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: bool = False,
+) -> Union[SearchResult[Post], SearchResult[Dict]]:
+    """
+    Same as `search_posts(...)`, but additionally returns the `total` amount of results the API reported,
+    e.g. to know the number of pages before requesting them.
+    The `total` is `None` if the API didn't send one.
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient`, or just an already opened `requests.Session`/`httpx.Client`.
+                    See `search_posts(...)` for examples.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+    :rtype:  SearchResult[Post]|SearchResult[Dict]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/posts')
     response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params={
@@ -846,15 +1396,21 @@ def search_posts(
         'page': page,
         'key': key,
     })
-    result: Dict[str, List[Dict]] = response.json()
-    result: List[Dict] = result['posts']
-    assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Post] = [
-        Post.from_dict(item)
-        for item in result
-    ]
+    result: Dict[str, Union[List[Dict], int]] = loads(response.content)
+    hits: List[Dict] = result['posts']
+    assert_type_or_raise(hits, list, parameter_name='hits')
+    if _raw:
+        return SearchResult(hits=hits, total=result.get('total', None))
+    # end if
+    result: SearchResult[Post] = SearchResult(
+        hits=[
+            Post.from_dict(item)
+            for item in hits
+        ],
+        total=result.get('total', None),
+    )
     return result
-# end def search_posts
+# end def search_posts_with_total
 
 
 def search_images(
@@ -866,7 +1422,8 @@ def search_images(
     sort_field: Union[str, None] = None,
     key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
-) -> List[Image]:
+    _raw: bool = False,
+) -> Union[List[Image], List[Dict]]:
     """
     Executes the search given by the `q` query parameter, and returns **image responses**.
 
@@ -925,56 +1482,201 @@ def search_images(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  List[Image]
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  List[Image]|List[Dict]
     """
-    _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/images')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params={
-        'q': query,
-        'filter_id': filter_id,
-        'page': page,
-        'per_page': per_page,
-        'sd': sort_direction,
-        'sf': sort_field,
-        'key': key,
-    })
-    result: Dict[str, List[Dict]] = response.json()
-    result: List[Dict] = result['images']
-    assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Image] = [
-        Image.from_dict(item)
-        for item in result
-    ]
-    return result
+    result: SearchResult[Image] = search_images_with_total(
+        query=query,
+        filter_id=filter_id,
+        page=page,
+        per_page=per_page,
+        sort_direction=sort_direction,
+        sort_field=sort_field,
+        key=key,
+        _client=_client,
+        _raw=_raw,
+    )
+    return result.hits
 # end def search_images
 
 
-def search_tags(
+def search_images_with_total(
     query: str,
+    filter_id: Union[int, None] = None,
     page: Union[int, None] = None,
+    per_page: Union[int, None] = None,
+    sort_direction: Union[str, None] = None,
+    sort_field: Union[str, None] = None,
+    key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
-) -> List[Tag]:
+    _raw: bool = False,
+) -> Union[SearchResult[Image], SearchResult[Dict]]:
     """
-    Executes the search given by the `q` query parameter, and returns **tag responses** sorted by descending image count.
-
-    A request will be sent to the following endpoint: `/api/v1/json/search/tags`
-    It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
-    which would for example look like this: https://derpibooru.org/api/v1/json/search/tags?q=analyzed_name:wing
-
-    The API should return json looking like `{"tags":[Tag]}` which will then be parsed to the python result `List[Tag]`.
+    Same as `search_images(...)`, but additionally returns the `total` amount of results the API reported,
+    e.g. to know the number of pages before requesting them.
+    The `total` is `None` if the API didn't send one.
     
     :param query: The current search query, if the request is a search request.
                   Note, on derpibooru's side this parameter is called `q`.
     :type  query: str
     
+    :param filter_id: Assuming the user can access the filter ID given by the parameter, overrides the current filter for this request. This is primarily useful for unauthenticated API access.
+    :type  filter_id: int|None
+    
     :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
     :type  page: int|None
     
-    :param _client: If you wanna to provide your custom `DerpiClient` or just an already opened `requests.Session`/`httpx.Client`.
-                    For example with requests:
-                    >>> client = requests.Session()
-                    >>> result = search_tags(..., _client=client)
-
+    :param per_page: Controls the number of results per page, up to a limit of 50, if the response is paginated. The default is 25.
+    :type  per_page: int|None
+    
+    :param sort_direction: The current sort direction, if the request is a search request.
+                           Note, on derpibooru's side this parameter is called `sd`.
+    :type  sort_direction: str|None
+    
+    :param sort_field: The current sort field, if the request is a search request.
+                       Note, on derpibooru's side this parameter is called `sf`.
+    :type  sort_field: str|None
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient`, or just an already opened `requests.Session`/`httpx.Client`.
+                    See `search_images(...)` for examples.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+    :rtype:  SearchResult[Image]|SearchResult[Dict]
+    """
+    _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/images')
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params={
+        'q': query,
+        'filter_id': filter_id,
+        'page': page,
+        'per_page': per_page,
+        'sd': sort_direction,
+        'sf': sort_field,
+        'key': key,
+    })
+    result: Dict[str, Union[List[Dict], int]] = loads(response.content)
+    hits: List[Dict] = result['images']
+    assert_type_or_raise(hits, list, parameter_name='hits')
+    if _raw:
+        return SearchResult(hits=hits, total=result.get('total', None))
+    # end if
+    result: SearchResult[Image] = SearchResult(
+        hits=[
+            Image.from_dict(item)
+            for item in hits
+        ],
+        total=result.get('total', None),
+    )
+    return result
+# end def search_images_with_total
+
+
+def search_images_batch(
+    query: str,
+    filter_id: Union[int, None] = None,
+    page: Union[int, None] = None,
+    per_page: Union[int, None] = None,
+    sort_direction: Union[str, None] = None,
+    sort_field: Union[str, None] = None,
+    key: Union[str, None] = None,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+) -> 'ImageBatch':
+    """
+    Same as `search_images(...)`, but returns the page as columnar `ImageBatch` of numpy arrays,
+    built directly from the response without creating `Image` models. Needs numpy to be installed.
+    Use `ImageBatch.concatenate(...)` to join multiple pages.
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param filter_id: Assuming the user can access the filter ID given by the parameter, overrides the current filter for this request. This is primarily useful for unauthenticated API access.
+    :type  filter_id: int|None
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param per_page: Controls the number of results per page, up to a limit of 50, if the response is paginated. The default is 25.
+    :type  per_page: int|None
+    
+    :param sort_direction: The current sort direction, if the request is a search request.
+                           Note, on derpibooru's side this parameter is called `sd`.
+    :type  sort_direction: str|None
+    
+    :param sort_field: The current sort field, if the request is a search request.
+                       Note, on derpibooru's side this parameter is called `sf`.
+    :type  sort_field: str|None
+    
+    :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+    :type  key: str|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient`, or just an already opened `requests.Session`/`httpx.Client`.
+                    See `search_images(...)` for examples.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+
+    :return: The images of that page, and the total amount of results.
+    :rtype:  derpi.batch.ImageBatch
+    """
+    from ..batch import ImageBatch  # numpy is optional, so only import it when needed.
+    _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/images')
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params={
+        'q': query,
+        'filter_id': filter_id,
+        'page': page,
+        'per_page': per_page,
+        'sd': sort_direction,
+        'sf': sort_field,
+        'key': key,
+    })
+    result: Dict[str, Union[List[Dict], int]] = loads(response.content)
+    hits: List[Dict] = result['images']
+    assert_type_or_raise(hits, list, parameter_name='hits')
+    return ImageBatch.from_dicts(hits, total=result.get('total', None))
+# end def search_images_batch
+
+
+def search_tags(
+    query: str,
+    page: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: bool = False,
+) -> Union[List[Tag], List[Dict]]:
+    """
+    Executes the search given by the `q` query parameter, and returns **tag responses** sorted by descending image count.
+
+    A request will be sent to the following endpoint: `/api/v1/json/search/tags`
+    It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
+    which would for example look like this: https://derpibooru.org/api/v1/json/search/tags?q=analyzed_name:wing
+
+    The API should return json looking like `{"tags":[Tag]}` which will then be parsed to the python result `List[Tag]`.
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient` or just an already opened `requests.Session`/`httpx.Client`.
+                    For example with requests:
+                    >>> client = requests.Session()
+                    >>> result = search_tags(..., _client=client)
+
                     If you use httpx instead of requests, this would be with a context manager:
                     >>> with httpx.Client() as client:
                     ...     result = search_tags(..., _client=client)
@@ -993,23 +1695,72 @@ def search_tags(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  List[Tag]
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  List[Tag]|List[Dict]
+    """
+    result: SearchResult[Tag] = search_tags_with_total(
+        query=query,
+        page=page,
+        _client=_client,
+        _raw=_raw,
+    )
+    return result.hits
+# end def search_tags
+
+
+def search_tags_with_total(
+    query: str,
+    page: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: bool = False,
+) -> Union[SearchResult[Tag], SearchResult[Dict]]:
+    """
+    Same as `search_tags(...)`, but additionally returns the `total` amount of results the API reported,
+    e.g. to know the number of pages before requesting them.
+    The `total` is `None` if the API didn't send one.
+    
+    :param query: The current search query, if the request is a search request.
+                  Note, on derpibooru's side this parameter is called `q`.
+    :type  query: str
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient`, or just an already opened `requests.Session`/`httpx.Client`.
+                    See `search_tags(...)` for examples.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+    :rtype:  SearchResult[Tag]|SearchResult[Dict]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/tags')
     response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params={
         'q': query,
         'page': page,
     })
-    result: Dict[str, List[Dict]] = response.json()
-    result: List[Dict] = result['tags']
-    assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Tag] = [
-        Tag.from_dict(item)
-        for item in result
-    ]
+    result: Dict[str, Union[List[Dict], int]] = loads(response.content)
+    hits: List[Dict] = result['tags']
+    assert_type_or_raise(hits, list, parameter_name='hits')
+    if _raw:
+        return SearchResult(hits=hits, total=result.get('total', None))
+    # end if
+    result: SearchResult[Tag] = SearchResult(
+        hits=[
+            Tag.from_dict(item)
+            for item in hits
+        ],
+        total=result.get('total', None),
+    )
     return result
-# end def search_tags
+# end def search_tags_with_total
 
 
 def search_reverse(
@@ -1017,7 +1768,8 @@ def search_reverse(
     distance: Union[float, None] = None,
     key: Union[str, None] = None,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
-) -> List[Image]:
+    _raw: bool = False,
+) -> Union[List[Image], List[Dict]]:
     """
     Returns **image responses** based on the results of reverse-searching the image given by the `url` query parameter.
 
@@ -1061,8 +1813,12 @@ def search_reverse(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  List[Image]
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  List[Image]|List[Dict]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/search/reverse')
     response: internet.Response = DerpiClient.static_request('POST', url=_url, client=_client, params={
@@ -1070,9 +1826,12 @@ def search_reverse(
         'distance': distance,
         'key': key,
     })
-    result: Dict[str, List[Dict]] = response.json()
+    result: Dict[str, List[Dict]] = loads(response.content)
     result: List[Dict] = result['images']
     assert_type_or_raise(result, list, parameter_name='result')
+    if _raw:
+        return result
+    # end if
     result: List[Image] = [
         Image.from_dict(item)
         for item in result
@@ -1083,7 +1842,8 @@ def search_reverse(
 
 def forums(
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
-) -> List[Forum]:
+    _raw: bool = False,
+) -> Union[List[Forum], List[Dict]]:
     """
     Fetches a list of **forum responses**.
 
@@ -1116,14 +1876,21 @@ def forums(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  List[Forum]
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  List[Forum]|List[Dict]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/forums')
     response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, List[Dict]] = response.json()
+    result: Dict[str, List[Dict]] = loads(response.content)
     result: List[Dict] = result['forums']
     assert_type_or_raise(result, list, parameter_name='result')
+    if _raw:
+        return result
+    # end if
     result: List[Forum] = [
         Forum.from_dict(item)
         for item in result
@@ -1135,7 +1902,8 @@ def forums(
 def forum(
     short_name: str,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
-) -> Forum:
+    _raw: bool = False,
+) -> Union[Forum, Dict]:
     """
     Fetches a **forum response** for the abbreviated name given by the `short_name` URL parameter.
 
@@ -1171,15 +1939,44 @@ def forum(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  Forum
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  Forum|Dict
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/forums/{short_name}')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    _params: Union[Dict, None] = None
+    _headers: Union[Dict[str, str], None] = None
+    cache: Union[ModelCache, None] = None if _raw else DerpiClient.get_cache(_client)  # it holds models, not json.
+    if cache is not None:
+        cache_key = cache.make_key(route='forum', url=_url, params=_params)
+        cached: Union[Forum, None] = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        _headers = cache.revalidation_headers(cache_key)  # if we have an expired result, only ask if it changed.
+    # end if
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params=_params, headers=_headers)
+    if response.status_code == NOT_MODIFIED:
+        cached: Union[Forum, None] = cache.revalidated(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        # it got evicted in the meantime, so we need the full response after all.
+        response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params=_params)
+    # end if
+    result: Dict[str, Dict] = loads(response.content)
     result: Dict = result['forum']
     assert_type_or_raise(result, dict, parameter_name='result')
+    if _raw:
+        return result
+    # end if
     result: Forum = Forum.from_dict(result)
+    if cache is not None:
+        cache.set(cache_key, result, revalidation_headers=revalidation_headers_for(*validators_of(response)))
+    # end if
     return result
 # end def forum
 
@@ -1188,7 +1985,8 @@ def forum_topics(
     short_name: str,
     page: Union[int, None] = None,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
-) -> List[Topic]:
+    _raw: bool = False,
+) -> Union[List[Topic], List[Dict]]:
     """
     Fetches a list of **topic responses** for the abbreviated forum name given by the `short_name` URL parameter.
 
@@ -1227,29 +2025,78 @@ def forum_topics(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  List[Topic]
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  List[Topic]|List[Dict]
+    """
+    result: SearchResult[Topic] = forum_topics_with_total(
+        short_name=short_name,
+        page=page,
+        _client=_client,
+        _raw=_raw,
+    )
+    return result.hits
+# end def forum_topics
+
+
+def forum_topics_with_total(
+    short_name: str,
+    page: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: bool = False,
+) -> Union[SearchResult[Topic], SearchResult[Dict]]:
+    """
+    Same as `forum_topics(...)`, but additionally returns the `total` amount of results the API reported,
+    e.g. to know the number of pages before requesting them.
+    The `total` is `None` if the API didn't send one.
+    
+    :param short_name: the variable short_name part of the url.
+    :type  short_name: str
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient`, or just an already opened `requests.Session`/`httpx.Client`.
+                    See `forum_topics(...)` for examples.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+    :rtype:  SearchResult[Topic]|SearchResult[Dict]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/forums/{short_name}/topics')
     response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params={
         'page': page,
     })
-    result: Dict[str, List[Dict]] = response.json()
-    result: List[Dict] = result['topics']
-    assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Topic] = [
-        Topic.from_dict(item)
-        for item in result
-    ]
+    result: Dict[str, Union[List[Dict], int]] = loads(response.content)
+    hits: List[Dict] = result['topics']
+    assert_type_or_raise(hits, list, parameter_name='hits')
+    if _raw:
+        return SearchResult(hits=hits, total=result.get('total', None))
+    # end if
+    result: SearchResult[Topic] = SearchResult(
+        hits=[
+            Topic.from_dict(item)
+            for item in hits
+        ],
+        total=result.get('total', None),
+    )
     return result
-# end def forum_topics
+# end def forum_topics_with_total
 
 
 def forum_topic(
     short_name: str,
     topic_slug: str,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
-) -> Topic:
+    _raw: bool = False,
+) -> Union[Topic, Dict]:
     """
     Fetches a **topic response** for the abbreviated forum name given by the `short_name` and topic given by `topic_slug` URL parameters.
 
@@ -1288,15 +2135,44 @@ def forum_topic(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  Topic
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  Topic|Dict
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/forums/{short_name}/topics/{topic_slug}')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    _params: Union[Dict, None] = None
+    _headers: Union[Dict[str, str], None] = None
+    cache: Union[ModelCache, None] = None if _raw else DerpiClient.get_cache(_client)  # it holds models, not json.
+    if cache is not None:
+        cache_key = cache.make_key(route='forum_topic', url=_url, params=_params)
+        cached: Union[Topic, None] = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        _headers = cache.revalidation_headers(cache_key)  # if we have an expired result, only ask if it changed.
+    # end if
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params=_params, headers=_headers)
+    if response.status_code == NOT_MODIFIED:
+        cached: Union[Topic, None] = cache.revalidated(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        # it got evicted in the meantime, so we need the full response after all.
+        response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params=_params)
+    # end if
+    result: Dict[str, Dict] = loads(response.content)
     result: Dict = result['topic']
     assert_type_or_raise(result, dict, parameter_name='result')
+    if _raw:
+        return result
+    # end if
     result: Topic = Topic.from_dict(result)
+    if cache is not None:
+        cache.set(cache_key, result, revalidation_headers=revalidation_headers_for(*validators_of(response)))
+    # end if
     return result
 # end def forum_topic
 
@@ -1306,7 +2182,8 @@ def forum_posts(
     topic_slug: str,
     page: Union[int, None] = None,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
-) -> List[Post]:
+    _raw: bool = False,
+) -> Union[List[Post], List[Dict]]:
     """
     Fetches a list of **post responses** for the abbreviated forum name given by the `short_name` and topic given by `topic_slug` URL parameters.
 
@@ -1348,22 +2225,75 @@ def forum_posts(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  List[Post]
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  List[Post]|List[Dict]
+    """
+    result: SearchResult[Post] = forum_posts_with_total(
+        short_name=short_name,
+        topic_slug=topic_slug,
+        page=page,
+        _client=_client,
+        _raw=_raw,
+    )
+    return result.hits
+# end def forum_posts
+
+
+def forum_posts_with_total(
+    short_name: str,
+    topic_slug: str,
+    page: Union[int, None] = None,
+    _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
+    _raw: bool = False,
+) -> Union[SearchResult[Post], SearchResult[Dict]]:
+    """
+    Same as `forum_posts(...)`, but additionally returns the `total` amount of results the API reported,
+    e.g. to know the number of pages before requesting them.
+    The `total` is `None` if the API didn't send one.
+    
+    :param short_name: the variable short_name part of the url.
+    :type  short_name: str
+    
+    :param topic_slug: the variable topic_slug part of the url.
+    :type  topic_slug: str
+    
+    :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+    :type  page: int|None
+    
+    :param _client: If you wanna to provide your custom `DerpiClient`, or just an already opened `requests.Session`/`httpx.Client`.
+                    See `forum_posts(...)` for examples.
+    :type  _client: requests.Session|httpx.Client|DerpiClient|None
+
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+    :rtype:  SearchResult[Post]|SearchResult[Dict]
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/forums/{short_name}/topics/{topic_slug}/posts')
     response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params={
         'page': page,
     })
-    result: Dict[str, List[Dict]] = response.json()
-    result: List[Dict] = result['posts']
-    assert_type_or_raise(result, list, parameter_name='result')
-    result: List[Post] = [
-        Post.from_dict(item)
-        for item in result
-    ]
+    result: Dict[str, Union[List[Dict], int]] = loads(response.content)
+    hits: List[Dict] = result['posts']
+    assert_type_or_raise(hits, list, parameter_name='hits')
+    if _raw:
+        return SearchResult(hits=hits, total=result.get('total', None))
+    # end if
+    result: SearchResult[Post] = SearchResult(
+        hits=[
+            Post.from_dict(item)
+            for item in hits
+        ],
+        total=result.get('total', None),
+    )
     return result
-# end def forum_posts
+# end def forum_posts_with_total
 
 
 def forum_post(
@@ -1371,7 +2301,8 @@ def forum_post(
     topic_slug: str,
     post_id: int,
     _client: Union[None, 'DerpiClient', (internet.Session if is_requests else internet.Client)] = None,
-) -> Post:
+    _raw: bool = False,
+) -> Union[Post, Dict]:
     """
     Fetches a **post response** for the abbreviated forum name given by the `short_name`, topic given by `topic_slug` and post given by `post_id` URL parameters.
 
@@ -1413,15 +2344,44 @@ def forum_post(
 
     :type  _client: requests.Session|httpx.Client|DerpiClient|None
     
-    :return: The parsed result from the API.
-    :rtype:  Post
+    :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                 Skips all the parsing, if you don't need the models.
+    :type  _raw: bool
+
+    :return: The parsed result from the API, or the plain json with `_raw`.
+    :rtype:  Post|Dict
     """
     _url = DerpiClient.get_url(client=_client, path=f'/api/v1/json/forums/{short_name}/topics/{topic_slug}/posts/{post_id}')
-    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client)
-    result: Dict[str, Dict] = response.json()
+    _params: Union[Dict, None] = None
+    _headers: Union[Dict[str, str], None] = None
+    cache: Union[ModelCache, None] = None if _raw else DerpiClient.get_cache(_client)  # it holds models, not json.
+    if cache is not None:
+        cache_key = cache.make_key(route='forum_post', url=_url, params=_params)
+        cached: Union[Post, None] = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        _headers = cache.revalidation_headers(cache_key)  # if we have an expired result, only ask if it changed.
+    # end if
+    response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params=_params, headers=_headers)
+    if response.status_code == NOT_MODIFIED:
+        cached: Union[Post, None] = cache.revalidated(cache_key)
+        if cached is not None:
+            return cached
+        # end if
+        # it got evicted in the meantime, so we need the full response after all.
+        response: internet.Response = DerpiClient.static_request('GET', url=_url, client=_client, params=_params)
+    # end if
+    result: Dict[str, Dict] = loads(response.content)
     result: Dict = result['post']
     assert_type_or_raise(result, dict, parameter_name='result')
+    if _raw:
+        return result
+    # end if
     result: Post = Post.from_dict(result)
+    if cache is not None:
+        cache.set(cache_key, result, revalidation_headers=revalidation_headers_for(*validators_of(response)))
+    # end if
     return result
 # end def forum_post
 
@@ -1432,9 +2392,48 @@ class DerpiClient(object):
     """
     DEFAULT_BASE_URL = 'https://derpibooru.org'  # default base url.
 
-    def __init__(self, key, client: Union[None, CLIENT_TYPE] = None, base_url = None):
+    # Shared http client for all requests not bringing their own.
+    # Use `DerpiClient.pool.configure(max_connections=..., keepalive_expiry=...)` to tune it,
+    # it is closed automatically on exit, or explicitly with `DerpiClient.pool.close()`.
+    pool = register(ConnectionPool(factory=_new_http_client))
+
+    # Limits the requests per second, per base url. Set it here to limit all requests,
+    # or give it to the constructor to only limit the requests of that DerpiClient instance.
+    rate_limiter: Union[RateLimiter, None] = None
+
+    # Decides which failed requests are sent again. Set it here for all requests,
+    # or give it to the constructor for the requests of that DerpiClient instance. `None` disables retrying.
+    retry_policy: Union[RetryPolicy, None] = RetryPolicy()
+
+    # Caches the parsed results of lookups by id, like `image(...)` or `tag(...)`. Set it here for all requests,
+    # or give it to the constructor for the requests of that DerpiClient instance. `None` disables caching.
+    cache: Union[ModelCache, None] = None
+
+    # Stores the raw bodies of `GET` responses on disk, e.g. `SQLiteResponseCache('derpi-cache.sqlite')`,
+    # so restarted jobs don't download everything again. Set it here for all requests,
+    # or give it to the constructor for the requests of that DerpiClient instance. `None` disables it.
+    response_cache: Union[SQLiteResponseCache, None] = None
+
+    # Lets identical `GET` requests running at the same time (in different threads) share one request to the server.
+    # Set it here for all requests, or give it to the constructor for the requests of that DerpiClient instance.
+    # `None` disables it.
+    single_flight: Union[SingleFlight, None] = SingleFlight()
+
+    def __init__(
+        self, key, client: Union[None, CLIENT_TYPE] = None, base_url = None,
+        rate_limiter: Union[RateLimiter, None] = None,
+        retry_policy: Union[RetryPolicy, None] = None,
+        cache: Union[ModelCache, None] = None,
+        response_cache: Union[SQLiteResponseCache, None] = None,
+        single_flight: Union[SingleFlight, None] = None,
+    ):
         """
         :param key: API key
+        :param rate_limiter: Optional `RateLimiter` for the requests of this client, instead of `DerpiClient.rate_limiter`.
+        :param retry_policy: Optional `RetryPolicy` for the requests of this client, instead of `DerpiClient.retry_policy`.
+        :param cache: Optional `ModelCache` for the results of this client, instead of `DerpiClient.cache`.
+        :param response_cache: Optional `SQLiteResponseCache` for the responses of this client, instead of `DerpiClient.response_cache`.
+        :param single_flight: Optional `SingleFlight` for the requests of this client, instead of `DerpiClient.single_flight`.
         """
         if base_url is None:
             base_url = self.DEFAULT_BASE_URL
@@ -1442,6 +2441,21 @@ class DerpiClient(object):
         self._key = key
         self._client = client
         self._base_url = base_url
+        if rate_limiter is not None:
+            self.rate_limiter = rate_limiter
+        # end if
+        if retry_policy is not None:
+            self.retry_policy = retry_policy
+        # end if
+        if cache is not None:
+            self.cache = cache
+        # end if
+        if response_cache is not None:
+            self.response_cache = response_cache
+        # end if
+        if single_flight is not None:
+            self.single_flight = single_flight
+        # end if
     # end def
 
     @classmethod
@@ -1453,38 +2467,157 @@ class DerpiClient(object):
         # end if
     # end if
 
+    @classmethod
+    def get_cache(cls, client: Union['DerpiClient', Any]) -> Union[ModelCache, None]:
+        if isinstance(client, DerpiClient):
+            return client.cache
+        else:
+            return cls.cache
+        # end if
+    # end def
+
     @classmethod
     def static_request(
         cls: Type['DerpiClient'],
         method: str,
         url: str,
         params: Union[Dict, None] = None,
-        client: Union[None, CLIENT_TYPE, 'DerpiClient'] = None
+        client: Union[None, CLIENT_TYPE, 'DerpiClient'] = None,
+        headers: Union[Dict[str, str], None] = None,
+    ) -> internet.Response:
+        """
+        Sends a request, handling rate limiting, retries, the response cache
+        and sharing the response with identical `GET` requests already running.
+
+        :param method: The http method, e.g. `'GET'`.
+        :param url: The full url.
+        :param params: The query parameters.
+        :param client: A `DerpiClient`, or a http client. `None` to use the shared `DerpiClient.pool`.
+        :param headers: Additional headers. If they make it a conditional request, a `304` response is returned as well.
+
+        :raises DerpiException: If the request still failed after all retries.
+        """
+        single_flight: Union[SingleFlight, None] = client.single_flight if isinstance(client, DerpiClient) else cls.single_flight
+        if single_flight is None or method.upper() != 'GET':
+            return cls._send_request(method=method, url=url, params=params, client=client, headers=headers)
+        # end if
+        return single_flight.do(
+            key=single_flight.make_key(method=method, url=url, params=params, headers=headers),
+            function=lambda: cls._send_request(method=method, url=url, params=params, client=client, headers=headers),
+        )
+    # end def
+
+    @classmethod
+    def _send_request(
+        cls: Type['DerpiClient'],
+        method: str,
+        url: str,
+        params: Union[Dict, None] = None,
+        client: Union[None, CLIENT_TYPE, 'DerpiClient'] = None,
+        headers: Union[Dict[str, str], None] = None,
     ) -> internet.Response:
+        """
+        Actually sends a request for `static_request(...)`, without the coalescing of identical ones.
+        """
+        rate_limiter: Union[RateLimiter, None] = cls.rate_limiter
+        retry_policy: Union[RetryPolicy, None] = cls.retry_policy
+        response_cache: Union[SQLiteResponseCache, None] = cls.response_cache
+        base_url: str = cls.DEFAULT_BASE_URL
         if isinstance(client, DerpiClient):
+            rate_limiter = client.rate_limiter
+            retry_policy = client.retry_policy
+            response_cache = client.response_cache
+            base_url = client._base_url
             client: CLIENT_TYPE = client._client
         # end if
-        if client is None:  # if we have no client, call ourself recursively with a with statement.
-            with internet.Session() if is_requests else internet.Client() as client:
-                return cls.static_request(method=method, url=url, params=params, client=client)
-            # end with
+        if client is None:  # if we have no client, use the shared one, so we can reuse the open connections.
+            client = cls.pool.get()
+        # end if
+        revalidating = False  # if we added conditional headers for an expired body of the response cache
+        if response_cache is not None and method.upper() == 'GET':
+            response_cache_key = response_cache.make_key(method=method, url=url, params=params)
+            body: Union[bytes, None] = response_cache.get(response_cache_key)
+            if body is not None:
+                return CachedResponse(url=url, content=body)
+            # end if
+            if not is_conditional(headers):
+                revalidation_headers = response_cache.revalidation_headers(response_cache_key)
+                if revalidation_headers:
+                    headers = {**(headers or {}), **revalidation_headers}
+                    revalidating = True
+                # end if
+            # end if
+        else:
+            response_cache = None
         # end if
-        response: internet.Response = client.request(method=method, url=url, params=params)
-        cls._check_response(response)
-        return response
+        attempt = 0
+        while True:
+            attempt += 1
+            if rate_limiter is not None:
+                rate_limiter.acquire(base_url)
+            # end if
+            try:
+                try:
+                    response: internet.Response = client.request(method=method, url=url, params=params, headers=headers)
+                except CONNECTION_ERRORS as e:
+                    raise DerpiConnectionError(f'{method} request to {url!r} failed: {e!r}') from e
+                # end try
+                cls._check_response(response, allow_not_modified=is_conditional(headers))
+                if response.status_code == NOT_MODIFIED:
+                    if not revalidating:
+                        return response  # the caller asked for it
+                    # end if
+                    body: Union[bytes, None] = response_cache.revalidated(response_cache_key)
+                    if body is not None:
+                        return CachedResponse(url=url, content=body)
+                    # end if
+                    # it got evicted in the meantime, so we need the full response after all.
+                    headers = {name: value for name, value in headers.items() if name not in revalidation_headers}
+                    revalidating = False
+                    attempt -= 1  # nothing failed, so this doesn't count against the retry budget.
+                    continue
+                # end if
+                if response_cache is not None:
+                    etag, last_modified = validators_of(response)
+                    response_cache.set(response_cache_key, url=url, body=response.content, etag=etag, last_modified=last_modified)
+                # end if
+                return response
+            except DerpiException as e:
+                if retry_policy is None or not retry_policy.should_retry(method=method, attempt=attempt, error=e):
+                    raise
+                # end if
+                delay = retry_policy.delay(attempt=attempt, error=e)
+                logger.warning(f'Attempt {attempt} of {method} request to {url!r} failed, retrying in {delay:.2f}s: {e}')
+                time.sleep(delay)
+            # end try
+        # end while
     # end def
 
     @staticmethod
-    def _check_response(response: internet.Response) -> None:
+    def _check_response(response: internet.Response, allow_not_modified: bool = False) -> None:
         """
         Makes sure a server response looks valid,
         or raise the appropriate errors if not.
 
         :param response: A requests/httpx response.
         :type  response: requests.Response|httpx.Response
+
+        :param allow_not_modified: If a `304` response is fine as well, because we sent a conditional request.
+        :type  allow_not_modified: bool
+
+        :raises DerpiHttpError: If the status code isn't `200`. Subclasses tell the different kinds of status codes apart.
+        :raises DerpiUnexpectedResponseError: If the response isn't json.
         """
-        assert response.status_code == 200  # TODO
-        assert response.headers['content-type'] == 'application/json; charset=utf-8'
+        if allow_not_modified and response.status_code == NOT_MODIFIED:
+            return
+        # end if
+        if response.status_code != 200:
+            raise http_error_for(response)
+        # end if
+        content_type = response.headers.get('content-type', '')
+        if not content_type.startswith('application/json'):
+            raise DerpiUnexpectedResponseError(f'Expected a json response, but got {content_type!r}.', response=response)
+        # end if
     # end def
     
     # noinspection PyMethodMayBeStatic
@@ -1492,7 +2625,8 @@ class DerpiClient(object):
         self, 
         comment_id: int,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
-    ) -> Comment:
+        _raw: bool = False,
+    ) -> Union[Comment, Dict]:
         """
         Fetches a **comment response** for the comment ID referenced by the `comment_id` URL parameter.
 
@@ -1524,12 +2658,17 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
-        :return: The parsed result from the API.
-        :rtype:  Comment
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  Comment|Dict
         """
         return comment(
             comment_id=comment_id,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def comment
     
@@ -1539,7 +2678,8 @@ class DerpiClient(object):
         image_id: int,
         filter_id: Union[int, None] = None,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
-    ) -> Image:
+        _raw: bool = False,
+    ) -> Union[Image, Dict]:
         """
         Fetches an **image response** for the image ID referenced by the `image_id` URL parameter.
 
@@ -1579,14 +2719,19 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
-        :return: The parsed result from the API.
-        :rtype:  Image
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  Image|Dict
         """
         return image(
             image_id=image_id,
             filter_id=filter_id,
             key=self._key,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def image
     
@@ -1595,7 +2740,8 @@ class DerpiClient(object):
         self, 
         url: str,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
-    ) -> Image:
+        _raw: bool = False,
+    ) -> Union[Image, Dict]:
         """
         Submits a new image. Both `key` and `url` are required. Errors will result in an `{"errors":image-errors-response}`.
 
@@ -1632,13 +2778,18 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
-        :return: The parsed result from the API.
-        :rtype:  Image
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  Image|Dict
         """
         return image_upload(
             url=url,
             key=self._key,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def image_upload
     
@@ -1646,7 +2797,8 @@ class DerpiClient(object):
     def featured_image(
         self, 
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
-    ) -> Image:
+        _raw: bool = False,
+    ) -> Union[Image, Dict]:
         """
         Fetches an **image response** for the for the current featured image.
 
@@ -1675,11 +2827,16 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
-        :return: The parsed result from the API.
-        :rtype:  Image
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  Image|Dict
         """
         return featured_image(
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def featured_image
     
@@ -1688,7 +2845,8 @@ class DerpiClient(object):
         self, 
         tag_id: str,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
-    ) -> Tag:
+        _raw: bool = False,
+    ) -> Union[Tag, Dict]:
         """
         Fetches a **tag response** for the **tag slug** given by the `tag_id` URL parameter. The tag's ID is **not** used. For getting a tag by ID the search endpoint can be used like `search/tags?q=id:4458`.
 
@@ -1720,12 +2878,17 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
-        :return: The parsed result from the API.
-        :rtype:  Tag
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  Tag|Dict
         """
         return tag(
             tag_id=tag_id,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def tag
     
@@ -1734,7 +2897,8 @@ class DerpiClient(object):
         self, 
         post_id: int,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
-    ) -> Post:
+        _raw: bool = False,
+    ) -> Union[Post, Dict]:
         """
         Fetches a **post response** for the post ID given by the `post_id` URL parameter.
 
@@ -1766,12 +2930,17 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
-        :return: The parsed result from the API.
-        :rtype:  Post
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  Post|Dict
         """
         return post(
             post_id=post_id,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def post
     
@@ -1780,7 +2949,8 @@ class DerpiClient(object):
         self, 
         user_id: int,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
-    ) -> User:
+        _raw: bool = False,
+    ) -> Union[User, Dict]:
         """
         Fetches a **profile response** for the user ID given by the `user_id` URL parameter.
 
@@ -1812,12 +2982,17 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
-        :return: The parsed result from the API.
-        :rtype:  User
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  User|Dict
         """
         return user(
             user_id=user_id,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def user
     
@@ -1826,7 +3001,8 @@ class DerpiClient(object):
         self, 
         filter_id: int,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
-    ) -> Filter:
+        _raw: bool = False,
+    ) -> Union[Filter, Dict]:
         """
         Fetches a **filter response** for the filter ID given by the `filter_id` URL parameter.
 
@@ -1863,13 +3039,18 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
-        :return: The parsed result from the API.
-        :rtype:  Filter
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  Filter|Dict
         """
         return filter(
             filter_id=filter_id,
             key=self._key,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def filter
     
@@ -1878,7 +3059,8 @@ class DerpiClient(object):
         self, 
         page: Union[int, None] = None,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
-    ) -> List[Filter]:
+        _raw: bool = False,
+    ) -> Union[List[Filter], List[Dict]]:
         """
         Fetches a list of **filter responses** that are flagged as being **system** filters (and thus usable by anyone).
 
@@ -1910,21 +3092,106 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
-        :return: The parsed result from the API.
-        :rtype:  List[Filter]
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  List[Filter]|List[Dict]
         """
         return system_filters(
             page=page,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def system_filters
     
+    # noinspection PyMethodMayBeStatic
+    def system_filters_with_total(
+        self, 
+        page: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: bool = False,
+    ) -> Union[SearchResult[Filter], SearchResult[Dict]]:
+        """
+        Same as `system_filters(...)`, but additionally returns the `total` amount of results the API reported,
+        e.g. to know the number of pages before requesting them.
+        The `total` is `None` if the API didn't send one.
+        
+        :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+        :type  page: int|None
+        
+        :param _client: If you wanna to provide your custom, already opened requests.Session/httpx.Client.
+                        See `system_filters(...)` for examples.
+        :type  _client: requests.Session|httpx.Client|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+        :rtype:  SearchResult[Filter]|SearchResult[Dict]
+        """
+        return system_filters_with_total(
+            page=page,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def system_filters_with_total
+
+    # noinspection PyMethodMayBeStatic
+    def iter_system_filters(
+        self, 
+        start_page: int = 1,
+        max_items: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: bool = False,
+    ) -> Iterator[Union[Filter, Dict]]:
+        """
+        Iterates over all the results of `system_filters(...)`, requesting one page after another as needed.
+        While the items of one page are consumed, the next page is already requested in the background.
+        Stops once the `total` amount of results is reached, or after the first page which isn't full.
+
+        Usage:
+        >>> for item in client.iter_system_filters(...):
+        ...     pass
+        
+        :param start_page: The first page to request. The first page is `1`.
+        :type  start_page: int
+
+        :param max_items: Stop after that many items. `None` to continue until the last page.
+        :type  max_items: int|None
+
+        :param _client: If you wanna to provide your custom, already opened requests.Session/httpx.Client.
+                        See `system_filters(...)` for examples.
+        :type  _client: requests.Session|httpx.Client|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed items of all the pages, or their plain json with `_raw`.
+        :rtype:  Iterator[Filter|Dict]
+        """
+        return iterate_pages(
+            lambda page: self.system_filters_with_total(
+                page=page,
+                _client=_client,
+                _raw=_raw,
+            ),
+            per_page=None,
+            start_page=start_page,
+            max_items=max_items,
+        )
+    # end def iter_system_filters
+    
     # noinspection PyMethodMayBeStatic
     def user_filters(
         self, 
         page: Union[int, None] = None,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
-    ) -> List[Filter]:
+        _raw: bool = False,
+    ) -> Union[List[Filter], List[Dict]]:
         """
         Fetches a list of **filter responses** that belong to the user given by **key**. If no **key** is given or it is invalid, will return a **403 Forbidden** error.
 
@@ -1961,22 +3228,118 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
-        :return: The parsed result from the API.
-        :rtype:  List[Filter]
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  List[Filter]|List[Dict]
         """
         return user_filters(
             key=self._key,
             page=page,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def user_filters
     
+    # noinspection PyMethodMayBeStatic
+    def user_filters_with_total(
+        self, 
+        page: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: bool = False,
+    ) -> Union[SearchResult[Filter], SearchResult[Dict]]:
+        """
+        Same as `user_filters(...)`, but additionally returns the `total` amount of results the API reported,
+        e.g. to know the number of pages before requesting them.
+        The `total` is `None` if the API didn't send one.
+        
+        :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+        :type  key: str
+        
+        :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+        :type  page: int|None
+        
+        :param _client: If you wanna to provide your custom, already opened requests.Session/httpx.Client.
+                        See `user_filters(...)` for examples.
+        :type  _client: requests.Session|httpx.Client|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+        :rtype:  SearchResult[Filter]|SearchResult[Dict]
+        """
+        return user_filters_with_total(
+            key=self._key,
+            page=page,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def user_filters_with_total
+
+    # noinspection PyMethodMayBeStatic
+    def iter_user_filters(
+        self, 
+        start_page: int = 1,
+        max_items: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: bool = False,
+    ) -> Iterator[Union[Filter, Dict]]:
+        """
+        Iterates over all the results of `user_filters(...)`, requesting one page after another as needed.
+        While the items of one page are consumed, the next page is already requested in the background.
+        Stops once the `total` amount of results is reached, or after the first page which isn't full.
+
+        Usage:
+        >>> for item in client.iter_user_filters(...):
+        ...     pass
+        
+        :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+        :type  key: str
+        
+        :param start_page: The first page to request. The first page is `1`.
+        :type  start_page: int
+
+        :param max_items: Stop after that many items. `None` to continue until the last page.
+        :type  max_items: int|None
+
+        :param _client: If you wanna to provide your custom, already opened requests.Session/httpx.Client.
+                        See `user_filters(...)` for examples.
+        :type  _client: requests.Session|httpx.Client|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed items of all the pages, or their plain json with `_raw`.
+        :rtype:  Iterator[Filter|Dict]
+        """
+        return iterate_pages(
+            lambda page: self.user_filters_with_total(
+                page=page,
+                _client=_client,
+                _raw=_raw,
+            ),
+            per_page=None,
+            start_page=start_page,
+            max_items=max_items,
+        )
+    # end def iter_user_filters
+    
     # noinspection PyMethodMayBeStatic
     def oembed(
         self, 
         url: str,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
-    ) -> Oembed:
+        _raw: bool = False,
+    ) -> Union[Oembed, Dict]:
         """
         Fetches an **oEmbed response** for the given app link or CDN URL.
 
@@ -2008,12 +3371,17 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
-        :return: The parsed result from the API.
-        :rtype:  Oembed
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  Oembed|Dict
         """
         return oembed(
             url=url,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def oembed
     
@@ -2023,7 +3391,8 @@ class DerpiClient(object):
         query: str,
         page: Union[int, None] = None,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
-    ) -> List[Comment]:
+        _raw: bool = False,
+    ) -> Union[List[Comment], List[Dict]]:
         """
         Executes the search given by the `q` query parameter (case insensitive and stemming is applied. If you search for **best pony** results like **Best Ponies** are also be returned), and returns **comment responses** sorted by descending creation time.
 
@@ -2063,24 +3432,130 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
-        :return: The parsed result from the API.
-        :rtype:  List[Comment]
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  List[Comment]|List[Dict]
         """
         return search_comments(
             query=query,
             page=page,
             key=self._key,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def search_comments
     
+    # noinspection PyMethodMayBeStatic
+    def search_comments_with_total(
+        self, 
+        query: str,
+        page: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: bool = False,
+    ) -> Union[SearchResult[Comment], SearchResult[Dict]]:
+        """
+        Same as `search_comments(...)`, but additionally returns the `total` amount of results the API reported,
+        e.g. to know the number of pages before requesting them.
+        The `total` is `None` if the API didn't send one.
+        
+        :param query: The current search query, if the request is a search request.
+        :type  query: str
+        
+        :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+        :type  page: int|None
+        
+        :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+        :type  key: str|None
+        
+        :param _client: If you wanna to provide your custom, already opened requests.Session/httpx.Client.
+                        See `search_comments(...)` for examples.
+        :type  _client: requests.Session|httpx.Client|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+        :rtype:  SearchResult[Comment]|SearchResult[Dict]
+        """
+        return search_comments_with_total(
+            query=query,
+            page=page,
+            key=self._key,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def search_comments_with_total
+
+    # noinspection PyMethodMayBeStatic
+    def iter_search_comments(
+        self, 
+        query: str,
+        start_page: int = 1,
+        max_items: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: bool = False,
+    ) -> Iterator[Union[Comment, Dict]]:
+        """
+        Iterates over all the results of `search_comments(...)`, requesting one page after another as needed.
+        While the items of one page are consumed, the next page is already requested in the background.
+        Stops once the `total` amount of results is reached, or after the first page which isn't full.
+
+        Usage:
+        >>> for item in client.iter_search_comments(...):
+        ...     pass
+        
+        :param query: The current search query, if the request is a search request.
+        :type  query: str
+        
+        :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+        :type  key: str|None
+        
+        :param start_page: The first page to request. The first page is `1`.
+        :type  start_page: int
+
+        :param max_items: Stop after that many items. `None` to continue until the last page.
+        :type  max_items: int|None
+
+        :param _client: If you wanna to provide your custom, already opened requests.Session/httpx.Client.
+                        See `search_comments(...)` for examples.
+        :type  _client: requests.Session|httpx.Client|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed items of all the pages, or their plain json with `_raw`.
+        :rtype:  Iterator[Comment|Dict]
+        """
+        return iterate_pages(
+            lambda page: self.search_comments_with_total(
+                query=query,
+                page=page,
+                _client=_client,
+                _raw=_raw,
+            ),
+            per_page=None,
+            start_page=start_page,
+            max_items=max_items,
+        )
+    # end def iter_search_comments
+    
     # noinspection PyMethodMayBeStatic
     def search_galleries(
         self, 
         query: str,
         page: Union[int, None] = None,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
-    ) -> List[Gallery]:
+        _raw: bool = False,
+    ) -> Union[List[Gallery], List[Dict]]:
         """
         Executes the search given by the `q` query parameter, and returns **gallery responses** sorted by descending creation time.
 
@@ -2120,93 +3595,510 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
-        :return: The parsed result from the API.
-        :rtype:  List[Gallery]
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  List[Gallery]|List[Dict]
         """
         return search_galleries(
             query=query,
             page=page,
             key=self._key,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def search_galleries
     
     # noinspection PyMethodMayBeStatic
-    def search_posts(
+    def search_galleries_with_total(
+        self, 
+        query: str,
+        page: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: bool = False,
+    ) -> Union[SearchResult[Gallery], SearchResult[Dict]]:
+        """
+        Same as `search_galleries(...)`, but additionally returns the `total` amount of results the API reported,
+        e.g. to know the number of pages before requesting them.
+        The `total` is `None` if the API didn't send one.
+        
+        :param query: The current search query, if the request is a search request.
+        :type  query: str
+        
+        :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+        :type  page: int|None
+        
+        :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+        :type  key: str|None
+        
+        :param _client: If you wanna to provide your custom, already opened requests.Session/httpx.Client.
+                        See `search_galleries(...)` for examples.
+        :type  _client: requests.Session|httpx.Client|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+        :rtype:  SearchResult[Gallery]|SearchResult[Dict]
+        """
+        return search_galleries_with_total(
+            query=query,
+            page=page,
+            key=self._key,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def search_galleries_with_total
+
+    # noinspection PyMethodMayBeStatic
+    def iter_search_galleries(
+        self, 
+        query: str,
+        start_page: int = 1,
+        max_items: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: bool = False,
+    ) -> Iterator[Union[Gallery, Dict]]:
+        """
+        Iterates over all the results of `search_galleries(...)`, requesting one page after another as needed.
+        While the items of one page are consumed, the next page is already requested in the background.
+        Stops once the `total` amount of results is reached, or after the first page which isn't full.
+
+        Usage:
+        >>> for item in client.iter_search_galleries(...):
+        ...     pass
+        
+        :param query: The current search query, if the request is a search request.
+        :type  query: str
+        
+        :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+        :type  key: str|None
+        
+        :param start_page: The first page to request. The first page is `1`.
+        :type  start_page: int
+
+        :param max_items: Stop after that many items. `None` to continue until the last page.
+        :type  max_items: int|None
+
+        :param _client: If you wanna to provide your custom, already opened requests.Session/httpx.Client.
+                        See `search_galleries(...)` for examples.
+        :type  _client: requests.Session|httpx.Client|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed items of all the pages, or their plain json with `_raw`.
+        :rtype:  Iterator[Gallery|Dict]
+        """
+        return iterate_pages(
+            lambda page: self.search_galleries_with_total(
+                query=query,
+                page=page,
+                _client=_client,
+                _raw=_raw,
+            ),
+            per_page=None,
+            start_page=start_page,
+            max_items=max_items,
+        )
+    # end def iter_search_galleries
+    
+    # noinspection PyMethodMayBeStatic
+    def search_posts(
+        self, 
+        query: str,
+        page: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: bool = False,
+    ) -> Union[List[Post], List[Dict]]:
+        """
+        Executes the search given by the `q` query parameter, and returns **post responses** sorted by descending creation time.
+
+        A request will be sent to the following endpoint: `/api/v1/json/search/posts`
+        It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
+        which would for example look like this: https://derpibooru.org/api/v1/json/search/posts?q=subject:time wasting thread
+
+        The API should return json looking like `{"posts":[Post]}` which will then be parsed to the python result `List[Post]`.
+        
+        :param query: The current search query, if the request is a search request.
+        :type  query: str
+        
+        :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+        :type  page: int|None
+        
+        :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+        :type  key: str|None
+        
+        :param _client: If you wanna to provide your custom, already opened requests.Session/httpx.Client.
+                        For example with requests:
+                        >>> client = requests.Session()
+                        >>> result = search_posts(..., _client=client)
+
+                        If you use httpx instead of requests, this would be with a context manager:
+                        >>> with httpx.Client() as client:
+                        ...     result = search_posts(..., _client=client)
+
+                        Or httpx and manually closing it:
+                        >>> client = httpx.Client()
+                        >>> try:
+                        ...     result = search_posts(..., _client=client)
+                        ... finally:
+                        ...     client.close()
+
+
+        :type  _client: requests.Session|httpx.Client|None
+        
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  List[Post]|List[Dict]
+        """
+        return search_posts(
+            query=query,
+            page=page,
+            key=self._key,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def search_posts
+    
+    # noinspection PyMethodMayBeStatic
+    def search_posts_with_total(
+        self, 
+        query: str,
+        page: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: bool = False,
+    ) -> Union[SearchResult[Post], SearchResult[Dict]]:
+        """
+        Same as `search_posts(...)`, but additionally returns the `total` amount of results the API reported,
+        e.g. to know the number of pages before requesting them.
+        The `total` is `None` if the API didn't send one.
+        
+        :param query: The current search query, if the request is a search request.
+        :type  query: str
+        
+        :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+        :type  page: int|None
+        
+        :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+        :type  key: str|None
+        
+        :param _client: If you wanna to provide your custom, already opened requests.Session/httpx.Client.
+                        See `search_posts(...)` for examples.
+        :type  _client: requests.Session|httpx.Client|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+        :rtype:  SearchResult[Post]|SearchResult[Dict]
+        """
+        return search_posts_with_total(
+            query=query,
+            page=page,
+            key=self._key,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def search_posts_with_total
+
+    # noinspection PyMethodMayBeStatic
+    def iter_search_posts(
+        self, 
+        query: str,
+        start_page: int = 1,
+        max_items: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: bool = False,
+    ) -> Iterator[Union[Post, Dict]]:
+        """
+        Iterates over all the results of `search_posts(...)`, requesting one page after another as needed.
+        While the items of one page are consumed, the next page is already requested in the background.
+        Stops once the `total` amount of results is reached, or after the first page which isn't full.
+
+        Usage:
+        >>> for item in client.iter_search_posts(...):
+        ...     pass
+        
+        :param query: The current search query, if the request is a search request.
+        :type  query: str
+        
+        :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+        :type  key: str|None
+        
+        :param start_page: The first page to request. The first page is `1`.
+        :type  start_page: int
+
+        :param max_items: Stop after that many items. `None` to continue until the last page.
+        :type  max_items: int|None
+
+        :param _client: If you wanna to provide your custom, already opened requests.Session/httpx.Client.
+                        See `search_posts(...)` for examples.
+        :type  _client: requests.Session|httpx.Client|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed items of all the pages, or their plain json with `_raw`.
+        :rtype:  Iterator[Post|Dict]
+        """
+        return iterate_pages(
+            lambda page: self.search_posts_with_total(
+                query=query,
+                page=page,
+                _client=_client,
+                _raw=_raw,
+            ),
+            per_page=None,
+            start_page=start_page,
+            max_items=max_items,
+        )
+    # end def iter_search_posts
+    
+    # noinspection PyMethodMayBeStatic
+    def search_images(
+        self, 
+        query: str,
+        filter_id: Union[int, None] = None,
+        page: Union[int, None] = None,
+        per_page: Union[int, None] = None,
+        sort_direction: Union[str, None] = None,
+        sort_field: Union[str, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: bool = False,
+    ) -> Union[List[Image], List[Dict]]:
+        """
+        Executes the search given by the `q` query parameter, and returns **image responses**.
+
+        A request will be sent to the following endpoint: `/api/v1/json/search/images`
+        It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
+        which would for example look like this: https://derpibooru.org/api/v1/json/search/images?q=safe
+
+        The API should return json looking like `{"images":[Image]}` which will then be parsed to the python result `List[Image]`.
+        
+        :param query: The current search query, if the request is a search request.
+        :type  query: str
+        
+        :param filter_id: Assuming the user can access the filter ID given by the parameter, overrides the current filter for this request. This is primarily useful for unauthenticated API access.
+        :type  filter_id: int|None
+        
+        :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+        :type  page: int|None
+        
+        :param per_page: Controls the number of results per page, up to a limit of 50, if the response is paginated. The default is 25.
+        :type  per_page: int|None
+        
+        :param sort_direction: The current sort direction, if the request is a search request.
+        :type  sort_direction: str|None
+        
+        :param sort_field: The current sort field, if the request is a search request.
+        :type  sort_field: str|None
+        
+        :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+        :type  key: str|None
+        
+        :param _client: If you wanna to provide your custom, already opened requests.Session/httpx.Client.
+                        For example with requests:
+                        >>> client = requests.Session()
+                        >>> result = search_images(..., _client=client)
+
+                        If you use httpx instead of requests, this would be with a context manager:
+                        >>> with httpx.Client() as client:
+                        ...     result = search_images(..., _client=client)
+
+                        Or httpx and manually closing it:
+                        >>> client = httpx.Client()
+                        >>> try:
+                        ...     result = search_images(..., _client=client)
+                        ... finally:
+                        ...     client.close()
+
+
+        :type  _client: requests.Session|httpx.Client|None
+        
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  List[Image]|List[Dict]
+        """
+        return search_images(
+            query=query,
+            filter_id=filter_id,
+            page=page,
+            per_page=per_page,
+            sort_direction=sort_direction,
+            sort_field=sort_field,
+            key=self._key,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def search_images
+    
+    # noinspection PyMethodMayBeStatic
+    def search_images_with_total(
+        self, 
+        query: str,
+        filter_id: Union[int, None] = None,
+        page: Union[int, None] = None,
+        per_page: Union[int, None] = None,
+        sort_direction: Union[str, None] = None,
+        sort_field: Union[str, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: bool = False,
+    ) -> Union[SearchResult[Image], SearchResult[Dict]]:
+        """
+        Same as `search_images(...)`, but additionally returns the `total` amount of results the API reported,
+        e.g. to know the number of pages before requesting them.
+        The `total` is `None` if the API didn't send one.
+        
+        :param query: The current search query, if the request is a search request.
+        :type  query: str
+        
+        :param filter_id: Assuming the user can access the filter ID given by the parameter, overrides the current filter for this request. This is primarily useful for unauthenticated API access.
+        :type  filter_id: int|None
+        
+        :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+        :type  page: int|None
+        
+        :param per_page: Controls the number of results per page, up to a limit of 50, if the response is paginated. The default is 25.
+        :type  per_page: int|None
+        
+        :param sort_direction: The current sort direction, if the request is a search request.
+        :type  sort_direction: str|None
+        
+        :param sort_field: The current sort field, if the request is a search request.
+        :type  sort_field: str|None
+        
+        :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+        :type  key: str|None
+        
+        :param _client: If you wanna to provide your custom, already opened requests.Session/httpx.Client.
+                        See `search_images(...)` for examples.
+        :type  _client: requests.Session|httpx.Client|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+        :rtype:  SearchResult[Image]|SearchResult[Dict]
+        """
+        return search_images_with_total(
+            query=query,
+            filter_id=filter_id,
+            page=page,
+            per_page=per_page,
+            sort_direction=sort_direction,
+            sort_field=sort_field,
+            key=self._key,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def search_images_with_total
+
+    # noinspection PyMethodMayBeStatic
+    def search_images_batch(
         self, 
         query: str,
+        filter_id: Union[int, None] = None,
         page: Union[int, None] = None,
+        per_page: Union[int, None] = None,
+        sort_direction: Union[str, None] = None,
+        sort_field: Union[str, None] = None,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
-    ) -> List[Post]:
+    ) -> 'ImageBatch':
         """
-        Executes the search given by the `q` query parameter, and returns **post responses** sorted by descending creation time.
-
-        A request will be sent to the following endpoint: `/api/v1/json/search/posts`
-        It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
-        which would for example look like this: https://derpibooru.org/api/v1/json/search/posts?q=subject:time wasting thread
-
-        The API should return json looking like `{"posts":[Post]}` which will then be parsed to the python result `List[Post]`.
+        Same as `search_images(...)`, but returns the page as columnar `ImageBatch` of numpy arrays,
+        built directly from the response without creating `Image` models. Needs numpy to be installed.
         
         :param query: The current search query, if the request is a search request.
         :type  query: str
         
+        :param filter_id: Assuming the user can access the filter ID given by the parameter, overrides the current filter for this request. This is primarily useful for unauthenticated API access.
+        :type  filter_id: int|None
+        
         :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
         :type  page: int|None
         
+        :param per_page: Controls the number of results per page, up to a limit of 50, if the response is paginated. The default is 25.
+        :type  per_page: int|None
+        
+        :param sort_direction: The current sort direction, if the request is a search request.
+        :type  sort_direction: str|None
+        
+        :param sort_field: The current sort field, if the request is a search request.
+        :type  sort_field: str|None
+        
         :param key: An optional authentication token. If omitted, no user will be authenticated.
 
                     You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
         :type  key: str|None
         
         :param _client: If you wanna to provide your custom, already opened requests.Session/httpx.Client.
-                        For example with requests:
-                        >>> client = requests.Session()
-                        >>> result = search_posts(..., _client=client)
-
-                        If you use httpx instead of requests, this would be with a context manager:
-                        >>> with httpx.Client() as client:
-                        ...     result = search_posts(..., _client=client)
-
-                        Or httpx and manually closing it:
-                        >>> client = httpx.Client()
-                        >>> try:
-                        ...     result = search_posts(..., _client=client)
-                        ... finally:
-                        ...     client.close()
-
-
+                        See `search_images(...)` for examples.
         :type  _client: requests.Session|httpx.Client|None
-        
-        :return: The parsed result from the API.
-        :rtype:  List[Post]
+
+        :return: The images of that page, and the total amount of results.
+        :rtype:  derpi.batch.ImageBatch
         """
-        return search_posts(
+        return search_images_batch(
             query=query,
+            filter_id=filter_id,
             page=page,
+            per_page=per_page,
+            sort_direction=sort_direction,
+            sort_field=sort_field,
             key=self._key,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
         )
-    # end def search_posts
-    
+    # end def search_images_batch
+
     # noinspection PyMethodMayBeStatic
-    def search_images(
+    def iter_search_images(
         self, 
         query: str,
         filter_id: Union[int, None] = None,
-        page: Union[int, None] = None,
         per_page: Union[int, None] = None,
         sort_direction: Union[str, None] = None,
         sort_field: Union[str, None] = None,
+        start_page: int = 1,
+        max_items: Union[int, None] = None,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
-    ) -> List[Image]:
+        _raw: bool = False,
+    ) -> Iterator[Union[Image, Dict]]:
         """
-        Executes the search given by the `q` query parameter, and returns **image responses**.
-
-        A request will be sent to the following endpoint: `/api/v1/json/search/images`
-        It will take in account `self._base_url` and fill in all url variables and append the data parameters as needed,
-        which would for example look like this: https://derpibooru.org/api/v1/json/search/images?q=safe
+        Iterates over all the results of `search_images(...)`, requesting one page after another as needed.
+        While the items of one page are consumed, the next page is already requested in the background.
+        Stops once the `total` amount of results is reached, or after the first page which isn't full.
 
-        The API should return json looking like `{"images":[Image]}` which will then be parsed to the python result `List[Image]`.
+        Usage:
+        >>> for item in client.iter_search_images(...):
+        ...     pass
         
         :param query: The current search query, if the request is a search request.
         :type  query: str
@@ -2214,9 +4106,6 @@ class DerpiClient(object):
         :param filter_id: Assuming the user can access the filter ID given by the parameter, overrides the current filter for this request. This is primarily useful for unauthenticated API access.
         :type  filter_id: int|None
         
-        :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
-        :type  page: int|None
-        
         :param per_page: Controls the number of results per page, up to a limit of 50, if the response is paginated. The default is 25.
         :type  per_page: int|None
         
@@ -2231,39 +4120,109 @@ class DerpiClient(object):
                     You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
         :type  key: str|None
         
+        :param start_page: The first page to request. The first page is `1`.
+        :type  start_page: int
+
+        :param max_items: Stop after that many items. `None` to continue until the last page.
+        :type  max_items: int|None
+
         :param _client: If you wanna to provide your custom, already opened requests.Session/httpx.Client.
-                        For example with requests:
-                        >>> client = requests.Session()
-                        >>> result = search_images(..., _client=client)
+                        See `search_images(...)` for examples.
+        :type  _client: requests.Session|httpx.Client|None
 
-                        If you use httpx instead of requests, this would be with a context manager:
-                        >>> with httpx.Client() as client:
-                        ...     result = search_images(..., _client=client)
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
 
-                        Or httpx and manually closing it:
-                        >>> client = httpx.Client()
-                        >>> try:
-                        ...     result = search_images(..., _client=client)
-                        ... finally:
-                        ...     client.close()
+        :return: The parsed items of all the pages, or their plain json with `_raw`.
+        :rtype:  Iterator[Image|Dict]
+        """
+        return iterate_pages(
+            lambda page: self.search_images_with_total(
+                query=query,
+                filter_id=filter_id,
+                page=page,
+                per_page=per_page,
+                sort_direction=sort_direction,
+                sort_field=sort_field,
+                _client=_client,
+                _raw=_raw,
+            ),
+            per_page=per_page,
+            start_page=start_page,
+            max_items=max_items,
+        )
+    # end def iter_search_images
+
+    # noinspection PyMethodMayBeStatic
+    def iter_search_images_by_id(
+        self, 
+        query: str,
+        filter_id: Union[int, None] = None,
+        per_page: Union[int, None] = None,
+        before_id: Union[int, None] = None,
+        max_items: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: bool = False,
+    ) -> Iterator[Union[Image, Dict]]:
+        """
+        Iterates over all the results of `search_images(...)`, newest first, by sorting by `id`
+        and narrowing the query to `id.lt:<last id>` on each step instead of requesting page numbers.
+        Every request costs the same regardless how deep it is, and results which are added or removed meanwhile
+        don't shift the later pages, so no result is skipped or repeated.
+
+        Usage:
+        >>> for item in client.iter_search_images_by_id(...):
+        ...     pass
+        
+        :param query: The current search query, if the request is a search request.
+        :type  query: str
+        
+        :param filter_id: Assuming the user can access the filter ID given by the parameter, overrides the current filter for this request. This is primarily useful for unauthenticated API access.
+        :type  filter_id: int|None
+        
+        :param per_page: Controls the number of results per page, up to a limit of 50, if the response is paginated. The default is 25.
+        :type  per_page: int|None
+        
+        :param key: An optional authentication token. If omitted, no user will be authenticated.
+
+                    You can find your authentication token in your [account settings](https://derpibooru.org/registration/edit).
+        :type  key: str|None
+        
+        :param before_id: Only results with an id lower than that, e.g. to continue after the last one seen.
+                          `None` to start with the newest one.
+        :type  before_id: int|None
 
+        :param max_items: Stop after that many items. `None` to continue until the last one.
+        :type  max_items: int|None
 
+        :param _client: If you wanna to provide your custom, already opened requests.Session/httpx.Client.
+                        See `search_images(...)` for examples.
         :type  _client: requests.Session|httpx.Client|None
-        
-        :return: The parsed result from the API.
-        :rtype:  List[Image]
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed items, or their plain json with `_raw`.
+        :rtype:  Iterator[Image|Dict]
         """
-        return search_images(
-            query=query,
-            filter_id=filter_id,
-            page=page,
+        return iterate_by_id(
+            lambda last_id: self.search_images_with_total(
+                query=query_before_id(query, last_id),
+                filter_id=filter_id,
+                page=1,
+                per_page=per_page,
+                sort_direction='desc',
+                sort_field='id',
+                _client=_client,
+                _raw=_raw,
+            ),
             per_page=per_page,
-            sort_direction=sort_direction,
-            sort_field=sort_field,
-            key=self._key,
-            _client=_client if _client else self._client,
+            before_id=before_id,
+            max_items=max_items,
         )
-    # end def search_images
+    # end def iter_search_images_by_id
     
     # noinspection PyMethodMayBeStatic
     def search_tags(
@@ -2271,7 +4230,8 @@ class DerpiClient(object):
         query: str,
         page: Union[int, None] = None,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
-    ) -> List[Tag]:
+        _raw: bool = False,
+    ) -> Union[List[Tag], List[Dict]]:
         """
         Executes the search given by the `q` query parameter, and returns **tag responses** sorted by descending image count.
 
@@ -2306,23 +4266,118 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
-        :return: The parsed result from the API.
-        :rtype:  List[Tag]
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  List[Tag]|List[Dict]
         """
         return search_tags(
             query=query,
             page=page,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def search_tags
     
+    # noinspection PyMethodMayBeStatic
+    def search_tags_with_total(
+        self, 
+        query: str,
+        page: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: bool = False,
+    ) -> Union[SearchResult[Tag], SearchResult[Dict]]:
+        """
+        Same as `search_tags(...)`, but additionally returns the `total` amount of results the API reported,
+        e.g. to know the number of pages before requesting them.
+        The `total` is `None` if the API didn't send one.
+        
+        :param query: The current search query, if the request is a search request.
+        :type  query: str
+        
+        :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+        :type  page: int|None
+        
+        :param _client: If you wanna to provide your custom, already opened requests.Session/httpx.Client.
+                        See `search_tags(...)` for examples.
+        :type  _client: requests.Session|httpx.Client|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+        :rtype:  SearchResult[Tag]|SearchResult[Dict]
+        """
+        return search_tags_with_total(
+            query=query,
+            page=page,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def search_tags_with_total
+
+    # noinspection PyMethodMayBeStatic
+    def iter_search_tags(
+        self, 
+        query: str,
+        start_page: int = 1,
+        max_items: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: bool = False,
+    ) -> Iterator[Union[Tag, Dict]]:
+        """
+        Iterates over all the results of `search_tags(...)`, requesting one page after another as needed.
+        While the items of one page are consumed, the next page is already requested in the background.
+        Stops once the `total` amount of results is reached, or after the first page which isn't full.
+
+        Usage:
+        >>> for item in client.iter_search_tags(...):
+        ...     pass
+        
+        :param query: The current search query, if the request is a search request.
+        :type  query: str
+        
+        :param start_page: The first page to request. The first page is `1`.
+        :type  start_page: int
+
+        :param max_items: Stop after that many items. `None` to continue until the last page.
+        :type  max_items: int|None
+
+        :param _client: If you wanna to provide your custom, already opened requests.Session/httpx.Client.
+                        See `search_tags(...)` for examples.
+        :type  _client: requests.Session|httpx.Client|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed items of all the pages, or their plain json with `_raw`.
+        :rtype:  Iterator[Tag|Dict]
+        """
+        return iterate_pages(
+            lambda page: self.search_tags_with_total(
+                query=query,
+                page=page,
+                _client=_client,
+                _raw=_raw,
+            ),
+            per_page=None,
+            start_page=start_page,
+            max_items=max_items,
+        )
+    # end def iter_search_tags
+    
     # noinspection PyMethodMayBeStatic
     def search_reverse(
         self, 
         url: str,
         distance: Union[float, None] = None,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
-    ) -> List[Image]:
+        _raw: bool = False,
+    ) -> Union[List[Image], List[Dict]]:
         """
         Returns **image responses** based on the results of reverse-searching the image given by the `url` query parameter.
 
@@ -2362,14 +4417,19 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
-        :return: The parsed result from the API.
-        :rtype:  List[Image]
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  List[Image]|List[Dict]
         """
         return search_reverse(
             url=url,
             distance=distance,
             key=self._key,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def search_reverse
     
@@ -2377,7 +4437,8 @@ class DerpiClient(object):
     def forums(
         self, 
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
-    ) -> List[Forum]:
+        _raw: bool = False,
+    ) -> Union[List[Forum], List[Dict]]:
         """
         Fetches a list of **forum responses**.
 
@@ -2406,11 +4467,16 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
-        :return: The parsed result from the API.
-        :rtype:  List[Forum]
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  List[Forum]|List[Dict]
         """
         return forums(
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def forums
     
@@ -2419,7 +4485,8 @@ class DerpiClient(object):
         self, 
         short_name: str,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
-    ) -> Forum:
+        _raw: bool = False,
+    ) -> Union[Forum, Dict]:
         """
         Fetches a **forum response** for the abbreviated name given by the `short_name` URL parameter.
 
@@ -2451,12 +4518,17 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
-        :return: The parsed result from the API.
-        :rtype:  Forum
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  Forum|Dict
         """
         return forum(
             short_name=short_name,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def forum
     
@@ -2466,7 +4538,8 @@ class DerpiClient(object):
         short_name: str,
         page: Union[int, None] = None,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
-    ) -> List[Topic]:
+        _raw: bool = False,
+    ) -> Union[List[Topic], List[Dict]]:
         """
         Fetches a list of **topic responses** for the abbreviated forum name given by the `short_name` URL parameter.
 
@@ -2501,23 +4574,118 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
-        :return: The parsed result from the API.
-        :rtype:  List[Topic]
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  List[Topic]|List[Dict]
         """
         return forum_topics(
             short_name=short_name,
             page=page,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def forum_topics
     
+    # noinspection PyMethodMayBeStatic
+    def forum_topics_with_total(
+        self, 
+        short_name: str,
+        page: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: bool = False,
+    ) -> Union[SearchResult[Topic], SearchResult[Dict]]:
+        """
+        Same as `forum_topics(...)`, but additionally returns the `total` amount of results the API reported,
+        e.g. to know the number of pages before requesting them.
+        The `total` is `None` if the API didn't send one.
+        
+        :param short_name: the variable short_name part of the url.
+        :type  short_name: str
+        
+        :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+        :type  page: int|None
+        
+        :param _client: If you wanna to provide your custom, already opened requests.Session/httpx.Client.
+                        See `forum_topics(...)` for examples.
+        :type  _client: requests.Session|httpx.Client|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+        :rtype:  SearchResult[Topic]|SearchResult[Dict]
+        """
+        return forum_topics_with_total(
+            short_name=short_name,
+            page=page,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def forum_topics_with_total
+
+    # noinspection PyMethodMayBeStatic
+    def iter_forum_topics(
+        self, 
+        short_name: str,
+        start_page: int = 1,
+        max_items: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: bool = False,
+    ) -> Iterator[Union[Topic, Dict]]:
+        """
+        Iterates over all the results of `forum_topics(...)`, requesting one page after another as needed.
+        While the items of one page are consumed, the next page is already requested in the background.
+        Stops once the `total` amount of results is reached, or after the first page which isn't full.
+
+        Usage:
+        >>> for item in client.iter_forum_topics(...):
+        ...     pass
+        
+        :param short_name: the variable short_name part of the url.
+        :type  short_name: str
+        
+        :param start_page: The first page to request. The first page is `1`.
+        :type  start_page: int
+
+        :param max_items: Stop after that many items. `None` to continue until the last page.
+        :type  max_items: int|None
+
+        :param _client: If you wanna to provide your custom, already opened requests.Session/httpx.Client.
+                        See `forum_topics(...)` for examples.
+        :type  _client: requests.Session|httpx.Client|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed items of all the pages, or their plain json with `_raw`.
+        :rtype:  Iterator[Topic|Dict]
+        """
+        return iterate_pages(
+            lambda page: self.forum_topics_with_total(
+                short_name=short_name,
+                page=page,
+                _client=_client,
+                _raw=_raw,
+            ),
+            per_page=None,
+            start_page=start_page,
+            max_items=max_items,
+        )
+    # end def iter_forum_topics
+    
     # noinspection PyMethodMayBeStatic
     def forum_topic(
         self, 
         short_name: str,
         topic_slug: str,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
-    ) -> Topic:
+        _raw: bool = False,
+    ) -> Union[Topic, Dict]:
         """
         Fetches a **topic response** for the abbreviated forum name given by the `short_name` and topic given by `topic_slug` URL parameters.
 
@@ -2552,13 +4720,18 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
-        :return: The parsed result from the API.
-        :rtype:  Topic
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  Topic|Dict
         """
         return forum_topic(
             short_name=short_name,
             topic_slug=topic_slug,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def forum_topic
     
@@ -2569,7 +4742,8 @@ class DerpiClient(object):
         topic_slug: str,
         page: Union[int, None] = None,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
-    ) -> List[Post]:
+        _raw: bool = False,
+    ) -> Union[List[Post], List[Dict]]:
         """
         Fetches a list of **post responses** for the abbreviated forum name given by the `short_name` and topic given by `topic_slug` URL parameters.
 
@@ -2607,17 +4781,121 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
-        :return: The parsed result from the API.
-        :rtype:  List[Post]
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  List[Post]|List[Dict]
         """
         return forum_posts(
             short_name=short_name,
             topic_slug=topic_slug,
             page=page,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def forum_posts
     
+    # noinspection PyMethodMayBeStatic
+    def forum_posts_with_total(
+        self, 
+        short_name: str,
+        topic_slug: str,
+        page: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: bool = False,
+    ) -> Union[SearchResult[Post], SearchResult[Dict]]:
+        """
+        Same as `forum_posts(...)`, but additionally returns the `total` amount of results the API reported,
+        e.g. to know the number of pages before requesting them.
+        The `total` is `None` if the API didn't send one.
+        
+        :param short_name: the variable short_name part of the url.
+        :type  short_name: str
+        
+        :param topic_slug: the variable topic_slug part of the url.
+        :type  topic_slug: str
+        
+        :param page: Controls the current page of the response, if the response is paginated. Empty values default to the first page. The first page is `1`.
+        :type  page: int|None
+        
+        :param _client: If you wanna to provide your custom, already opened requests.Session/httpx.Client.
+                        See `forum_posts(...)` for examples.
+        :type  _client: requests.Session|httpx.Client|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed results of that page, and the total amount of results. With `_raw` the results are the plain json.
+        :rtype:  SearchResult[Post]|SearchResult[Dict]
+        """
+        return forum_posts_with_total(
+            short_name=short_name,
+            topic_slug=topic_slug,
+            page=page,
+            _client=_client if _client else self,
+            _raw=_raw,
+        )
+    # end def forum_posts_with_total
+
+    # noinspection PyMethodMayBeStatic
+    def iter_forum_posts(
+        self, 
+        short_name: str,
+        topic_slug: str,
+        start_page: int = 1,
+        max_items: Union[int, None] = None,
+        _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
+        _raw: bool = False,
+    ) -> Iterator[Union[Post, Dict]]:
+        """
+        Iterates over all the results of `forum_posts(...)`, requesting one page after another as needed.
+        While the items of one page are consumed, the next page is already requested in the background.
+        Stops once the `total` amount of results is reached, or after the first page which isn't full.
+
+        Usage:
+        >>> for item in client.iter_forum_posts(...):
+        ...     pass
+        
+        :param short_name: the variable short_name part of the url.
+        :type  short_name: str
+        
+        :param topic_slug: the variable topic_slug part of the url.
+        :type  topic_slug: str
+        
+        :param start_page: The first page to request. The first page is `1`.
+        :type  start_page: int
+
+        :param max_items: Stop after that many items. `None` to continue until the last page.
+        :type  max_items: int|None
+
+        :param _client: If you wanna to provide your custom, already opened requests.Session/httpx.Client.
+                        See `forum_posts(...)` for examples.
+        :type  _client: requests.Session|httpx.Client|None
+
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed items of all the pages, or their plain json with `_raw`.
+        :rtype:  Iterator[Post|Dict]
+        """
+        return iterate_pages(
+            lambda page: self.forum_posts_with_total(
+                short_name=short_name,
+                topic_slug=topic_slug,
+                page=page,
+                _client=_client,
+                _raw=_raw,
+            ),
+            per_page=None,
+            start_page=start_page,
+            max_items=max_items,
+        )
+    # end def iter_forum_posts
+    
     # noinspection PyMethodMayBeStatic
     def forum_post(
         self, 
@@ -2625,7 +4903,8 @@ class DerpiClient(object):
         topic_slug: str,
         post_id: int,
         _client: Union[None, (internet.Session if is_requests else internet.Client)] = None,
-    ) -> Post:
+        _raw: bool = False,
+    ) -> Union[Post, Dict]:
         """
         Fetches a **post response** for the abbreviated forum name given by the `short_name`, topic given by `topic_slug` and post given by `post_id` URL parameters.
 
@@ -2663,14 +4942,19 @@ class DerpiClient(object):
 
         :type  _client: requests.Session|httpx.Client|None
         
-        :return: The parsed result from the API.
-        :rtype:  Post
+        :param _raw: Return the json of the API as is, without building any models, e.g. to pass it on to storage.
+                     Skips all the parsing, if you don't need the models.
+        :type  _raw: bool
+
+        :return: The parsed result from the API, or the plain json with `_raw`.
+        :rtype:  Post|Dict
         """
         return forum_post(
             short_name=short_name,
             topic_slug=topic_slug,
             post_id=post_id,
-            _client=_client if _client else self._client,
+            _client=_client if _client else self,
+            _raw=_raw,
         )
     # end def forum_post
     
@@ -1,15 +1,19 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 from __future__ import annotations
-import iso8601
 
 from datetime import datetime
-from typing import Union, List, Dict, Type, TypeVar, Generic
+from typing import Union, List, Dict, Type, TypeVar, Generic, FrozenSet
 
 from luckydonaldUtils.logger import logging
 from luckydonaldUtils.typing import JSONType
 from luckydonaldUtils.exceptions import assert_type_or_raise
 
+from ..lazy import LazyModel, json_value
+from ..serialization import dumps
+from ..timestamps import LazyDatetime
+from ..intern import InternPool, tag_pool
+
 
 __author__ = 'luckydonald'
 __all__ = ['DerpiModel', 'SearchResult', 'Image', 'Representations', 'Intensities', 'Comment', 'Forum', 'Topic', 'Post', 'Tag', 'User', 'Filter', 'Links', 'Awards', 'Gallery', 'ImageErrors', 'Oembed']
@@ -24,10 +28,24 @@ T = TypeVar('T')
 
 class DerpiModel(object):
     """
-    Base class for all models
+    Base class for all models.
+
+    The models use `__slots__` instead of a per instance `__dict__`, which makes e.g. an `Image` instance
+    about 340 instead of 1640 bytes big (without the field values).
+    Therefore only the fields of the model can be set.
     """
+    __slots__ = ('_raw',)  # the original json payload, if created with `from_dict(...)`.
 
     _assert_consuming_all_params = True  # If set to true we check that we have consumed all arguments.
+    _field_names: FrozenSet[str] = frozenset()  # The keys `prepare_dict(...)` knows, everything else is leftover data.
+
+    # Shares the tag names and ids of all models, e.g. of `Image.tags`. Set it to `InternPool(compact_ids=True)`
+    # to store tag id lists as `array('I')`, or to `None` to keep the lists as they are parsed.
+    intern_pool: Union[InternPool, None] = tag_pool
+
+    # If `from_dict(...)` keeps the original json payload, for `to_dict()`. Costs roughly one more dict per model,
+    # without it `to_dict()` builds the dict from the fields instead.
+    keep_raw: bool = True
 
     @classmethod
     def prepare_dict(cls: Type[DerpiModel], data: Union[Dict[str, JSONType]]) -> Dict[str, JSONType]:
@@ -39,6 +57,20 @@ class DerpiModel(object):
         """
         return {}
     # end def prepare_dict
+
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        The json of this model, like the API sent it.
+        """
+        return {}
+    # end def to_dict
+
+    def to_json_bytes(self) -> bytes:
+        """
+        The json of this model, encoded with the fastest json library installed. See `to_dict()`.
+        """
+        return dumps(self.to_dict())
+    # end def to_json_bytes
 # end class DerpiModel
 
 
@@ -55,6 +87,8 @@ class SearchResult(DerpiModel, Generic[T]):
     :type  total: int
     
     """
+    __slots__ = ('hits', 'total', )
+    _field_names: FrozenSet[str] = frozenset(('hits', 'total', ))
 
     
     """ List of results """
@@ -97,15 +131,13 @@ class SearchResult(DerpiModel, Generic[T]):
         arguments = super().prepare_dict(data) 
         arguments['hits'] = List[T].from_dict(data['hits'])
         arguments['total'] = data['total']
-        
-        del data['hits']
-        del data['total']
 
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
+        if not cls._field_names.issuperset(data):
+            leftover = {key: value for key, value in data.items() if key not in cls._field_names}
+            logger.warning(f'still got leftover data: {leftover!r}')
             if cls._assert_consuming_all_params:
                 raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
+                    f'the dict should be consumed completely, but still has the following elements left: {list(leftover.keys())!r}'
                 )
             # end if
         # end if
@@ -127,12 +159,33 @@ class SearchResult(DerpiModel, Generic[T]):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: SearchResult = cls(**data)
+        arguments: Dict = cls.prepare_dict(data)
+        instance: SearchResult = cls(**arguments)
+        if not cls.keep_raw:
+            return instance
+        # end if
         instance._raw = data
         return instance
     # end def from_dict
 
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        The json of this SearchResult, like the API sent it.
+
+        If created with `from_dict(...)` that is a shallow copy of the original payload, so nothing has to be built.
+        Note that changes of the fields afterwards aren't included then.
+        Otherwise it's built from the fields. Fields not read yet are still in their original json form.
+        """
+        raw = getattr(self, '_raw', None)
+        if raw is not None:
+            return dict(raw)
+        # end if
+        return {
+            'hits': json_value(self.hits),
+            'total': self.total,
+        }
+    # end def to_dict
+
     def __str__(self):
         """
         Implements `str(searchresult_instance)`
@@ -278,6 +331,8 @@ class Image(DerpiModel):
     :type  wilson_score: float
     
     """
+    __slots__ = ('animated', 'aspect_ratio', 'comment_count', '_created_at', 'deletion_reason', 'description', 'downvotes', 'duplicate_of', 'duration', 'faves', '_first_seen_at', 'format', 'height', 'hidden_from_users', 'id', '_intensities', 'mime_type', 'name', 'orig_sha512_hash', 'processed', '_representations', 'score', 'sha512_hash', 'size', 'source_url', 'spoilered', 'tag_count', 'tag_ids', 'tags', 'thumbnails_generated', '_updated_at', 'uploader', 'uploader_id', 'upvotes', 'view_url', 'width', 'wilson_score', )
+    _field_names: FrozenSet[str] = frozenset(('animated', 'aspect_ratio', 'comment_count', 'created_at', 'deletion_reason', 'description', 'downvotes', 'duplicate_of', 'duration', 'faves', 'first_seen_at', 'format', 'height', 'hidden_from_users', 'id', 'intensities', 'mime_type', 'name', 'orig_sha512_hash', 'processed', 'representations', 'score', 'sha512_hash', 'size', 'source_url', 'spoilered', 'tag_count', 'tag_ids', 'tags', 'thumbnails_generated', 'updated_at', 'uploader', 'uploader_id', 'upvotes', 'view_url', 'width', 'wilson_score', ))
 
     
     """ Whether the image is animated. """
@@ -289,8 +344,8 @@ class Image(DerpiModel):
     """ The number of comments made on the image. """
     comment_count: int
     
-    """ The creation time, in UTC, of the image. """
-    created_at: datetime
+    """ The creation time, in UTC, of the image. Parsed when first read. """
+    created_at: datetime = LazyDatetime()
     
     """ The hide reason for the image, or `null` if none provided. This will only have a value on images which are deleted for a rule violation. """
     deletion_reason: Union[str, None]
@@ -310,8 +365,8 @@ class Image(DerpiModel):
     """ The number of faves the image has. """
     faves: int
     
-    """ The time, in UTC, the image was first seen (before any duplicate merging). """
-    first_seen_at: datetime
+    """ The time, in UTC, the image was first seen (before any duplicate merging). Parsed when first read. """
+    first_seen_at: datetime = LazyDatetime()
     
     """ The file extension of the image. One of `"gif", "jpg", "jpeg", "png", "svg", "webm"`. """
     format: str
@@ -325,8 +380,8 @@ class Image(DerpiModel):
     """ The image's ID. """
     id: int
     
-    """ Optional object of [internal image intensity data](https://derpibooru.orghttps://github.com/derpibooru/cli_intensities) for deduplication purposes. May be `null` if intensities have not yet been generated. """
-    intensities: Union[Intensities, None]
+    """ Optional object of [internal image intensity data](https://derpibooru.orghttps://github.com/derpibooru/cli_intensities) for deduplication purposes. May be `null` if intensities have not yet been generated. Built when first read. """
+    intensities: Union[Intensities, None] = LazyModel('Intensities')
     
     """ The MIME type of this image. One of `"image/gif", "image/jpeg", "image/png", "image/svg+xml", "video/webm"`. """
     mime_type: str
@@ -340,8 +395,8 @@ class Image(DerpiModel):
     """ Whether the image has finished optimization. """
     processed: bool
     
-    """ A mapping of representation names to their respective URLs. Contains the keys `"full", "large", "medium", "small", "tall", "thumb", "thumb_small", "thumb_tiny"`. """
-    representations: Representations
+    """ A mapping of representation names to their respective URLs. Contains the keys `"full", "large", "medium", "small", "tall", "thumb", "thumb_small", "thumb_tiny"`. Built when first read. """
+    representations: Representations = LazyModel('Representations')
     
     """ The image's number of upvotes minus the image's number of downvotes. """
     score: int
@@ -370,8 +425,8 @@ class Image(DerpiModel):
     """ Whether the image has finished thumbnail generation. Do not attempt to load images from `view_url` or `representations` if this is false. """
     thumbnails_generated: bool
     
-    """ The time, in UTC, the image was last updated. """
-    updated_at: datetime
+    """ The time, in UTC, the image was last updated. Parsed when first read. """
+    updated_at: datetime = LazyDatetime()
     
     """ The image's uploader. """
     uploader: str
@@ -601,92 +656,47 @@ class Image(DerpiModel):
         arguments['animated'] = data['animated']
         arguments['aspect_ratio'] = data['aspect_ratio']
         arguments['comment_count'] = data['comment_count']
-        arguments['created_at'] = iso8601.parse_date(data['created_at'])
+        arguments['created_at'] = data['created_at']
         arguments['deletion_reason'] = data['deletion_reason'] if data.get('deletion_reason', None) is not None else None
         arguments['description'] = data['description']
         arguments['downvotes'] = data['downvotes']
         arguments['duplicate_of'] = data['duplicate_of'] if data.get('duplicate_of', None) is not None else None
         arguments['duration'] = data['duration']
         arguments['faves'] = data['faves']
-        arguments['first_seen_at'] = iso8601.parse_date(data['first_seen_at'])
+        arguments['first_seen_at'] = data['first_seen_at']
         arguments['format'] = data['format']
         arguments['height'] = data['height']
         arguments['hidden_from_users'] = data['hidden_from_users']
         arguments['id'] = data['id']
-        arguments['intensities'] = Intensities.from_dict(data['intensities']) if data.get('intensities', None) is not None else None
+        arguments['intensities'] = data['intensities'] if data.get('intensities', None) is not None else None
         arguments['mime_type'] = data['mime_type']
         arguments['name'] = data['name']
         arguments['orig_sha512_hash'] = data['orig_sha512_hash']
         arguments['processed'] = data['processed']
-        arguments['representations'] = Representations.from_dict(data['representations'])
+        arguments['representations'] = data['representations']
         arguments['score'] = data['score']
         arguments['sha512_hash'] = data['sha512_hash']
         arguments['size'] = data['size']
         arguments['source_url'] = data['source_url']
         arguments['spoilered'] = data['spoilered']
         arguments['tag_count'] = data['tag_count']
-        arguments['tag_ids'] = data['tag_ids']
-        arguments['tags'] = data['tags']
+        arguments['tag_ids'] = data['tag_ids'] if cls.intern_pool is None else cls.intern_pool.ids(data['tag_ids'])
+        arguments['tags'] = data['tags'] if cls.intern_pool is None else cls.intern_pool.strings(data['tags'])
         arguments['thumbnails_generated'] = data['thumbnails_generated']
-        arguments['updated_at'] = iso8601.parse_date(data['updated_at'])
+        arguments['updated_at'] = data['updated_at']
         arguments['uploader'] = data['uploader']
         arguments['uploader_id'] = data['uploader_id'] if data.get('uploader_id', None) is not None else None
         arguments['upvotes'] = data['upvotes']
         arguments['view_url'] = data['view_url']
         arguments['width'] = data['width']
         arguments['wilson_score'] = data['wilson_score']
-        
-        del data['animated']
-        del data['aspect_ratio']
-        del data['comment_count']
-        del data['created_at']
-        if 'deletion_reason' in data:
-            del data['deletion_reason']
-        # end if
-        del data['description']
-        del data['downvotes']
-        if 'duplicate_of' in data:
-            del data['duplicate_of']
-        # end if
-        del data['duration']
-        del data['faves']
-        del data['first_seen_at']
-        del data['format']
-        del data['height']
-        del data['hidden_from_users']
-        del data['id']
-        if 'intensities' in data:
-            del data['intensities']
-        # end if
-        del data['mime_type']
-        del data['name']
-        del data['orig_sha512_hash']
-        del data['processed']
-        del data['representations']
-        del data['score']
-        del data['sha512_hash']
-        del data['size']
-        del data['source_url']
-        del data['spoilered']
-        del data['tag_count']
-        del data['tag_ids']
-        del data['tags']
-        del data['thumbnails_generated']
-        del data['updated_at']
-        del data['uploader']
-        if 'uploader_id' in data:
-            del data['uploader_id']
-        # end if
-        del data['upvotes']
-        del data['view_url']
-        del data['width']
-        del data['wilson_score']
-
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
+
+        if not cls._field_names.issuperset(data):
+            leftover = {key: value for key, value in data.items() if key not in cls._field_names}
+            logger.warning(f'still got leftover data: {leftover!r}')
             if cls._assert_consuming_all_params:
                 raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
+                    f'the dict should be consumed completely, but still has the following elements left: {list(leftover.keys())!r}'
                 )
             # end if
         # end if
@@ -708,12 +718,78 @@ class Image(DerpiModel):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: Image = cls(**data)
+        arguments: Dict = cls.prepare_dict(data)
+        instance: Image = cls(**arguments)
+        if not cls.keep_raw:
+            return instance
+        # end if
+        if cls.intern_pool is not None:
+            # a copy of the payload using the interned tags too, instead of keeping the parsed lists alive.
+            # The caller's dict stays untouched.
+            instance._raw = dict(data, tag_ids=arguments['tag_ids'], tags=arguments['tags'])
+            return instance
+        # end if
         instance._raw = data
         return instance
     # end def from_dict
 
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        The json of this Image, like the API sent it.
+
+        If created with `from_dict(...)` that is a shallow copy of the original payload, so nothing has to be built.
+        Note that changes of the fields afterwards aren't included then.
+        Otherwise it's built from the fields. Fields not read yet are still in their original json form.
+        """
+        raw = getattr(self, '_raw', None)
+        if raw is not None:
+            data = dict(raw)
+            # the interned tag lists may be shared, or `array`s with `InternPool(compact_ids=True)`.
+            data['tag_ids'] = json_value(data['tag_ids'])
+            data['tags'] = json_value(data['tags'])
+            return data
+        # end if
+        return {
+            'animated': self.animated,
+            'aspect_ratio': self.aspect_ratio,
+            'comment_count': self.comment_count,
+            'created_at': json_value(self._created_at),
+            'deletion_reason': self.deletion_reason,
+            'description': self.description,
+            'downvotes': self.downvotes,
+            'duplicate_of': self.duplicate_of,
+            'duration': self.duration,
+            'faves': self.faves,
+            'first_seen_at': json_value(self._first_seen_at),
+            'format': self.format,
+            'height': self.height,
+            'hidden_from_users': self.hidden_from_users,
+            'id': self.id,
+            'intensities': json_value(self._intensities),
+            'mime_type': self.mime_type,
+            'name': self.name,
+            'orig_sha512_hash': self.orig_sha512_hash,
+            'processed': self.processed,
+            'representations': json_value(self._representations),
+            'score': self.score,
+            'sha512_hash': self.sha512_hash,
+            'size': self.size,
+            'source_url': self.source_url,
+            'spoilered': self.spoilered,
+            'tag_count': self.tag_count,
+            'tag_ids': json_value(self.tag_ids),
+            'tags': json_value(self.tags),
+            'thumbnails_generated': self.thumbnails_generated,
+            'updated_at': json_value(self._updated_at),
+            'uploader': self.uploader,
+            'uploader_id': self.uploader_id,
+            'upvotes': self.upvotes,
+            'view_url': self.view_url,
+            'width': self.width,
+            'wilson_score': self.wilson_score,
+        }
+    # end def to_dict
+
     def __str__(self):
         """
         Implements `str(image_instance)`
@@ -778,6 +854,8 @@ class Representations(DerpiModel):
     :type  webm: str|None
     
     """
+    __slots__ = ('full', 'large', 'medium', 'small', 'tall', 'thumb', 'thumb_small', 'thumb_tiny', 'mp4', 'webm', )
+    _field_names: FrozenSet[str] = frozenset(('full', 'large', 'medium', 'small', 'tall', 'thumb', 'thumb_small', 'thumb_tiny', 'mp4', 'webm', ))
 
     
     """ The url to the image in original resolution. """
@@ -892,27 +970,13 @@ class Representations(DerpiModel):
         arguments['thumb_tiny'] = data['thumb_tiny']
         arguments['mp4'] = data['mp4'] if data.get('mp4', None) is not None else None
         arguments['webm'] = data['webm'] if data.get('webm', None) is not None else None
-        
-        del data['full']
-        del data['large']
-        del data['medium']
-        del data['small']
-        del data['tall']
-        del data['thumb']
-        del data['thumb_small']
-        del data['thumb_tiny']
-        if 'mp4' in data:
-            del data['mp4']
-        # end if
-        if 'webm' in data:
-            del data['webm']
-        # end if
 
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
+        if not cls._field_names.issuperset(data):
+            leftover = {key: value for key, value in data.items() if key not in cls._field_names}
+            logger.warning(f'still got leftover data: {leftover!r}')
             if cls._assert_consuming_all_params:
                 raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
+                    f'the dict should be consumed completely, but still has the following elements left: {list(leftover.keys())!r}'
                 )
             # end if
         # end if
@@ -934,12 +998,41 @@ class Representations(DerpiModel):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: Representations = cls(**data)
+        arguments: Dict = cls.prepare_dict(data)
+        instance: Representations = cls(**arguments)
+        if not cls.keep_raw:
+            return instance
+        # end if
         instance._raw = data
         return instance
     # end def from_dict
 
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        The json of this Representations, like the API sent it.
+
+        If created with `from_dict(...)` that is a shallow copy of the original payload, so nothing has to be built.
+        Note that changes of the fields afterwards aren't included then.
+        Otherwise it's built from the fields. Fields not read yet are still in their original json form.
+        """
+        raw = getattr(self, '_raw', None)
+        if raw is not None:
+            return dict(raw)
+        # end if
+        return {
+            'full': self.full,
+            'large': self.large,
+            'medium': self.medium,
+            'small': self.small,
+            'tall': self.tall,
+            'thumb': self.thumb,
+            'thumb_small': self.thumb_small,
+            'thumb_tiny': self.thumb_tiny,
+            'mp4': self.mp4,
+            'webm': self.webm,
+        }
+    # end def to_dict
+
     def __str__(self):
         """
         Implements `str(representations_instance)`
@@ -986,6 +1079,8 @@ class Intensities(DerpiModel):
     :type  sw: float
     
     """
+    __slots__ = ('ne', 'nw', 'se', 'sw', )
+    _field_names: FrozenSet[str] = frozenset(('ne', 'nw', 'se', 'sw', ))
 
     
     """ Northeast intensity. Whatever that means… """
@@ -1046,17 +1141,13 @@ class Intensities(DerpiModel):
         arguments['nw'] = data['nw']
         arguments['se'] = data['se']
         arguments['sw'] = data['sw']
-        
-        del data['ne']
-        del data['nw']
-        del data['se']
-        del data['sw']
 
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
+        if not cls._field_names.issuperset(data):
+            leftover = {key: value for key, value in data.items() if key not in cls._field_names}
+            logger.warning(f'still got leftover data: {leftover!r}')
             if cls._assert_consuming_all_params:
                 raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
+                    f'the dict should be consumed completely, but still has the following elements left: {list(leftover.keys())!r}'
                 )
             # end if
         # end if
@@ -1078,12 +1169,35 @@ class Intensities(DerpiModel):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: Intensities = cls(**data)
+        arguments: Dict = cls.prepare_dict(data)
+        instance: Intensities = cls(**arguments)
+        if not cls.keep_raw:
+            return instance
+        # end if
         instance._raw = data
         return instance
     # end def from_dict
 
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        The json of this Intensities, like the API sent it.
+
+        If created with `from_dict(...)` that is a shallow copy of the original payload, so nothing has to be built.
+        Note that changes of the fields afterwards aren't included then.
+        Otherwise it's built from the fields. Fields not read yet are still in their original json form.
+        """
+        raw = getattr(self, '_raw', None)
+        if raw is not None:
+            return dict(raw)
+        # end if
+        return {
+            'ne': self.ne,
+            'nw': self.nw,
+            'se': self.se,
+            'sw': self.sw,
+        }
+    # end def to_dict
+
     def __str__(self):
         """
         Implements `str(intensities_instance)`
@@ -1148,6 +1262,8 @@ class Comment(DerpiModel):
     :type  user_id: int
     
     """
+    __slots__ = ('author', 'avatar', 'body', '_created_at', 'edit_reason', '_edited_at', 'id', 'image_id', '_updated_at', 'user_id', )
+    _field_names: FrozenSet[str] = frozenset(('author', 'avatar', 'body', 'created_at', 'edit_reason', 'edited_at', 'id', 'image_id', 'updated_at', 'user_id', ))
 
     
     """ The comment's author. """
@@ -1159,14 +1275,14 @@ class Comment(DerpiModel):
     """ The comment text. """
     body: str
     
-    """ The creation time, in UTC, of the comment. """
-    created_at: datetime
+    """ The creation time, in UTC, of the comment. Parsed when first read. """
+    created_at: datetime = LazyDatetime()
     
     """ The edit reason for this comment, or `null` if none provided. """
     edit_reason: Union[str, None]
     
-    """ The time, in UTC, this comment was last edited at, or `null` if it was not edited. """
-    edited_at: Union[datetime, None]
+    """ The time, in UTC, this comment was last edited at, or `null` if it was not edited. Parsed when first read. """
+    edited_at: Union[datetime, None] = LazyDatetime()
     
     """ The comment's ID. """
     id: int
@@ -1174,8 +1290,8 @@ class Comment(DerpiModel):
     """ The ID of the image the comment belongs to. """
     image_id: int
     
-    """ The time, in UTC, the comment was last updated at. """
-    updated_at: datetime
+    """ The time, in UTC, the comment was last updated at. Parsed when first read. """
+    updated_at: datetime = LazyDatetime()
     
     """ The ID of the user the comment belongs to, if any. """
     user_id: int
@@ -1255,34 +1371,20 @@ class Comment(DerpiModel):
         arguments['author'] = data['author']
         arguments['avatar'] = data['avatar']
         arguments['body'] = data['body']
-        arguments['created_at'] = iso8601.parse_date(data['created_at'])
+        arguments['created_at'] = data['created_at']
         arguments['edit_reason'] = data['edit_reason'] if data.get('edit_reason', None) is not None else None
-        arguments['edited_at'] = iso8601.parse_date(data['edited_at']) if data.get('edited_at', None) is not None else None
+        arguments['edited_at'] = data['edited_at'] if data.get('edited_at', None) is not None else None
         arguments['id'] = data['id']
         arguments['image_id'] = data['image_id']
-        arguments['updated_at'] = iso8601.parse_date(data['updated_at'])
+        arguments['updated_at'] = data['updated_at']
         arguments['user_id'] = data['user_id']
-        
-        del data['author']
-        del data['avatar']
-        del data['body']
-        del data['created_at']
-        if 'edit_reason' in data:
-            del data['edit_reason']
-        # end if
-        if 'edited_at' in data:
-            del data['edited_at']
-        # end if
-        del data['id']
-        del data['image_id']
-        del data['updated_at']
-        del data['user_id']
 
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
+        if not cls._field_names.issuperset(data):
+            leftover = {key: value for key, value in data.items() if key not in cls._field_names}
+            logger.warning(f'still got leftover data: {leftover!r}')
             if cls._assert_consuming_all_params:
                 raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
+                    f'the dict should be consumed completely, but still has the following elements left: {list(leftover.keys())!r}'
                 )
             # end if
         # end if
@@ -1304,12 +1406,41 @@ class Comment(DerpiModel):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: Comment = cls(**data)
+        arguments: Dict = cls.prepare_dict(data)
+        instance: Comment = cls(**arguments)
+        if not cls.keep_raw:
+            return instance
+        # end if
         instance._raw = data
         return instance
     # end def from_dict
 
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        The json of this Comment, like the API sent it.
+
+        If created with `from_dict(...)` that is a shallow copy of the original payload, so nothing has to be built.
+        Note that changes of the fields afterwards aren't included then.
+        Otherwise it's built from the fields. Fields not read yet are still in their original json form.
+        """
+        raw = getattr(self, '_raw', None)
+        if raw is not None:
+            return dict(raw)
+        # end if
+        return {
+            'author': self.author,
+            'avatar': self.avatar,
+            'body': self.body,
+            'created_at': json_value(self._created_at),
+            'edit_reason': self.edit_reason,
+            'edited_at': json_value(self._edited_at),
+            'id': self.id,
+            'image_id': self.image_id,
+            'updated_at': json_value(self._updated_at),
+            'user_id': self.user_id,
+        }
+    # end def to_dict
+
     def __str__(self):
         """
         Implements `str(comment_instance)`
@@ -1359,6 +1490,8 @@ class Forum(DerpiModel):
     :type  post_count: int
     
     """
+    __slots__ = ('name', 'short_name', 'description', 'topic_count', 'post_count', )
+    _field_names: FrozenSet[str] = frozenset(('name', 'short_name', 'description', 'topic_count', 'post_count', ))
 
     
     """ The forum's name. """
@@ -1428,18 +1561,13 @@ class Forum(DerpiModel):
         arguments['description'] = data['description']
         arguments['topic_count'] = data['topic_count']
         arguments['post_count'] = data['post_count']
-        
-        del data['name']
-        del data['short_name']
-        del data['description']
-        del data['topic_count']
-        del data['post_count']
 
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
+        if not cls._field_names.issuperset(data):
+            leftover = {key: value for key, value in data.items() if key not in cls._field_names}
+            logger.warning(f'still got leftover data: {leftover!r}')
             if cls._assert_consuming_all_params:
                 raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
+                    f'the dict should be consumed completely, but still has the following elements left: {list(leftover.keys())!r}'
                 )
             # end if
         # end if
@@ -1461,12 +1589,36 @@ class Forum(DerpiModel):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: Forum = cls(**data)
+        arguments: Dict = cls.prepare_dict(data)
+        instance: Forum = cls(**arguments)
+        if not cls.keep_raw:
+            return instance
+        # end if
         instance._raw = data
         return instance
     # end def from_dict
 
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        The json of this Forum, like the API sent it.
+
+        If created with `from_dict(...)` that is a shallow copy of the original payload, so nothing has to be built.
+        Note that changes of the fields afterwards aren't included then.
+        Otherwise it's built from the fields. Fields not read yet are still in their original json form.
+        """
+        raw = getattr(self, '_raw', None)
+        if raw is not None:
+            return dict(raw)
+        # end if
+        return {
+            'name': self.name,
+            'short_name': self.short_name,
+            'description': self.description,
+            'topic_count': self.topic_count,
+            'post_count': self.post_count,
+        }
+    # end def to_dict
+
     def __str__(self):
         """
         Implements `str(forum_instance)`
@@ -1528,6 +1680,8 @@ class Topic(DerpiModel):
     :type  author: str
     
     """
+    __slots__ = ('slug', 'title', 'post_count', 'view_count', 'sticky', '_last_replied_to_at', 'locked', 'user_id', 'author', )
+    _field_names: FrozenSet[str] = frozenset(('slug', 'title', 'post_count', 'view_count', 'sticky', 'last_replied_to_at', 'locked', 'user_id', 'author', ))
 
     
     """ The topic's slug (used to identify it). """
@@ -1545,8 +1699,8 @@ class Topic(DerpiModel):
     """ Whether the topic is sticky. """
     sticky: bool
     
-    """ The time, in UTC, when the last reply was made. """
-    last_replied_to_at: datetime
+    """ The time, in UTC, when the last reply was made. Parsed when first read. """
+    last_replied_to_at: datetime = LazyDatetime()
     
     """ Whether the topic is locked. """
     locked: bool
@@ -1629,28 +1783,17 @@ class Topic(DerpiModel):
         arguments['post_count'] = data['post_count']
         arguments['view_count'] = data['view_count']
         arguments['sticky'] = data['sticky']
-        arguments['last_replied_to_at'] = iso8601.parse_date(data['last_replied_to_at'])
+        arguments['last_replied_to_at'] = data['last_replied_to_at']
         arguments['locked'] = data['locked']
         arguments['user_id'] = data['user_id'] if data.get('user_id', None) is not None else None
         arguments['author'] = data['author']
-        
-        del data['slug']
-        del data['title']
-        del data['post_count']
-        del data['view_count']
-        del data['sticky']
-        del data['last_replied_to_at']
-        del data['locked']
-        if 'user_id' in data:
-            del data['user_id']
-        # end if
-        del data['author']
 
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
+        if not cls._field_names.issuperset(data):
+            leftover = {key: value for key, value in data.items() if key not in cls._field_names}
+            logger.warning(f'still got leftover data: {leftover!r}')
             if cls._assert_consuming_all_params:
                 raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
+                    f'the dict should be consumed completely, but still has the following elements left: {list(leftover.keys())!r}'
                 )
             # end if
         # end if
@@ -1672,12 +1815,40 @@ class Topic(DerpiModel):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: Topic = cls(**data)
+        arguments: Dict = cls.prepare_dict(data)
+        instance: Topic = cls(**arguments)
+        if not cls.keep_raw:
+            return instance
+        # end if
         instance._raw = data
         return instance
     # end def from_dict
 
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        The json of this Topic, like the API sent it.
+
+        If created with `from_dict(...)` that is a shallow copy of the original payload, so nothing has to be built.
+        Note that changes of the fields afterwards aren't included then.
+        Otherwise it's built from the fields. Fields not read yet are still in their original json form.
+        """
+        raw = getattr(self, '_raw', None)
+        if raw is not None:
+            return dict(raw)
+        # end if
+        return {
+            'slug': self.slug,
+            'title': self.title,
+            'post_count': self.post_count,
+            'view_count': self.view_count,
+            'sticky': self.sticky,
+            'last_replied_to_at': json_value(self._last_replied_to_at),
+            'locked': self.locked,
+            'user_id': self.user_id,
+            'author': self.author,
+        }
+    # end def to_dict
+
     def __str__(self):
         """
         Implements `str(topic_instance)`
@@ -1739,6 +1910,8 @@ class Post(DerpiModel):
     :type  user_id: int
     
     """
+    __slots__ = ('author', 'avatar', 'body', '_created_at', 'edit_reason', '_edited_at', 'id', '_updated_at', 'user_id', )
+    _field_names: FrozenSet[str] = frozenset(('author', 'avatar', 'body', 'created_at', 'edit_reason', 'edited_at', 'id', 'updated_at', 'user_id', ))
 
     
     """ The post's author. """
@@ -1750,20 +1923,20 @@ class Post(DerpiModel):
     """ The post text. """
     body: str
     
-    """ The creation time, in UTC, of the post. """
-    created_at: datetime
+    """ The creation time, in UTC, of the post. Parsed when first read. """
+    created_at: datetime = LazyDatetime()
     
     """ The edit reason for this post. """
     edit_reason: str
     
-    """ The time, in UTC, this post was last edited at, or `null` if it was not edited. """
-    edited_at: Union[datetime, None]
+    """ The time, in UTC, this post was last edited at, or `null` if it was not edited. Parsed when first read. """
+    edited_at: Union[datetime, None] = LazyDatetime()
     
     """ The post's ID (used to identify it). """
     id: int
     
-    """ The time, in UTC, the post was last updated at. """
-    updated_at: datetime
+    """ The time, in UTC, the post was last updated at. Parsed when first read. """
+    updated_at: datetime = LazyDatetime()
     
     """ The ID of the user the post belongs to, if any. """
     user_id: int
@@ -1838,30 +2011,19 @@ class Post(DerpiModel):
         arguments['author'] = data['author']
         arguments['avatar'] = data['avatar']
         arguments['body'] = data['body']
-        arguments['created_at'] = iso8601.parse_date(data['created_at'])
+        arguments['created_at'] = data['created_at']
         arguments['edit_reason'] = data['edit_reason']
-        arguments['edited_at'] = iso8601.parse_date(data['edited_at']) if data.get('edited_at', None) is not None else None
+        arguments['edited_at'] = data['edited_at'] if data.get('edited_at', None) is not None else None
         arguments['id'] = data['id']
-        arguments['updated_at'] = iso8601.parse_date(data['updated_at'])
+        arguments['updated_at'] = data['updated_at']
         arguments['user_id'] = data['user_id']
-        
-        del data['author']
-        del data['avatar']
-        del data['body']
-        del data['created_at']
-        del data['edit_reason']
-        if 'edited_at' in data:
-            del data['edited_at']
-        # end if
-        del data['id']
-        del data['updated_at']
-        del data['user_id']
 
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
+        if not cls._field_names.issuperset(data):
+            leftover = {key: value for key, value in data.items() if key not in cls._field_names}
+            logger.warning(f'still got leftover data: {leftover!r}')
             if cls._assert_consuming_all_params:
                 raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
+                    f'the dict should be consumed completely, but still has the following elements left: {list(leftover.keys())!r}'
                 )
             # end if
         # end if
@@ -1883,12 +2045,40 @@ class Post(DerpiModel):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: Post = cls(**data)
+        arguments: Dict = cls.prepare_dict(data)
+        instance: Post = cls(**arguments)
+        if not cls.keep_raw:
+            return instance
+        # end if
         instance._raw = data
         return instance
     # end def from_dict
 
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        The json of this Post, like the API sent it.
+
+        If created with `from_dict(...)` that is a shallow copy of the original payload, so nothing has to be built.
+        Note that changes of the fields afterwards aren't included then.
+        Otherwise it's built from the fields. Fields not read yet are still in their original json form.
+        """
+        raw = getattr(self, '_raw', None)
+        if raw is not None:
+            return dict(raw)
+        # end if
+        return {
+            'author': self.author,
+            'avatar': self.avatar,
+            'body': self.body,
+            'created_at': json_value(self._created_at),
+            'edit_reason': self.edit_reason,
+            'edited_at': json_value(self._edited_at),
+            'id': self.id,
+            'updated_at': json_value(self._updated_at),
+            'user_id': self.user_id,
+        }
+    # end def to_dict
+
     def __str__(self):
         """
         Implements `str(post_instance)`
@@ -1968,6 +2158,8 @@ class Tag(DerpiModel):
     :type  spoiler_image_uri: str|None
     
     """
+    __slots__ = ('aliased_tag', 'aliases', 'category', 'description', 'dnp_entries', 'id', 'images', 'implied_by_tags', 'implied_tags', 'name', 'name_in_namespace', 'namespace', 'short_description', 'slug', 'spoiler_image_uri', )
+    _field_names: FrozenSet[str] = frozenset(('aliased_tag', 'aliases', 'category', 'description', 'dnp_entries', 'id', 'images', 'implied_by_tags', 'implied_tags', 'name', 'name_in_namespace', 'namespace', 'short_description', 'slug', 'spoiler_image_uri', ))
 
     
     """ The slug of the tag this tag is aliased to, if any. """
@@ -2113,44 +2305,27 @@ class Tag(DerpiModel):
 
         arguments = super().prepare_dict(data) 
         arguments['aliased_tag'] = data['aliased_tag']
-        arguments['aliases'] = data['aliases']
+        arguments['aliases'] = data['aliases'] if cls.intern_pool is None else cls.intern_pool.strings(data['aliases'])
         arguments['category'] = data['category']
         arguments['description'] = data['description']
         arguments['dnp_entries'] = data['dnp_entries']
         arguments['id'] = data['id']
         arguments['images'] = data['images']
-        arguments['implied_by_tags'] = data['implied_by_tags']
-        arguments['implied_tags'] = data['implied_tags']
+        arguments['implied_by_tags'] = data['implied_by_tags'] if cls.intern_pool is None else cls.intern_pool.strings(data['implied_by_tags'])
+        arguments['implied_tags'] = data['implied_tags'] if cls.intern_pool is None else cls.intern_pool.strings(data['implied_tags'])
         arguments['name'] = data['name']
         arguments['name_in_namespace'] = data['name_in_namespace']
         arguments['namespace'] = data['namespace']
         arguments['short_description'] = data['short_description']
         arguments['slug'] = data['slug']
         arguments['spoiler_image_uri'] = data['spoiler_image_uri'] if data.get('spoiler_image_uri', None) is not None else None
-        
-        del data['aliased_tag']
-        del data['aliases']
-        del data['category']
-        del data['description']
-        del data['dnp_entries']
-        del data['id']
-        del data['images']
-        del data['implied_by_tags']
-        del data['implied_tags']
-        del data['name']
-        del data['name_in_namespace']
-        del data['namespace']
-        del data['short_description']
-        del data['slug']
-        if 'spoiler_image_uri' in data:
-            del data['spoiler_image_uri']
-        # end if
-
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
+
+        if not cls._field_names.issuperset(data):
+            leftover = {key: value for key, value in data.items() if key not in cls._field_names}
+            logger.warning(f'still got leftover data: {leftover!r}')
             if cls._assert_consuming_all_params:
                 raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
+                    f'the dict should be consumed completely, but still has the following elements left: {list(leftover.keys())!r}'
                 )
             # end if
         # end if
@@ -2172,12 +2347,57 @@ class Tag(DerpiModel):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: Tag = cls(**data)
+        arguments: Dict = cls.prepare_dict(data)
+        instance: Tag = cls(**arguments)
+        if not cls.keep_raw:
+            return instance
+        # end if
+        if cls.intern_pool is not None:
+            # a copy of the payload using the interned tags too, instead of keeping the parsed lists alive.
+            # The caller's dict stays untouched.
+            instance._raw = dict(data, aliases=arguments['aliases'], implied_by_tags=arguments['implied_by_tags'], implied_tags=arguments['implied_tags'])
+            return instance
+        # end if
         instance._raw = data
         return instance
     # end def from_dict
 
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        The json of this Tag, like the API sent it.
+
+        If created with `from_dict(...)` that is a shallow copy of the original payload, so nothing has to be built.
+        Note that changes of the fields afterwards aren't included then.
+        Otherwise it's built from the fields. Fields not read yet are still in their original json form.
+        """
+        raw = getattr(self, '_raw', None)
+        if raw is not None:
+            data = dict(raw)
+            # the interned tag lists may be shared, or `array`s with `InternPool(compact_ids=True)`.
+            data['aliases'] = json_value(data['aliases'])
+            data['implied_by_tags'] = json_value(data['implied_by_tags'])
+            data['implied_tags'] = json_value(data['implied_tags'])
+            return data
+        # end if
+        return {
+            'aliased_tag': self.aliased_tag,
+            'aliases': json_value(self.aliases),
+            'category': self.category,
+            'description': self.description,
+            'dnp_entries': self.dnp_entries,
+            'id': self.id,
+            'images': self.images,
+            'implied_by_tags': json_value(self.implied_by_tags),
+            'implied_tags': json_value(self.implied_tags),
+            'name': self.name,
+            'name_in_namespace': self.name_in_namespace,
+            'namespace': self.namespace,
+            'short_description': self.short_description,
+            'slug': self.slug,
+            'spoiler_image_uri': self.spoiler_image_uri,
+        }
+    # end def to_dict
+
     def __str__(self):
         """
         Implements `str(tag_instance)`
@@ -2251,6 +2471,8 @@ class User(DerpiModel):
     :type  awards: Awards
     
     """
+    __slots__ = ('id', 'name', 'slug', 'role', 'description', 'avatar_url', '_created_at', 'comments_count', 'uploads_count', 'posts_count', 'topics_count', '_links', '_awards', )
+    _field_names: FrozenSet[str] = frozenset(('id', 'name', 'slug', 'role', 'description', 'avatar_url', 'created_at', 'comments_count', 'uploads_count', 'posts_count', 'topics_count', 'links', 'awards', ))
 
     
     """ The ID of the user. """
@@ -2271,8 +2493,8 @@ class User(DerpiModel):
     """ The URL of the user's thumbnail. `null` if the avatar is not set. """
     avatar_url: Union[str, None]
     
-    """ The creation time, in UTC, of the user. """
-    created_at: datetime
+    """ The creation time, in UTC, of the user. Parsed when first read. """
+    created_at: datetime = LazyDatetime()
     
     """ The comment count of the user. """
     comments_count: int
@@ -2286,11 +2508,11 @@ class User(DerpiModel):
     """ The forum topics count of the user. """
     topics_count: int
     
-    """ `Links`. """
-    links: Links
+    """ `Links`. Built when first read. """
+    links: Links = LazyModel('Links')
     
-    """ `Awards`. """
-    awards: Awards
+    """ `Awards`. Built when first read. """
+    awards: Awards = LazyModel('Awards')
     
     def __init__(
         self, 
@@ -2385,35 +2607,20 @@ class User(DerpiModel):
         arguments['role'] = data['role']
         arguments['description'] = data['description']
         arguments['avatar_url'] = data['avatar_url'] if data.get('avatar_url', None) is not None else None
-        arguments['created_at'] = iso8601.parse_date(data['created_at'])
+        arguments['created_at'] = data['created_at']
         arguments['comments_count'] = data['comments_count']
         arguments['uploads_count'] = data['uploads_count']
         arguments['posts_count'] = data['posts_count']
         arguments['topics_count'] = data['topics_count']
-        arguments['links'] = Links.from_dict(data['links'])
-        arguments['awards'] = Awards.from_dict(data['awards'])
-        
-        del data['id']
-        del data['name']
-        del data['slug']
-        del data['role']
-        del data['description']
-        if 'avatar_url' in data:
-            del data['avatar_url']
-        # end if
-        del data['created_at']
-        del data['comments_count']
-        del data['uploads_count']
-        del data['posts_count']
-        del data['topics_count']
-        del data['links']
-        del data['awards']
-
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
+        arguments['links'] = data['links']
+        arguments['awards'] = data['awards']
+
+        if not cls._field_names.issuperset(data):
+            leftover = {key: value for key, value in data.items() if key not in cls._field_names}
+            logger.warning(f'still got leftover data: {leftover!r}')
             if cls._assert_consuming_all_params:
                 raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
+                    f'the dict should be consumed completely, but still has the following elements left: {list(leftover.keys())!r}'
                 )
             # end if
         # end if
@@ -2435,12 +2642,44 @@ class User(DerpiModel):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: User = cls(**data)
+        arguments: Dict = cls.prepare_dict(data)
+        instance: User = cls(**arguments)
+        if not cls.keep_raw:
+            return instance
+        # end if
         instance._raw = data
         return instance
     # end def from_dict
 
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        The json of this User, like the API sent it.
+
+        If created with `from_dict(...)` that is a shallow copy of the original payload, so nothing has to be built.
+        Note that changes of the fields afterwards aren't included then.
+        Otherwise it's built from the fields. Fields not read yet are still in their original json form.
+        """
+        raw = getattr(self, '_raw', None)
+        if raw is not None:
+            return dict(raw)
+        # end if
+        return {
+            'id': self.id,
+            'name': self.name,
+            'slug': self.slug,
+            'role': self.role,
+            'description': self.description,
+            'avatar_url': self.avatar_url,
+            'created_at': json_value(self._created_at),
+            'comments_count': self.comments_count,
+            'uploads_count': self.uploads_count,
+            'posts_count': self.posts_count,
+            'topics_count': self.topics_count,
+            'links': json_value(self._links),
+            'awards': json_value(self._awards),
+        }
+    # end def to_dict
+
     def __str__(self):
         """
         Implements `str(user_instance)`
@@ -2508,6 +2747,8 @@ class Filter(DerpiModel):
     :type  hidden_complex: str
     
     """
+    __slots__ = ('id', 'name', 'description', 'user_id', 'user_count', 'system', 'public', 'spoilered_tag_ids', 'spoilered_complex', 'hidden_tag_ids', 'hidden_complex', )
+    _field_names: FrozenSet[str] = frozenset(('id', 'name', 'description', 'user_id', 'user_count', 'system', 'public', 'spoilered_tag_ids', 'spoilered_complex', 'hidden_tag_ids', 'hidden_complex', ))
 
     
     """ The id of the filter. """
@@ -2627,30 +2868,17 @@ class Filter(DerpiModel):
         arguments['user_count'] = data['user_count']
         arguments['system'] = data['system']
         arguments['public'] = data['public']
-        arguments['spoilered_tag_ids'] = data['spoilered_tag_ids']
+        arguments['spoilered_tag_ids'] = data['spoilered_tag_ids'] if cls.intern_pool is None else cls.intern_pool.ids(data['spoilered_tag_ids'])
         arguments['spoilered_complex'] = data['spoilered_complex']
-        arguments['hidden_tag_ids'] = data['hidden_tag_ids']
+        arguments['hidden_tag_ids'] = data['hidden_tag_ids'] if cls.intern_pool is None else cls.intern_pool.ids(data['hidden_tag_ids'])
         arguments['hidden_complex'] = data['hidden_complex']
-        
-        del data['id']
-        del data['name']
-        del data['description']
-        if 'user_id' in data:
-            del data['user_id']
-        # end if
-        del data['user_count']
-        del data['system']
-        del data['public']
-        del data['spoilered_tag_ids']
-        del data['spoilered_complex']
-        del data['hidden_tag_ids']
-        del data['hidden_complex']
-
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
+
+        if not cls._field_names.issuperset(data):
+            leftover = {key: value for key, value in data.items() if key not in cls._field_names}
+            logger.warning(f'still got leftover data: {leftover!r}')
             if cls._assert_consuming_all_params:
                 raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
+                    f'the dict should be consumed completely, but still has the following elements left: {list(leftover.keys())!r}'
                 )
             # end if
         # end if
@@ -2672,12 +2900,52 @@ class Filter(DerpiModel):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: Filter = cls(**data)
+        arguments: Dict = cls.prepare_dict(data)
+        instance: Filter = cls(**arguments)
+        if not cls.keep_raw:
+            return instance
+        # end if
+        if cls.intern_pool is not None:
+            # a copy of the payload using the interned tags too, instead of keeping the parsed lists alive.
+            # The caller's dict stays untouched.
+            instance._raw = dict(data, spoilered_tag_ids=arguments['spoilered_tag_ids'], hidden_tag_ids=arguments['hidden_tag_ids'])
+            return instance
+        # end if
         instance._raw = data
         return instance
     # end def from_dict
 
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        The json of this Filter, like the API sent it.
+
+        If created with `from_dict(...)` that is a shallow copy of the original payload, so nothing has to be built.
+        Note that changes of the fields afterwards aren't included then.
+        Otherwise it's built from the fields. Fields not read yet are still in their original json form.
+        """
+        raw = getattr(self, '_raw', None)
+        if raw is not None:
+            data = dict(raw)
+            # the interned tag lists may be shared, or `array`s with `InternPool(compact_ids=True)`.
+            data['spoilered_tag_ids'] = json_value(data['spoilered_tag_ids'])
+            data['hidden_tag_ids'] = json_value(data['hidden_tag_ids'])
+            return data
+        # end if
+        return {
+            'id': self.id,
+            'name': self.name,
+            'description': self.description,
+            'user_id': self.user_id,
+            'user_count': self.user_count,
+            'system': self.system,
+            'public': self.public,
+            'spoilered_tag_ids': json_value(self.spoilered_tag_ids),
+            'spoilered_complex': self.spoilered_complex,
+            'hidden_tag_ids': json_value(self.hidden_tag_ids),
+            'hidden_complex': self.hidden_complex,
+        }
+    # end def to_dict
+
     def __str__(self):
         """
         Implements `str(filter_instance)`
@@ -2724,13 +2992,15 @@ class Links(DerpiModel):
     :type  tag_id: int|None
     
     """
+    __slots__ = ('user_id', '_created_at', 'state', 'tag_id', )
+    _field_names: FrozenSet[str] = frozenset(('user_id', 'created_at', 'state', 'tag_id', ))
 
     
     """ The ID of the user who owns this link. """
     user_id: int
     
-    """ The creation time, in UTC, of this link. """
-    created_at: datetime
+    """ The creation time, in UTC, of this link. Parsed when first read. """
+    created_at: datetime = LazyDatetime()
     
     """ The state of this link. """
     state: str
@@ -2781,22 +3051,16 @@ class Links(DerpiModel):
 
         arguments = super().prepare_dict(data) 
         arguments['user_id'] = data['user_id']
-        arguments['created_at'] = iso8601.parse_date(data['created_at'])
+        arguments['created_at'] = data['created_at']
         arguments['state'] = data['state']
         arguments['tag_id'] = data['tag_id'] if data.get('tag_id', None) is not None else None
-        
-        del data['user_id']
-        del data['created_at']
-        del data['state']
-        if 'tag_id' in data:
-            del data['tag_id']
-        # end if
 
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
+        if not cls._field_names.issuperset(data):
+            leftover = {key: value for key, value in data.items() if key not in cls._field_names}
+            logger.warning(f'still got leftover data: {leftover!r}')
             if cls._assert_consuming_all_params:
                 raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
+                    f'the dict should be consumed completely, but still has the following elements left: {list(leftover.keys())!r}'
                 )
             # end if
         # end if
@@ -2818,12 +3082,35 @@ class Links(DerpiModel):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: Links = cls(**data)
+        arguments: Dict = cls.prepare_dict(data)
+        instance: Links = cls(**arguments)
+        if not cls.keep_raw:
+            return instance
+        # end if
         instance._raw = data
         return instance
     # end def from_dict
 
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        The json of this Links, like the API sent it.
+
+        If created with `from_dict(...)` that is a shallow copy of the original payload, so nothing has to be built.
+        Note that changes of the fields afterwards aren't included then.
+        Otherwise it's built from the fields. Fields not read yet are still in their original json form.
+        """
+        raw = getattr(self, '_raw', None)
+        if raw is not None:
+            return dict(raw)
+        # end if
+        return {
+            'user_id': self.user_id,
+            'created_at': json_value(self._created_at),
+            'state': self.state,
+            'tag_id': self.tag_id,
+        }
+    # end def to_dict
+
     def __str__(self):
         """
         Implements `str(links_instance)`
@@ -2873,6 +3160,8 @@ class Awards(DerpiModel):
     :type  awarded_on: datetime
     
     """
+    __slots__ = ('image_url', 'title', 'id', 'label', '_awarded_on', )
+    _field_names: FrozenSet[str] = frozenset(('image_url', 'title', 'id', 'label', 'awarded_on', ))
 
     
     """ The URL of this award. """
@@ -2887,8 +3176,8 @@ class Awards(DerpiModel):
     """ The label of this award. """
     label: str
     
-    """ The time, in UTC, when this award was given. """
-    awarded_on: datetime
+    """ The time, in UTC, when this award was given. Parsed when first read. """
+    awarded_on: datetime = LazyDatetime()
     
     def __init__(
         self, 
@@ -2941,19 +3230,14 @@ class Awards(DerpiModel):
         arguments['title'] = data['title']
         arguments['id'] = data['id']
         arguments['label'] = data['label']
-        arguments['awarded_on'] = iso8601.parse_date(data['awarded_on'])
-        
-        del data['image_url']
-        del data['title']
-        del data['id']
-        del data['label']
-        del data['awarded_on']
+        arguments['awarded_on'] = data['awarded_on']
 
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
+        if not cls._field_names.issuperset(data):
+            leftover = {key: value for key, value in data.items() if key not in cls._field_names}
+            logger.warning(f'still got leftover data: {leftover!r}')
             if cls._assert_consuming_all_params:
                 raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
+                    f'the dict should be consumed completely, but still has the following elements left: {list(leftover.keys())!r}'
                 )
             # end if
         # end if
@@ -2975,12 +3259,36 @@ class Awards(DerpiModel):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: Awards = cls(**data)
+        arguments: Dict = cls.prepare_dict(data)
+        instance: Awards = cls(**arguments)
+        if not cls.keep_raw:
+            return instance
+        # end if
         instance._raw = data
         return instance
     # end def from_dict
 
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        The json of this Awards, like the API sent it.
+
+        If created with `from_dict(...)` that is a shallow copy of the original payload, so nothing has to be built.
+        Note that changes of the fields afterwards aren't included then.
+        Otherwise it's built from the fields. Fields not read yet are still in their original json form.
+        """
+        raw = getattr(self, '_raw', None)
+        if raw is not None:
+            return dict(raw)
+        # end if
+        return {
+            'image_url': self.image_url,
+            'title': self.title,
+            'id': self.id,
+            'label': self.label,
+            'awarded_on': json_value(self._awarded_on),
+        }
+    # end def to_dict
+
     def __str__(self):
         """
         Implements `str(awards_instance)`
@@ -3036,6 +3344,8 @@ class Gallery(DerpiModel):
     :type  user_id: int
     
     """
+    __slots__ = ('description', 'id', 'spoiler_warning', 'thumbnail_id', 'title', 'user', 'user_id', )
+    _field_names: FrozenSet[str] = frozenset(('description', 'id', 'spoiler_warning', 'thumbnail_id', 'title', 'user', 'user_id', ))
 
     
     """ The gallery's description. """
@@ -3123,20 +3433,13 @@ class Gallery(DerpiModel):
         arguments['title'] = data['title']
         arguments['user'] = data['user']
         arguments['user_id'] = data['user_id']
-        
-        del data['description']
-        del data['id']
-        del data['spoiler_warning']
-        del data['thumbnail_id']
-        del data['title']
-        del data['user']
-        del data['user_id']
 
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
+        if not cls._field_names.issuperset(data):
+            leftover = {key: value for key, value in data.items() if key not in cls._field_names}
+            logger.warning(f'still got leftover data: {leftover!r}')
             if cls._assert_consuming_all_params:
                 raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
+                    f'the dict should be consumed completely, but still has the following elements left: {list(leftover.keys())!r}'
                 )
             # end if
         # end if
@@ -3158,12 +3461,38 @@ class Gallery(DerpiModel):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: Gallery = cls(**data)
+        arguments: Dict = cls.prepare_dict(data)
+        instance: Gallery = cls(**arguments)
+        if not cls.keep_raw:
+            return instance
+        # end if
         instance._raw = data
         return instance
     # end def from_dict
 
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        The json of this Gallery, like the API sent it.
+
+        If created with `from_dict(...)` that is a shallow copy of the original payload, so nothing has to be built.
+        Note that changes of the fields afterwards aren't included then.
+        Otherwise it's built from the fields. Fields not read yet are still in their original json form.
+        """
+        raw = getattr(self, '_raw', None)
+        if raw is not None:
+            return dict(raw)
+        # end if
+        return {
+            'description': self.description,
+            'id': self.id,
+            'spoiler_warning': self.spoiler_warning,
+            'thumbnail_id': self.thumbnail_id,
+            'title': self.title,
+            'user': self.user,
+            'user_id': self.user_id,
+        }
+    # end def to_dict
+
     def __str__(self):
         """
         Implements `str(gallery_instance)`
@@ -3234,6 +3563,8 @@ class ImageErrors(DerpiModel):
     :type  uploaded_image: list
     
     """
+    __slots__ = ('image', 'image_aspect_ratio', 'image_format', 'image_height', 'image_width', 'image_size', 'image_is_animated', 'image_mime_type', 'image_orig_sha512_hash', 'image_sha512_hash', 'tag_input', 'uploaded_image', )
+    _field_names: FrozenSet[str] = frozenset(('image', 'image_aspect_ratio', 'image_format', 'image_height', 'image_width', 'image_size', 'image_is_animated', 'image_mime_type', 'image_orig_sha512_hash', 'image_sha512_hash', 'tag_input', 'uploaded_image', ))
 
     
     """ Errors in the submitted image """
@@ -3366,25 +3697,13 @@ class ImageErrors(DerpiModel):
         arguments['image_sha512_hash'] = data['image_sha512_hash']
         arguments['tag_input'] = data['tag_input']
         arguments['uploaded_image'] = data['uploaded_image']
-        
-        del data['image']
-        del data['image_aspect_ratio']
-        del data['image_format']
-        del data['image_height']
-        del data['image_width']
-        del data['image_size']
-        del data['image_is_animated']
-        del data['image_mime_type']
-        del data['image_orig_sha512_hash']
-        del data['image_sha512_hash']
-        del data['tag_input']
-        del data['uploaded_image']
-
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
+
+        if not cls._field_names.issuperset(data):
+            leftover = {key: value for key, value in data.items() if key not in cls._field_names}
+            logger.warning(f'still got leftover data: {leftover!r}')
             if cls._assert_consuming_all_params:
                 raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
+                    f'the dict should be consumed completely, but still has the following elements left: {list(leftover.keys())!r}'
                 )
             # end if
         # end if
@@ -3406,12 +3725,43 @@ class ImageErrors(DerpiModel):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: ImageErrors = cls(**data)
+        arguments: Dict = cls.prepare_dict(data)
+        instance: ImageErrors = cls(**arguments)
+        if not cls.keep_raw:
+            return instance
+        # end if
         instance._raw = data
         return instance
     # end def from_dict
 
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        The json of this ImageErrors, like the API sent it.
+
+        If created with `from_dict(...)` that is a shallow copy of the original payload, so nothing has to be built.
+        Note that changes of the fields afterwards aren't included then.
+        Otherwise it's built from the fields. Fields not read yet are still in their original json form.
+        """
+        raw = getattr(self, '_raw', None)
+        if raw is not None:
+            return dict(raw)
+        # end if
+        return {
+            'image': self.image,
+            'image_aspect_ratio': self.image_aspect_ratio,
+            'image_format': self.image_format,
+            'image_height': self.image_height,
+            'image_width': self.image_width,
+            'image_size': self.image_size,
+            'image_is_animated': self.image_is_animated,
+            'image_mime_type': self.image_mime_type,
+            'image_orig_sha512_hash': self.image_orig_sha512_hash,
+            'image_sha512_hash': self.image_sha512_hash,
+            'tag_input': self.tag_input,
+            'uploaded_image': self.uploaded_image,
+        }
+    # end def to_dict
+
     def __str__(self):
         """
         Implements `str(imageerrors_instance)`
@@ -3482,6 +3832,8 @@ class Oembed(DerpiModel):
     :type  version: str
     
     """
+    __slots__ = ('author_name', 'author_url', 'cache_age', 'derpibooru_comments', 'derpibooru_id', 'derpibooru_score', 'derpibooru_tags', 'provider_name', 'provider_url', 'title', 'type', 'version', )
+    _field_names: FrozenSet[str] = frozenset(('author_name', 'author_url', 'cache_age', 'derpibooru_comments', 'derpibooru_id', 'derpibooru_score', 'derpibooru_tags', 'provider_name', 'provider_url', 'title', 'type', 'version', ))
 
     
     """ The comma-delimited names of the image authors. """
@@ -3608,31 +3960,19 @@ class Oembed(DerpiModel):
         arguments['derpibooru_comments'] = data['derpibooru_comments']
         arguments['derpibooru_id'] = data['derpibooru_id']
         arguments['derpibooru_score'] = data['derpibooru_score']
-        arguments['derpibooru_tags'] = data['derpibooru_tags']
+        arguments['derpibooru_tags'] = data['derpibooru_tags'] if cls.intern_pool is None else cls.intern_pool.strings(data['derpibooru_tags'])
         arguments['provider_name'] = data['provider_name']
         arguments['provider_url'] = data['provider_url']
         arguments['title'] = data['title']
         arguments['type'] = data['type']
         arguments['version'] = data['version']
-        
-        del data['author_name']
-        del data['author_url']
-        del data['cache_age']
-        del data['derpibooru_comments']
-        del data['derpibooru_id']
-        del data['derpibooru_score']
-        del data['derpibooru_tags']
-        del data['provider_name']
-        del data['provider_url']
-        del data['title']
-        del data['type']
-        del data['version']
-
-        if data:
-            logger.warning(f'still got leftover data: {data!r}')
+
+        if not cls._field_names.issuperset(data):
+            leftover = {key: value for key, value in data.items() if key not in cls._field_names}
+            logger.warning(f'still got leftover data: {leftover!r}')
             if cls._assert_consuming_all_params:
                 raise ValueError(
-                    f'the dict should be consumed completely, but still has the following elements left: {list(data.keys())!r}'
+                    f'the dict should be consumed completely, but still has the following elements left: {list(leftover.keys())!r}'
                 )
             # end if
         # end if
@@ -3654,12 +3994,52 @@ class Oembed(DerpiModel):
             return [cls.from_dict(item) for item in data]
         # end if
 
-        data: Dict = cls.prepare_dict(data)
-        instance: Oembed = cls(**data)
+        arguments: Dict = cls.prepare_dict(data)
+        instance: Oembed = cls(**arguments)
+        if not cls.keep_raw:
+            return instance
+        # end if
+        if cls.intern_pool is not None:
+            # a copy of the payload using the interned tags too, instead of keeping the parsed lists alive.
+            # The caller's dict stays untouched.
+            instance._raw = dict(data, derpibooru_tags=arguments['derpibooru_tags'])
+            return instance
+        # end if
         instance._raw = data
         return instance
     # end def from_dict
 
+    def to_dict(self) -> Dict[str, JSONType]:
+        """
+        The json of this Oembed, like the API sent it.
+
+        If created with `from_dict(...)` that is a shallow copy of the original payload, so nothing has to be built.
+        Note that changes of the fields afterwards aren't included then.
+        Otherwise it's built from the fields. Fields not read yet are still in their original json form.
+        """
+        raw = getattr(self, '_raw', None)
+        if raw is not None:
+            data = dict(raw)
+            # the interned tag lists may be shared, or `array`s with `InternPool(compact_ids=True)`.
+            data['derpibooru_tags'] = json_value(data['derpibooru_tags'])
+            return data
+        # end if
+        return {
+            'author_name': self.author_name,
+            'author_url': self.author_url,
+            'cache_age': self.cache_age,
+            'derpibooru_comments': self.derpibooru_comments,
+            'derpibooru_id': self.derpibooru_id,
+            'derpibooru_score': self.derpibooru_score,
+            'derpibooru_tags': json_value(self.derpibooru_tags),
+            'provider_name': self.provider_name,
+            'provider_url': self.provider_url,
+            'title': self.title,
+            'type': self.type,
+            'version': self.version,
+        }
+    # end def to_dict
+
     def __str__(self):
         """
         Implements `str(oembed_instance)`
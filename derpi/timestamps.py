@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Parsing of the RFC3339 timestamps of the API, only done once a model's timestamp is actually used.
+"""
+import sys
+
+from datetime import datetime, timezone
+from typing import Any, Callable, Union
+
+import iso8601
+from luckydonaldUtils.logger import logging
+
+__author__ = 'luckydonald'
+__all__ = ['FAST_PARSER_AVAILABLE', 'parse_datetime', 'parse_datetime_fast', 'LazyDatetime']
+
+logger = logging.getLogger(__name__)
+if __name__ == '__main__':
+    logging.add_colored_handler(level=logging.DEBUG)
+# end if
+
+
+# Since python 3.11 `datetime.fromisoformat(...)` understands all the formats the API sends, including a `Z` suffix.
+FAST_PARSER_AVAILABLE = sys.version_info >= (3, 11)
+
+
+def parse_datetime(value: str) -> datetime:
+    """
+    Parses a timestamp with `iso8601`. Timestamps without a timezone are in UTC.
+    """
+    return iso8601.parse_date(value)
+# end def
+
+
+def parse_datetime_fast(value: str) -> datetime:
+    """
+    Parses a timestamp with `datetime.fromisoformat(...)`, if available, which is a lot faster than `iso8601`.
+    Timestamps without a timezone are in UTC, like with `parse_datetime(...)`.
+    Everything `fromisoformat` can't handle is given to `parse_datetime(...)` instead.
+    """
+    try:
+        result = datetime.fromisoformat(value)
+    except ValueError:
+        return parse_datetime(value)
+    # end try
+    if result.tzinfo is None:
+        result = result.replace(tzinfo=timezone.utc)
+    # end if
+    return result
+# end def
+
+
+class LazyDatetime(object):
+    """
+    Descriptor for a timestamp field of a model.
+    The API's string is stored as is, in the slot with the same name prefixed by an underscore,
+    and only parsed to a `datetime` when the field is read the first time. The parsed value replaces the string.
+
+    Which parser is used can be changed with `LazyDatetime.parser = ...`.
+    By default that's `parse_datetime_fast` if available, else `parse_datetime`.
+    """
+
+    parser: Callable[[str], datetime] = staticmethod(parse_datetime_fast if FAST_PARSER_AVAILABLE else parse_datetime)
+
+    def __init__(self):
+        self.name: Union[str, None] = None
+        self.slot_name: Union[str, None] = None
+    # end def
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+        self.slot_name = '_' + name
+    # end def
+
+    def __get__(self, instance: Any, owner: type = None) -> Union['LazyDatetime', datetime, None]:
+        if instance is None:
+            return self
+        # end if
+        value = getattr(instance, self.slot_name)
+        if isinstance(value, str):
+            value = LazyDatetime.parser(value)
+            setattr(instance, self.slot_name, value)
+        # end if
+        return value
+    # end def
+
+    def __set__(self, instance: Any, value: Union[datetime, str, None]) -> None:
+        setattr(instance, self.slot_name, value)
+    # end def
+# end class
@@ -78,6 +78,11 @@ setup(
     extras_require={
         'sync': ['requests'],
         'async': ['httpx'],
+        'fast': ['orjson'],
+        'msgspec': ['msgspec'],
+        'numpy': ['numpy'],
+        'zstd': ['zstandard'],
+        'arrow': ['pyarrow'],
     },
     # If there are data files included in your packages that need to be
     # installed, specify them here. If using Python 2.6 or less, then these
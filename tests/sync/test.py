@@ -3,7 +3,7 @@ import iso8601
 import datetime
 from derpi.syncrounous import (
     client, Comment, Image, Intensities, Representations, DerpiModel, Tag, Post, User, Filter,
-    Oembed, Links, Awards, Gallery, Forum, Topic,
+    Oembed, Links, Awards, Gallery, Forum, Topic, SearchResult,
 )
 
 null = None    # jSoN
@@ -478,5 +478,1252 @@ class OfflineTest(unittest.TestCase):
     # end def
 
 
+
+class FakeResponse(object):
+    def __init__(self, data, status_code=200, headers=None):
+        import json
+        self.content = json.dumps(data).encode('utf-8')
+        self.status_code = status_code
+        self.headers = {'content-type': 'application/json; charset=utf-8'}
+        self.headers.update(headers or {})
+    # end def
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8')
+    # end def
+
+    def json(self):
+        import json
+        return json.loads(self.content)
+    # end def
+# end class
+
+
+class FakeAsyncSession(object):
+    """ Like `FakeSession`, but for the async client. """
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests = []
+    # end def
+
+    async def request(self, method, url, params=None, **kwargs):
+        import asyncio
+        self.requests.append((method, url, params))
+        await asyncio.sleep(0.001 * (params or {}).get('page', 0) % 3)  # let them finish out of order
+        return FakeResponse(self.handler(method, url, params))
+    # end def
+# end class
+
+
+def run_async(coroutine):
+    import asyncio
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+    # end try
+# end def
+
+
+class FakeSession(object):
+    """ Answers requests with `handler(method, url, params)`, and remembers them in `self.requests`. """
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests = []
+        self.headers = []
+    # end def
+
+    def request(self, method, url, params=None, headers=None, **kwargs):
+        self.requests.append((method, url, params))
+        self.headers.append(headers)
+        result = self.handler(method, url, params)
+        return result if isinstance(result, FakeResponse) else FakeResponse(result)
+    # end def
+# end class
+
+
+def fake_tag(tag_id):
+    return {
+        "aliased_tag": None, "aliases": [], "category": None, "description": "", "dnp_entries": [], "id": tag_id,
+        "images": 1, "implied_by_tags": [], "implied_tags": [], "name": f"tag {tag_id}", "name_in_namespace": f"tag {tag_id}",
+        "namespace": None, "short_description": "", "slug": f"tag-{tag_id}", "spoiler_image_uri": None,
+    }
+# end def
+
+
+def fake_tag_pages(total):
+    def handler(method, url, params):
+        page = params['page']
+        return {'tags': [fake_tag(i) for i in range((page - 1) * 25, min(page * 25, total))], 'total': total}
+    # end def
+    return handler
+# end def
+
+
+class PaginationTest(unittest.TestCase):
+    def test_iter_stops_on_short_page(self):
+        session = FakeSession(fake_tag_pages(53))
+        tags = list(client.DerpiClient(key=None, client=session).iter_search_tags('*'))
+        self.assertEqual([tag.id for tag in tags], list(range(53)))
+        self.assertEqual([params['page'] for method, url, params in session.requests], [1, 2, 3])
+    # end def
+
+    def test_iter_stops_at_total(self):
+        session = FakeSession(fake_tag_pages(50))
+        tags = list(client.DerpiClient(key=None, client=session).iter_search_tags('*'))
+        self.assertEqual(len(tags), 50)
+        self.assertEqual(len(session.requests), 2)
+    # end def
+
+    def test_with_total(self):
+        result = client.search_tags_with_total('*', page=2, _client=FakeSession(fake_tag_pages(53)))
+        self.assertIsInstance(result, SearchResult)
+        self.assertEqual(result.total, 53)
+        self.assertEqual([tag.id for tag in result.hits], list(range(25, 50)))
+        self.assertEqual(client.search_tags('*', page=2, _client=FakeSession(fake_tag_pages(53))), result.hits)
+    # end def
+
+    def test_async_fan_out(self):
+        from derpi.asyncrounous import client as async_client
+
+        async def collect(**kwargs):
+            session = FakeAsyncSession(fake_tag_pages(260))
+            derpi = async_client.DerpiClient(key=None, client=session)
+            return [tag.id async for tag in derpi.search_tags_all('*', **kwargs)], session.requests
+        # end def
+
+        ids, requests = run_async(collect(concurrency=4))
+        self.assertEqual(ids, list(range(260)))
+        self.assertEqual(len(requests), 11)
+        ids, requests = run_async(collect(concurrency=3, ordered=False))
+        self.assertEqual(sorted(ids), list(range(260)))
+        ids, requests = run_async(collect(max_pages=2))
+        self.assertEqual(ids, list(range(50)))
+    # end def
+
+    def test_iter_max_items(self):
+        session = FakeSession(fake_tag_pages(500))
+        tags = list(client.DerpiClient(key=None, client=session).iter_search_tags('*', max_items=30))
+        self.assertEqual(len(tags), 30)
+        self.assertEqual(len(session.requests), 2)
+    # end def
+
+    def test_iter_max_items_zero(self):
+        from derpi.asyncrounous import client as async_client
+        session = FakeSession(fake_tag_pages(50))
+        self.assertEqual(list(client.DerpiClient(key=None, client=session).iter_search_tags('*', max_items=0)), [])
+        self.assertEqual(session.requests, [])
+
+        async def collect():
+            derpi = async_client.DerpiClient(key=None, client=FakeAsyncSession(fake_tag_pages(50)))
+            return [tag async for tag in derpi.iter_search_tags('*', max_items=0)]
+        # end def
+
+        self.assertEqual(run_async(collect()), [])
+    # end def
+
+    def test_iter_by_id(self):
+        session = FakeSession(fake_image_pages(120))
+        derpi = client.DerpiClient(key=None, client=session)
+        images = list(derpi.iter_search_images_by_id('safe', per_page=50, _raw=True))
+        self.assertEqual([image['id'] for image in images], list(range(120, 0, -1)))
+        self.assertEqual(
+            [params['q'] for method, url, params in session.requests],
+            ['safe', '(safe), id.lt:71', '(safe), id.lt:21'],
+        )
+        self.assertEqual({(params['page'], params['sf'], params['sd']) for method, url, params in session.requests}, {(1, 'id', 'desc')})
+        images = list(derpi.iter_search_images_by_id('safe', per_page=50, before_id=100, max_items=60, _raw=True))
+        self.assertEqual([image['id'] for image in images], list(range(99, 39, -1)))
+    # end def
+
+    def test_async_iter_by_id(self):
+        from derpi.asyncrounous import client as async_client
+
+        async def collect():
+            session = FakeAsyncSession(fake_image_pages(100))
+            derpi = async_client.DerpiClient(key=None, client=session)
+            return [image['id'] async for image in derpi.iter_search_images_by_id('*', per_page=50, _raw=True)], session.requests
+        # end def
+
+        ids, requests = run_async(collect())
+        self.assertEqual(ids, list(range(100, 0, -1)))
+        self.assertEqual(len(requests), 2)  # the `total` of the second page tells there's nothing after it.
+    # end def
+# end class
+
+
+class RateLimiterTest(unittest.TestCase):
+    def test_token_bucket(self):
+        from derpi.ratelimit import TokenBucket
+        bucket = TokenBucket(rate=10, burst=2)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertAlmostEqual(bucket.reserve(), 0.1, places=2)
+        self.assertAlmostEqual(bucket.reserve(), 0.2, places=2)
+    # end def
+
+    def test_per_host(self):
+        from derpi.ratelimit import RateLimiter
+        limiter = RateLimiter(rate=1000, burst=1)
+        self.assertEqual(limiter.acquire('https://derpibooru.org'), 0)
+        self.assertEqual(limiter.acquire('https://furbooru.org'), 0)
+        self.assertGreater(limiter.acquire('https://derpibooru.org'), 0)
+        self.assertGreater(limiter.total_waited('https://derpibooru.org'), 0)
+        self.assertEqual(limiter.total_waited('https://furbooru.org'), 0)
+    # end def
+
+    def test_client_uses_rate_limiter(self):
+        from derpi.ratelimit import RateLimiter
+        limiter = RateLimiter(rate=1000, burst=1)
+        derpi = client.DerpiClient(key=None, client=FakeSession(fake_tag_pages(5)), rate_limiter=limiter)
+        derpi.search_tags('*', page=1)
+        derpi.search_tags('*', page=1)
+        self.assertGreater(limiter.total_waited(client.DerpiClient.DEFAULT_BASE_URL), 0)
+        self.assertIsNone(client.DerpiClient.rate_limiter)
+    # end def
+# end class
+
+
+class RetryTest(unittest.TestCase):
+    def setUp(self):
+        from derpi.retry import RetryPolicy
+        self.policy = RetryPolicy(max_attempts=3, backoff_factor=0, jitter=False)
+    # end def
+
+    def flaky(self, *status_codes, headers=None):
+        answers = [FakeResponse({'error': 'nope'}, status_code=code, headers=headers) for code in status_codes]
+
+        def handler(method, url, params):
+            return answers.pop(0) if answers else {'tag': fake_tag(4)}
+        # end def
+        return FakeSession(handler)
+    # end def
+
+    def test_retries_server_errors(self):
+        session = self.flaky(502, 503)
+        tag = client.DerpiClient(key=None, client=session, retry_policy=self.policy).tag('tag-4')
+        self.assertEqual(tag.id, 4)
+        self.assertEqual(len(session.requests), 3)
+    # end def
+
+    def test_gives_up(self):
+        from derpi.exceptions import DerpiServerError
+        session = self.flaky(500, 500, 500)
+        with self.assertRaises(DerpiServerError) as context:
+            client.DerpiClient(key=None, client=session, retry_policy=self.policy).tag('tag-4')
+        # end with
+        self.assertEqual(context.exception.status_code, 500)
+        self.assertEqual(len(session.requests), 3)
+    # end def
+
+    def test_does_not_retry_not_found(self):
+        from derpi.exceptions import DerpiNotFoundError
+        session = self.flaky(404)
+        with self.assertRaises(DerpiNotFoundError):
+            client.DerpiClient(key=None, client=session, retry_policy=self.policy).tag('tag-4')
+        # end with
+        self.assertEqual(len(session.requests), 1)
+    # end def
+
+    def test_retry_after(self):
+        from derpi.exceptions import DerpiRateLimitedError
+        session = self.flaky(429, headers={'retry-after': '7'})
+        from derpi.retry import RetryPolicy
+        with self.assertRaises(DerpiRateLimitedError) as context:
+            client.DerpiClient(key=None, client=session, retry_policy=RetryPolicy(max_attempts=1)).tag('tag-4')
+        # end with
+        self.assertEqual(context.exception.retry_after, 7)
+        self.assertEqual(self.policy.delay(1, context.exception), 7)
+    # end def
+
+    def test_post_is_not_retried(self):
+        self.assertFalse(self.policy.should_retry('POST', 1, client.DerpiConnectionError('reset')))
+        self.assertTrue(self.policy.should_retry('GET', 1, client.DerpiConnectionError('reset')))
+        self.assertFalse(self.policy.should_retry('GET', 3, client.DerpiConnectionError('reset')))
+    # end def
+# end class
+
+
+class ModelCacheTest(unittest.TestCase):
+    def test_lookup_is_cached(self):
+        from derpi.cache import ModelCache
+        cache = ModelCache()
+        session = FakeSession(lambda method, url, params: {'tag': fake_tag(int(url.rsplit('-', 1)[-1]))})
+        derpi = client.DerpiClient(key=None, client=session, cache=cache)
+        first = derpi.tag('tag-4')
+        self.assertIs(derpi.tag('tag-4'), first)
+        self.assertEqual(derpi.tag('tag-5').id, 5)
+        self.assertEqual(len(session.requests), 2)
+        self.assertEqual(cache.stats(), {'hits': 1, 'misses': 2, 'size': 2})
+        self.assertEqual(cache.hits, {'tag': 1})
+    # end def
+
+    def test_lru_and_ttl(self):
+        from derpi.cache import ModelCache
+        cache = ModelCache(max_size=2, ttl=60, route_ttls={'image': -1})
+        for i in range(3):
+            cache.set(cache.make_key('tag', f'url/{i}'), i)
+        # end for
+        self.assertIsNone(cache.get(cache.make_key('tag', 'url/0')))
+        self.assertEqual(cache.get(cache.make_key('tag', 'url/2')), 2)
+        cache.set(cache.make_key('image', 'url/1'), 1)
+        self.assertIsNone(cache.get(cache.make_key('image', 'url/1')))  # already expired
+    # end def
+
+    def test_key_is_hashed(self):
+        from derpi.cache import ModelCache
+        key = ModelCache.make_key('image', 'url/1', {'key': 'secret', 'filter_id': None})
+        self.assertNotIn('secret', repr(key))
+        self.assertNotEqual(key, ModelCache.make_key('image', 'url/1', {'key': 'other'}))
+        self.assertEqual(ModelCache.make_key('image', 'url/1', {'filter_id': None}), ModelCache.make_key('image', 'url/1'))
+    # end def
+# end class
+
+
+class ConnectionPoolTest(unittest.TestCase):
+    class FakeSession(object):
+        def __init__(self, max_connections, keepalive_expiry):
+            self.max_connections = max_connections
+            self.keepalive_expiry = keepalive_expiry
+            self.closed = False
+        # end def
+
+        def close(self):
+            self.closed = True
+        # end def
+    # end class
+
+    def test_reuses_client(self):
+        from derpi.pool import ConnectionPool
+        pool = ConnectionPool(factory=self.FakeSession, max_connections=3)
+        first = pool.get()
+        self.assertIs(first, pool.get())
+        self.assertEqual(first.max_connections, 3)
+    # end def
+
+    def test_keeps_idle_client(self):
+        from derpi.pool import ConnectionPool
+        pool = ConnectionPool(factory=self.FakeSession, keepalive_expiry=0)
+        first = pool.get()
+        self.assertIs(first, pool.get())  # expiring idle connections is up to the client.
+        self.assertEqual(first.keepalive_expiry, 0)
+        self.assertFalse(first.closed)
+    # end def
+
+    def test_configure(self):
+        import time
+        from derpi.pool import ConnectionPool
+        pool = ConnectionPool(factory=self.FakeSession, max_connections=3)
+        pool.close_delay = 0.05
+        first = pool.get()
+        pool.configure(keepalive_expiry=None)
+        self.assertFalse(first.closed)  # other threads might still use it.
+        self.assertIsNot(first, pool.get())
+        self.assertIsNone(pool.get().keepalive_expiry)
+        self.assertEqual(pool.get().max_connections, 3)
+        pool.configure(max_connections=4)
+        self.assertIsNone(pool.get().keepalive_expiry)
+        self.assertEqual(pool.get().max_connections, 4)
+        time.sleep(0.2)
+        self.assertTrue(first.closed)
+    # end def
+
+    def test_close(self):
+        from derpi.pool import ConnectionPool
+        pool = ConnectionPool(factory=self.FakeSession)
+        first = pool.get()
+        pool.close()
+        self.assertTrue(first.closed)
+        self.assertIsNot(first, pool.get())
+    # end def
+
+    def test_default_client_uses_pool(self):
+        self.assertIsInstance(client.DerpiClient.pool.get(), client.CLIENT_TYPE)
+    # end def
+# end class
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def setUp(self):
+        import tempfile
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = self.directory.name + '/cache.sqlite'
+    # end def
+
+    def tearDown(self):
+        self.directory.cleanup()
+    # end def
+
+    def test_survives_restart(self):
+        from derpi.response_cache import SQLiteResponseCache
+        session = FakeSession(lambda method, url, params: {'tag': fake_tag(4)})
+        derpi = client.DerpiClient(key=None, client=session, response_cache=SQLiteResponseCache(self.path))
+        self.assertEqual(derpi.tag('tag-4').id, 4)
+        derpi.response_cache.close()
+        # a new process, with a new cache on the same file
+        offline = FakeSession(lambda method, url, params: self.fail('should be served from disk'))
+        derpi = client.DerpiClient(key=None, client=offline, response_cache=SQLiteResponseCache(self.path, ttl=None))
+        self.assertEqual(derpi.tag('tag-4').id, 4)
+        self.assertEqual(derpi.response_cache.hits, 1)
+        self.assertEqual(len(offline.requests), 0)
+    # end def
+
+    def test_ttl(self):
+        from derpi.response_cache import SQLiteResponseCache
+        cache = SQLiteResponseCache(self.path, ttl=-1)
+        key = cache.make_key('GET', 'url/1', {'page': 1, 'q': None})
+        self.assertEqual(key, cache.make_key('GET', 'url/1', {'page': 1}))
+        cache.set(key, url='url/1', body=b'{}')
+        self.assertIsNone(cache.get(key))
+        cache.evict()
+        self.assertEqual(len(cache), 0)
+    # end def
+
+    def test_evicts_least_recently_used(self):
+        from derpi.response_cache import SQLiteResponseCache
+        cache = SQLiteResponseCache(self.path, max_bytes=20, evict_every=1)
+        for i in range(3):
+            cache.set(f'key-{i}', url=f'url/{i}', body=b'0123456789')
+            cache.get('key-0')
+        # end for
+        self.assertEqual(cache.get('key-0'), b'0123456789')
+        self.assertIsNone(cache.get('key-1'))
+        self.assertEqual(cache.get('key-2'), b'0123456789')
+    # end def
+# end class
+
+
+class ConditionalRequestTest(unittest.TestCase):
+    @staticmethod
+    def etag_handler(headers):
+        def handler(method, url, params):
+            if (headers[-1] or {}).get('If-None-Match') == '"v1"':
+                return FakeResponse(None, status_code=304, headers={'content-type': ''})
+            # end if
+            return FakeResponse({'tag': fake_tag(4)}, headers={'etag': '"v1"'})
+        # end def
+        return handler
+    # end def
+
+    def test_model_cache_revalidation(self):
+        from derpi.cache import ModelCache
+        cache = ModelCache(ttl=-1)  # always expired
+        session = FakeSession(None)
+        session.handler = self.etag_handler(session.headers)
+        derpi = client.DerpiClient(key=None, client=session, cache=cache)
+        first = derpi.tag('tag-4')
+        self.assertIs(derpi.tag('tag-4'), first)
+        self.assertEqual(session.headers, [None, {'If-None-Match': '"v1"'}])
+        self.assertEqual(cache.revalidations, {'tag': 1})
+    # end def
+
+    def test_response_cache_revalidation(self):
+        import tempfile
+        from derpi.response_cache import SQLiteResponseCache
+        with tempfile.TemporaryDirectory() as directory:
+            response_cache = SQLiteResponseCache(directory + '/cache.sqlite', ttl=-1)
+            session = FakeSession(None)
+            session.handler = self.etag_handler(session.headers)
+            derpi = client.DerpiClient(key=None, client=session, response_cache=response_cache)
+            self.assertEqual(derpi.tag('tag-4').id, 4)
+            self.assertEqual(derpi.tag('tag-4').id, 4)
+            self.assertEqual(session.headers, [None, {'If-None-Match': '"v1"'}])
+            self.assertEqual(response_cache.revalidations, 1)
+            response_cache.close()
+        # end with
+    # end def
+
+    def test_evicted_while_revalidating(self):
+        import tempfile
+        from derpi.response_cache import SQLiteResponseCache
+        from derpi.retry import RetryPolicy
+        with tempfile.TemporaryDirectory() as directory:
+            response_cache = SQLiteResponseCache(directory + '/cache.sqlite', ttl=-1)
+            response_cache.revalidated = lambda key: None  # gone before the `304` arrived
+            answers = [
+                FakeResponse({'tag': fake_tag(4)}, headers={'etag': '"v1"'}),
+                FakeResponse(None, status_code=304, headers={'content-type': ''}),
+                FakeResponse({'error': 'nope'}, status_code=503),
+                FakeResponse({'tag': fake_tag(4)}, headers={'etag': '"v1"'}),
+            ]
+            session = FakeSession(lambda method, url, params: answers.pop(0))
+            policy = RetryPolicy(max_attempts=2, backoff_factor=0, jitter=False)
+            derpi = client.DerpiClient(key=None, client=session, response_cache=response_cache, retry_policy=policy)
+            self.assertEqual(derpi.tag('tag-4').id, 4)
+            # the request without validators after the `304` is no retry, so the `503` still can be retried once.
+            self.assertEqual(derpi.tag('tag-4').id, 4)
+            self.assertEqual(session.headers, [None, {'If-None-Match': '"v1"'}, {}, {}])
+            response_cache.close()
+        # end with
+    # end def
+
+    def test_retry_after_date(self):
+        import os
+        import time
+        from email.utils import formatdate
+        from derpi.exceptions import parse_retry_after
+        if not hasattr(time, 'tzset'):
+            self.skipTest('needs time.tzset()')
+        # end if
+        previous = os.environ.get('TZ')
+        try:
+            os.environ['TZ'] = 'America/New_York'  # a date without zone must not be read as local time.
+            time.tzset()
+            in_a_minute = formatdate(time.time() + 60, usegmt=True)
+            self.assertAlmostEqual(parse_retry_after(in_a_minute), 60, delta=2)
+            self.assertAlmostEqual(parse_retry_after(in_a_minute.replace('GMT', '-0000')), 60, delta=2)
+        finally:
+            if previous is None:
+                del os.environ['TZ']
+            else:
+                os.environ['TZ'] = previous
+            # end if
+            time.tzset()
+        # end try
+    # end def
+
+    def test_unexpected_not_modified(self):
+        from derpi.exceptions import DerpiHttpError
+        session = FakeSession(lambda method, url, params: FakeResponse(None, status_code=304))
+        derpi = client.DerpiClient(key=None, client=session)
+        with self.assertRaises(DerpiHttpError):
+            derpi.tag('tag-4')
+        # end with
+    # end def
+# end class
+
+
+class SingleFlightTest(unittest.TestCase):
+    def test_threads_share_request(self):
+        import threading
+        import time
+        from derpi.singleflight import SingleFlight
+        barrier = threading.Barrier(5)
+
+        def handler(method, url, params):
+            time.sleep(0.2)
+            return {'tag': fake_tag(4)}
+        # end def
+
+        session = FakeSession(handler)
+        derpi = client.DerpiClient(key=None, client=session, single_flight=SingleFlight())
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(derpi.tag('tag-4'))
+        # end def
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        # end for
+        for thread in threads:
+            thread.join()
+        # end for
+        self.assertEqual([tag.id for tag in results], [4] * 5)
+        self.assertEqual(len(session.requests), 1)
+        self.assertEqual(derpi.single_flight.shared, 4)
+    # end def
+
+    def test_threads_share_error(self):
+        from derpi.singleflight import SingleFlight
+        single_flight = SingleFlight()
+        with self.assertRaises(ValueError):
+            single_flight.do('key', lambda: int('nope'))
+        # end with
+        self.assertEqual(single_flight.do('key', lambda: 4), 4)  # not remembered afterwards
+    # end def
+
+    def test_tasks_share_request(self):
+        import asyncio
+        from derpi.asyncrounous import client as async_client
+        from derpi.singleflight import AsyncSingleFlight
+        session = FakeAsyncSession(lambda method, url, params: {'tag': fake_tag(4)})
+        derpi = async_client.DerpiClient(key=None, client=session, single_flight=AsyncSingleFlight())
+
+        async def main():
+            return await asyncio.gather(*[derpi.tag('tag-4') for _ in range(5)], derpi.tag('tag-5'))
+        # end def
+
+        results = run_async(main())
+        self.assertEqual([tag.id for tag in results], [4] * 6)
+        self.assertEqual(len(session.requests), 2)
+        self.assertEqual(derpi.single_flight.shared, 4)
+    # end def
+# end class
+
+
+class SlotsTest(unittest.TestCase):
+    def test_models_have_no_dict(self):
+        tag = Tag.from_dict(fake_tag(4))
+        self.assertFalse(hasattr(tag, '__dict__'))
+        self.assertEqual(tag.id, 4)
+        tag.name = 'changed'
+        self.assertEqual(tag.name, 'changed')
+        with self.assertRaises(AttributeError):
+            tag.not_a_field = 1
+        # end with
+    # end def
+# end class
+
+
+class PrepareDictTest(unittest.TestCase):
+    def test_input_is_not_modified(self):
+        data = fake_tag(4)
+        expected = dict(data)
+        Tag.from_dict(data)
+        self.assertEqual(data, expected)
+    # end def
+
+    def test_leftover_data(self):
+        data = fake_tag(4)
+        data['new_field'] = 1
+        with self.assertRaises(ValueError) as context:
+            Tag.from_dict(data)
+        # end with
+        self.assertIn("['new_field']", str(context.exception))
+    # end def
+# end class
+
+
+class LazyDatetimeTest(unittest.TestCase):
+    def test_parsed_on_first_read(self):
+        links = Links.from_dict({'created_at': '2018-05-02T20:42:44', 'state': 'verified', 'tag_id': 53157, 'user_id': 264159})
+        self.assertEqual(links._created_at, '2018-05-02T20:42:44')
+        expected = datetime.datetime(2018, 5, 2, 20, 42, 44, tzinfo=datetime.timezone.utc)
+        self.assertEqual(links.created_at, expected)
+        self.assertIs(links._created_at, links.created_at)  # the parsed value is kept
+    # end def
+
+    def test_fast_parser_matches_iso8601(self):
+        from derpi.timestamps import parse_datetime, parse_datetime_fast
+        for value in ['2018-05-02T20:42:44', '2018-05-02T20:35:09Z', '2019-05-02T05:33:36.123456+02:00', '2018-05-02']:
+            self.assertEqual(parse_datetime_fast(value), parse_datetime(value), value)
+            self.assertIsNotNone(parse_datetime_fast(value).tzinfo, value)
+        # end for
+    # end def
+# end class
+
+
+class LazyModelTest(unittest.TestCase):
+    def test_built_on_first_read(self):
+        user = User.from_dict({
+            'id': 264159, 'name': 'luckydonald', 'slug': 'luckydonald', 'role': 'user', 'description': None,
+            'avatar_url': None, 'created_at': '2013-05-02T16:07:03', 'comments_count': 10, 'uploads_count': 12,
+            'posts_count': 3, 'topics_count': 0,
+            'links': [{'created_at': '2018-05-02T20:42:44', 'state': 'verified', 'tag_id': 53157, 'user_id': 264159}],
+            'awards': [],
+        })
+        self.assertNotIsInstance(user._links, list)  # not built yet
+        links = user.links
+        self.assertEqual(links, [Links.from_dict({'created_at': '2018-05-02T20:42:44', 'state': 'verified', 'tag_id': 53157, 'user_id': 264159})])
+        self.assertIs(user.links, links)  # the built models are kept
+        self.assertIsNone(user.awards)  # like `Awards.from_dict([])`
+    # end def
+
+    def test_models_are_kept(self):
+        link = Links.from_dict({'created_at': '2018-05-02T20:42:44', 'state': 'verified', 'tag_id': 53157, 'user_id': 264159})
+        representations = Representations(full='f', large='l', medium='m', small='s', tall='t', thumb='t', thumb_small='ts', thumb_tiny='tt')
+        user = User(
+            id=1, name='a', slug='a', role='user', description=None, avatar_url=None, created_at=None,
+            comments_count=0, uploads_count=0, posts_count=0, topics_count=0, links=[link], awards=None,
+        )
+        self.assertIs(user.links[0], link)
+        self.assertIsNone(user.awards)
+        image = Image.__new__(Image)
+        image.representations = representations
+        self.assertIs(image.representations, representations)
+        image.representations = {'full': 'f', 'large': 'l', 'medium': 'm', 'small': 's', 'tall': 't', 'thumb': 't', 'thumb_small': 'ts', 'thumb_tiny': 'tt'}
+        self.assertEqual(image.representations, representations)  # dicts are built too
+    # end def
+# end class
+
+
+class RawModeTest(unittest.TestCase):
+    def test_single(self):
+        session = FakeSession(lambda method, url, params: {'tag': fake_tag(4)})
+        self.assertEqual(client.tag('tag-4', _client=session, _raw=True), fake_tag(4))
+        self.assertEqual(client.DerpiClient(key=None, client=session).tag('tag-4', _raw=True), fake_tag(4))
+    # end def
+
+    def test_pages(self):
+        result = client.search_tags_with_total('*', page=2, _client=FakeSession(fake_tag_pages(53)), _raw=True)
+        self.assertEqual(result.total, 53)
+        self.assertEqual(result.hits, [fake_tag(i) for i in range(25, 50)])
+        self.assertEqual(client.search_tags('*', page=2, _client=FakeSession(fake_tag_pages(53)), _raw=True), result.hits)
+        tags = list(client.DerpiClient(key=None, client=FakeSession(fake_tag_pages(53))).iter_search_tags('*', _raw=True))
+        self.assertEqual(tags, [fake_tag(i) for i in range(53)])
+    # end def
+
+    def test_skips_cache(self):
+        from derpi.cache import ModelCache
+        session = FakeSession(lambda method, url, params: {'tag': fake_tag(4)})
+        derpi = client.DerpiClient(key=None, client=session, cache=ModelCache())
+        self.assertIsInstance(derpi.tag('tag-4', _raw=True), dict)
+        self.assertIsInstance(derpi.tag('tag-4'), Tag)  # the raw result wasn't cached
+        self.assertEqual(len(session.requests), 2)
+    # end def
+# end class
+
+
+def fake_user():
+    return {
+        'id': 264159, 'name': 'luckydonald', 'slug': 'luckydonald', 'role': 'user', 'description': None,
+        'avatar_url': None, 'created_at': '2013-05-02T16:07:03', 'comments_count': 10, 'uploads_count': 12,
+        'posts_count': 3, 'topics_count': 0,
+        'links': [{'created_at': '2018-05-02T20:42:44', 'state': 'verified', 'tag_id': 53157, 'user_id': 264159}],
+        'awards': [{'awarded_on': '2018-05-02T20:35:09Z', 'id': 27, 'image_url': 'url', 'label': None, 'title': 'Artist'}],
+    }
+# end def
+
+
+class ToDictTest(unittest.TestCase):
+    def test_keeps_payload(self):
+        from derpi.serialization import loads
+        data = fake_user()
+        user = User.from_dict(data)
+        self.assertIs(user._raw, data)
+        self.assertEqual(user.links[0].tag_id, 53157)
+        self.assertEqual(user.to_dict(), fake_user())
+        self.assertIsNot(user.to_dict(), data)
+        self.assertEqual(loads(user.to_json_bytes()), fake_user())
+    # end def
+
+    def test_built_from_fields(self):
+        from derpi.serialization import loads
+        previous = DerpiModel.keep_raw
+        try:
+            DerpiModel.keep_raw = False
+            user = User.from_dict(fake_user())
+            self.assertIsNone(getattr(user, '_raw', None))
+            self.assertEqual(user.to_dict(), fake_user())  # nothing read yet
+            self.assertEqual(user.created_at.year, 2013)
+            self.assertEqual(user.awards[0].awarded_on.year, 2018)
+            expected = fake_user()
+            expected['created_at'] = '2013-05-02T16:07:03+00:00'
+            expected['awards'][0]['awarded_on'] = '2018-05-02T20:35:09+00:00'
+            self.assertEqual(user.to_dict(), expected)
+            self.assertEqual(loads(user.to_json_bytes()), expected)
+        finally:
+            DerpiModel.keep_raw = previous
+        # end try
+    # end def
+# end class
+
+
+class SerializationTest(unittest.TestCase):
+    def test_backends_agree(self):
+        from derpi.serialization import BACKENDS
+        body = FakeResponse({'tag': fake_tag(4), 'text': 'ünïcödé'}).content
+        for name, loads in BACKENDS.items():
+            self.assertEqual(loads(body), {'tag': fake_tag(4), 'text': 'ünïcödé'}, name)
+        # end for
+    # end def
+
+    def test_encoders_agree(self):
+        from derpi.serialization import ENCODERS, loads
+        value = {'tag': Tag.from_dict(fake_tag(4)), 'at': datetime.datetime(2019, 5, 2, tzinfo=datetime.timezone.utc)}
+        for name, dumps in ENCODERS.items():
+            result = loads(dumps(value))
+            self.assertEqual(result['tag'], fake_tag(4), name)
+            self.assertEqual(iso8601.parse_date(result['at']), value['at'], name)  # msgspec writes `Z` instead of `+00:00`
+        # end for
+    # end def
+
+    def test_use_backend(self):
+        from derpi import serialization
+        previous = serialization.backend
+        try:
+            serialization.use_backend('json')
+            self.assertEqual(serialization.backend, 'json')
+            session = FakeSession(lambda method, url, params: {'tag': fake_tag(4)})
+            self.assertEqual(client.tag('tag-4', _client=session).id, 4)
+            with self.assertRaises(ValueError):
+                serialization.use_backend('yaml')
+            # end with
+        finally:
+            serialization.use_backend(previous)
+        # end try
+    # end def
+# end class
+
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+# end try
+
+
+@unittest.skipIf(msgspec is None, 'msgspec is not installed')
+class StructsTest(unittest.TestCase):
+    def test_matches_models(self):
+        import json
+        from derpi import structs
+        data = {
+            'id': 264159, 'name': 'luckydonald', 'slug': 'luckydonald', 'role': 'user', 'description': None,
+            'avatar_url': None, 'created_at': '2013-05-02T16:07:03', 'comments_count': 10, 'uploads_count': 12,
+            'posts_count': 3, 'topics_count': 0,
+            'links': [{'created_at': '2018-05-02T20:42:44', 'state': 'verified', 'tag_id': 53157, 'user_id': 264159}],
+            'awards': [{'awarded_on': '2018-05-02T20:35:09Z', 'id': 27, 'image_url': 'url', 'label': None, 'title': 'Artist'}],
+        }
+        model = User.from_dict(dict(data))
+        struct = structs.decode_user(json.dumps({'user': data}).encode('utf-8'))
+        self.assertEqual(struct.created_at, model.created_at)
+        self.assertEqual(struct.created_at.tzinfo, datetime.timezone.utc)
+        self.assertEqual(struct.links[0].created_at, model.links[0].created_at)
+        self.assertEqual(struct.awards[0].awarded_on, model.awards[0].awarded_on)
+        self.assertEqual(struct.name, model.name)
+    # end def
+
+    def test_search_with_total(self):
+        import json
+        from derpi import structs
+        body = json.dumps({'tags': [fake_tag(1), fake_tag(2)], 'total': 2}).encode('utf-8')
+        result = structs.decode_search_tags_with_total(body)
+        self.assertEqual([tag.id for tag in result.hits], [1, 2])
+        self.assertEqual(result.total, 2)
+        self.assertEqual([tag.slug for tag in structs.decode_search_tags(body)], ['tag-1', 'tag-2'])
+    # end def
+# end class
+
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+# end try
+
+
+def fake_image(image_id, score=0, tag_ids=(), created_at='2019-05-02T05:33:36'):
+    return {
+        'id': image_id, 'score': score, 'upvotes': score, 'downvotes': 0, 'faves': 0, 'comment_count': 0,
+        'width': 100, 'height': 50, 'size': 1000, 'tag_count': len(tag_ids), 'wilson_score': 0.5, 'aspect_ratio': 2.0,
+        'duration': None, 'created_at': created_at, 'first_seen_at': created_at, 'updated_at': created_at,
+        'tag_ids': list(tag_ids),
+    }
+# end def
+
+
+def fake_full_image(image_id, tag_ids=(), tags=()):
+    data = fake_image(image_id, tag_ids=tag_ids)
+    data.update({
+        'animated': False, 'deletion_reason': None, 'description': '', 'duplicate_of': None, 'duration': 0.0,
+        'format': 'png', 'hidden_from_users': False, 'intensities': None, 'mime_type': 'image/png', 'name': 'a.png',
+        'orig_sha512_hash': '', 'processed': True, 'representations': {}, 'sha512_hash': '', 'source_url': '',
+        'spoilered': False, 'tags': list(tags), 'thumbnails_generated': True, 'uploader': None, 'uploader_id': None,
+        'view_url': '',
+    })
+    return data
+# end def
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class ImageBatchTest(unittest.TestCase):
+    def test_search_images_batch(self):
+        session = FakeSession(lambda method, url, params: {
+            'images': [fake_image(1, 10, [5, 6]), fake_image(2, 200, []), fake_image(3, 300, [6, 7, 8], '2020-01-01T00:00:00Z')],
+            'total': 3,
+        })
+        batch = client.search_images_batch('*', _client=session)
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(batch.total, 3)
+        self.assertEqual(batch.id.tolist(), [1, 2, 3])
+        self.assertTrue(numpy.isnan(batch.duration).all())
+        self.assertEqual(str(batch.created_at[2]), '2020-01-01T00:00:00.000000')
+        self.assertEqual(batch.tag_offsets.tolist(), [0, 2, 2, 5])
+        self.assertEqual(batch.tags_of(2).tolist(), [6, 7, 8])
+        self.assertEqual(batch.has_tag(6).tolist(), [True, False, True])
+        popular = batch[batch.score > 100]
+        self.assertEqual(popular.id.tolist(), [2, 3])
+        self.assertEqual(popular.tag_offsets.tolist(), [0, 0, 3])
+        self.assertEqual(popular.tag_ids.tolist(), [6, 7, 8])
+    # end def
+
+    def test_concatenate(self):
+        from derpi.batch import ImageBatch
+        first = ImageBatch.from_dicts([fake_image(1, tag_ids=[1]), fake_image(2, tag_ids=[2, 3])])
+        second = ImageBatch.from_images([Image.from_dict(fake_full_image(3, [4]))])
+        batch = ImageBatch.concatenate([first, second])
+        self.assertEqual(batch.id.tolist(), [1, 2, 3])
+        self.assertEqual(batch.tags_of(2).tolist(), [4])
+        self.assertEqual(batch.created_at[2], numpy.datetime64('2019-05-02T05:33:36'))
+    # end def
+# end class
+
+
+class InternPoolTest(unittest.TestCase):
+    def test_tags_are_shared(self):
+        import json
+        from array import array
+        from derpi.intern import InternPool
+        first, second = fake_tag(1), fake_tag(2)
+        first['implied_tags'] = ['safe', 'pony']
+        second['implied_tags'] = ['pony', 'safe']
+        first, second = json.loads(json.dumps([first, second]))  # new string objects, like parsed responses have
+        self.assertIsNot(first['implied_tags'][0], second['implied_tags'][1])
+        previous = DerpiModel.intern_pool
+        try:
+            DerpiModel.intern_pool = InternPool()
+            first, second = Tag.from_dict(first), Tag.from_dict(second)
+            self.assertIs(first.implied_tags[0], second.implied_tags[1])
+            self.assertEqual(first.implied_tags, ['safe', 'pony'])
+            DerpiModel.intern_pool = InternPool(compact_ids=True)
+            data = {'id': 1, 'name': 'f', 'description': '', 'public': True, 'system': True, 'user_count': 0,
+                    'user_id': None, 'spoilered_tag_ids': [1, 2], 'hidden_tag_ids': [3], 'hidden_complex': None,
+                    'spoilered_complex': None}
+            self.assertEqual(Filter.from_dict(data).hidden_tag_ids, array('I', [3]))
+        finally:
+            DerpiModel.intern_pool = previous
+        # end try
+    # end def
+
+    def test_input_is_not_modified(self):
+        import json
+        from derpi.intern import InternPool
+        data = fake_full_image(1, tag_ids=[24249, 26029], tags=['safe', 'pony'])
+        expected = json.loads(json.dumps(data))
+        previous = DerpiModel.intern_pool
+        try:
+            DerpiModel.intern_pool = InternPool(compact_ids=True)
+            image = Image.from_dict(data)
+        finally:
+            DerpiModel.intern_pool = previous
+        # end try
+        self.assertEqual(data, expected)
+        self.assertIsInstance(data['tag_ids'], list)
+        self.assertEqual(json.loads(json.dumps(data)), expected)
+        self.assertEqual(image.to_dict(), expected)
+        self.assertIsInstance(image.to_dict()['tag_ids'], list)
+        self.assertEqual(json.loads(json.dumps(image.to_dict())), expected)
+        self.assertEqual(json.loads(image.to_json_bytes()), expected)
+        image._raw = None  # built from the fields
+        self.assertIsInstance(image.to_dict()['tag_ids'], list)
+        self.assertEqual(json.loads(json.dumps(image.to_dict()))['tags'], ['safe', 'pony'])
+    # end def
+# end class
+
+
+def fake_image_pages(total, fail_after=None):
+    """
+    Images `total` to `1`, newest first. Understands `id.lt:` in the query, like the keyset pagination uses.
+    Answers with an error after `fail_after` requests.
+    """
+    requests = []
+
+    def handler(method, url, params):
+        requests.append(params)
+        if fail_after is not None and len(requests) > fail_after:
+            return FakeResponse({}, status_code=503)
+        # end if
+        ids = list(range(total, 0, -1))
+        if 'id.lt:' in params['q']:
+            last_id = int(params['q'].split('id.lt:')[1])
+            ids = [image_id for image_id in ids if image_id < last_id]
+        # end if
+        per_page = params['per_page']
+        page = ids[(params['page'] - 1) * per_page:params['page'] * per_page]
+        return {'images': [fake_image(image_id) for image_id in page], 'total': len(ids)}
+    # end def
+    return handler
+# end def
+
+
+class JsonlExportTest(unittest.TestCase):
+    def setUp(self):
+        import tempfile
+        self.directory = tempfile.TemporaryDirectory()
+    # end def
+
+    def tearDown(self):
+        self.directory.cleanup()
+    # end def
+
+    def read_ids(self, path):
+        import gzip
+        from derpi.serialization import loads
+        with (gzip.open(path, 'rb') if path.endswith('.gz') else open(path, 'rb')) as file:
+            return [loads(line)['id'] for line in file]
+        # end with
+    # end def
+
+    def test_export(self):
+        from derpi.export import search_images_to_jsonl
+        for name in ['images.jsonl', 'images.jsonl.gz']:
+            path = self.directory.name + '/' + name
+            derpi = client.DerpiClient(key=None, client=FakeSession(fake_image_pages(120)))
+            self.assertEqual(search_images_to_jsonl('*', path, client=derpi), 120)
+            self.assertEqual(self.read_ids(path), list(range(120, 0, -1)))
+        # end for
+    # end def
+
+    def test_resume(self):
+        from derpi.export import search_images_to_jsonl
+        from derpi.exceptions import DerpiException
+        from derpi.retry import RetryPolicy
+        for resume_by in ['page', 'id']:
+            path = self.directory.name + f'/images-{resume_by}.jsonl.gz'
+            session = FakeSession(fake_image_pages(230, fail_after=3))
+            derpi = client.DerpiClient(key=None, client=session, retry_policy=RetryPolicy(max_attempts=1))
+            with self.assertRaises(DerpiException):
+                search_images_to_jsonl('*', path, per_page=50, resume_by=resume_by, checkpoint_every=2, client=derpi)
+            # end with
+            session = FakeSession(fake_image_pages(230))
+            derpi = client.DerpiClient(key=None, client=session)
+            self.assertEqual(search_images_to_jsonl('*', path, per_page=50, resume_by=resume_by, checkpoint_every=2, client=derpi), 230)
+            self.assertEqual(self.read_ids(path), list(range(230, 0, -1)), resume_by)
+            self.assertEqual(len(session.requests), 3, resume_by)  # continued after the 2nd page
+            # a finished export isn't requested again
+            self.assertEqual(search_images_to_jsonl('*', path, per_page=50, resume_by=resume_by, checkpoint_every=2, client=derpi), 230)
+            self.assertEqual(len(session.requests), 3, resume_by)
+        # end for
+    # end def
+
+    def test_stale_checkpoint(self):
+        import os
+        from derpi.export import search_images_to_jsonl
+        from derpi.exceptions import DerpiException
+        from derpi.retry import RetryPolicy
+        path = self.directory.name + '/images.jsonl'
+        no_retries = RetryPolicy(max_attempts=1)
+        derpi = client.DerpiClient(key=None, client=FakeSession(fake_image_pages(230, fail_after=4)), retry_policy=no_retries)
+        with self.assertRaises(DerpiException):
+            search_images_to_jsonl('*', path, per_page=50, checkpoint_every=2, client=derpi)
+        # end with
+        self.assertTrue(os.path.exists(path + '.checkpoint'))
+        # a fresh run stopping before it's first checkpoint leaves a file shorter than the old checkpoint.
+        derpi = client.DerpiClient(key=None, client=FakeSession(fake_image_pages(230, fail_after=1)), retry_policy=no_retries)
+        with self.assertRaises(DerpiException):
+            search_images_to_jsonl('*', path, per_page=50, resume=False, checkpoint_every=10, client=derpi)
+        # end with
+        self.assertFalse(os.path.exists(path + '.checkpoint'))
+        session = FakeSession(fake_image_pages(230))
+        derpi = client.DerpiClient(key=None, client=session)
+        self.assertEqual(search_images_to_jsonl('*', path, per_page=50, checkpoint_every=2, client=derpi), 230)
+        self.assertEqual(self.read_ids(path), list(range(230, 0, -1)))
+        self.assertEqual(len(session.requests), 5)
+        # a checkpoint without it's file starts over as well.
+        os.remove(path)
+        self.assertEqual(search_images_to_jsonl('*', path, per_page=50, checkpoint_every=2, client=derpi), 230)
+        self.assertEqual(self.read_ids(path), list(range(230, 0, -1)))
+    # end def
+
+    def test_max_items_and_async(self):
+        from derpi.export import async_search_images_to_jsonl
+        from derpi.asyncrounous import client as async_client
+        path = self.directory.name + '/images.jsonl'
+        derpi = async_client.DerpiClient(key=None, client=FakeAsyncSession(fake_image_pages(120)))
+        self.assertEqual(run_async(async_search_images_to_jsonl('*', path, max_items=70, client=derpi)), 70)
+        self.assertEqual(self.read_ids(path), list(range(120, 50, -1)))
+    # end def
+
+    def test_other_parameters(self):
+        from derpi.export import search_images_to_jsonl
+        path = self.directory.name + '/images.jsonl'
+        derpi = client.DerpiClient(key=None, client=FakeSession(fake_image_pages(10)))
+        search_images_to_jsonl('*', path, client=derpi)
+        with self.assertRaises(ValueError):
+            search_images_to_jsonl('safe', path, client=derpi)
+        # end with
+    # end def
+# end class
+
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+# end try
+
+
+@unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+class ArrowExportTest(unittest.TestCase):
+    def test_table_of(self):
+        from derpi.export.arrow import table_of
+        data = fake_user()
+        table = table_of([data, User.from_dict(fake_user())], 'User')
+        self.assertEqual(table.num_rows, 2)
+        self.assertEqual(str(table.schema.field('links').type), 'list<item: struct<user_id: int64, created_at: timestamp[us, tz=UTC], state: string, tag_id: int64>>')
+        rows = table.to_pylist()
+        self.assertEqual(rows[0], rows[1])
+        self.assertEqual(rows[0]['created_at'], datetime.datetime(2013, 5, 2, 16, 7, 3, tzinfo=datetime.timezone.utc))
+        self.assertEqual(rows[0]['awards'][0]['awarded_on'], datetime.datetime(2018, 5, 2, 20, 35, 9, tzinfo=datetime.timezone.utc))
+        tags = table_of([dict(fake_tag(4), dnp_entries=[{'reason': 'artist request'}])], 'Tag')
+        self.assertEqual(tags.column('dnp_entries').to_pylist(), [['{"reason":"artist request"}']])
+        self.assertEqual(tags.column('aliases').type, pyarrow.list_(pyarrow.string()))
+    # end def
+
+    def test_search_to_parquet(self):
+        import tempfile
+        import pyarrow.parquet
+        from derpi.export.arrow import search_images_to_parquet
+        with tempfile.TemporaryDirectory() as directory:
+            path = directory + '/images.parquet'
+            derpi = client.DerpiClient(key=None, client=FakeSession(fake_image_pages(120)))
+            self.assertEqual(search_images_to_parquet('*', path, row_group_size=40, client=derpi), 120)
+            file = pyarrow.parquet.ParquetFile(path)
+            self.assertEqual(file.metadata.num_row_groups, 3)
+            self.assertEqual(file.read(columns=['id']).column('id').to_pylist(), list(range(120, 0, -1)))
+            self.assertEqual(file.schema_arrow.field('tag_ids').type, pyarrow.list_(pyarrow.int64()))
+        # end with
+    # end def
+# end class
+
+
+class MirrorTest(unittest.TestCase):
+    def setUp(self):
+        import tempfile
+        self.directory = tempfile.TemporaryDirectory()
+        self.images = {
+            image_id: dict(fake_image(image_id, tag_ids=[image_id % 2]), updated_at=f'2020-01-01T00:00:0{image_id // 2}Z')
+            for image_id in range(1, 8)
+        }
+    # end def
+
+    def tearDown(self):
+        self.directory.cleanup()
+    # end def
+
+    def handler(self, method, url, params):
+        """ The images sorted by `updated_at`, understands `updated_at.gte:` in the query. """
+        from derpi.timestamps import parse_datetime_fast
+        images = sorted(self.images.values(), key=lambda image: (image['updated_at'], image['id']))
+        if 'updated_at.gte:' in params['q']:
+            watermark = parse_datetime_fast(params['q'].split('updated_at.gte:')[1])
+            images = [image for image in images if parse_datetime_fast(image['updated_at']) >= watermark]
+        # end if
+        page = images[(params['page'] - 1) * params['per_page']:params['page'] * params['per_page']]
+        return {'images': page, 'total': len(images)}
+    # end def
+
+    def test_sync_images(self):
+        from derpi.mirror import Mirror
+        mirror = Mirror(self.directory.name + '/mirror.sqlite')
+        session = FakeSession(self.handler)
+        derpi = client.DerpiClient(key=None, client=session)
+        self.assertIsNone(mirror.watermark('*'))
+        mirror.sync_images('*', per_page=3, client=derpi)
+        self.assertEqual(mirror.count(), 7)
+        self.assertEqual(mirror.watermark('*'), '2020-01-01T00:00:03Z')
+        self.assertEqual(mirror.image_ids_with_tag(1), [7, 5, 3, 1])
+        self.assertEqual(session.requests[0][2]['sf'], 'updated_at')
+        self.assertEqual(session.requests[0][2]['sd'], 'asc')
+
+        self.images[2] = dict(self.images[2], score=42, tag_ids=[1], updated_at='2020-01-01T00:00:09Z')
+        session.requests.clear()
+        # 6 and 7 have the old watermark, so they are requested again, and 2 once more as the first page was full.
+        self.assertEqual(mirror.sync_images('*', per_page=3, client=derpi), 4)
+        self.assertEqual(len(session.requests), 2)
+        self.assertIn('updated_at.gte:2020-01-01T00:00:03Z', session.requests[0][2]['q'])
+        self.assertIn('updated_at.gte:2020-01-01T00:00:09Z', session.requests[1][2]['q'])
+        self.assertEqual(mirror.image(2)['score'], 42)
+        self.assertEqual(mirror.image_ids_with_tag(1), [7, 5, 3, 2, 1])
+        self.assertEqual(mirror.image_ids_with_tag(0), [6, 4])
+        self.assertEqual(mirror.count(), 7)
+        mirror.close()
+    # end def
+
+    def test_store(self):
+        from derpi.mirror import Mirror
+        mirror = Mirror(self.directory.name + '/mirror.sqlite')
+        self.assertEqual(mirror.store_tags([fake_tag(4), Tag.from_dict(fake_tag(5))]), 2)
+        self.assertEqual(mirror.count('tags'), 2)
+        with self.assertRaises(ValueError):
+            mirror.count('users; DROP TABLE images')
+        # end with
+        self.assertIsNone(mirror.image(1))
+        mirror.close()
+    # end def
+# end class
+
+
+def fake_dated_image_pages(total):
+    """
+    Images `1` to `total`, image `n` uploaded `n` hours after 2020-01-01, newest first.
+    Understands `created_at.gte:`, `created_at.lt:` and `id.lt:` in the query.
+    """
+    import re
+    start = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+    uploaded = {image_id: start + datetime.timedelta(hours=image_id) for image_id in range(1, total + 1)}
+
+    def handler(method, url, params):
+        ids = list(range(total, 0, -1))
+        for operator, value in re.findall(r'(created_at\.gte|created_at\.lt|id\.lt):([^,)]+)', params['q']):
+            if operator == 'id.lt':
+                ids = [image_id for image_id in ids if image_id < int(value)]
+                continue
+            # end if
+            moment = iso8601.parse_date(value)
+            ids = [image_id for image_id in ids if (uploaded[image_id] >= moment) == (operator == 'created_at.gte')]
+        # end for
+        per_page = params['per_page']
+        page = ids[(params['page'] - 1) * per_page:params['page'] * per_page]
+        return {'images': [fake_image(image_id, created_at=uploaded[image_id].isoformat()) for image_id in page], 'total': len(ids)}
+    # end def
+    return handler
+# end def
+
+
+class CrawlTest(unittest.TestCase):
+    start = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+    end = datetime.datetime(2020, 1, 21, tzinfo=datetime.timezone.utc)
+
+    def test_plan_shards(self):
+        from derpi.crawl import Shard, plan_shards
+        derpi = client.DerpiClient(key=None, client=FakeSession(fake_dated_image_pages(300)))
+        shards = plan_shards('*', start=self.start, end=self.end, shard_size=100, client=derpi)
+        self.assertEqual(sum(shard.total for shard in shards), 300)
+        self.assertTrue(all(0 < shard.total <= 100 for shard in shards))
+        self.assertEqual(shards[0].start, self.start)
+        self.assertTrue(all(before.end == after.start for before, after in zip(shards, shards[1:])))
+        self.assertEqual(
+            Shard(self.start, self.end).query('safe'),
+            '(safe), created_at.gte:2020-01-01T00:00:00Z, created_at.lt:2020-01-21T00:00:00Z',
+        )
+        with self.assertRaises(ValueError):
+            plan_shards('*', start=self.end, end=self.start, client=derpi)
+        # end with
+    # end def
+
+    def test_plan_shards_below_one_second(self):
+        from derpi.crawl import plan_shards
+        session = FakeSession(lambda method, url, params: {'images': [], 'total': 5})  # 5 images in the same second
+        derpi = client.DerpiClient(key=None, client=session)
+        end = self.start + datetime.timedelta(milliseconds=500)  # can't be split at whole seconds
+        shards = plan_shards('*', start=self.start, end=end, shard_size=1, min_span=datetime.timedelta(0), client=derpi)
+        self.assertEqual([shard.total for shard in shards], [5])
+        self.assertEqual(len(session.requests), 1)
+    # end def
+
+    def test_crawl_images(self):
+        from derpi.crawl import crawl_images
+        derpi = client.DerpiClient(key=None, client=FakeSession(fake_dated_image_pages(300)))
+        images = list(crawl_images('*', start=self.start, end=self.end, shard_size=100, concurrency=3, client=derpi, _raw=True))
+        self.assertEqual(sorted(image['id'] for image in images), list(range(1, 301)))
+        images = crawl_images('*', start=self.start, end=self.end, shard_size=100, client=derpi, _raw=True)
+        self.assertIn(next(images)['id'], range(1, 301))
+        images.close()  # stops the threads waiting to hand over their images.
+    # end def
+
+    def test_async_crawl_images(self):
+        from derpi.asyncrounous import client as async_client
+        from derpi.crawl import async_crawl_images
+
+        async def collect():
+            derpi = async_client.DerpiClient(key=None, client=FakeAsyncSession(fake_dated_image_pages(300)))
+            return [
+                image['id'] async for image in
+                async_crawl_images('*', start=self.start, end=self.end, shard_size=100, concurrency=3, client=derpi, _raw=True)
+            ]
+        # end def
+
+        self.assertEqual(sorted(run_async(collect())), list(range(1, 301)))
+    # end def
+# end class
+
+
 if __name__ == '__main__':
     unittest.main()